@@ -0,0 +1,108 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the recording throughput of the episode data used by the recorder manager.
+
+Three recording strategies are compared for each number of environments:
+
+* ``concat``: one episode per environment, each key grown with ``torch.cat`` at every step (previous implementation).
+* ``episode``: one :class:`EpisodeData` per environment, each key appended to a buffer whose capacity doubles.
+* ``batched``: a single :class:`EpisodeDataBuffer`, the values of all the environments appended with one write.
+
+.. code-block python
+
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_episode_recording.py --num_envs 1024 4096 --num_steps 200 \
+        --device cuda --headless
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the recording throughput of the episode data.")
+parser.add_argument("--num_envs", type=int, nargs="+", default=[1024, 4096], help="Number of environments.")
+parser.add_argument("--num_steps", type=int, default=200, help="Number of steps recorded in each episode.")
+parser.add_argument("--obs_dim", type=int, default=64, help="Size of the recorded observations.")
+parser.add_argument("--action_dim", type=int, default=8, help="Size of the recorded actions.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# parse the arguments
+args_cli, _ = parser.parse_known_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import torch
+
+from isaaclab.utils.datasets import EpisodeData, EpisodeDataBuffer
+from isaaclab.utils.timer import Timer
+
+
+def synchronize(device: str) -> None:
+    if device.startswith("cuda"):
+        torch.cuda.synchronize()
+
+
+def record_concat(step_values: list[dict[str, torch.Tensor]], num_envs: int) -> None:
+    episodes = [dict() for _ in range(num_envs)]
+    for values in step_values:
+        for key, value in values.items():
+            for env_id in range(num_envs):
+                if key not in episodes[env_id]:
+                    episodes[env_id][key] = value[env_id].unsqueeze(0).clone()
+                else:
+                    episodes[env_id][key] = torch.cat((episodes[env_id][key], value[env_id].unsqueeze(0)))
+
+
+def record_episode(step_values: list[dict[str, torch.Tensor]], num_envs: int) -> None:
+    episodes = [EpisodeData() for _ in range(num_envs)]
+    for values in step_values:
+        for key, value in values.items():
+            for env_id in range(num_envs):
+                episodes[env_id].add(key, value[env_id])
+
+
+def record_batched(step_values: list[dict[str, torch.Tensor]], num_envs: int) -> None:
+    buffer = EpisodeDataBuffer(num_envs)
+    for values in step_values:
+        for key, value in values.items():
+            buffer.add(key, value)
+
+
+def main():
+    device = args_cli.device
+    print(
+        f"[INFO] Recording {args_cli.num_steps} steps of 'obs' ({args_cli.obs_dim}) and 'actions'"
+        f" ({args_cli.action_dim})."
+    )
+    print(f"{'envs':>8} | {'concat [steps/s]':>16} | {'episode [steps/s]':>17} | {'batched [steps/s]':>17}")
+    for num_envs in args_cli.num_envs:
+        step_values = [
+            {
+                "obs/policy": torch.rand((num_envs, args_cli.obs_dim), device=device),
+                "actions": torch.rand((num_envs, args_cli.action_dim), device=device),
+            }
+            for _ in range(args_cli.num_steps)
+        ]
+        throughputs = []
+        for record_fn in [record_concat, record_episode, record_batched]:
+            synchronize(device)
+            with Timer() as timer:
+                record_fn(step_values, num_envs)
+                synchronize(device)
+            throughputs.append(args_cli.num_steps / timer.total_run_time)
+        print(f"{num_envs:>8} | {throughputs[0]:>16.1f} | {throughputs[1]:>17.1f} | {throughputs[2]:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
+    simulation_app.close()
@@ -0,0 +1,153 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the per-substep cost of the hydrostatics, hydrodynamics and propellers of the Kingfisher.
+
+The separate :class:`Hydrostatics`, :class:`Hydrodynamics` and :class:`PropellerActuator` used before the
+:class:`KingfisherPhysics` are compared with the fused function, in eager mode, compiled with torch.compile, and as a
+warp kernel. The peak memory reported is the one of one substep on CUDA devices.
+
+.. code-block python
+
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_kingfisher_physics.py --num_envs 4096 16384 --device cuda \
+        --headless
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the physics of the Kingfisher.")
+parser.add_argument("--num_envs", type=int, nargs="+", default=[4096, 16384], help="Number of environments.")
+parser.add_argument("--num_iterations", type=int, default=1000, help="Number of substeps to time.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# parse the arguments
+args_cli, _ = parser.parse_known_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import torch
+
+from isaaclab.actuator_force.actuator_force import PropellerActuator
+from isaaclab.physics.hydrodynamics import Hydrodynamics
+from isaaclab.physics.hydrostatics import Hydrostatics
+from isaaclab.utils import math as math_utils
+from isaaclab.utils.timer import Timer
+
+from isaaclab_tasks.rans import KingfisherRobotCfg
+from isaaclab_tasks.rans.robots import KingfisherPhysics
+from isaaclab_tasks.rans.utils import PerEnvSeededRNG
+
+
+class SeparatePhysics:
+    """The hydrostatics, hydrodynamics and propellers as separate classes, kept as a baseline."""
+
+    def __init__(self, robot_cfg: KingfisherRobotCfg, num_envs: int, dt: float, device: str):
+        self.hydrostatics = Hydrostatics(num_envs, device, robot_cfg.hydrostatics_cfg)
+        self.hydrodynamics = Hydrodynamics(num_envs, device, robot_cfg.hydrodynamics_cfg)
+        self.left = PropellerActuator(num_envs=num_envs, device=device, dt=dt, cfg=robot_cfg.propeller_cfg)
+        self.right = PropellerActuator(num_envs=num_envs, device=device, dt=dt, cfg=robot_cfg.propeller_cfg)
+        self.hydrostatic_force = torch.zeros((num_envs, 1, 6), device=device)
+        self.hydrodynamic_force = torch.zeros((num_envs, 1, 6), device=device)
+        self.thruster_forces_left = torch.zeros((num_envs, 1, 3), device=device)
+        self.thruster_forces_right = torch.zeros((num_envs, 1, 3), device=device)
+
+    def set_target_cmds(self, commands: torch.Tensor) -> None:
+        self.left.set_target_cmd(commands[:, 0])
+        self.right.set_target_cmd(commands[:, 1])
+
+    def update(self, root_pos: torch.Tensor, root_quat: torch.Tensor, root_vel: torch.Tensor) -> None:
+        self.hydrostatic_force[:, 0, :] = self.hydrostatics.compute_archimedes_metacentric_local(root_pos, root_quat)
+        self.hydrodynamic_force[:, 0, :] = self.hydrodynamics.ComputeHydrodynamicsEffects(root_quat, root_vel)
+        self.thruster_forces_left[:, 0] = self.left.update_forces()
+        self.thruster_forces_right[:, 0] = self.right.update_forces()
+        # Summed before being applied on the root
+        self.hydrostatic_force + self.hydrodynamic_force
+
+
+def synchronize(device: str) -> None:
+    if device.startswith("cuda"):
+        torch.cuda.synchronize()
+
+
+def time_fn(fn, device: str, num_iterations: int) -> float:
+    # Warm-up, long enough for torch.compile to finish
+    for _ in range(10):
+        fn()
+    synchronize(device)
+    with Timer() as timer:
+        for _ in range(num_iterations):
+            fn()
+        synchronize(device)
+    return timer.total_run_time / num_iterations * 1e6
+
+
+def peak_memory(fn, device: str) -> float:
+    """Peak memory of one call on top of the memory already allocated, in MB. NaN if not on a CUDA device."""
+    if not device.startswith("cuda"):
+        return float("nan")
+    synchronize(device)
+    torch.cuda.reset_peak_memory_stats(device)
+    baseline = torch.cuda.memory_allocated(device)
+    fn()
+    synchronize(device)
+    return (torch.cuda.max_memory_allocated(device) - baseline) / 2**20
+
+
+def main():
+    device = args_cli.device
+    robot_cfg = KingfisherRobotCfg()
+    dt = 1.0 / 60.0
+    print(f"{'envs':>8} | {'method':>10} | {'peak [MB]':>10} | {'substep [us]':>12} | speed-up")
+    for num_envs in args_cli.num_envs:
+        root_pos = torch.rand((num_envs, 3), device=device) * 0.4 - 0.2
+        root_quat = math_utils.random_orientation(num_envs, device=device)
+        root_vel = torch.rand((num_envs, 6), device=device) * 4 - 2
+        commands = torch.rand((num_envs, 2), device=device) * 2 - 1
+        rng = PerEnvSeededRNG(torch.arange(num_envs, dtype=torch.int32, device=device), num_envs, device)
+
+        methods = [("separate", SeparatePhysics(robot_cfg, num_envs, dt, device))]
+        for name, backend, compile in [("eager", "torch", False), ("compiled", "torch", True), ("warp", "warp", False)]:
+            physics = KingfisherPhysics(
+                robot_cfg.hydrostatics_cfg,
+                robot_cfg.hydrodynamics_cfg,
+                robot_cfg.propeller_cfg,
+                rng,
+                num_envs=num_envs,
+                dt=dt,
+                device=device,
+                backend=backend,
+                compile=compile,
+            )
+            physics.reset(torch.arange(num_envs, device=device))
+            methods.append((name, physics))
+
+        baseline = None
+        for name, physics in methods:
+            physics.set_target_cmds(commands)
+
+            def fn():
+                physics.update(root_pos, root_quat, root_vel)
+
+            step_time = time_fn(fn, device, args_cli.num_iterations)
+            baseline = step_time if baseline is None else baseline
+            print(
+                f"{num_envs:>8} | {name:>10} | {peak_memory(fn, device):>10.2f} | {step_time:>12.1f} |"
+                f" {baseline / step_time:.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
+    simulation_app.close()
@@ -0,0 +1,167 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the look-ahead observations of the multi-goal tasks.
+
+The per-goal loop used before the :class:`GoalLookAhead` is compared with the batched observations, for the goals
+expressed in the robot frame (GoThroughPositions, RaceWaypoints) and in the previous goal's frame (GoThroughPoses,
+RaceWayposes, RaceGates), for a growing number of observed goals.
+
+.. code-block python
+
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_look_ahead.py --num_envs 4096 --num_subsequent_goals 2 4 8 16 \
+        --device cuda --headless
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the look-ahead observations of the multi-goal tasks.")
+parser.add_argument("--num_envs", type=int, default=4096, help="Number of environments.")
+parser.add_argument(
+    "--num_subsequent_goals", type=int, nargs="+", default=[2, 4, 8, 16], help="Number of goals observed."
+)
+parser.add_argument("--max_num_goals", type=int, default=32, help="Number of goals of the trajectories.")
+parser.add_argument("--num_iterations", type=int, default=1000, help="Number of observations to time.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# parse the arguments
+args_cli, _ = parser.parse_known_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import math
+import torch
+
+from isaaclab.utils.timer import Timer
+
+from isaaclab_tasks.rans.tasks import GoalLookAhead
+from isaaclab_tasks.rans.tasks.look_ahead import wrap_angle
+
+
+def loop_robot_frame(obs, positions, target_index, num_goals, robot_pos, heading, num_subsequent_goals):
+    """The per-goal loop of the GoThroughPositions observations, kept as a baseline."""
+    all_indices = torch.arange(positions.shape[0], device=positions.device)
+    error = positions[all_indices, target_index] - robot_pos
+    bearing = wrap_angle(torch.atan2(error[:, 1], error[:, 0]) - heading)
+    obs[:, 0] = torch.linalg.norm(error, dim=-1)
+    obs[:, 1] = torch.cos(bearing)
+    obs[:, 2] = torch.sin(bearing)
+    for i in range(num_subsequent_goals - 1):
+        overflowing = (target_index + i + 1) >= num_goals
+        indices = (target_index + i + 1) * torch.logical_not(overflowing)
+        error = positions[all_indices, indices] - robot_pos
+        bearing = wrap_angle(torch.atan2(error[:, 1], error[:, 0]) - heading) * torch.logical_not(overflowing)
+        obs[:, 3 + 3 * i] = torch.linalg.norm(error, dim=-1) * torch.logical_not(overflowing)
+        obs[:, 4 + 3 * i] = torch.cos(bearing)
+        obs[:, 5 + 3 * i] = torch.sin(bearing)
+
+
+def loop_goal_frame(obs, positions, headings, target_index, num_goals, robot_pos, heading, num_subsequent_goals):
+    """The per-goal loop of the GoThroughPoses observations, kept as a baseline."""
+    all_indices = torch.arange(positions.shape[0], device=positions.device)
+    error = positions[all_indices, target_index] - robot_pos
+    bearing = wrap_angle(torch.atan2(error[:, 1], error[:, 0]) - heading)
+    heading_error = wrap_angle(headings[all_indices, target_index] - heading)
+    obs[:, 0] = torch.linalg.norm(error, dim=-1)
+    obs[:, 1] = torch.cos(bearing)
+    obs[:, 2] = torch.sin(bearing)
+    obs[:, 3] = torch.cos(heading_error)
+    obs[:, 4] = torch.sin(heading_error)
+    for i in range(num_subsequent_goals - 1):
+        overflowing = (target_index + i + 1) >= num_goals
+        indices = (target_index + i + 1) * torch.logical_not(overflowing)
+        error = positions[all_indices, indices] - positions[all_indices, indices - 1]
+        bearing = wrap_angle(torch.atan2(error[:, 1], error[:, 0]) - headings[all_indices, indices - 1])
+        bearing = bearing * torch.logical_not(overflowing)
+        heading_error = wrap_angle(headings[all_indices, indices] - headings[all_indices, indices - 1])
+        obs[:, 5 + 5 * i] = torch.linalg.norm(error, dim=-1) * torch.logical_not(overflowing)
+        obs[:, 6 + 5 * i] = torch.cos(bearing)
+        obs[:, 7 + 5 * i] = torch.sin(bearing)
+        obs[:, 8 + 5 * i] = torch.cos(heading_error)
+        obs[:, 9 + 5 * i] = torch.sin(heading_error)
+
+
+def synchronize(device: str) -> None:
+    if device.startswith("cuda"):
+        torch.cuda.synchronize()
+
+
+def time_fn(fn, device: str, num_iterations: int) -> float:
+    # Warm-up
+    for _ in range(10):
+        fn()
+    synchronize(device)
+    with Timer() as timer:
+        for _ in range(num_iterations):
+            fn()
+        synchronize(device)
+    return timer.total_run_time / num_iterations * 1e6
+
+
+def main():
+    device = args_cli.device
+    num_envs = args_cli.num_envs
+    num_goals = torch.randint(1, args_cli.max_num_goals + 1, (num_envs,), device=device)
+    target_index = (torch.rand(num_envs, device=device) * num_goals).long()
+    positions = torch.rand((num_envs, args_cli.max_num_goals, 2), device=device) * 20 - 10
+    headings = torch.rand((num_envs, args_cli.max_num_goals), device=device) * 2 * math.pi - math.pi
+    robot_pos = torch.rand((num_envs, 2), device=device) * 20 - 10
+    heading = torch.rand(num_envs, device=device) * 2 * math.pi - math.pi
+
+    print(f"{'goals':>6} | {'frame':>6} | {'loop [us]':>10} | {'batched [us]':>12} | speed-up")
+    for num_subsequent_goals in args_cli.num_subsequent_goals:
+        look_ahead = GoalLookAhead(num_subsequent_goals, device)
+        for frame, width in [("robot", 3), ("goal", 5)]:
+            obs = torch.zeros((num_envs, width * num_subsequent_goals), device=device)
+            if frame == "robot":
+
+                def loop():
+                    loop_robot_frame(obs, positions, target_index, num_goals, robot_pos, heading, num_subsequent_goals)
+
+                def batched():
+                    look_ahead.robot_frame_2d(
+                        obs.unflatten(1, (-1, 3)), positions, target_index, num_goals, robot_pos, heading, True
+                    )
+
+            else:
+
+                def loop():
+                    loop_goal_frame(
+                        obs, positions, headings, target_index, num_goals, robot_pos, heading, num_subsequent_goals
+                    )
+
+                def batched():
+                    look_ahead.goal_frame_2d(
+                        obs.unflatten(1, (-1, 5)),
+                        positions,
+                        headings,
+                        target_index,
+                        num_goals,
+                        robot_pos,
+                        heading,
+                        True,
+                    )
+
+            loop_time = time_fn(loop, device, args_cli.num_iterations)
+            batched_time = time_fn(batched, device, args_cli.num_iterations)
+            print(
+                f"{num_subsequent_goals:>6} | {frame:>6} | {loop_time:>10.1f} | {batched_time:>12.1f} |"
+                f" {loop_time / batched_time:.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
+    simulation_app.close()
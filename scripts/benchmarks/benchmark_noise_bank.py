@@ -0,0 +1,137 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the per-step cost of the action and observation noise with and without a noise bank.
+
+For each number of environments, the action and observation noise are applied through the
+:class:`RandomizationPipeline`, first drawing the noise at every step, then reading it from a bank of pre-sampled
+noise. The time of the refill of the bank at reset is reported separately, as it is amortized over the episode.
+
+.. code-block python
+
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_noise_bank.py --num_envs 4096 16384 --noise_bank_size 64 \
+        --device cuda --headless
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the per-step cost of the noise banks.")
+parser.add_argument("--num_envs", type=int, nargs="+", default=[4096, 16384], help="Number of environments.")
+parser.add_argument("--noise_bank_size", type=int, default=64, help="Number of steps of noise stored in the bank.")
+parser.add_argument("--dim_actions", type=int, default=8, help="Size of the actions.")
+parser.add_argument("--dim_observations", type=int, default=32, help="Size of the observations.")
+parser.add_argument(
+    "--distribution", type=str, default="uniform", choices=["uniform", "normal"], help="Noise distribution."
+)
+parser.add_argument("--num_iterations", type=int, default=1000, help="Number of steps to time.")
+parser.add_argument("--eager", action="store_true", default=False, help="Do not compile the fused stages.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# parse the arguments
+args_cli, _ = parser.parse_known_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import torch
+
+from isaaclab.utils.timer import Timer
+
+from isaaclab_tasks.rans.domain_randomization import (
+    NoisyActions,
+    NoisyActionsCfg,
+    NoisyObservations,
+    NoisyObservationsCfg,
+    RandomizationPipeline,
+)
+from isaaclab_tasks.rans.utils import PerEnvSeededRNG
+
+
+def synchronize(device: str) -> None:
+    if device.startswith("cuda"):
+        torch.cuda.synchronize()
+
+
+def time_fn(fn, device: str, num_iterations: int) -> float:
+    # Warm-up, includes the compilation of the fused stages
+    for _ in range(10):
+        fn()
+    synchronize(device)
+    with Timer() as timer:
+        for _ in range(num_iterations):
+            fn()
+        synchronize(device)
+    return timer.total_run_time / num_iterations * 1e6
+
+
+def make_pipeline(num_envs: int, noise_bank_size: int, device: str) -> RandomizationPipeline:
+    rng = PerEnvSeededRNG(0, num_envs, device)
+    rng.set_seeds(torch.arange(num_envs, dtype=torch.int32, device=device), torch.arange(num_envs, device=device))
+    half_actions, half_observations = args_cli.dim_actions // 2, args_cli.dim_observations // 2
+    actions_cfg = NoisyActionsCfg(
+        enable=True,
+        randomization_modes=[args_cli.distribution],
+        slices=[(0, half_actions), (half_actions, args_cli.dim_actions)],
+        max_delta=[0.1, 0.2],
+        std=[0.1, 0.2],
+        noise_bank_size=noise_bank_size,
+    )
+    observations_cfg = NoisyObservationsCfg(
+        enable=True,
+        randomization_modes=[args_cli.distribution],
+        slices=[(0, half_observations), (half_observations, args_cli.dim_observations)],
+        max_delta=[0.05, 0.1],
+        std=[0.05, 0.1],
+        noise_bank_size=noise_bank_size,
+    )
+    randomizers = []
+    for cls, cfg in [(NoisyActions, actions_cfg), (NoisyObservations, observations_cfg)]:
+        randomizer = cls(cfg, rng, None, num_envs, device)
+        randomizer.setup()
+        randomizers.append(randomizer)
+    return RandomizationPipeline(
+        randomizers,
+        dims={"actions": args_cli.dim_actions, "observations": args_cli.dim_observations},
+        compile=not args_cli.eager,
+    )
+
+
+def main():
+    device = args_cli.device
+    print(f"[INFO] Noise bank of {args_cli.noise_bank_size} steps, {args_cli.distribution} noise.")
+    print(f"{'envs':>8} | {'per-step [us]':>14} | {'bank [us]':>10} | {'refill [us]':>12} | speed-up")
+    for num_envs in args_cli.num_envs:
+        env_ids = torch.arange(num_envs, device=device)
+        actions = torch.rand((num_envs, args_cli.dim_actions), device=device)
+        observations = torch.rand((num_envs, args_cli.dim_observations), device=device)
+        results = []
+        for noise_bank_size in [0, args_cli.noise_bank_size]:
+            pipeline = make_pipeline(num_envs, noise_bank_size, device)
+            pipeline.reset(env_ids)
+
+            def step():
+                pipeline.actions(actions=actions)
+                pipeline.observations(observations=observations)
+
+            results.append(time_fn(step, device, args_cli.num_iterations))
+        refill = time_fn(lambda: pipeline.reset(env_ids), device, max(args_cli.num_iterations // 10, 1))
+        print(
+            f"{num_envs:>8} | {results[0]:>14.2f} | {results[1]:>10.2f} | {refill:>12.2f} |"
+            f" {results[0] / results[1]:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
+    simulation_app.close()
@@ -0,0 +1,137 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the per-step overhead of the domain randomization as the number of randomizers grows.
+
+The randomizers of the robot (action noise, action rescaling, wrench, mass and CoM) are enabled in turn, cycling
+through them until the requested number is reached, and a fixed number of disabled randomizers is added on top. For
+each count, the script compares the legacy dispatch, where every randomizer is called in each phase, against the
+compiled :class:`RandomizationPipeline`. The robot runs on the kinematic backend, so only the randomization is timed.
+
+.. code-block python
+
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_randomization_pipeline.py --num_randomizers 0 1 2 4 8 16 \
+        --num_envs 4096 --device cuda --headless
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the per-step overhead of the domain randomization.")
+parser.add_argument("--robot", type=str, default="FloatingPlatform", help="Robot providing the randomizers.")
+parser.add_argument("--num_envs", type=int, default=4096, help="Number of environments.")
+parser.add_argument(
+    "--num_randomizers",
+    type=int,
+    nargs="+",
+    default=[0, 1, 2, 4, 8, 16],
+    help="Number of enabled randomizers to benchmark.",
+)
+parser.add_argument("--num_disabled", type=int, default=4, help="Number of disabled randomizers added on top.")
+parser.add_argument("--num_iterations", type=int, default=1000, help="Number of steps to time.")
+parser.add_argument("--eager", action="store_true", default=False, help="Do not compile the fused stages.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# parse the arguments
+args_cli, _ = parser.parse_known_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import torch
+
+from isaaclab.utils.timer import Timer
+
+from isaaclab_tasks.rans import RandomizationCoreCfg, RandomizationPipeline, RandomizerFactory
+from isaaclab_tasks.rans.environments.single.kinematic_env_single import KinematicSingleEnv, KinematicSingleEnvCfg
+
+
+def synchronize(device: str) -> None:
+    if device.startswith("cuda"):
+        torch.cuda.synchronize()
+
+
+def time_step(fn, device: str) -> float:
+    # Warm-up, includes the compilation of the fused stages
+    for _ in range(10):
+        fn()
+    synchronize(device)
+    with Timer() as timer:
+        for _ in range(args_cli.num_iterations):
+            fn()
+        synchronize(device)
+    return timer.total_run_time / args_cli.num_iterations * 1e6
+
+
+def main():
+    device = args_cli.device
+    cfg = KinematicSingleEnvCfg(
+        robot_name=args_cli.robot, task_name="GoToPosition", num_envs=args_cli.num_envs, device=device, seed=0
+    )
+    env = KinematicSingleEnv(cfg)
+    robot_api = env.robot_api
+    pool = [
+        getattr(env.robot_cfg, attr)
+        for attr in env.robot_cfg.__dir__()
+        if isinstance(getattr(env.robot_cfg, attr), RandomizationCoreCfg)
+    ]
+    assert len(pool) > 0, f"The robot {args_cli.robot} does not define any randomizer."
+    env_ids = torch.arange(args_cli.num_envs, device=device)
+    actions = torch.rand((args_cli.num_envs, robot_api._dim_robot_act), device=device)
+
+    print(f"[INFO] Randomizers cycled through: {[type(cfg).__name__[:-3] for cfg in pool]}")
+    print(f"{'enabled':>8} | {'disabled':>8} | {'hooks':>6} | {'legacy [us]':>12} | {'pipeline [us]':>14} | speed-up")
+    for num_randomizers in args_cli.num_randomizers:
+        cfgs = [pool[i % len(pool)].replace(enable=True) for i in range(num_randomizers)]
+        cfgs += [pool[i % len(pool)].replace(enable=False) for i in range(args_cli.num_disabled)]
+        randomizers = []
+        for randomizer_cfg in cfgs:
+            randomizer = RandomizerFactory.create(
+                randomizer_cfg,
+                robot_api._rng,
+                env.scene,
+                asset_name=env.robot_cfg.robot_name,
+                num_envs=args_cli.num_envs,
+                device=device,
+            )
+            randomizer.setup()
+            randomizers.append(randomizer)
+        for randomizer in randomizers:
+            randomizer.reset(env_ids)
+
+        def legacy_step():
+            for randomizer in randomizers:
+                randomizer.actions(dt=env.physics_dt, actions=actions)
+            for randomizer in randomizers:
+                randomizer.update(dt=env.physics_dt, actions=actions)
+
+        pipeline = RandomizationPipeline(
+            randomizers, dims={"actions": robot_api._dim_robot_act}, compile=not args_cli.eager
+        )
+
+        def pipeline_step():
+            pipeline.actions(dt=env.physics_dt, actions=actions)
+            pipeline.update(dt=env.physics_dt, actions=actions)
+
+        legacy = time_step(legacy_step, device)
+        compiled = time_step(pipeline_step, device)
+        num_hooks = pipeline.num_hooks("actions") + pipeline.num_hooks("update")
+        print(
+            f"{num_randomizers:>8} | {args_cli.num_disabled:>8} | {num_hooks:>6} | {legacy:>12.2f} |"
+            f" {compiled:>14.2f} | {legacy / compiled:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
+    simulation_app.close()
@@ -0,0 +1,236 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the hot path of the RANS tasks: observations, rewards, dones, resets and visualization.
+
+Every task registered in the ``TASK_FACTORY`` is driven by the kinematic robot backend and a kinematic scene, such
+that the timings only contain the cost of the task logic. For each phase the script reports the mean time per call,
+the number of kernels (ops on CPU) launched and the number of allocations performed by a single call.
+
+.. code-block python
+
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_rans_tasks.py --num_envs 256 4096 65536 --device cuda --headless
+
+    # Compare against a previous report, exits with a non-zero code if a phase regressed
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_rans_tasks.py --baseline logs/benchmarks/rans_tasks/report.json \
+        --device cuda --headless
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the hot path of the RANS tasks.")
+parser.add_argument("--tasks", type=str, nargs="+", default=None, help="Tasks to benchmark. Defaults to all of them.")
+parser.add_argument(
+    "--robot", type=str, default=None, help="Robot driving the tasks. Defaults to Jetbot (2D) and IntBall2 (3D)."
+)
+parser.add_argument(
+    "--num_envs",
+    type=int,
+    nargs="+",
+    default=[256, 1024, 4096, 16384, 65536],
+    help="Number of environments to benchmark.",
+)
+parser.add_argument("--num_iterations", type=int, default=100, help="Number of calls to time for each phase.")
+parser.add_argument("--reset_ratio", type=float, default=0.05, help="Fraction of the environments reset at once.")
+parser.add_argument(
+    "--visualize", action="store_true", default=False, help="Create the task markers and time their update."
+)
+parser.add_argument(
+    "--output_dir", type=str, default="logs/benchmarks/rans_tasks", help="Folder where the report is written."
+)
+parser.add_argument("--baseline", type=str, default=None, help="Report to compare against.")
+parser.add_argument(
+    "--tolerance", type=float, default=0.1, help="Relative slow-down above which a phase is flagged as a regression."
+)
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# parse the arguments
+args_cli, _ = parser.parse_known_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import csv
+import json
+import os
+import sys
+import torch
+from torch.profiler import ProfilerActivity, profile
+
+from isaaclab.utils.timer import Timer
+
+from isaaclab_tasks.rans import TASK_FACTORY
+from isaaclab_tasks.rans.environments.single.kinematic_env_single import (
+    KINEMATIC_UNSUPPORTED_TASKS,
+    KinematicSingleEnv,
+    KinematicSingleEnvCfg,
+)
+
+PHASES = ["get_observations", "compute_rewards", "get_dones", "reset", "update_task_visualization"]
+REPORT_FIELDS = ["task", "robot", "num_envs", "phase", "time_ms", "kernels", "allocations"]
+
+
+def synchronize(device: str) -> None:
+    if device.startswith("cuda"):
+        torch.cuda.synchronize()
+
+
+def time_phase(fn, device: str) -> float:
+    # Warm-up, includes the kernel compilation and the caching allocator growth
+    for _ in range(5):
+        fn()
+    synchronize(device)
+    with Timer() as timer:
+        for _ in range(args_cli.num_iterations):
+            fn()
+        synchronize(device)
+    return timer.total_run_time / args_cli.num_iterations * 1e3
+
+
+def count_launches(fn, device: str) -> tuple[int, int]:
+    """Counts the kernels launched and the allocations performed by a single call.
+
+    On CUDA, the kernels are the device-side events of the profiler and the allocations come from the caching
+    allocator statistics. On CPU, every aten op counts as a launch and the allocations are the ops that requested
+    memory from the allocator."""
+
+    if device.startswith("cuda"):
+        synchronize(device)
+        allocations = torch.cuda.memory_stats(device)["allocation.all.allocated"]
+        with profile(activities=[ProfilerActivity.CPU, ProfilerActivity.CUDA]) as prof:
+            fn()
+            synchronize(device)
+        allocations = torch.cuda.memory_stats(device)["allocation.all.allocated"] - allocations
+        kernels = sum(1 for event in prof.events() if event.device_type == torch.autograd.DeviceType.CUDA)
+    else:
+        with profile(activities=[ProfilerActivity.CPU], profile_memory=True) as prof:
+            fn()
+        events = [event for event in prof.events() if event.name.startswith("aten::")]
+        kernels = sum(
+            1 for event in events if event.cpu_parent is None or not event.cpu_parent.name.startswith("aten::")
+        )
+        allocations = sum(1 for event in events if event.self_cpu_memory_usage > 0)
+    return kernels, allocations
+
+
+def benchmark_task(task_name: str, robot_name: str, num_envs: int) -> list[dict]:
+    device = args_cli.device
+    cfg = KinematicSingleEnvCfg(robot_name=robot_name, task_name=task_name, num_envs=num_envs, device=device, seed=0)
+    env = KinematicSingleEnv(cfg)
+    env.reset()
+    # Move the robots away from their initial conditions
+    for _ in range(10):
+        env.step(torch.rand((num_envs, env.robot_cfg.action_space), device=device) * 2 - 1)
+
+    num_resets = max(1, int(num_envs * args_cli.reset_ratio))
+    reset_ids = torch.randperm(num_envs, device=device)[:num_resets]
+    fns = {
+        "get_observations": env.task_api.get_observations,
+        "compute_rewards": env.task_api.compute_rewards,
+        "get_dones": env.task_api.get_dones,
+        "reset": lambda: env.task_api.reset(reset_ids),
+    }
+    if args_cli.visualize:
+        env.task_api.create_task_visualization()
+        fns["update_task_visualization"] = env.task_api.update_task_visualization
+
+    results = []
+    for phase in PHASES:
+        row = {"task": task_name, "robot": robot_name, "num_envs": num_envs, "phase": phase}
+        if phase in fns:
+            row["time_ms"] = time_phase(fns[phase], device)
+            row["kernels"], row["allocations"] = count_launches(fns[phase], device)
+        else:
+            row.update({"time_ms": None, "kernels": None, "allocations": None})
+        results.append(row)
+    return results
+
+
+def write_report(results: list[dict]) -> None:
+    os.makedirs(args_cli.output_dir, exist_ok=True)
+    with open(os.path.join(args_cli.output_dir, "report.json"), "w") as f:
+        json.dump(
+            {"device": args_cli.device, "num_iterations": args_cli.num_iterations, "results": results}, f, indent=2
+        )
+    with open(os.path.join(args_cli.output_dir, "report.csv"), "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+    print(f"[INFO] Report written to: {os.path.abspath(args_cli.output_dir)}")
+
+
+def compare(results: list[dict], baseline_path: str) -> list[str]:
+    """Flags the phases that got slower than the baseline by more than the tolerance, or that launch more kernels.
+
+    Returns:
+        list[str]: A description of each regression."""
+
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    if baseline["device"] != args_cli.device:
+        print(f"[WARN] The baseline was recorded on {baseline['device']}, the timings are not comparable.")
+    reference = {(r["task"], r["robot"], r["num_envs"], r["phase"]): r for r in baseline["results"]}
+
+    regressions = []
+    for row in results:
+        ref = reference.get((row["task"], row["robot"], row["num_envs"], row["phase"]))
+        if ref is None or row["time_ms"] is None or ref["time_ms"] is None:
+            continue
+        name = f"{row['task']}/{row['robot']}/{row['num_envs']}/{row['phase']}"
+        if row["time_ms"] > ref["time_ms"] * (1 + args_cli.tolerance):
+            regressions.append(f"{name}: {ref['time_ms']:.4f} ms -> {row['time_ms']:.4f} ms")
+        if row["kernels"] > ref["kernels"]:
+            regressions.append(f"{name}: {ref['kernels']} -> {row['kernels']} kernels")
+    return regressions
+
+
+def main() -> int:
+    tasks = args_cli.tasks
+    if tasks is None:
+        tasks = [task for task in TASK_FACTORY.get_keys if task not in KINEMATIC_UNSUPPORTED_TASKS]
+
+    results = []
+    print(f"{'task':>22} | {'robot':>10} | {'num_envs':>8} | {'phase':>25} | {'time [ms]':>10} | kernels | allocs")
+    for task_name in tasks:
+        robot_name = args_cli.robot
+        if robot_name is None:
+            robot_name = "IntBall2" if task_name.endswith("3D") else "Jetbot"
+        for num_envs in args_cli.num_envs:
+            for row in benchmark_task(task_name, robot_name, num_envs):
+                results.append(row)
+                if row["time_ms"] is None:
+                    continue
+                print(
+                    f"{task_name:>22} | {robot_name:>10} | {num_envs:>8} | {row['phase']:>25} |"
+                    f" {row['time_ms']:>10.4f} | {row['kernels']:>7} | {row['allocations']:>6}"
+                )
+            # Release the buffers of the previous environment before creating the next one
+            if args_cli.device.startswith("cuda"):
+                torch.cuda.empty_cache()
+
+    write_report(results)
+
+    if args_cli.baseline is None:
+        return 0
+    regressions = compare(results, args_cli.baseline)
+    for regression in regressions:
+        print(f"[REGRESSION] {regression}")
+    print(f"[INFO] {len(regressions)} regression(s) against {args_cli.baseline}.")
+    return int(len(regressions) > 0)
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    simulation_app.close()
+    sys.exit(exit_code)
@@ -0,0 +1,106 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the reset cost of the per-env seeded RNG: individual calls vs. a fused draw plan.
+
+The draws mimic the ones performed by ``GoThroughPositionsTask.set_goals``: one integer draw for the number of goals
+and two uniform draws per goal.
+
+.. code-block python
+
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_rng_draw_plan.py --num_envs 256 1024 4096 16384 --headless
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the per-env seeded RNG draw plans.")
+parser.add_argument(
+    "--num_envs", type=int, nargs="+", default=[256, 1024, 4096, 16384], help="Number of environments to benchmark."
+)
+parser.add_argument("--max_num_goals", type=int, default=10, help="Number of goals sampled at each reset.")
+parser.add_argument("--reset_ratio", type=float, default=0.25, help="Fraction of the environments reset at once.")
+parser.add_argument("--num_iterations", type=int, default=200, help="Number of resets to time.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# parse the arguments
+args_cli, _ = parser.parse_known_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import math
+import time
+import torch
+
+from isaaclab_tasks.rans.utils import PerEnvSeededRNG
+
+
+def synchronize(device: str) -> None:
+    if device.startswith("cuda"):
+        torch.cuda.synchronize()
+
+
+def per_call_reset(rng: PerEnvSeededRNG, ids: torch.Tensor, low: torch.Tensor, high: torch.Tensor) -> None:
+    rng.sample_integer_torch(1, args_cli.max_num_goals, 1, ids=ids)
+    rng.sample_uniform_torch(-1.0, 1.0, 2, ids=ids)
+    for _ in range(1, args_cli.max_num_goals):
+        rng.sample_uniform_torch(low, high, 1, ids=ids)
+        rng.sample_uniform_torch(0, math.pi, 1, ids=ids)
+
+
+def build_plan(rng: PerEnvSeededRNG):
+    plan = rng.create_draw_plan()
+    plan.add_integer("num_goals", 1, args_cli.max_num_goals, 1)
+    plan.add_uniform("first_goal", -1.0, 1.0, 2)
+    for i in range(1, args_cli.max_num_goals):
+        plan.add_uniform(f"radius_{i}", 0.0, 1.0, 1)
+        plan.add_uniform(f"theta_{i}", 0.0, math.pi, 1)
+    return plan
+
+
+def time_fn(fn, device: str) -> float:
+    # Warm-up, includes the kernel compilation
+    for _ in range(5):
+        fn()
+    synchronize(device)
+    start = time.perf_counter_ns()
+    for _ in range(args_cli.num_iterations):
+        fn()
+    synchronize(device)
+    return (time.perf_counter_ns() - start) / args_cli.num_iterations / 1e6
+
+
+def main():
+    device = args_cli.device
+    print(f"{'num_envs':>10} | {'per-call [ms]':>14} | {'draw plan [ms]':>14} | {'speed-up':>8}")
+    for num_envs in args_cli.num_envs:
+        seeds = torch.arange(num_envs, dtype=torch.int32, device=device)
+        num_resets = max(1, int(num_envs * args_cli.reset_ratio))
+        ids = torch.randperm(num_envs, device=device)[:num_resets].to(torch.int32)
+        low = torch.zeros(num_resets, device=device)
+        high = torch.ones(num_resets, device=device)
+
+        rng = PerEnvSeededRNG(seeds, num_envs, device)
+        per_call_ms = time_fn(lambda: per_call_reset(rng, ids, low, high), device)
+
+        plan = build_plan(PerEnvSeededRNG(seeds, num_envs, device))
+        bounds = {f"radius_{i}": (low, high) for i in range(1, args_cli.max_num_goals)}
+        plan_ms = time_fn(lambda: plan.sample(ids, bounds=bounds), device)
+
+        print(f"{num_envs:>10} | {per_call_ms:>14.4f} | {plan_ms:>14.4f} | {per_call_ms / plan_ms:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
+    simulation_app.close()
@@ -0,0 +1,148 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the memory and the per-step cost of the projection of the thrusts.
+
+The per-environment projection used by the IntBall2 before the :class:`ThrusterAllocation` (a 4x4 transform, a unit
+vector and a maximum thrust stored for every thruster of every environment) is compared with the allocation matrix,
+both when the wrench of each thruster is computed and when a single root wrench is aggregated. The memory reported is
+the one of the persistent buffers, and the peak memory of one step on CUDA devices.
+
+.. code-block python
+
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_thruster_allocation.py --num_envs 4096 16384 --device cuda \
+        --headless
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the projection of the thrusts.")
+parser.add_argument("--num_envs", type=int, nargs="+", default=[4096, 16384], help="Number of environments.")
+parser.add_argument("--num_iterations", type=int, default=1000, help="Number of steps to time.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# parse the arguments
+args_cli, _ = parser.parse_known_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import torch
+
+from isaaclab.utils import math as math_utils
+from isaaclab.utils.timer import Timer
+
+from isaaclab_tasks.rans import IntBall2RobotCfg
+from isaaclab_tasks.rans.robots import ThrusterAllocation
+
+
+class PerEnvProjection:
+    """The projection of the thrusts with per-environment copies of the geometry, kept as a baseline."""
+
+    def __init__(self, transforms: list[list[float]], max_thrust: list[float], num_envs: int, device: str):
+        num_thrusters = len(transforms)
+        self.transforms3D = torch.zeros((num_envs, num_thrusters, 4, 4), device=device)
+        self.unit_vector = torch.zeros((num_envs, num_thrusters, 3), device=device)
+        self.thrust_force = torch.zeros((num_envs, num_thrusters), device=device)
+        for i, (x, y, z, rot_x, rot_y, rot_z) in enumerate(transforms):
+            R = math_utils.matrix_from_euler(torch.tensor([[rot_x, rot_y, rot_z]], device=device), convention="XYZ")
+            self.transforms3D[:, i, :3, :3] = R
+            self.transforms3D[:, i, :3, 3] = torch.tensor([x, y, z], device=device)
+            self.transforms3D[:, i, 3, 3] = 1.0
+            self.unit_vector[:, i] = R[:, 2]
+            self.thrust_force[:, i] = max_thrust[i]
+
+    def __call__(self, actions: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        num_thrusters = actions.shape[1]
+        rand_forces = actions * self.thrust_force
+        R = self.transforms3D[:, :, :3, :3].reshape(-1, 3, 3)
+        T = self.transforms3D[:, :, :3, 3].reshape(-1, 3)
+        force_vector = -self.unit_vector * rand_forces.view(-1, num_thrusters, 1)
+        rotated_forces = torch.matmul(R, force_vector.view(-1, 3, 1)).squeeze(-1)
+        torques = torch.cross(T, rotated_forces, dim=-1)
+        return (
+            T.reshape(-1, num_thrusters, 3),
+            rotated_forces.reshape(-1, num_thrusters, 3),
+            torques.reshape(-1, num_thrusters, 3),
+        )
+
+    def buffers(self) -> list[torch.Tensor]:
+        return [self.transforms3D, self.unit_vector, self.thrust_force]
+
+
+def synchronize(device: str) -> None:
+    if device.startswith("cuda"):
+        torch.cuda.synchronize()
+
+
+def time_fn(fn, device: str, num_iterations: int) -> float:
+    # Warm-up
+    for _ in range(10):
+        fn()
+    synchronize(device)
+    with Timer() as timer:
+        for _ in range(num_iterations):
+            fn()
+        synchronize(device)
+    return timer.total_run_time / num_iterations * 1e6
+
+
+def peak_memory(fn, device: str) -> float:
+    """Peak memory of one call on top of the memory already allocated, in MB. NaN if not on a CUDA device."""
+    if not device.startswith("cuda"):
+        return float("nan")
+    synchronize(device)
+    torch.cuda.reset_peak_memory_stats(device)
+    baseline = torch.cuda.memory_allocated(device)
+    fn()
+    synchronize(device)
+    return (torch.cuda.max_memory_allocated(device) - baseline) / 2**20
+
+
+def buffers_memory(tensors: list[torch.Tensor]) -> float:
+    return sum(tensor.numel() * tensor.element_size() for tensor in tensors) / 2**20
+
+
+def main():
+    device = args_cli.device
+    robot_cfg = IntBall2RobotCfg()
+    print(f"[INFO] IntBall2, {robot_cfg.num_thrusters} thrusters.")
+    print(f"{'envs':>8} | {'method':>14} | {'buffers [MB]':>12} | {'peak [MB]':>10} | {'step [us]':>10} | speed-up")
+    for num_envs in args_cli.num_envs:
+        actions = torch.rand((num_envs, robot_cfg.num_thrusters), device=device)
+        per_env = PerEnvProjection(
+            robot_cfg.thruster_transforms, robot_cfg.thruster_max_thrust, num_envs=num_envs, device=device
+        )
+        allocation = ThrusterAllocation.from_transforms_3d(
+            robot_cfg.thruster_transforms, robot_cfg.thruster_max_thrust, num_envs=num_envs, device=device
+        )
+        allocation_buffers = [allocation.allocation_matrix, allocation.positions[0]]
+        methods = [
+            ("per-env", lambda: per_env(actions), per_env.buffers()),
+            ("per-thruster", lambda: allocation.compute_thruster_forces(actions), allocation_buffers),
+            ("root wrench", lambda: allocation.compute_wrench(actions), allocation_buffers),
+        ]
+        baseline = None
+        for name, fn, buffers in methods:
+            step_time = time_fn(fn, device, args_cli.num_iterations)
+            baseline = step_time if baseline is None else baseline
+            print(
+                f"{num_envs:>8} | {name:>14} | {buffers_memory(buffers):>12.3f} | {peak_memory(fn, device):>10.2f} |"
+                f" {step_time:>10.1f} | {baseline / step_time:.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
+    simulation_app.close()
@@ -249,7 +249,9 @@ def plot_radar(combo, metrics, libs, title, results_dir="results", save_path=Non
         if not os.path.exists(filename):
             print(f"Missing file: {filename}")
             continue
-        df = pd.read_csv(filename)
+        # Only read the columns of the plotted metrics
+        columns = {f"{m}_{stat}" for m in metrics for stat in ["mean", "std", "ci95"]}
+        df = pd.read_csv(filename, usecols=lambda c: c in columns)
         metric_values = _agg_mean_std(df, metrics)
         d = [metric_values.get(m, {}).get("mean", 0.0) for m in metrics]
         d += d[:1]
@@ -271,7 +273,7 @@ def plot_violin_goals(combo, title, results_dir="results", save_path=None):
         path = os.path.join(results_dir, f"{combo}_{lib}_run-0.csv")
         if not os.path.exists(path):
             continue
-        df = pd.read_csv(path)
+        df = pd.read_csv(path, usecols=lambda c: c == "num_goals_reached_mean")
         if "num_goals_reached_mean" in df.columns:
             df["lib"] = lib
             dfs.append(df)
@@ -293,7 +295,7 @@ def plot_ribbon_tracking(combo, title, results_dir="results", save_path=None):
         path = os.path.join(results_dir, f"{combo}_{lib}_run-0.csv")
         if not os.path.exists(path):
             continue
-        df = pd.read_csv(path)
+        df = pd.read_csv(path, usecols=lambda c: c == "tracking_error_mean")
         if "tracking_error_mean" in df.columns:
             df["lib"] = lib
             dfs.append(df)
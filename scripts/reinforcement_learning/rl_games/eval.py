@@ -3,7 +3,19 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
-"""Script to play a checkpoint if an RL agent from RL-Games."""
+"""Script to play a checkpoint if an RL agent from RL-Games.
+
+Several checkpoints of the same robot and task can be evaluated in a single simulator process with ``--checkpoints``.
+They either share the environments, each policy acting on its own slice, or run one after the other on all the
+environments reset with the same seed. One result is written per checkpoint.
+
+.. code-block:: bash
+
+    ./isaaclab.sh -p scripts/reinforcement_learning/rl_games/eval.py --task Isaac-RANS-Single-v0 --num_envs 1024 \
+        --checkpoints "logs/rl_games/*/nn/*.pth" --multi_mode sequential --headless \
+        env.robot_name=FloatingPlatform env.task_name=GoToPose
+
+"""
 
 """Launch Isaac Sim Simulator first."""
 
@@ -22,6 +34,24 @@ parser.add_argument(
 parser.add_argument("--num_envs", type=int, default=None, help="Number of environments to simulate.")
 parser.add_argument("--task", type=str, default=None, help="Name of the task.")
 parser.add_argument("--checkpoint", type=str, default=None, help="Path to model checkpoint.")
+parser.add_argument(
+    "--checkpoints",
+    type=str,
+    nargs="+",
+    default=None,
+    help="Paths or glob patterns of checkpoints of the same robot and task, evaluated in a single simulator process.",
+)
+parser.add_argument(
+    "--multi_mode",
+    type=str,
+    default="partition",
+    choices=["partition", "sequential"],
+    help=(
+        "How several checkpoints are evaluated: on slices of the environments at the same time, or one after the"
+        " other on all the environments, reset with the same seed."
+    ),
+)
+parser.add_argument("--eval_seed", type=int, default=0, help="Seed of the resets of the sequential evaluations.")
 parser.add_argument(
     "--use_last_checkpoint",
     action="store_true",
@@ -39,6 +69,12 @@ parser.add_argument(
     default=512,
     help="The maximum number of steps in an episode.",
 )
+parser.add_argument(
+    "--results_dir",
+    type=str,
+    default="results",
+    help="Directory where the per-run CSV files of the metrics are written.",
+)
 
 # append AppLauncher cli args
 AppLauncher.add_app_launcher_args(parser)
@@ -59,7 +95,6 @@ simulation_app = app_launcher.app
 
 import gymnasium as gym
 import math
-import numpy as np
 import os
 
 from rl_games.common import env_configurations, vecenv
@@ -78,8 +113,16 @@ from isaaclab.utils.dict import print_dict
 
 from isaaclab_rl.rl_games import RlGamesGpuEnv, RlGamesVecEnvWrapper
 
+from isaaclab_tasks.rans.utils.multi_checkpoint import (
+    act_partitioned,
+    partition_envs,
+    reseed_env,
+    resolve_checkpoints,
+    split_episode_data,
+)
 from isaaclab_tasks.rans.utils.performance_evaluator_v2 import PerformanceEvaluatorV2
 from isaaclab_tasks.rans.utils.plot_eval_multi import plot_episode_data_virtual
+from isaaclab_tasks.rans.utils.rollout_recorder import RolloutRecorder
 from isaaclab_tasks.utils import get_checkpoint_path
 from isaaclab_tasks.utils.hydra import hydra_task_config
 
@@ -100,7 +143,9 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
     log_root_path = os.path.abspath(log_root_path)
     print(f"[INFO] Loading experiment from directory: {log_root_path}")
     # find checkpoint
-    if args_cli.checkpoint is None:
+    if args_cli.checkpoints:
+        checkpoints = resolve_checkpoints(args_cli.checkpoints)
+    elif args_cli.checkpoint is None:
         # specify directory for logging runs
         run_dir = agent_cfg["params"]["config"].get("full_experiment_name", ".*")
         # specify name of checkpoint
@@ -110,10 +155,11 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
             # this loads the best checkpoint
             checkpoint_file = f"{agent_cfg['params']['config']['name']}.pth"
         # get path to previous checkpoint
-        resume_path = get_checkpoint_path(log_root_path, run_dir, checkpoint_file, other_dirs=["nn"])
+        checkpoints = [get_checkpoint_path(log_root_path, run_dir, checkpoint_file, other_dirs=["nn"])]
     else:
-        resume_path = retrieve_file_path(args_cli.checkpoint)
-    log_dir = os.path.dirname(os.path.dirname(resume_path))
+        checkpoints = [retrieve_file_path(args_cli.checkpoint)]
+    log_dirs = [os.path.dirname(os.path.dirname(checkpoint)) for checkpoint in checkpoints]
+    log_dir = log_dirs[0]
 
     # wrap around environment for rl-games
     rl_device = agent_cfg["params"]["config"]["device"]
@@ -150,8 +196,7 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
 
     # load previously trained model
     agent_cfg["params"]["load_checkpoint"] = True
-    agent_cfg["params"]["load_path"] = resume_path
-    print(f"[INFO]: Loading model checkpoint from: {agent_cfg['params']['load_path']}")
+    agent_cfg["params"]["load_path"] = checkpoints[0]
 
     if "Single" in args_cli.task:
         task_name = env.env.cfg.task_name
@@ -168,66 +213,76 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
     runner = Runner()
     runner.load(agent_cfg)
 
-    # obtain the agent from the runner
-    agent: BasePlayer = runner.create_player()
-    agent.restore(resume_path)
-    agent.reset()
-
-    # Declare dictionary to store obs, actions, and rewards
-    ep_data = {"act": [], "obs": [], "rews": [], "dones": []}
+    # obtain one agent per checkpoint from the runner, all of them acting on the same environment
+    agents: list[BasePlayer] = []
+    for checkpoint in checkpoints:
+        print(f"[INFO]: Loading model checkpoint from: {checkpoint}")
+        agent = runner.create_player()
+        agent.restore(checkpoint)
+        agent.reset()
+        agents.append(agent)
 
     horizon = args_cli.horizon if args_cli.horizon is not None else 512
-    # reset environment
-    obs = env.reset()
-    if isinstance(obs, dict):
-        obs = obs["obs"]
-    timestep = 0
-    # required: enables the flag for batched observations
-    _ = agent.get_batch_size(obs, 1)
-
-    # simulate environment
-    # note: We simplified the logic in rl-games player.py (:func:`BasePlayer.run()`) function in an
-    #   attempt to have complete control over environment stepping. However, this removes other
-    #   operations such as masking that is used for multi-agent learning by RL-Games.
-    # while simulation_app.is_running():
-
-    print("Evaluation started over ", horizon, " steps for ", args_cli.num_envs, " environments.")
-    for _ in range(horizon):
-        # run everything in inference mode
-        # with torch.inference_mode():
-        # convert obs to agent format
-        obs = agent.obs_to_torch(obs)
-        # agent stepping
-        actions = agent.get_action(obs, is_deterministic=True)
-        # env stepping
-        obs, rews, dones, _ = env.step(actions)
-
-        ep_data["act"].append(actions.cpu().numpy())
-        ep_data["obs"].append(obs.cpu().numpy())
-        ep_data["rews"].append(rews.cpu().numpy())
-        ep_data["dones"].append(dones.cpu().numpy())
-
-        if args_cli.video:
-            timestep += 1
-            # Exit the play loop after recording one video
-            if timestep == args_cli.video_length:
-                break
-
-    # Convert data to numpy arrays
-    ep_data["obs"], ep_data["rews"], ep_data["act"] = map(np.array, (ep_data["obs"], ep_data["rews"], ep_data["act"]))
-
-    save_dir = os.path.join(log_root_path, log_dir, f"eval_{args_cli.num_envs}_envs", task_name)
-    print("Saving plots in ", save_dir)
-
-    # Plot the episode data
-    if print_all_agents:
-        print("Plotting data for all agents.")
-        plot_episode_data_virtual(
-            ep_data,
-            save_dir=save_dir,
-            task=task_name,
-            all_agents=print_all_agents,
+
+    save_dirs = [os.path.join(log_root_path, path, f"eval_{args_cli.num_envs}_envs", task_name) for path in log_dirs]
+
+    def rollout(agents: list[BasePlayer], env_slices: list[slice], save_path: str) -> dict:
+        # Record obs, actions, and rewards on the device, flushed in chunks to memory-mapped files
+        recorder = RolloutRecorder(horizon, env.unwrapped.num_envs, rl_device, save_path=save_path)
+        # reset environment
+        obs = env.reset()
+        if isinstance(obs, dict):
+            obs = obs["obs"]
+        timestep = 0
+        # required: enables the flag for batched observations
+        for agent, env_slice in zip(agents, env_slices):
+            _ = agent.get_batch_size(obs[env_slice], 1)
+        policies = [lambda obs, agent=agent: agent.get_action(obs, is_deterministic=True) for agent in agents]
+
+        # simulate environment
+        # note: We simplified the logic in rl-games player.py (:func:`BasePlayer.run()`) function in an
+        #   attempt to have complete control over environment stepping. However, this removes other
+        #   operations such as masking that is used for multi-agent learning by RL-Games.
+        # while simulation_app.is_running():
+
+        print("Evaluation started over ", horizon, " steps for ", args_cli.num_envs, " environments.")
+        for _ in range(horizon):
+            # run everything in inference mode
+            # with torch.inference_mode():
+            # convert obs to agent format
+            obs = agents[0].obs_to_torch(obs)
+            # agent stepping, each policy acts on its slice of the environments
+            actions = act_partitioned(policies, obs, env_slices)
+            # env stepping
+            obs, rews, dones, _ = env.step(actions)
+
+            recorder.record(act=actions, obs=obs, rews=rews, dones=dones)
+
+            if args_cli.video:
+                timestep += 1
+                # Exit the play loop after recording one video
+                if timestep == args_cli.video_length:
+                    break
+
+        # Wait for the last chunks, the data is read lazily from the memory-mapped files
+        return recorder.finalize()
+
+    num_envs = env.unwrapped.num_envs
+    if len(checkpoints) == 1:
+        ep_datas = [rollout(agents, [slice(0, num_envs)], os.path.join(save_dirs[0], "rollout"))]
+    elif args_cli.multi_mode == "partition":
+        env_slices = partition_envs(num_envs, len(checkpoints))
+        save_path = os.path.join(
+            log_root_path, f"eval_{args_cli.num_envs}_envs_{len(checkpoints)}_checkpoints", task_name, "rollout"
         )
+        ep_datas = split_episode_data(rollout(agents, env_slices, save_path), env_slices)
+    else:
+        # every checkpoint starts from the same initial conditions
+        ep_datas = []
+        for agent, save_dir in zip(agents, save_dirs):
+            reseed_env(env.unwrapped, args_cli.eval_seed)
+            ep_datas.append(rollout([agent], [slice(0, num_envs)], os.path.join(save_dir, "rollout")))
+
     # Run performance evaluation
     # evaluator = PerformanceEvaluator(task_name, env.env.cfg.robot_name, ep_data, horizon)
     # evaluator = PerformanceMetrics(task_name, robot_name, ep_data, horizon, plot_metrics=False, save_path=save_dir)
@@ -237,11 +292,34 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
     # print_dict(results, nesting=4)
 
     combo_id = f"{robot_name}_{task_name}_rl_games"  # lib is 'skrl' or 'rlgames'
-    evaluator = PerformanceEvaluatorV2(task_name, robot_name, "rl_games", ep_data, horizon, combo_id, seed=0)
-    metrics = evaluator.evaluate()
-    evaluator.save_csv()  # writes per-run CSV
-    evaluator.export_timeseries_metrics()
-    print_dict(metrics, nesting=4)
+    # one result per checkpoint, the index of the checkpoint is used as the run id
+    for run_id, (checkpoint, ep_data, save_dir) in enumerate(zip(checkpoints, ep_datas, save_dirs)):
+        print("Saving plots in ", save_dir)
+
+        # Plot the episode data
+        if print_all_agents:
+            print("Plotting data for all agents.")
+            plot_episode_data_virtual(
+                ep_data,
+                save_dir=save_dir,
+                task=task_name,
+                all_agents=print_all_agents,
+            )
+        evaluator = PerformanceEvaluatorV2(
+            task_name,
+            robot_name,
+            "rl_games",
+            ep_data,
+            horizon,
+            combo_id,
+            seed=run_id,
+            results_dir=args_cli.results_dir,
+        )
+        metrics = evaluator.evaluate()
+        evaluator.save_csv()  # writes per-run CSV
+        evaluator.export_timeseries_metrics()
+        print(f"[INFO] Metrics of {checkpoint} (run {run_id}):")
+        print_dict(metrics, nesting=4)
 
     # close the simulator
     env.close()
@@ -3,68 +3,284 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+"""Script to evaluate the checkpoints of every robot-task-library combination.
+
+The evaluations run in parallel, in a pool of worker slots that each launch one ``eval.py`` process at a time. Every
+evaluation writes its output to its own log file, and is killed if it exceeds the timeout.
+
+The state of the sweep is kept in a JSON manifest. Each job is identified by a hash of the content of its
+checkpoint and of its configuration (the evaluation parameters and the ``params`` files of the run). A job that
+completed with the same hash is skipped, so an interrupted or partially failed sweep resumes where it stopped, and a
+new checkpoint is evaluated again. Once all the jobs are done, the per-run CSV files of the evaluator are aggregated
+into a single table.
+
+The dry-run mode replaces the evaluation command by a stub, to check the scheduling without launching the simulator.
+
+.. code-block:: bash
+
+    python scripts/reinforcement_learning/run_all_evals.py --num_workers 2 --gpus 0 1 --timeout 3600
+
+"""
+
+import argparse
+import concurrent.futures
+import glob
+import hashlib
+import json
 import os
+import signal
 import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
 from itertools import product
 
-robots = ["FloatingPlatform", "Kingfisher", "Turtlebot2", "Jetbot", "Leatherback"]
-tasks = ["GoToPosition", "GoToPose", "GoThroughPositions", "TrackVelocities"]
-rl_libs = ["skrl", "rl_games"]
-
-# Root directories
-checkpoint_dir = "navbench_models"
-results_dir = "results"
-os.makedirs(results_dir, exist_ok=True)
-
-# Common parameters
-horizon = 600
-num_envs = 1024
-
-for robot, task, rl_lib in product(robots, tasks, rl_libs):
-    combo = f"{robot}_{task}_{rl_lib}"
-    # get the right checkpoint path from the checkpoint directory (robot-task-rl_lib)
-    checkpoint_path = os.path.join(checkpoint_dir, combo)
-    episode_length_s = 60.0 if task == "GoThroughPositions" else 40.0
-    horizon = 1000 if task == "GoThroughPositions" else 600
-
-    if not checkpoint_path or not os.path.exists(checkpoint_path):
-        print(f"Checkpoint not found for combo: {combo}. Skipping...")
-        continue
-    results_path = os.path.join(results_dir, f"{combo}.csv")
-
-    print(f"Running eval for {combo}...")
-
-    algorithm = "ppo-discrete" if robot == "FloatingPlatform" else "ppo"
-
-    model_dir = "checkpoints/best_agent.pt" if rl_lib == "skrl" else "nn/" + str(robot) + "-" + str(task) + ".pth"
-    checkpoint_path = os.path.join(checkpoint_path, model_dir)
-    if not os.path.exists(checkpoint_path):
-        print(f"Checkpoint file not found at {checkpoint_path}. Skipping...")
-        continue
-
-    base_command = [
-        "./isaaclab.sh",
-        "-p",
-        f"scripts/reinforcement_learning/{rl_lib}/eval.py",
-        "--task",
-        "Isaac-RANS-Single-v0",
-        "--num_envs",
-        str(num_envs),
-        "--checkpoint",
-        checkpoint_path,
-        "--headless",
-        "--algorithm",
-        algorithm,
-        "--horizon",
-        str(horizon),
-        f"env.robot_name={robot}",
-        f"env.task_name={task}",
-        f"env.episode_length_s={str(episode_length_s)}",
-        # "--save_metrics_path", results_path,
-    ]
-    # Execute the command
-    try:
-        subprocess.run(base_command, check=True)
-    except subprocess.CalledProcessError as e:
-        print(f"Error occurred while executing command: {e}")
-        continue
+ROBOTS = ["FloatingPlatform", "Kingfisher", "Turtlebot2", "Jetbot", "Leatherback"]
+TASKS = ["GoToPosition", "GoToPose", "GoThroughPositions", "TrackVelocities"]
+RL_LIBS = ["skrl", "rl_games"]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Evaluate the checkpoints of every robot-task-library combination.")
+    parser.add_argument("--robots", type=str, nargs="+", default=ROBOTS, help="Robots to evaluate.")
+    parser.add_argument("--tasks", type=str, nargs="+", default=TASKS, help="Tasks to evaluate.")
+    parser.add_argument("--rl_libs", type=str, nargs="+", default=RL_LIBS, help="RL libraries to evaluate.")
+    parser.add_argument("--checkpoint_dir", type=str, default="navbench_models", help="Root of the checkpoints.")
+    parser.add_argument(
+        "--results_dir",
+        type=str,
+        default="results",
+        help="Directory where the evaluator writes the per-run CSV files, the logs and the manifest are stored there.",
+    )
+    parser.add_argument("--num_envs", type=int, default=1024, help="Number of environments of each evaluation.")
+    parser.add_argument("--num_workers", type=int, default=1, help="Number of evaluations running at the same time.")
+    parser.add_argument(
+        "--gpus", type=str, nargs="*", default=[], help="GPUs assigned to the worker slots, in a round-robin fashion."
+    )
+    parser.add_argument("--timeout", type=float, default=None, help="Timeout of an evaluation, in seconds.")
+    parser.add_argument(
+        "--force", action="store_true", default=False, help="Evaluate again the jobs that are already completed."
+    )
+    parser.add_argument(
+        "--dry_run", action="store_true", default=False, help="Run a stub command instead of the evaluations."
+    )
+    parser.add_argument(
+        "--stub_duration", type=float, default=0.5, help="Duration of the stub command of the dry run, in seconds."
+    )
+    return parser.parse_args()
+
+
+@dataclass
+class EvalJob:
+    """An evaluation of a robot-task-library combination."""
+
+    combo: str
+    checkpoint_path: str
+    command: list[str]
+    config_files: list[str] = field(default_factory=list)
+    content_hash: str = ""
+
+
+@dataclass
+class JobRecord:
+    """The state of a job in the manifest."""
+
+    combo: str
+    content_hash: str
+    status: str  # one of "running", "done", "failed", "timeout"
+    log_path: str
+    returncode: int | None = None
+    started_at: float | None = None
+    duration_s: float | None = None
+
+
+def build_jobs(args) -> list[EvalJob]:
+    """Build the evaluation jobs of the combinations whose checkpoint exists."""
+    jobs = []
+    for robot, task, rl_lib in product(args.robots, args.tasks, args.rl_libs):
+        combo = f"{robot}_{task}_{rl_lib}"
+        # get the right checkpoint path from the checkpoint directory (robot-task-rl_lib)
+        run_dir = os.path.join(args.checkpoint_dir, combo)
+        episode_length_s = 60.0 if task == "GoThroughPositions" else 40.0
+        horizon = 1000 if task == "GoThroughPositions" else 600
+        algorithm = "ppo-discrete" if robot == "FloatingPlatform" else "ppo"
+        model_dir = "checkpoints/best_agent.pt" if rl_lib == "skrl" else "nn/" + str(robot) + "-" + str(task) + ".pth"
+        checkpoint_path = os.path.join(run_dir, model_dir)
+        if not os.path.exists(checkpoint_path) and not args.dry_run:
+            print(f"[INFO] Checkpoint not found for combo: {combo}. Skipping...")
+            continue
+
+        command = [
+            "./isaaclab.sh",
+            "-p",
+            f"scripts/reinforcement_learning/{rl_lib}/eval.py",
+            "--task",
+            "Isaac-RANS-Single-v0",
+            "--num_envs",
+            str(args.num_envs),
+            "--checkpoint",
+            checkpoint_path,
+            "--headless",
+            "--algorithm",
+            algorithm,
+            "--horizon",
+            str(horizon),
+            "--results_dir",
+            args.results_dir,
+            f"env.robot_name={robot}",
+            f"env.task_name={task}",
+            f"env.episode_length_s={str(episode_length_s)}",
+        ]
+        config_files = sorted(glob.glob(os.path.join(run_dir, "params", "*")))
+        jobs.append(EvalJob(combo, checkpoint_path, command, config_files))
+    return jobs
+
+
+def hash_job(job: EvalJob) -> str:
+    """Hash the content of the checkpoint and the configuration of a job."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps(job.command).encode())
+    for path in [job.checkpoint_path] + job.config_files:
+        digest.update(path.encode())
+        if not os.path.isfile(path):
+            continue
+        with open(path, "rb") as file:
+            for block in iter(lambda: file.read(1 << 20), b""):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def load_manifest(path: str) -> dict[str, JobRecord]:
+    """Load the records of the jobs from the manifest."""
+    if not os.path.exists(path):
+        return {}
+    with open(path) as file:
+        return {combo: JobRecord(**record) for combo, record in json.load(file).items()}
+
+
+def save_manifest(path: str, records: dict[str, JobRecord]) -> None:
+    """Save the records of the jobs to the manifest. The file is replaced atomically."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as file:
+        json.dump({combo: asdict(record) for combo, record in records.items()}, file, indent=2)
+    os.replace(tmp_path, path)
+
+
+def run_job(job: EvalJob, log_path: str, timeout: float | None, env: dict[str, str]) -> tuple[int | None, str]:
+    """Run the command of a job, killing its process group on timeout.
+
+    Returns:
+        The return code of the command, None on timeout, and the status of the job.
+    """
+    with open(log_path, "w") as log_file:
+        log_file.write(f"$ {' '.join(job.command)}\n")
+        log_file.flush()
+        process = subprocess.Popen(
+            job.command, stdout=log_file, stderr=subprocess.STDOUT, env=env, start_new_session=True
+        )
+        try:
+            returncode = process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            # isaaclab.sh spawns the python process, the whole process group is killed
+            os.killpg(process.pid, signal.SIGKILL)
+            process.wait()
+            return None, "timeout"
+    return returncode, "done" if returncode == 0 else "failed"
+
+
+def aggregate_results(results_dir: str, records: dict[str, JobRecord]) -> None:
+    """Aggregate the per-run CSV files of the completed jobs into a single table."""
+    rows = []
+    for combo, record in sorted(records.items()):
+        row = {"combo": combo, "status": record.status, "duration_s": record.duration_s}
+        run_files = sorted(glob.glob(os.path.join(results_dir, f"{combo}_run-*.csv")))
+        if record.status == "done" and run_files:
+            import pandas as pd
+
+            metrics = pd.concat([pd.read_csv(run_file) for run_file in run_files], ignore_index=True)
+            row.update(metrics.mean(numeric_only=True).drop(labels=["seed"], errors="ignore").to_dict())
+        rows.append(row)
+    if not rows:
+        print("[INFO] No evaluation to aggregate.")
+        return
+
+    import pandas as pd
+
+    table = pd.DataFrame(rows)
+    summary_path = os.path.join(results_dir, "eval_summary.csv")
+    table.to_csv(summary_path, index=False)
+    print(table.to_string(index=False))
+    print(f"[INFO] Aggregated results saved to {summary_path}")
+
+
+def main():
+    args = parse_args()
+    os.makedirs(args.results_dir, exist_ok=True)
+    log_dir = os.path.join(args.results_dir, "logs")
+    os.makedirs(log_dir, exist_ok=True)
+    manifest_path = os.path.join(
+        args.results_dir, "eval_manifest_dry_run.json" if args.dry_run else "eval_manifest.json"
+    )
+    records = load_manifest(manifest_path)
+
+    jobs = build_jobs(args)
+    pending = []
+    for job in jobs:
+        job.content_hash = hash_job(job)
+        record = records.get(job.combo)
+        if (
+            not args.force
+            and record is not None
+            and record.status == "done"
+            and record.content_hash == job.content_hash
+        ):
+            print(f"[INFO] {job.combo} is already evaluated. Skipping...")
+            continue
+        if args.dry_run:
+            job.command = [
+                sys.executable,
+                "-c",
+                f"import time; print({json.dumps(' '.join(job.command))}); time.sleep({args.stub_duration})",
+            ]
+        pending.append(job)
+    print(f"[INFO] {len(pending)} evaluations to run, {len(jobs) - len(pending)} already done.")
+
+    def launch(job: EvalJob, slot: int) -> tuple[EvalJob, int | None, str, float]:
+        env = dict(os.environ)
+        if args.gpus:
+            env["CUDA_VISIBLE_DEVICES"] = args.gpus[slot % len(args.gpus)]
+        start_time = time.time()
+        returncode, status = run_job(job, os.path.join(log_dir, f"{job.combo}.log"), args.timeout, env)
+        return job, returncode, status, time.time() - start_time
+
+    # the worker slots are reused in order, such that each slot keeps its GPU
+    free_slots = list(range(args.num_workers))
+    futures = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args.num_workers) as executor:
+        queue = list(pending)
+        while queue or futures:
+            while queue and free_slots:
+                job, slot = queue.pop(0), free_slots.pop(0)
+                records[job.combo] = JobRecord(
+                    job.combo, job.content_hash, "running", os.path.join(log_dir, f"{job.combo}.log"), None, time.time()
+                )
+                save_manifest(manifest_path, records)
+                print(f"[INFO] Running eval for {job.combo} (slot {slot})...")
+                futures[executor.submit(launch, job, slot)] = slot
+            done, _ = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                free_slots.append(futures.pop(future))
+                job, returncode, status, duration = future.result()
+                record = records[job.combo]
+                record.status, record.returncode, record.duration_s = status, returncode, duration
+                save_manifest(manifest_path, records)
+                print(f"[INFO] {job.combo}: {status} in {duration:.1f} s (log: {record.log_path})")
+
+    failed = [combo for combo, record in records.items() if record.status != "done"]
+    if failed:
+        print(f"[WARN] {len(failed)} evaluations did not complete: {failed}")
+    aggregate_results(args.results_dir, {job.combo: records[job.combo] for job in jobs if job.combo in records})
+
+
+if __name__ == "__main__":
+    main()
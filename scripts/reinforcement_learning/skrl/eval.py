@@ -3,7 +3,19 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
-"""Script to play a checkpoint if an RL agent from skrl."""
+"""Script to play a checkpoint if an RL agent from skrl.
+
+Several checkpoints of the same robot and task can be evaluated in a single simulator process with ``--checkpoints``.
+They either share the environments, each policy acting on its own slice, or run one after the other on all the
+environments reset with the same seed. One result is written per checkpoint.
+
+.. code-block:: bash
+
+    ./isaaclab.sh -p scripts/reinforcement_learning/skrl/eval.py --task Isaac-RANS-Single-v0 --num_envs 1024 \
+        --checkpoints "logs/skrl/Single/*/checkpoints/best_agent.pt" --multi_mode partition --headless \
+        env.robot_name=FloatingPlatform env.task_name=GoToPose
+
+"""
 
 """Launch Isaac Sim Simulator first."""
 
@@ -22,6 +34,24 @@ parser.add_argument(
 parser.add_argument("--num_envs", type=int, default=None, help="Number of environments to simulate.")
 parser.add_argument("--task", type=str, default=None, help="Name of the task.")
 parser.add_argument("--checkpoint", type=str, default=None, help="Path to model checkpoint.")
+parser.add_argument(
+    "--checkpoints",
+    type=str,
+    nargs="+",
+    default=None,
+    help="Paths or glob patterns of checkpoints of the same robot and task, evaluated in a single simulator process.",
+)
+parser.add_argument(
+    "--multi_mode",
+    type=str,
+    default="partition",
+    choices=["partition", "sequential"],
+    help=(
+        "How several checkpoints are evaluated: on slices of the environments at the same time, or one after the"
+        " other on all the environments, reset with the same seed."
+    ),
+)
+parser.add_argument("--eval_seed", type=int, default=0, help="Seed of the resets of the sequential evaluations.")
 parser.add_argument(
     "--ml_framework",
     type=str,
@@ -42,6 +72,12 @@ parser.add_argument(
     default=512,
     help="The maximum number of steps in an episode.",
 )
+parser.add_argument(
+    "--results_dir",
+    type=str,
+    default="results",
+    help="Directory where the per-run CSV files of the metrics are written.",
+)
 
 # append AppLauncher cli args
 AppLauncher.add_app_launcher_args(parser)
@@ -60,8 +96,8 @@ simulation_app = app_launcher.app
 
 """Rest everything follows."""
 
+import copy
 import gymnasium as gym
-import numpy as np
 import os
 import torch
 
@@ -79,8 +115,10 @@ if version.parse(skrl.__version__) < version.parse(SKRL_VERSION):
 
 if args_cli.ml_framework.startswith("torch"):
     from skrl.utils.runner.torch import Runner
+    from skrl.utils.spaces.torch import flatten_tensorized_space, tensorize_space
 elif args_cli.ml_framework.startswith("jax"):
     from skrl.utils.runner.jax import Runner
+    from skrl.utils.spaces.jax import flatten_tensorized_space, tensorize_space
 
 from isaaclab.envs import (
     DirectMARLEnv,
@@ -93,8 +131,16 @@ from isaaclab.utils.dict import print_dict
 
 from isaaclab_rl.skrl import SkrlVecEnvWrapper
 
+from isaaclab_tasks.rans.utils.multi_checkpoint import (
+    act_partitioned,
+    partition_envs,
+    reseed_env,
+    resolve_checkpoints,
+    split_episode_data,
+)
 from isaaclab_tasks.rans.utils.performance_evaluator_v2 import PerformanceEvaluatorV2
 from isaaclab_tasks.rans.utils.plot_eval_multi import plot_episode_data_virtual
+from isaaclab_tasks.rans.utils.rollout_recorder import RolloutRecorder
 from isaaclab_tasks.utils import get_checkpoint_path
 from isaaclab_tasks.utils.hydra import hydra_task_config
 
@@ -139,14 +185,19 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
     # log_root_path = os.path.join("logs", "skrl", experiment_cfg["agent"]["experiment"]["directory"])
     log_root_path = os.path.abspath(log_root_path)
     print(f"[INFO] Loading experiment from directory: {log_root_path}")
-    # get checkpoint path
-    if args_cli.checkpoint:
-        resume_path = os.path.abspath(args_cli.checkpoint)
+    # get checkpoint paths
+    if args_cli.checkpoints:
+        checkpoints = resolve_checkpoints(args_cli.checkpoints)
+    elif args_cli.checkpoint:
+        checkpoints = [os.path.abspath(args_cli.checkpoint)]
     else:
-        resume_path = get_checkpoint_path(
-            log_root_path, run_dir=f".*_{algorithm}_{args_cli.ml_framework}", other_dirs=["checkpoints"]
-        )
-    log_dir = os.path.dirname(os.path.dirname(resume_path))
+        checkpoints = [
+            get_checkpoint_path(
+                log_root_path, run_dir=f".*_{algorithm}_{args_cli.ml_framework}", other_dirs=["checkpoints"]
+            )
+        ]
+    log_dirs = [os.path.dirname(os.path.dirname(checkpoint)) for checkpoint in checkpoints]
+    log_dir = log_dirs[0]
 
     # wrap for video recording
     if args_cli.video:
@@ -168,9 +219,7 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
     experiment_cfg["trainer"]["close_environment_at_exit"] = False
     experiment_cfg["agent"]["experiment"]["write_interval"] = 0  # don't log to TensorBoard
     experiment_cfg["agent"]["experiment"]["checkpoint_interval"] = 0  # don't generate checkpoints
-    runner = Runner(env, experiment_cfg)
 
-    print(f"[INFO] Loading model checkpoint from: {resume_path}")
     if "Single" in args_cli.task:
         task_name = env.env.cfg.task_name
     else:
@@ -178,12 +227,15 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
 
     print_all_agents = False
 
-    runner.agent.load(resume_path)
-    # set agent to evaluation mode
-    runner.agent.set_running_mode("eval")
-
-    # Declare dictionary to store obs, actions, and rewards
-    ep_data = {"act": [], "obs": [], "rews": [], "dones": [], "terminations": []}
+    # one agent per checkpoint, all of them acting on the same environment
+    policies = []
+    for checkpoint in checkpoints:
+        runner = Runner(env, copy.deepcopy(experiment_cfg))
+        print(f"[INFO] Loading model checkpoint from: {checkpoint}")
+        runner.agent.load(checkpoint)
+        # set agent to evaluation mode
+        runner.agent.set_running_mode("eval")
+        policies.append(lambda obs, agent=runner.agent: agent.act(obs, timestep=0, timesteps=0)[0])
 
     # #if horizon is an argument, use it, otherwise use 250
     # if hasattr(env.env.cfg, "horizon"):
@@ -191,46 +243,52 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
     # else:
     horizon = args_cli.horizon if args_cli.horizon is not None else 512
 
-    # reset environment
-    obs, _ = env.reset()
-    timestep = 0
-    # simulate environment
-    # while simulation_app.is_running():
-    print("Evaluation started over ", horizon, " steps for ", args_cli.num_envs, " environments.")
-
-    for _ in range(horizon):  # run everything in inference mode
-        with torch.inference_mode():
-            # agent stepping
-            actions = runner.agent.act(obs, timestep=0, timesteps=0)[0]
-            # env stepping
-            obs, rews, dones, terminations, _ = env.step(actions)
-            ep_data["act"].append(actions.cpu().numpy())
-            ep_data["obs"].append(obs.cpu().numpy())
-            ep_data["rews"].append(rews.cpu().numpy())
-            ep_data["dones"].append(dones.cpu().numpy())
-            ep_data["terminations"].append(terminations.cpu().numpy())
-
-        if args_cli.video:
-            timestep += 1
-            # Exit the play loop after recording one video
-            if timestep == args_cli.video_length:
-                break
-
-    # Convert data to numpy arrays
-    ep_data["rews"] = np.array(ep_data["rews"]).squeeze(axis=-1)
-    ep_data["obs"], ep_data["rews"], ep_data["act"] = map(np.array, (ep_data["obs"], ep_data["rews"], ep_data["act"]))
-
-    save_dir = os.path.join(log_root_path, log_dir, f"eval_{args_cli.num_envs}_envs", task_name)
-    print("Saving plots in ", save_dir)
-    # Plot the episode data
-    if print_all_agents:
-        print("Plotting data for all agents.")
-        plot_episode_data_virtual(
-            ep_data,
-            save_dir=save_dir,
-            task=task_name,
-            all_agents=print_all_agents,
+    save_dirs = [os.path.join(log_root_path, path, f"eval_{args_cli.num_envs}_envs", task_name) for path in log_dirs]
+
+    def rollout(policies: list, env_slices: list[slice], save_path: str) -> dict:
+        # Record obs, actions, and rewards on the device, flushed in chunks to memory-mapped files
+        recorder = RolloutRecorder(horizon, env.num_envs, env.device, save_path=save_path)
+
+        # reset environment, through the unwrapped environment as the skrl wrapper only resets it on its first call
+        obs, _ = env.unwrapped.reset()
+        obs = flatten_tensorized_space(tensorize_space(env.observation_space, obs["policy"]))
+        timestep = 0
+        # simulate environment
+        # while simulation_app.is_running():
+        print("Evaluation started over ", horizon, " steps for ", args_cli.num_envs, " environments.")
+
+        for _ in range(horizon):  # run everything in inference mode
+            with torch.inference_mode():
+                # agent stepping, each policy acts on its slice of the environments
+                actions = act_partitioned(policies, obs, env_slices)
+                # env stepping
+                obs, rews, dones, terminations, _ = env.step(actions)
+                recorder.record(act=actions, obs=obs, rews=rews.squeeze(-1), dones=dones, terminations=terminations)
+
+            if args_cli.video:
+                timestep += 1
+                # Exit the play loop after recording one video
+                if timestep == args_cli.video_length:
+                    break
+
+        # Wait for the last chunks, the data is read lazily from the memory-mapped files
+        return recorder.finalize()
+
+    if len(checkpoints) == 1:
+        ep_datas = [rollout(policies, [slice(0, env.num_envs)], os.path.join(save_dirs[0], "rollout"))]
+    elif args_cli.multi_mode == "partition":
+        env_slices = partition_envs(env.num_envs, len(checkpoints))
+        save_path = os.path.join(
+            log_root_path, f"eval_{args_cli.num_envs}_envs_{len(checkpoints)}_checkpoints", task_name, "rollout"
         )
+        ep_datas = split_episode_data(rollout(policies, env_slices, save_path), env_slices)
+    else:
+        # every checkpoint starts from the same initial conditions
+        ep_datas = []
+        for policy, save_dir in zip(policies, save_dirs):
+            reseed_env(env.unwrapped, args_cli.eval_seed)
+            ep_datas.append(rollout([policy], [slice(0, env.num_envs)], os.path.join(save_dir, "rollout")))
+
     # Run performance evaluation
     # evaluator = PerformanceEvaluator(task_name, env.env.cfg.robot_name, ep_data, horizon)
     # evaluator = PerformanceMetrics(
@@ -242,12 +300,34 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
     robot_name = env.env.cfg.robot_name
 
     combo_id = f"{robot_name}_{task_name}_skrl"  # lib is 'skrl' or 'rlgames'
-    evaluator = PerformanceEvaluatorV2(task_name, robot_name, "skrl", ep_data, horizon, combo_id, seed=0)
-    metrics = evaluator.evaluate()
-    evaluator.save_csv()  # writes per-run CSV
-    evaluator.export_timeseries_metrics()
+    # one result per checkpoint, the index of the checkpoint is used as the run id
+    for run_id, (checkpoint, ep_data, save_dir) in enumerate(zip(checkpoints, ep_datas, save_dirs)):
+        print("Saving plots in ", save_dir)
+        # Plot the episode data
+        if print_all_agents:
+            print("Plotting data for all agents.")
+            plot_episode_data_virtual(
+                ep_data,
+                save_dir=save_dir,
+                task=task_name,
+                all_agents=print_all_agents,
+            )
+        evaluator = PerformanceEvaluatorV2(
+            task_name,
+            robot_name,
+            "skrl",
+            ep_data,
+            horizon,
+            combo_id,
+            seed=run_id,
+            results_dir=args_cli.results_dir,
+        )
+        metrics = evaluator.evaluate()
+        evaluator.save_csv()  # writes per-run CSV
+        evaluator.export_timeseries_metrics()
 
-    print_dict(metrics, nesting=4)
+        print(f"[INFO] Metrics of {checkpoint} (run {run_id}):")
+        print_dict(metrics, nesting=4)
 
     # close the simulator
     env.close()
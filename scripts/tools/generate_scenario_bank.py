@@ -0,0 +1,111 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Generate a bank of evaluation scenarios for a robot-task pair.
+
+A scenario holds the seed of the task, the seed of the robot, and the generation actions (the difficulty parameters)
+of the task and of the robot used to reset an episode. The generation actions are stratified over the difficulty
+space, by blocks of ``--block_size`` consecutive scenarios. Setting the block size to the number of environments of
+the evaluation makes every round of episodes cover the difficulty space evenly.
+
+The bank is replayed by the environment when its path is given in ``env.scenario_bank_path``. All the evaluations
+using the same bank and the same number of environments then run the same episodes.
+
+.. code-block:: bash
+
+    ./isaaclab.sh -p scripts/tools/generate_scenario_bank.py --robot_name FloatingPlatform --task_name GoToPose \
+        --num_scenarios 4096 --block_size 512 --method lhs --output scenarios/FloatingPlatform_GoToPose.npz
+
+    ./isaaclab.sh -p scripts/reinforcement_learning/skrl/eval.py --task Isaac-RANS-Single-v0 --num_envs 512 \
+        --checkpoint model.pt --headless env.robot_name=FloatingPlatform env.task_name=GoToPose \
+        env.scenario_bank_path=scenarios/FloatingPlatform_GoToPose.npz
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Generate a bank of evaluation scenarios for a robot-task pair.")
+parser.add_argument("--robot_name", type=str, required=True, help="Name of the robot.")
+parser.add_argument("--task_name", type=str, required=True, help="Name of the task.")
+parser.add_argument("--num_scenarios", type=int, default=4096, help="Number of scenarios in the bank.")
+parser.add_argument(
+    "--block_size",
+    type=int,
+    default=None,
+    help="Number of consecutive scenarios stratified together, e.g. the number of environments of the evaluation.",
+)
+parser.add_argument(
+    "--method",
+    type=str,
+    default="lhs",
+    choices=["lhs", "grid", "uniform"],
+    help="Sampling of the generation actions: latin hypercube, jittered grid, or independent uniform samples.",
+)
+parser.add_argument("--low", type=float, default=0.0, help="Lower bound of the generation actions.")
+parser.add_argument("--high", type=float, default=1.0, help="Upper bound of the generation actions.")
+parser.add_argument("--seed", type=int, default=0, help="Seed of the generation.")
+parser.add_argument(
+    "--output", type=str, default=None, help="Path of the bank, defaults to scenarios/<robot>_<task>.npz"
+)
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# parse the arguments
+args_cli = parser.parse_args()
+args_cli.headless = True
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import os
+
+from isaaclab_tasks.rans import ROBOT_CFG_FACTORY, TASK_CFG_FACTORY
+from isaaclab_tasks.rans.utils import ScenarioBank
+
+
+def main():
+    robot_cfg = ROBOT_CFG_FACTORY(args_cli.robot_name)
+    task_cfg = TASK_CFG_FACTORY(args_cli.task_name)
+    output = args_cli.output
+    if output is None:
+        output = os.path.join("scenarios", f"{args_cli.robot_name}_{args_cli.task_name}.npz")
+
+    scenarios = ScenarioBank.generate(
+        args_cli.num_scenarios,
+        task_cfg.gen_space,
+        robot_cfg.gen_space,
+        seed=args_cli.seed,
+        method=args_cli.method,
+        block_size=args_cli.block_size,
+        low=args_cli.low,
+        high=args_cli.high,
+    )
+    metadata = {
+        "robot_name": args_cli.robot_name,
+        "task_name": args_cli.task_name,
+        "num_scenarios": args_cli.num_scenarios,
+        "block_size": args_cli.block_size,
+        "method": args_cli.method,
+        "low": args_cli.low,
+        "high": args_cli.high,
+        "seed": args_cli.seed,
+    }
+    ScenarioBank.save(output, scenarios, metadata)
+    print(
+        f"[INFO] Saved {args_cli.num_scenarios} scenarios ({task_cfg.gen_space} task and {robot_cfg.gen_space} robot"
+        f" generation actions) to {os.path.abspath(output)}"
+    )
+
+
+if __name__ == "__main__":
+    main()
+    simulation_app.close()
@@ -3,9 +3,38 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+"""Merge a set of HDF5 datasets.
+
+The episodes of the input files are renamed ``demo_<i>`` in the order of the input files, and in the order of the
+episodes within each file. The environment arguments of the first input file are kept. Four merge modes are
+available:
+
+* ``copy``: the episode groups are copied to the output file.
+* ``link``: the output file holds external links to the episode groups of the input files. No data is copied.
+* ``vds``: the output file holds virtual datasets mapping to the datasets of the input files. No data is copied. The
+  episodes packed into shared datasets by the :class:`~isaaclab.utils.datasets.HDF5DatasetFileHandler` are merged by
+  concatenating the shared datasets and rebuilding the index of the episodes.
+* ``compact``: the episodes are read by parallel worker processes and streamed, in order, into a chunked and
+  compressed output file, optionally packed into shared datasets.
+
+The ``link`` and ``vds`` outputs reference the input files by their absolute path: the input files must be kept, and
+moved along with the output file.
+
+.. code-block:: bash
+
+    ./isaaclab.sh -p scripts/tools/merge_hdf5_datasets.py --input_files a.hdf5 b.hdf5 --output_file merged.hdf5 \
+        --mode compact --num_workers 8 --compression gzip --packed
+
+"""
+
 import argparse
 import h5py
+import json
+import multiprocessing
+import numpy as np
 import os
+import re
+import time
 
 parser = argparse.ArgumentParser(description="Merge a set of HDF5 datasets.")
 parser.add_argument(
@@ -16,30 +45,261 @@ parser.add_argument(
     help="A list of paths to HDF5 files to merge.",
 )
 parser.add_argument("--output_file", type=str, default="merged_dataset.hdf5", help="File path to merged output.")
+parser.add_argument(
+    "--mode",
+    type=str,
+    default="copy",
+    choices=["copy", "link", "vds", "compact"],
+    help="How the episodes are merged, see the description of the script.",
+)
+parser.add_argument("--num_workers", type=int, default=4, help="Number of worker processes of the compact mode.")
+parser.add_argument(
+    "--compression",
+    type=str,
+    default="gzip",
+    choices=["none", "gzip", "lzf", "lz4"],
+    help="Compression of the datasets of the compact mode.",
+)
+parser.add_argument("--compression_opts", type=int, default=None, help="Options of the compression, e.g. gzip level.")
+parser.add_argument("--chunk_size", type=int, default=None, help="Number of steps per chunk of the compact mode.")
+parser.add_argument(
+    "--packed", action="store_true", default=False, help="Pack the episodes of the compact mode into shared datasets."
+)
 
 args_cli = parser.parse_args()
 
 
+def is_packed(data_group: h5py.Group) -> bool:
+    """Check if the episodes of a data group are packed into shared datasets."""
+    return data_group.attrs.get("layout", "") == "packed"
+
+
+def get_episode_names(data_group: h5py.Group) -> list[str]:
+    """Get the names of the episodes of a data group, in the order in which they were written."""
+    if is_packed(data_group):
+        return [json.loads(episode)["name"] for episode in data_group["_episodes"].asstr()[()]]
+    # h5py lists the groups in alphabetical order, demo_10 would come before demo_2
+    return sorted(data_group.keys(), key=lambda name: [int(s) if s.isdigit() else s for s in re.split(r"(\d+)", name)])
+
+
+def get_dataset_paths(group: h5py.Group) -> list[str]:
+    """Get the paths of the datasets of a group, relative to the group."""
+    paths = []
+    group.visititems(lambda name, obj: paths.append(name) if isinstance(obj, h5py.Dataset) else None)
+    return paths
+
+
+def has_dataset(input: h5py.File, group_name: str, path: str) -> bool:
+    """Check if the packed input file has the given dataset in the given group of its data group."""
+    return group_name in input["data"] and path in input["data"][group_name]
+
+
+def merge_demo_groups(output: h5py.File, inputs: list[h5py.File]) -> int:
+    """Merge the episode groups of the input files. Returns the number of bytes referenced by the output file."""
+    num_bytes = 0
+    episode_idx = 0
+    for input in inputs:
+        input_path = os.path.abspath(input.filename)
+        for episode in get_episode_names(input["data"]):
+            output_name = f"data/demo_{episode_idx}"
+            if args_cli.mode == "copy":
+                input.copy(f"data/{episode}", output, output_name)
+            elif args_cli.mode == "link":
+                output[output_name] = h5py.ExternalLink(input_path, f"data/{episode}")
+            else:
+                output_group = output.create_group(output_name)
+                input_group = input[f"data/{episode}"]
+
+                def copy_group_attrs(name, obj):
+                    if isinstance(obj, h5py.Group):
+                        output_group.require_group(name).attrs.update(obj.attrs)
+
+                output_group.attrs.update(input_group.attrs)
+                input_group.visititems(copy_group_attrs)
+                for path in get_dataset_paths(input_group):
+                    dataset = input_group[path]
+                    layout = h5py.VirtualLayout(shape=dataset.shape, dtype=dataset.dtype)
+                    layout[...] = h5py.VirtualSource(input_path, dataset.name, shape=dataset.shape)
+                    output_group.create_virtual_dataset(path, layout)
+            for path in get_dataset_paths(input[f"data/{episode}"]):
+                num_bytes += input[f"data/{episode}/{path}"].nbytes
+            episode_idx += 1
+    return num_bytes
+
+
+def merge_packed(output: h5py.File, inputs: list[h5py.File]) -> int:
+    """Merge the packed episodes of the input files with virtual datasets. Returns the number of bytes referenced."""
+    output_data = output["data"]
+    output_data.attrs["layout"] = "packed"
+
+    # the shared datasets are the concatenation of the shared datasets of the input files
+    value_paths = []
+    for input in inputs:
+        if "_values" in input["data"]:
+            for path in get_dataset_paths(input["data/_values"]):
+                if path not in value_paths:
+                    value_paths.append(path)
+    offsets = {path: [] for path in value_paths}
+    num_bytes = 0
+    for path in value_paths:
+        sources = [input["data/_values"][path] if has_dataset(input, "_values", path) else None for input in inputs]
+        num_rows = 0
+        for source in sources:
+            offsets[path].append(num_rows)
+            if source is not None:
+                num_rows += source.shape[0]
+        source = next(source for source in sources if source is not None)
+        layout = h5py.VirtualLayout(shape=(num_rows, *source.shape[1:]), dtype=source.dtype)
+        for input_idx, (input, source) in enumerate(zip(inputs, sources)):
+            if source is not None:
+                start = offsets[path][input_idx]
+                layout[start : start + source.shape[0]] = h5py.VirtualSource(
+                    os.path.abspath(input.filename), source.name, shape=source.shape
+                )
+                num_bytes += source.nbytes
+        output_data.create_virtual_dataset(f"_values/{path}", layout, fillvalue=0)
+
+    # the index of the episodes is rebuilt with the offsets of the input files
+    episodes = []
+    index = {path: [] for path in value_paths}
+    for input_idx, input in enumerate(inputs):
+        input_episodes = input["data/_episodes"].asstr()[()]
+        for path in value_paths:
+            if has_dataset(input, "_index", path):
+                input_index = input["data/_index"][path][()]
+                input_index[:, 0] += offsets[path][input_idx]
+                index[path].append(input_index)
+            else:
+                index[path].append(np.zeros((len(input_episodes), 2), dtype=np.int64))
+        for episode in input_episodes:
+            episode = json.loads(episode)
+            episode["name"] = f"demo_{len(episodes)}"
+            episodes.append(json.dumps(episode))
+    for path in value_paths:
+        output_data.create_dataset(f"_index/{path}", data=np.concatenate(index[path]), maxshape=(None, 2))
+    output_data.create_dataset(
+        "_episodes", data=np.array(episodes, dtype=object), dtype=h5py.string_dtype(), maxshape=(None,), chunks=True
+    )
+    return num_bytes
+
+
+"""
+Compact mode.
+"""
+
+_worker_handlers = {}
+
+
+def load_episode(task: tuple[str, str]) -> tuple[dict, object, object, int]:
+    """Load an episode of an input file in a worker process."""
+    from isaaclab.utils.datasets import HDF5DatasetFileHandler
+
+    filepath, episode_name = task
+    if filepath not in _worker_handlers:
+        _worker_handlers[filepath] = HDF5DatasetFileHandler()
+        _worker_handlers[filepath].open(filepath)
+    episode = _worker_handlers[filepath].load_episode(episode_name, device="cpu")
+
+    def to_numpy(data):
+        return {key: to_numpy(value) if isinstance(value, dict) else value.numpy() for key, value in data.items()}
+
+    data = to_numpy(episode.data)
+    num_bytes = sum(value.nbytes for value in _flatten(data))
+    return data, episode.seed, episode.success, num_bytes
+
+
+def _flatten(data: dict) -> list[np.ndarray]:
+    """Flatten the arrays of a nested dict."""
+    arrays = []
+    for value in data.values():
+        arrays.extend(_flatten(value) if isinstance(value, dict) else [value])
+    return arrays
+
+
+def merge_compact(inputs: list[h5py.File], env_args: str) -> int:
+    """Stream the episodes of the input files into a chunked and compressed output file."""
+    import torch
+
+    from isaaclab.utils.datasets import EpisodeData, HDF5DatasetFileHandler
+
+    tasks = [
+        (os.path.abspath(input.filename), episode) for input in inputs for episode in get_episode_names(input["data"])
+    ]
+    for input in inputs:
+        input.close()
+
+    handler = HDF5DatasetFileHandler(
+        compression=None if args_cli.compression == "none" else args_cli.compression,
+        compression_opts=args_cli.compression_opts,
+        chunk_size=args_cli.chunk_size,
+        packed=args_cli.packed,
+    )
+    handler.create(args_cli.output_file)
+    handler.add_env_args(json.loads(env_args))
+
+    num_bytes = 0
+    with multiprocessing.get_context("spawn").Pool(args_cli.num_workers) as pool:
+        # the episodes are written in order, while the next ones are read by the workers
+        for data, seed, success, episode_bytes in pool.imap(load_episode, tasks, chunksize=4):
+            episode = EpisodeData()
+
+            def to_torch(data):
+                return {
+                    key: to_torch(value) if isinstance(value, dict) else torch.from_numpy(value)
+                    for key, value in data.items()
+                }
+
+            episode.data = to_torch(data)
+            episode.seed = seed
+            episode.success = success
+            handler.write_episode(episode)
+            num_bytes += episode_bytes
+    handler.close()
+    return num_bytes
+
+
 def merge_datasets():
     for filepath in args_cli.input_files:
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"The dataset file {filepath} does not exist.")
 
-    with h5py.File(args_cli.output_file, "w") as output:
-        episode_idx = 0
-        copy_attributes = True
-
-        for filepath in args_cli.input_files:
+    if args_cli.mode == "compact" and not args_cli.output_file.endswith(".hdf5"):
+        args_cli.output_file += ".hdf5"
+    args_cli.output_file = os.path.abspath(args_cli.output_file)
 
-            with h5py.File(filepath, "r") as input:
-                for episode, data in input["data"].items():
-                    input.copy(f"data/{episode}", output, f"data/demo_{episode_idx}")
-                    episode_idx += 1
+    start_time = time.perf_counter()
+    inputs = [h5py.File(filepath, "r") for filepath in args_cli.input_files]
+    env_args = inputs[0]["data"].attrs["env_args"]
+    for input in inputs[1:]:
+        if input["data"].attrs["env_args"] != env_args:
+            print(f"[WARN] The environment arguments of {input.filename} differ from the first file, they are dropped.")
+    num_episodes = sum(len(get_episode_names(input["data"])) for input in inputs)
+    total = sum(int(input["data"].attrs.get("total", 0)) for input in inputs)
 
-                if copy_attributes:
-                    output["data"].attrs["env_args"] = input["data"].attrs["env_args"]
-                    copy_attributes = False
+    if args_cli.mode == "compact":
+        num_bytes = merge_compact(inputs, env_args)
+    else:
+        packed = [is_packed(input["data"]) for input in inputs]
+        if any(packed) and not (all(packed) and args_cli.mode == "vds"):
+            raise ValueError("The packed datasets can only be merged with each other, in the 'vds' or 'compact' modes.")
+        with h5py.File(args_cli.output_file, "w") as output:
+            output.create_group("data")
+            output["data"].attrs["env_args"] = env_args
+            output["data"].attrs["total"] = total
+            if all(packed):
+                num_bytes = merge_packed(output, inputs)
+            else:
+                num_bytes = merge_demo_groups(output, inputs)
+        for input in inputs:
+            input.close()
 
+    elapsed_time = time.perf_counter() - start_time
+    print(f"Merged {num_episodes} episodes from {len(args_cli.input_files)} files in {elapsed_time:.2f} s")
+    print(
+        f"Throughput: {num_episodes / elapsed_time:.1f} episodes/s, {num_bytes / elapsed_time / 2**20:.1f} MiB/s"
+        f" ({num_bytes / 2**20:.1f} MiB of episode data, output file of"
+        f" {os.path.getsize(args_cli.output_file) / 2**20:.1f} MiB)"
+    )
     print(f"Merged dataset saved to {args_cli.output_file}")
 
 
@@ -15,7 +15,7 @@ from prettytable import PrettyTable
 from typing import TYPE_CHECKING
 
 from isaaclab.utils import configclass
-from isaaclab.utils.datasets import EpisodeData, HDF5DatasetFileHandler
+from isaaclab.utils.datasets import EpisodeData, EpisodeDataBuffer, HDF5DatasetFileHandler
 
 from .manager_base import ManagerBase, ManagerTermBase
 from .manager_term_cfg import RecorderTermCfg
@@ -39,6 +39,9 @@ class RecorderManagerBaseCfg:
 
     dataset_file_handler_class_type: type = HDF5DatasetFileHandler
 
+    dataset_file_handler_kwargs: dict = dict()
+    """Keyword arguments passed to the dataset file handler, e.g. to write the episodes asynchronously."""
+
     dataset_export_dir_path: str = "/tmp/isaaclab/logs"
     """The directory path where the recorded datasets are exported."""
 
@@ -152,22 +155,22 @@ class RecorderManager(ManagerBase):
             raise TypeError("Configuration for the recorder manager is not of type RecorderManagerBaseCfg.")
 
         # create episode data buffer indexed by environment id
-        self._episodes: dict[int, EpisodeData] = dict()
-        for env_id in range(env.num_envs):
-            self._episodes[env_id] = EpisodeData()
+        self._episodes = EpisodeDataBuffer(env.num_envs)
 
         env_name = getattr(env.cfg, "env_name", None)
 
         self._dataset_file_handler = None
         if cfg.dataset_export_mode != DatasetExportMode.EXPORT_NONE:
-            self._dataset_file_handler = cfg.dataset_file_handler_class_type()
+            self._dataset_file_handler = cfg.dataset_file_handler_class_type(**cfg.dataset_file_handler_kwargs)
             self._dataset_file_handler.create(
                 os.path.join(cfg.dataset_export_dir_path, cfg.dataset_filename), env_name=env_name
             )
 
         self._failed_episode_dataset_file_handler = None
         if cfg.dataset_export_mode == DatasetExportMode.EXPORT_SUCCEEDED_FAILED_IN_SEPARATE_FILES:
-            self._failed_episode_dataset_file_handler = cfg.dataset_file_handler_class_type()
+            self._failed_episode_dataset_file_handler = cfg.dataset_file_handler_class_type(
+                **cfg.dataset_file_handler_kwargs
+            )
             self._failed_episode_dataset_file_handler.create(
                 os.path.join(cfg.dataset_export_dir_path, f"{cfg.dataset_filename}_failed"), env_name=env_name
             )
@@ -268,8 +271,7 @@ class RecorderManager(ManagerBase):
         for term in self._terms.values():
             term.reset(env_ids=env_ids)
 
-        for env_id in env_ids:
-            self._episodes[env_id] = EpisodeData()
+        self._episodes.reset(env_ids)
 
         # nothing to log here
         return {}
@@ -277,13 +279,18 @@ class RecorderManager(ManagerBase):
     def get_episode(self, env_id: int) -> EpisodeData:
         """Returns the episode data for the given environment id.
 
+        The episode holds copies of the recorded values, it stays valid after the environment is reset. The keys added
+        to the episode are exported with it.
+
         Args:
             env_id: The environment id.
 
         Returns:
             The episode data for the given environment id.
         """
-        return self._episodes.get(env_id, EpisodeData())
+        if env_id < 0 or env_id >= self._episodes.num_envs:
+            return EpisodeData()
+        return self._episodes.get_episode(env_id)
 
     def add_to_episodes(self, key: str, value: torch.Tensor | dict, env_ids: Sequence[int] | None = None):
         """Adds the given key-value pair to the episodes for the given environment ids.
@@ -313,11 +320,7 @@ class RecorderManager(ManagerBase):
                 self.add_to_episodes(f"{key}/{sub_key}", sub_value, env_ids)
             return
 
-        for value_index, env_id in enumerate(env_ids):
-            if env_id not in self._episodes:
-                self._episodes[env_id] = EpisodeData()
-                self._episodes[env_id].env_id = env_id
-            self._episodes[env_id].add(key, value[value_index])
+        self._episodes.add(key, value, env_ids)
 
     def set_success_to_episodes(self, env_ids: Sequence[int] | None, success_values: torch.Tensor):
         """Sets the task success values to the episodes for the given environment ids.
@@ -336,8 +339,8 @@ class RecorderManager(ManagerBase):
         if isinstance(env_ids, torch.Tensor):
             env_ids = env_ids.tolist()
 
-        for value_index, env_id in enumerate(env_ids):
-            self._episodes[env_id].success = success_values[value_index].item()
+        for env_id, success_value in zip(env_ids, success_values.flatten().tolist()):
+            self._episodes.get_episode(env_id, clone=False).success = success_value
 
     def record_pre_step(self) -> None:
         """Trigger recorder terms for pre-step functions."""
@@ -421,8 +424,9 @@ class RecorderManager(ManagerBase):
         # Export episode data through dataset exporter
         need_to_flush = False
         for env_id in env_ids:
-            if env_id in self._episodes and not self._episodes[env_id].is_empty():
-                episode_succeeded = self._episodes[env_id].success
+            episode = self._episodes.get_episode(env_id)
+            if not episode.is_empty():
+                episode_succeeded = episode.success
                 target_dataset_file_handler = None
                 if (self.cfg.dataset_export_mode == DatasetExportMode.EXPORT_ALL) or (
                     self.cfg.dataset_export_mode == DatasetExportMode.EXPORT_SUCCEEDED_ONLY and episode_succeeded
@@ -434,7 +438,7 @@ class RecorderManager(ManagerBase):
                     else:
                         target_dataset_file_handler = self._failed_episode_dataset_file_handler
                 if target_dataset_file_handler is not None:
-                    target_dataset_file_handler.write_episode(self._episodes[env_id])
+                    target_dataset_file_handler.write_episode(episode)
                     need_to_flush = True
                 # Update episode count
                 if episode_succeeded:
@@ -443,8 +447,8 @@ class RecorderManager(ManagerBase):
                     )
                 else:
                     self._exported_failed_episode_count[env_id] = self._exported_failed_episode_count.get(env_id, 0) + 1
-            # Reset the episode buffer for the given environment after export
-            self._episodes[env_id] = EpisodeData()
+        # Reset the episode buffer for the given environments after export
+        self._episodes.reset(env_ids)
 
         if need_to_flush:
             if self._dataset_file_handler is not None:
@@ -467,6 +471,7 @@ class RecorderManager(ManagerBase):
             # skip non-term settings
             if term_name in [
                 "dataset_file_handler_class_type",
+                "dataset_file_handler_kwargs",
                 "dataset_filename",
                 "dataset_export_dir_path",
                 "dataset_export_mode",
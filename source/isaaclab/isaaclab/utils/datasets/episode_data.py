@@ -9,11 +9,24 @@ import torch
 
 
 class EpisodeData:
-    """Class to store episode data."""
+    """Class to store episode data.
 
-    def __init__(self) -> None:
-        """Initializes episode data class."""
+    The values of a key are appended to a preallocated buffer whose capacity doubles when it is full, such that
+    recording a T-step episode costs O(T) copies. The tensors exposed through :attr:`data` are views on the recorded
+    rows of these buffers.
+    """
+
+    def __init__(self, capacity: int = 16) -> None:
+        """Initializes episode data class.
+
+        Args:
+            capacity: The number of values preallocated for each key. Defaults to 16. Set it to the horizon of the
+                episode to avoid any reallocation.
+        """
         self._data = dict()
+        self._capacity = max(capacity, 1)
+        self._buffers: dict[str, torch.Tensor] = dict()
+        self._lengths: dict[str, int] = dict()
         self._next_action_index = 0
         self._next_state_index = 0
         self._seed = None
@@ -29,6 +42,8 @@ class EpisodeData:
     def data(self, data: dict):
         """Set the episode data."""
         self._data = data
+        self._buffers = dict()
+        self._lengths = dict()
 
     @property
     def seed(self):
@@ -102,20 +117,32 @@ class EpisodeData:
 
         sub_keys = key.split("/")
         current_dataset_pointer = self._data
-        for sub_key_index in range(len(sub_keys)):
-            if sub_key_index == len(sub_keys) - 1:
-                # Add value to the final dict layer
-                if sub_keys[sub_key_index] not in current_dataset_pointer:
-                    current_dataset_pointer[sub_keys[sub_key_index]] = value.unsqueeze(0).clone()
-                else:
-                    current_dataset_pointer[sub_keys[sub_key_index]] = torch.cat(
-                        (current_dataset_pointer[sub_keys[sub_key_index]], value.unsqueeze(0))
-                    )
-                break
-            # key index
-            if sub_keys[sub_key_index] not in current_dataset_pointer:
-                current_dataset_pointer[sub_keys[sub_key_index]] = dict()
-            current_dataset_pointer = current_dataset_pointer[sub_keys[sub_key_index]]
+        for sub_key in sub_keys[:-1]:
+            if sub_key not in current_dataset_pointer:
+                current_dataset_pointer[sub_key] = dict()
+            current_dataset_pointer = current_dataset_pointer[sub_key]
+
+        if key not in self._buffers:
+            if sub_keys[-1] in current_dataset_pointer:
+                # The values were set through the data setter, they are used as a full buffer
+                self._buffers[key] = current_dataset_pointer[sub_keys[-1]]
+                self._lengths[key] = len(self._buffers[key])
+            else:
+                self._buffers[key] = torch.empty((self._capacity, *value.shape), dtype=value.dtype, device=value.device)
+                self._lengths[key] = 0
+
+        buffer = self._buffers[key]
+        length = self._lengths[key]
+        if length == len(buffer):
+            # Double the capacity of the buffer
+            capacity = max(2 * len(buffer), 1)
+            grown_buffer = torch.empty((capacity, *buffer.shape[1:]), dtype=buffer.dtype, device=buffer.device)
+            grown_buffer[:length] = buffer[:length]
+            buffer = self._buffers[key] = grown_buffer
+        buffer[length] = value
+        self._lengths[key] = length + 1
+        # Add value to the final dict layer
+        current_dataset_pointer[sub_keys[-1]] = buffer[: length + 1]
 
     def get_initial_state(self) -> torch.Tensor | None:
         """Get the initial state from the dataset."""
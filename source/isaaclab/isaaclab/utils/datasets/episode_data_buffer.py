@@ -0,0 +1,136 @@
+# Copyright (c) 2024-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import numpy as np
+import torch
+from collections.abc import Sequence
+
+from .episode_data import EpisodeData
+
+
+class EpisodeDataBuffer:
+    """Class to store the episode data of a batch of environments.
+
+    The values of a key are stored for all the environments in a single buffer of shape (num_envs, capacity, ...),
+    whose capacity doubles when an episode outgrows it. The values of all the environments are appended with a single
+    write, and the lengths of the episodes are tracked on the host. The episode of an environment is exposed as an
+    :class:`EpisodeData` holding copies of its rows of the buffers, or views on them for short-lived accesses.
+    """
+
+    def __init__(self, num_envs: int, capacity: int = 16) -> None:
+        """Initializes the episode data buffer.
+
+        Args:
+            num_envs: The number of environments.
+            capacity: The number of steps preallocated for each key. Defaults to 16. Set it to the horizon of the
+                episodes to avoid any reallocation.
+        """
+        self._num_envs = num_envs
+        self._capacity = max(capacity, 1)
+        self._buffers: dict[str, torch.Tensor] = dict()
+        self._lengths: dict[str, np.ndarray] = dict()
+        self._episodes = [EpisodeData() for _ in range(num_envs)]
+
+    @property
+    def num_envs(self) -> int:
+        """Returns the number of environments."""
+        return self._num_envs
+
+    def add(self, key: str, value: torch.Tensor | dict, env_ids: Sequence[int] | None = None):
+        """Add a key-value pair to the episodes of the given environments.
+
+        The key can be nested by using the "/" character.
+        For example: "obs/joint_pos".
+
+        Args:
+            key: The key name.
+            value: The corresponding value of tensor type or of dict type. The shape of a tensor is (env_ids, ...).
+            env_ids: The environment ids. Defaults to None, in which case all environments are considered.
+        """
+        # check datatype
+        if isinstance(value, dict):
+            for sub_key, sub_value in value.items():
+                self.add(f"{key}/{sub_key}", sub_value, env_ids)
+            return
+
+        if env_ids is None:
+            env_ids = np.arange(self._num_envs)
+        env_ids = np.asarray(env_ids, dtype=np.int64)
+        if len(env_ids) == 0:
+            return
+        value = value[: len(env_ids)]
+
+        if key not in self._buffers:
+            self._buffers[key] = torch.empty(
+                (self._num_envs, self._capacity, *value.shape[1:]), dtype=value.dtype, device=value.device
+            )
+            self._lengths[key] = np.zeros(self._num_envs, dtype=np.int64)
+
+        lengths = self._lengths[key]
+        positions = lengths[env_ids]
+        buffer = self._buffers[key]
+        required_capacity = int(positions.max()) + 1
+        if required_capacity > buffer.shape[1]:
+            # Double the capacity of the buffer until it fits the longest episode
+            capacity = buffer.shape[1]
+            while capacity < required_capacity:
+                capacity *= 2
+            grown_buffer = torch.empty(
+                (self._num_envs, capacity, *buffer.shape[2:]), dtype=buffer.dtype, device=buffer.device
+            )
+            grown_buffer[:, : buffer.shape[1]] = buffer
+            buffer = self._buffers[key] = grown_buffer
+
+        if len(env_ids) == self._num_envs and np.all(positions == positions[0]) and np.all(env_ids[1:] > env_ids[:-1]):
+            # All the environments are at the same step, the values are written in a single slice
+            buffer[:, positions[0]] = value
+        else:
+            indices = (torch.from_numpy(env_ids).to(buffer.device), torch.from_numpy(positions).to(buffer.device))
+            buffer.index_put_(indices, value.to(dtype=buffer.dtype))
+        lengths[env_ids] += 1
+
+    def get_episode(self, env_id: int, clone: bool = True) -> EpisodeData:
+        """Returns the episode data of the given environment.
+
+        The recorded values are merged into the data of the episode, such that the keys added to the returned episode,
+        e.g. through :meth:`EpisodeData.add`, are kept by the next calls and exported with the episode.
+
+        Args:
+            env_id: The environment id.
+            clone: Whether the recorded values are copied out of the buffers. Defaults to True, in which case the
+                episode stays valid once the environment is reset and its rows of the buffers are reused. Otherwise,
+                the tensors of the episode are views on the buffers, valid until the episode of the environment is
+                reset.
+
+        Returns:
+            The episode data of the given environment.
+        """
+        episode = self._episodes[env_id]
+        for key, buffer in self._buffers.items():
+            length = int(self._lengths[key][env_id])
+            if length == 0:
+                continue
+            sub_keys = key.split("/")
+            current_dataset_pointer = episode.data
+            for sub_key in sub_keys[:-1]:
+                current_dataset_pointer = current_dataset_pointer.setdefault(sub_key, dict())
+            values = buffer[env_id, :length]
+            current_dataset_pointer[sub_keys[-1]] = values.clone() if clone else values
+        return episode
+
+    def reset(self, env_ids: Sequence[int] | None = None):
+        """Clears the episodes of the given environments.
+
+        Args:
+            env_ids: The environment ids. Defaults to None, in which case all environments are considered.
+        """
+        if env_ids is None:
+            env_ids = range(self._num_envs)
+        for lengths in self._lengths.values():
+            lengths[np.asarray(env_ids, dtype=np.int64)] = 0
+        for env_id in env_ids:
+            self._episodes[env_id] = EpisodeData()
@@ -7,6 +7,8 @@ import h5py
 import json
 import numpy as np
 import os
+import queue
+import threading
 import torch
 from collections.abc import Iterable
 
@@ -15,22 +17,79 @@ from .episode_data import EpisodeData
 
 
 class HDF5DatasetFileHandler(DatasetFileHandlerBase):
-    """HDF5 dataset file handler for storing and loading episode data."""
+    """HDF5 dataset file handler for storing and loading episode data.
+
+    By default, each episode is written on the calling thread to its own ``data/demo_<i>`` group, following the
+    robomimic layout. The writer can optionally:
+
+    * write the episodes from a background thread. The episode tensors are copied to the host on the calling thread,
+      and the disk writes are performed by the writer thread in the order of the calls. At most ``max_queue_size``
+      episodes can be pending: :meth:`write_episode` blocks when the queue is full, which applies backpressure on
+      the simulation loop. :meth:`flush` queues a flush of the file after the pending writes, and :meth:`wait` blocks
+      until all of them are done.
+    * chunk and compress the datasets, with the gzip and lzf filters of HDF5 or the lz4 filter of ``hdf5plugin``.
+    * pack the episodes into shared resizable datasets. The values of a key are appended to ``data/_values/<key>``,
+      and ``data/_index/<key>`` stores the start and length of the values of each episode. The names and attributes
+      of the episodes are stored in ``data/_episodes``. Loading an episode only reads its slice of the datasets.
+    """
+
+    def __init__(
+        self,
+        async_write: bool = False,
+        max_queue_size: int = 16,
+        compression: str | None = None,
+        compression_opts: int | None = None,
+        chunk_size: int | None = None,
+        packed: bool = False,
+    ):
+        """Initializes the HDF5 dataset file handler.
 
-    def __init__(self):
-        """Initializes the HDF5 dataset file handler."""
+        Args:
+            async_write: Whether to write the episodes from a background thread. Defaults to False.
+            max_queue_size: The maximum number of episodes pending to be written by the background thread.
+                Defaults to 16.
+            compression: The compression filter of the datasets, one of "gzip", "lzf" or "lz4". Defaults to None,
+                in which case the datasets are not compressed. The "lz4" filter requires the ``hdf5plugin`` package.
+            compression_opts: The options of the compression filter, e.g. the gzip level. Defaults to None.
+            chunk_size: The number of steps in a chunk of the datasets. Defaults to None, in which case the chunks
+                are chosen by h5py when needed.
+            packed: Whether to pack the episodes into shared datasets indexed by episode. Only applies to the
+                created files, the layout of an opened file is read from the file. Defaults to False.
+        """
         self._hdf5_file_stream = None
         self._hdf5_data_group = None
         self._demo_count = 0
         self._env_args = {}
 
+        self._write_queue = None
+        self._writer_thread = None
+        self._writer_error = None
+
+        self._async_write = async_write
+        self._max_queue_size = max_queue_size
+        self._dataset_kwargs = self._resolve_compression(compression, compression_opts)
+        self._chunk_size = chunk_size
+        self._packed = packed
+        self._packed_episode_names: list[str] = []
+        self._packed_episode_indices: dict[str, int] = {}
+
     def open(self, file_path: str, mode: str = "r"):
         """Open an existing dataset file."""
         if self._hdf5_file_stream is not None:
             raise RuntimeError("HDF5 dataset file stream is already in use")
         self._hdf5_file_stream = h5py.File(file_path, mode)
         self._hdf5_data_group = self._hdf5_file_stream["data"]
-        self._demo_count = len(self._hdf5_data_group)
+        self._packed = self._hdf5_data_group.attrs.get("layout", "") == "packed"
+        if self._packed:
+            self._packed_episode_names = [
+                json.loads(episode)["name"] for episode in self._hdf5_data_group["_episodes"].asstr()[()]
+            ]
+            self._packed_episode_indices = {name: index for index, name in enumerate(self._packed_episode_names)}
+            self._demo_count = len(self._packed_episode_names)
+        else:
+            self._demo_count = len(self._hdf5_data_group)
+        if mode != "r":
+            self._start_writer()
 
     def create(self, file_path: str, env_name: str = None):
         """Create a new dataset file."""
@@ -47,6 +106,14 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
         self._hdf5_data_group = self._hdf5_file_stream.create_group("data")
         self._hdf5_data_group.attrs["total"] = 0
         self._demo_count = 0
+        if self._packed:
+            self._hdf5_data_group.attrs["layout"] = "packed"
+            self._hdf5_data_group.create_dataset(
+                "_episodes", shape=(0,), maxshape=(None,), dtype=h5py.string_dtype(), chunks=True
+            )
+            self._packed_episode_names = []
+            self._packed_episode_indices = {}
+        self._start_writer()
 
         # set environment arguments
         # the environment type (we use gym environment type) is set to be compatible with robomimic
@@ -84,6 +151,8 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
     def get_episode_names(self) -> Iterable[str]:
         """Get the names of the episodes in the file."""
         self._raise_if_not_initialized()
+        if self._packed:
+            return list(self._packed_episode_names)
         return self._hdf5_data_group.keys()
 
     def get_num_episodes(self) -> int:
@@ -102,6 +171,9 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
     def load_episode(self, episode_name: str, device: str) -> EpisodeData | None:
         """Load episode data from the file."""
         self._raise_if_not_initialized()
+        if self._packed:
+            return self._load_packed_episode(episode_name, device)
+        self.wait()
         if episode_name not in self._hdf5_data_group:
             return None
         episode = EpisodeData()
@@ -134,59 +206,277 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
     def write_episode(self, episode: EpisodeData):
         """Add an episode to the dataset.
 
+        When the episodes are written asynchronously, the episode data is copied to the host before returning and can
+        be modified afterwards. The call blocks while the write queue is full.
+
         Args:
             episode: The episode data to add.
         """
         self._raise_if_not_initialized()
+        self._raise_if_writer_failed()
         if episode.is_empty():
             return
 
-        # create episode group based on demo count
-        h5_episode_group = self._hdf5_data_group.create_group(f"demo_{self._demo_count}")
-
-        # store number of steps taken
-        if "actions" in episode.data:
-            h5_episode_group.attrs["num_samples"] = len(episode.data["actions"])
-        else:
-            h5_episode_group.attrs["num_samples"] = 0
-
+        episode_name = f"demo_{self._demo_count}"
+        attrs = {"num_samples": len(episode.data["actions"]) if "actions" in episode.data else 0}
         if episode.seed is not None:
-            h5_episode_group.attrs["seed"] = episode.seed
-
+            attrs["seed"] = episode.seed
         if episode.success is not None:
-            h5_episode_group.attrs["success"] = episode.success
-
-        def create_dataset_helper(group, key, value):
-            """Helper method to create dataset that contains recursive dict objects."""
-            if isinstance(value, dict):
-                key_group = group.create_group(key)
-                for sub_key, sub_value in value.items():
-                    create_dataset_helper(key_group, sub_key, sub_value)
-            else:
-                group.create_dataset(key, data=value.cpu().numpy())
-
-        for key, value in episode.data.items():
-            create_dataset_helper(h5_episode_group, key, value)
-
-        # increment total step counts
-        self._hdf5_data_group.attrs["total"] += h5_episode_group.attrs["num_samples"]
+            attrs["success"] = episode.success
 
+        if self._packed:
+            self._packed_episode_indices[episode_name] = len(self._packed_episode_names)
+            self._packed_episode_names.append(episode_name)
         # increment total demo counts
         self._demo_count += 1
 
+        if self._writer_thread is None:
+            self._write_episode_data(episode_name, attrs, episode.data)
+            return
+
+        # copy the episode data to the host, the copies from the GPU complete before the write is performed
+        host_data = self._copy_to_host(episode.data)
+        copy_event = None
+        if torch.cuda.is_available() and self._is_on_gpu(episode.data):
+            copy_event = torch.cuda.Event()
+            copy_event.record()
+        self._write_queue.put(("write", (episode_name, attrs, host_data, copy_event)))
+
     def flush(self):
-        """Flush the episode data to disk."""
+        """Flush the episode data to disk.
+
+        When the episodes are written asynchronously, the flush is queued after the pending writes and the call
+        returns immediately. Use :meth:`wait` to block until the episode data is on disk.
+        """
         self._raise_if_not_initialized()
+        self._raise_if_writer_failed()
 
-        self._hdf5_file_stream.flush()
+        if self._writer_thread is None:
+            self._hdf5_file_stream.flush()
+        else:
+            self._write_queue.put(("flush", None))
+
+    def wait(self):
+        """Block until all the pending writes are done."""
+        if self._writer_thread is not None:
+            self._write_queue.join()
+        self._raise_if_writer_failed()
 
     def close(self):
         """Close the dataset file handler."""
+        if self._writer_thread is not None:
+            self._write_queue.put(("stop", None))
+            self._writer_thread.join()
+            self._writer_thread = None
+            self._write_queue = None
         if self._hdf5_file_stream is not None:
             self._hdf5_file_stream.close()
             self._hdf5_file_stream = None
+        self._raise_if_writer_failed()
 
     def _raise_if_not_initialized(self):
         """Raise an error if the dataset file handler is not initialized."""
         if self._hdf5_file_stream is None:
             raise RuntimeError("HDF5 dataset file stream is not initialized")
+
+    def _raise_if_writer_failed(self):
+        """Raise the error of the background writer thread, if any."""
+        if self._writer_error is not None:
+            error, self._writer_error = self._writer_error, None
+            raise RuntimeError("Failed to write the episode data to the HDF5 dataset file") from error
+
+    """
+    Internal helpers - writing.
+    """
+
+    def _start_writer(self):
+        """Start the background writer thread."""
+        if not self._async_write or self._writer_thread is not None:
+            return
+        self._write_queue = queue.Queue(maxsize=self._max_queue_size)
+        self._writer_thread = threading.Thread(target=self._writer_loop, name="hdf5-dataset-writer", daemon=True)
+        self._writer_thread.start()
+
+    def _writer_loop(self):
+        """Perform the queued operations in order until a stop request is received."""
+        while True:
+            operation, payload = self._write_queue.get()
+            try:
+                if operation == "stop":
+                    return
+                if self._writer_error is not None:
+                    # skip the operations that follow a failed write
+                    continue
+                if operation == "write":
+                    episode_name, attrs, data, copy_event = payload
+                    if copy_event is not None:
+                        copy_event.synchronize()
+                    self._write_episode_data(episode_name, attrs, data)
+                elif operation == "flush":
+                    self._hdf5_file_stream.flush()
+            except Exception as error:
+                self._writer_error = error
+            finally:
+                self._write_queue.task_done()
+
+    @staticmethod
+    def _resolve_compression(compression: str | None, compression_opts: int | None) -> dict:
+        """Return the keyword arguments of the datasets for the given compression filter."""
+        if compression is None:
+            return {}
+        if compression == "lz4":
+            try:
+                import hdf5plugin
+            except ImportError as error:
+                raise ImportError("The lz4 compression requires the hdf5plugin package.") from error
+            return dict(hdf5plugin.LZ4())
+        if compression not in ("gzip", "lzf"):
+            raise ValueError(f"Invalid compression: {compression}. Valid options are: 'gzip', 'lzf', 'lz4'.")
+        return {"compression": compression, "compression_opts": compression_opts}
+
+    @staticmethod
+    def _is_on_gpu(data: dict) -> bool:
+        """Check if any tensor of the nested data is on the GPU."""
+        for value in data.values():
+            if isinstance(value, dict):
+                if HDF5DatasetFileHandler._is_on_gpu(value):
+                    return True
+            elif value.is_cuda:
+                return True
+        return False
+
+    @staticmethod
+    def _copy_to_host(data: dict) -> dict:
+        """Copy the tensors of the nested data to the host. The copies from the GPU are not blocking."""
+        host_data = {}
+        for key, value in data.items():
+            if isinstance(value, dict):
+                host_data[key] = HDF5DatasetFileHandler._copy_to_host(value)
+            elif value.is_cuda:
+                host_data[key] = torch.empty(value.shape, dtype=value.dtype, pin_memory=True)
+                host_data[key].copy_(value, non_blocking=True)
+            else:
+                host_data[key] = value.clone()
+        return host_data
+
+    def _chunks(self, shape: tuple[int, ...]) -> tuple[int, ...] | bool | None:
+        """Return the chunk shape of a dataset whose values have the given shape."""
+        if self._chunk_size is not None:
+            return (max(min(self._chunk_size, shape[0]), 1), *shape[1:])
+        return True if self._dataset_kwargs else None
+
+    def _write_episode_data(self, episode_name: str, attrs: dict, data: dict):
+        """Write the data and attributes of an episode to the file."""
+        if self._packed:
+            self._write_packed_episode_data(episode_name, attrs, data)
+        else:
+            # create episode group based on demo count
+            h5_episode_group = self._hdf5_data_group.create_group(episode_name)
+            for key, value in attrs.items():
+                h5_episode_group.attrs[key] = value
+
+            def create_dataset_helper(group, key, value):
+                """Helper method to create dataset that contains recursive dict objects."""
+                if isinstance(value, dict):
+                    key_group = group.create_group(key)
+                    for sub_key, sub_value in value.items():
+                        create_dataset_helper(key_group, sub_key, sub_value)
+                else:
+                    value = value.cpu().numpy()
+                    group.create_dataset(key, data=value, chunks=self._chunks(value.shape), **self._dataset_kwargs)
+
+            for key, value in data.items():
+                create_dataset_helper(h5_episode_group, key, value)
+
+        # increment total step counts
+        self._hdf5_data_group.attrs["total"] += attrs["num_samples"]
+
+    def _write_packed_episode_data(self, episode_name: str, attrs: dict, data: dict):
+        """Append the data of an episode to the shared datasets and index it."""
+        episodes = self._hdf5_data_group["_episodes"]
+        episode_index = len(episodes)
+        values_group = self._hdf5_data_group.require_group("_values")
+        index_group = self._hdf5_data_group.require_group("_index")
+
+        def append_dataset_helper(values_group, index_group, key, value):
+            """Helper method to append to the datasets that contain recursive dict objects."""
+            if isinstance(value, dict):
+                for sub_key, sub_value in value.items():
+                    append_dataset_helper(
+                        values_group.require_group(key), index_group.require_group(key), sub_key, sub_value
+                    )
+                return
+            value = value.cpu().numpy()
+            if key not in values_group:
+                # by default, the chunks hold about 1 MiB of values
+                chunk_size = self._chunk_size or max(2**20 // max(value[:1].nbytes, 1), 1)
+                chunks = (chunk_size, *value.shape[1:])
+                values_group.create_dataset(
+                    key,
+                    shape=(0, *value.shape[1:]),
+                    maxshape=(None, *value.shape[1:]),
+                    dtype=value.dtype,
+                    chunks=chunks,
+                    **self._dataset_kwargs,
+                )
+                # the episodes written before the key appeared have no values
+                index_group.create_dataset(key, shape=(episode_index, 2), maxshape=(None, 2), dtype=np.int64)
+            values, index = values_group[key], index_group[key]
+            start = values.shape[0]
+            values.resize(start + len(value), axis=0)
+            values[start:] = value
+            index.resize(episode_index + 1, axis=0)
+            index[episode_index] = (start, len(value))
+
+        for key, value in data.items():
+            append_dataset_helper(values_group, index_group, key, value)
+
+        def pad_index_helper(index_group):
+            """Helper method to index the keys that are absent from the episode."""
+            for key in index_group:
+                if isinstance(index_group[key], h5py.Group):
+                    pad_index_helper(index_group[key])
+                elif index_group[key].shape[0] == episode_index:
+                    index_group[key].resize(episode_index + 1, axis=0)
+                    index_group[key][episode_index] = (0, 0)
+
+        pad_index_helper(index_group)
+        episodes.resize(episode_index + 1, axis=0)
+        attrs = {key: value.item() if isinstance(value, np.generic) else value for key, value in attrs.items()}
+        episodes[episode_index] = json.dumps({"name": episode_name, **attrs})
+
+    """
+    Internal helpers - loading.
+    """
+
+    def _load_packed_episode(self, episode_name: str, device: str) -> EpisodeData | None:
+        """Load an episode from the shared datasets, only reading its slice of the datasets."""
+        if episode_name not in self._packed_episode_indices:
+            return None
+        self.wait()
+        episode_index = self._packed_episode_indices[episode_name]
+        attrs = json.loads(self._hdf5_data_group["_episodes"].asstr()[episode_index])
+
+        def load_dataset_helper(values_group, index_group):
+            """Helper method to load the slices of the datasets that contain recursive dict objects."""
+            data = {}
+            for key in index_group:
+                if isinstance(index_group[key], h5py.Group):
+                    sub_data = load_dataset_helper(values_group[key], index_group[key])
+                    if sub_data:
+                        data[key] = sub_data
+                    continue
+                start, length = index_group[key][episode_index]
+                if length > 0:
+                    data[key] = torch.tensor(values_group[key][start : start + length], device=device)
+            return data
+
+        episode = EpisodeData()
+        if "_index" in self._hdf5_data_group:
+            episode.data = load_dataset_helper(self._hdf5_data_group["_values"], self._hdf5_data_group["_index"])
+        if "seed" in attrs:
+            episode.seed = attrs["seed"]
+        if "success" in attrs:
+            episode.success = attrs["success"]
+        episode.env_id = self.get_env_name()
+        return episode
@@ -157,6 +157,28 @@ class TestRecorderManager(unittest.TestCase):
                     episode = recorder_manager.get_episode(env_id)
                     self.assertEqual(episode.data["record_post_reset"].shape, (1, 3))
 
+    def test_export_keys_added_to_episode(self):
+        """Test that the keys added to an episode by the caller are exported with the recorded data."""
+        for device in ("cuda:0", "cpu"):
+            with self.subTest(device=device):
+                env = create_dummy_env(device)
+                recorder_manager = RecorderManager(self.create_dummy_recorder_manager_cfg(), env)
+                recorder_manager.record_pre_step()
+                recorder_manager.record_post_step()
+
+                episode = recorder_manager.get_episode(0)
+                episode.add("obs/subtask_term_signals/grasp", torch.tensor([False, True], device=device))
+                recorder_manager.export_episodes([0])
+
+                exported_episode = recorder_manager._dataset_file_handler.load_episode("demo_0", device)
+                self.assertEqual(exported_episode.data["record_pre_step"].shape, (1, 4))
+                self.assertTrue(
+                    torch.equal(
+                        exported_episode.data["obs"]["subtask_term_signals"]["grasp"],
+                        torch.tensor([[False, True]], device=device),
+                    )
+                )
+
 
 if __name__ == "__main__":
     run_tests()
@@ -60,6 +60,22 @@ class TestEpisodeData(unittest.TestCase):
                 episode.add("first/second", dummy_data_1)
                 self.assertTrue(torch.equal(episode.data.get("first").get("second"), expected_added_data))
 
+    def test_add_beyond_capacity(self):
+        """Test appending more values than the preallocated capacity."""
+        for device in ("cuda:0", "cpu"):
+            with self.subTest(device=device):
+                values = torch.arange(30, device=device).view(10, 3)
+                episode = EpisodeData(capacity=4)
+                for value in values:
+                    episode.add("obs/term", value)
+                self.assertTrue(torch.equal(episode.data.get("obs").get("term"), values))
+
+                # test adding data to a key set through the data setter
+                episode = EpisodeData()
+                episode.data = {"actions": values[:2].clone()}
+                episode.add("actions", values[2])
+                self.assertTrue(torch.equal(episode.data.get("actions"), values[:3]))
+
     def test_add_dict_tensors(self):
         """Test appending dict data to the episode."""
         for device in ("cuda:0", "cpu"):
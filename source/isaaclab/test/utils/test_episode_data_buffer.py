@@ -0,0 +1,105 @@
+# Copyright (c) 2024-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app in headless mode
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows from here."""
+
+import torch
+import unittest
+
+from isaaclab.utils.datasets import EpisodeDataBuffer
+
+
+class TestEpisodeDataBuffer(unittest.TestCase):
+    """Test EpisodeDataBuffer implementation."""
+
+    """
+    Test cases for EpisodeDataBuffer class.
+    """
+
+    def test_add_all_envs(self):
+        """Test appending the values of all the environments."""
+        for device in ("cuda:0", "cpu"):
+            with self.subTest(device=device):
+                buffer = EpisodeDataBuffer(num_envs=3, capacity=2)
+                values = torch.arange(15, device=device).view(5, 3, 1)
+                for value in values:
+                    buffer.add("obs/term", {"sub_term": value})
+
+                for env_id in range(3):
+                    episode_values = buffer.get_episode(env_id).data.get("obs").get("term").get("sub_term")
+                    self.assertTrue(torch.equal(episode_values, values[:, env_id]))
+
+    def test_add_env_subset(self):
+        """Test appending the values of a subset of the environments."""
+        for device in ("cuda:0", "cpu"):
+            with self.subTest(device=device):
+                buffer = EpisodeDataBuffer(num_envs=4, capacity=1)
+                buffer.add("actions", torch.zeros(4, 2, device=device))
+                # the values are matched with the environment ids by position
+                buffer.add("actions", torch.tensor([[1, 1], [3, 3]], device=device), env_ids=[3, 1])
+
+                self.assertEqual(buffer.get_episode(0).data.get("actions").shape, (1, 2))
+                self.assertTrue(
+                    torch.equal(buffer.get_episode(1).data.get("actions")[-1], torch.tensor([3, 3.0], device=device))
+                )
+                self.assertTrue(
+                    torch.equal(buffer.get_episode(3).data.get("actions")[-1], torch.tensor([1, 1.0], device=device))
+                )
+
+    def test_reset(self):
+        """Test clearing the episodes of a subset of the environments."""
+        for device in ("cuda:0", "cpu"):
+            with self.subTest(device=device):
+                buffer = EpisodeDataBuffer(num_envs=2)
+                buffer.add("actions", torch.ones(2, 3, device=device))
+                buffer.get_episode(0).success = True
+                buffer.reset([0])
+
+                self.assertTrue(buffer.get_episode(0).is_empty())
+                self.assertIsNone(buffer.get_episode(0).success)
+                self.assertFalse(buffer.get_episode(1).is_empty())
+
+                # the episode restarts from the first step
+                buffer.add("actions", torch.zeros(1, 3, device=device), env_ids=[0])
+                self.assertEqual(buffer.get_episode(0).data.get("actions").shape, (1, 3))
+                self.assertEqual(buffer.get_episode(1).data.get("actions").shape, (1, 3))
+
+    def test_keys_added_to_episode_are_kept(self):
+        """Test that the keys added to a returned episode are kept by the next calls."""
+        for device in ("cuda:0", "cpu"):
+            with self.subTest(device=device):
+                buffer = EpisodeDataBuffer(num_envs=2)
+                buffer.add("obs/term", torch.ones(2, 3, device=device))
+                buffer.get_episode(0).add("obs/annotation", torch.zeros(4, dtype=torch.bool, device=device))
+                buffer.add("obs/term", torch.ones(2, 3, device=device))
+
+                episode = buffer.get_episode(0)
+                self.assertEqual(episode.data["obs"]["term"].shape, (2, 3))
+                self.assertEqual(episode.data["obs"]["annotation"].shape, (1, 4))
+                self.assertNotIn("annotation", buffer.get_episode(1).data["obs"])
+
+    def test_episode_outlives_reset(self):
+        """Test that a returned episode is not overwritten once the rows of its environment are reused."""
+        for device in ("cuda:0", "cpu"):
+            with self.subTest(device=device):
+                buffer = EpisodeDataBuffer(num_envs=2)
+                buffer.add("actions", torch.ones(2, 3, device=device))
+                episode = buffer.get_episode(0)
+                buffer.reset([0])
+                buffer.add("actions", torch.zeros(2, 3, device=device))
+
+                self.assertTrue(torch.equal(episode.data["actions"], torch.ones(1, 3, device=device)))
+                self.assertTrue(torch.equal(buffer.get_episode(0).data["actions"], torch.zeros(1, 3, device=device)))
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -124,6 +124,47 @@ class TestHDF5DatasetFileHandler(unittest.TestCase):
 
                 dataset_file_handler.close()
 
+    def test_write_and_load_episode_async_packed(self):
+        """Test writing episodes asynchronously to a packed and compressed dataset file."""
+        for device in ("cuda:0", "cpu"):
+            for packed in (True, False):
+                with self.subTest(device=device, packed=packed):
+                    dataset_file_path = os.path.join(self.temp_dir, f"{uuid.uuid4()}.hdf5")
+                    dataset_file_handler = HDF5DatasetFileHandler(
+                        async_write=True, max_queue_size=2, compression="gzip", chunk_size=2, packed=packed
+                    )
+                    dataset_file_handler.create(dataset_file_path, "test_env_name")
+
+                    test_episode = create_test_episode(device)
+                    short_episode = EpisodeData()
+                    short_episode.add("actions", torch.tensor([0, 0, 0], device=device))
+                    for _ in range(3):
+                        dataset_file_handler.write_episode(test_episode)
+                        dataset_file_handler.write_episode(short_episode)
+                    dataset_file_handler.flush()
+                    self.assertEqual(dataset_file_handler.get_num_episodes(), 6)
+                    dataset_file_handler.close()
+
+                    dataset_file_handler = HDF5DatasetFileHandler()
+                    dataset_file_handler.open(dataset_file_path)
+                    self.assertEqual(dataset_file_handler.get_num_episodes(), 6)
+                    self.assertEqual(dataset_file_handler.get_env_name(), "test_env_name")
+
+                    # the episodes are loaded in the order in which they were written
+                    loaded_episode = dataset_file_handler.load_episode("demo_4", device=device)
+                    self.assertEqual(loaded_episode.seed, test_episode.seed)
+                    self.assertTrue(torch.equal(loaded_episode.data["actions"], test_episode.data["actions"]))
+                    self.assertTrue(
+                        torch.equal(
+                            loaded_episode.data["obs"]["policy"]["term1"], test_episode.data["obs"]["policy"]["term1"]
+                        )
+                    )
+                    loaded_episode = dataset_file_handler.load_episode("demo_5", device=device)
+                    self.assertEqual(list(loaded_episode.data.keys()), ["actions"])
+                    self.assertTrue(torch.equal(loaded_episode.data["actions"], short_episode.data["actions"]))
+                    self.assertIsNone(dataset_file_handler.load_episode("demo_6", device=device))
+                    dataset_file_handler.close()
+
 
 if __name__ == "__main__":
     run_tests()
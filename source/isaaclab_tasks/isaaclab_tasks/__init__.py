@@ -24,7 +24,8 @@ __version__ = ISAACLAB_TASKS_METADATA["package"]["version"]
 
 from .utils import import_packages
 
-# The blacklist is used to prevent importing configs from sub-packages
-_BLACKLIST_PKGS = ["utils", ".mdp"]
+# The blacklist is used to prevent importing configs from sub-packages. The RANS robots, tasks and randomizers do not
+# register environments, they are resolved lazily by the RANS factories when an environment is created.
+_BLACKLIST_PKGS = ["utils", ".mdp", ".rans.robots", ".rans.tasks", ".rans.domain_randomization"]
 # Import all configs in this package
 import_packages(__name__, _BLACKLIST_PKGS)
@@ -3,74 +3,78 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
-# isort: off
+# The robots, tasks, their configurations and the randomizers are only imported on first access, so that importing
+# the package does not pull in the simulator modules. The factories register the import paths of their entries.
+from .utils.misc import lazy_exports
 
-from .utils import TrackGenerator, PerEnvSeededRNG, ScalarLogger  # noqa: F401, F403
-from .domain_randomization import RandomizerFactory, RandomizationCoreCfg, RandomizationCore  # noqa: F401, F403
+_EXPORTS = {
+    ".utils": ["TrackGenerator", "PerEnvSeededRNG", "RNG_FACTORY", "ScalarLogger", "ObjectStorage"],
+    ".domain_randomization": [
+        "RandomizerFactory",
+        "RandomizationCoreCfg",
+        "RandomizationCore",
+        "RandomizationPipeline",
+    ],
+    ".robots_cfg": [
+        "FloatingPlatformRobotCfg",
+        "LeatherbackRobotCfg",
+        "RobotCoreCfg",
+        "JetbotRobotCfg",
+        "ModularFreeflyerRobotCfg",
+        "KingfisherRobotCfg",
+        "TurtleBot2RobotCfg",
+        "IntBall2RobotCfg",
+        "ROBOT_CFG_FACTORY",
+    ],
+    ".robots": [
+        "FloatingPlatformRobot",
+        "LeatherbackRobot",
+        "RobotCore",
+        "JetbotRobot",
+        "ModularFreeflyerRobot",
+        "KingfisherRobot",
+        "TurtleBot2Robot",
+        "IntBall2Robot",
+        "ROBOT_FACTORY",
+    ],
+    ".tasks_cfg": [
+        "GoThroughPosesCfg",
+        "GoThroughPoses3DCfg",
+        "GoThroughPositionsCfg",
+        "GoThroughPositions3DCfg",
+        "GoToPoseCfg",
+        "GoToPose3DCfg",
+        "GoToPositionCfg",
+        "GoToPosition3DCfg",
+        "RaceWaypointsCfg",
+        "RaceWayposesCfg",
+        "TaskCoreCfg",
+        "TrackVelocitiesCfg",
+        "TrackVelocities3DCfg",
+        "PushBlockCfg",
+        "GoToPositionWithObstaclesCfg",
+        "RaceGatesCfg",
+        "TASK_CFG_FACTORY",
+    ],
+    ".tasks": [
+        "TaskCore",
+        "GoThroughPosesTask",
+        "GoThroughPoses3DTask",
+        "GoThroughPositionsTask",
+        "GoThroughPositions3DTask",
+        "GoToPoseTask",
+        "GoToPose3DTask",
+        "GoToPositionTask",
+        "GoToPosition3DTask",
+        "RaceWaypointsTask",
+        "RaceWayposesTask",
+        "TrackVelocitiesTask",
+        "TrackVelocities3DTask",
+        "PushBlockTask",
+        "GoToPositionWithObstaclesTask",
+        "RaceGatesTask",
+        "TASK_FACTORY",
+    ],
+}
 
-from .robots_cfg import (  # noqa: F401, F403
-    FloatingPlatformRobotCfg,
-    LeatherbackRobotCfg,
-    RobotCoreCfg,
-    JetbotRobotCfg,
-    ModularFreeflyerRobotCfg,
-    KingfisherRobotCfg,
-    TurtleBot2RobotCfg,
-    IntBall2RobotCfg,
-    ROBOT_CFG_FACTORY,
-)
-
-from .robots import (  # noqa: F401, F403
-    FloatingPlatformRobot,
-    LeatherbackRobot,
-    RobotCore,
-    JetbotRobot,
-    ModularFreeflyerRobot,
-    KingfisherRobot,
-    TurtleBot2Robot,
-    IntBall2Robot,
-    ROBOT_FACTORY,
-)
-
-from .tasks_cfg import (  # noqa: F401, F403
-    GoThroughPosesCfg,
-    GoThroughPoses3DCfg,
-    GoThroughPositionsCfg,
-    GoThroughPositions3DCfg,
-    GoToPoseCfg,
-    GoToPose3DCfg,
-    GoToPositionCfg,
-    GoToPosition3DCfg,
-    RaceWaypointsCfg,
-    RaceWayposesCfg,
-    TaskCoreCfg,
-    TrackVelocitiesCfg,
-    TrackVelocities3DCfg,
-    PushBlockCfg,
-    GoToPositionWithObstaclesCfg,
-    RaceGatesCfg,
-    TASK_CFG_FACTORY,
-)
-
-from .tasks import (  # noqa: F401, F403
-    TaskCore,
-    GoThroughPosesTask,
-    GoThroughPoses3DTask,
-    GoThroughPositionsTask,
-    GoThroughPositions3DTask,
-    GoToPoseTask,
-    GoToPose3DTask,
-    GoToPositionTask,
-    GoToPosition3DTask,
-    RaceWaypointsTask,
-    RaceWayposesTask,
-    TaskCore,
-    TrackVelocitiesTask,
-    TrackVelocities3DTask,
-    PushBlockTask,
-    GoToPositionWithObstaclesTask,
-    RaceGatesTask,
-    TASK_FACTORY,
-)
-
-from .utils import TrackGenerator, PerEnvSeededRNG, ScalarLogger, ObjectStorage  # noqa: F401, F403
+__getattr__, __dir__ = lazy_exports(__name__, {name: module for module, names in _EXPORTS.items() for name in names})
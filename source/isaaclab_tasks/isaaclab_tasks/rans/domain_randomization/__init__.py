@@ -3,7 +3,42 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
-from .randomization_core import RandomizationCore, RandomizationCoreCfg
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+from isaaclab_tasks.rans.utils.misc import lazy_exports
+
+if TYPE_CHECKING:
+    from .randomization_core import RandomizationCoreCfg
+
+# The randomizers are imported on first access. They register themselves in the RandomizerFactory when defined.
+_RANDOMIZERS = {
+    "ActionsRescaler": ".actions_rescaler",
+    "CoMRandomization": ".com",
+    "InertiaRandomization": ".inertia",
+    "MassRandomization": ".mass",
+    "NoisyActions": ".noisy_actions",
+    "NoisyObservations": ".noisy_observations",
+    "WrenchRandomization": ".wrench",
+}
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "NoiseBank": ".noise_bank",
+        "PhysxPropertyWriter": ".property_writer",
+        "RandomizationCore": ".randomization_core",
+        "RandomizationCoreCfg": ".randomization_core",
+        "ElementwiseStage": ".randomization_pipeline",
+        "RandomizationPipeline": ".randomization_pipeline",
+        "slice_bounds": ".randomization_pipeline",
+        "slice_columns": ".randomization_pipeline",
+        **_RANDOMIZERS,
+        **{f"{name}Cfg": module for name, module in _RANDOMIZERS.items()},
+    },
+)
 
 
 class Registerable:
@@ -15,8 +50,10 @@ class RandomizerFactory:
     registry = {}
 
     @classmethod
-    def register(cls, name: str, sub_class: Registerable):
-        if name in cls.registry:
+    def register(cls, name: str, sub_class: Registerable | str):
+        """Registers a randomizer, or the module of a randomizer that is imported on first create."""
+        # The module of a lazily registered randomizer registers the class when it is imported
+        if name in cls.registry and not isinstance(cls.registry[name], str):
             raise ValueError(f"Module {name} already registered.")
         cls.registry[name] = sub_class
 
@@ -26,14 +63,11 @@ class RandomizerFactory:
 
         if cls_name not in cls.registry:
             raise ValueError(f"Module {cls_name} not registered.")
+        if isinstance(cls.registry[cls_name], str):
+            importlib.import_module(cls.registry[cls_name], __name__)
 
         return cls.registry[cls_name](cfg, *args, **kwargs)
 
 
-from .actions_rescaler import ActionsRescaler, ActionsRescalerCfg
-from .com import CoMRandomization, CoMRandomizationCfg
-from .inertia import InertiaRandomization, InertiaRandomizationCfg
-from .mass import MassRandomization, MassRandomizationCfg
-from .noisy_actions import NoisyActions, NoisyActionsCfg
-from .noisy_observations import NoisyObservations, NoisyObservationsCfg
-from .wrench import WrenchRandomization, WrenchRandomizationCfg
+for _name, _module in _RANDOMIZERS.items():
+    RandomizerFactory.register(_name, _module)
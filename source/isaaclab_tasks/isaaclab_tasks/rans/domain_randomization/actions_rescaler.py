@@ -8,7 +8,13 @@ import torch
 from isaaclab.scene import InteractiveScene
 from isaaclab.utils import configclass
 
-from isaaclab_tasks.rans.domain_randomization import RandomizationCore, RandomizationCoreCfg, Registerable
+from isaaclab_tasks.rans.domain_randomization import (
+    ElementwiseStage,
+    RandomizationCore,
+    RandomizationCoreCfg,
+    Registerable,
+    slice_bounds,
+)
 from isaaclab_tasks.rans.utils import PerEnvSeededRNG
 
 
@@ -113,16 +119,6 @@ class ActionsRescaler(Registerable, RandomizationCore):
             else:
                 self._rescaling_ranges.append(torch.ones((self._num_envs, slices[1] - slices[0]), device=self._device))
 
-    def default_reset(self, env_ids: torch.Tensor | None, **kwargs) -> None:
-        """The default reset function for the randomization."""
-        # Do nothing
-        pass
-
-    def default_update(self, **kwargs) -> None:
-        """The default update function for the randomization."""
-        # Do nothing
-        pass
-
     def fn_on_reset_uniform(
         self, env_ids: torch.Tensor | None = None, gen_actions: torch.Tensor | None = None, **kwargs
     ) -> None:
@@ -169,6 +165,28 @@ class ActionsRescaler(Registerable, RandomizationCore):
                 if self._cfg.clip_actions is not None:
                     actions[:, slice[0] : slice[1]].clip_(self._cfg.clip_actions[i][0], self._cfg.clip_actions[i][1])
 
+    def elementwise_stages(self, phase: str, dim: int) -> list[ElementwiseStage] | None:
+        """The scaling factors of the slices are packed in a single [num_envs, dim] buffer, set to 1 outside of the
+        slices, such that the rescaling is a single multiplication. The per-slice buffers become views on it.
+
+        Args:
+            phase: The phase, only the actions phase is fused.
+            dim: The number of actions.
+
+        Returns:
+            list[ElementwiseStage] | None: The rescaling stage."""
+
+        if phase != "actions":
+            return None
+
+        self._scales = torch.ones((self._num_envs, dim), device=self._device)
+        for i, slice in enumerate(self._cfg.slices):
+            view = self._scales[:, slice] if isinstance(slice, int) else self._scales[:, slice[0] : slice[1]]
+            view[:] = self._rescaling_ranges[i]
+            self._rescaling_ranges[i] = view
+        low, high = slice_bounds(self._cfg.slices, self._cfg.clip_actions, dim, self._device)
+        return [ElementwiseStage("mul", lambda: self._scales, low, high)]
+
     def apply_randomization(self, ids: torch.Tensor | None = None) -> None:
         """Everything is done in place. Nothing to update.
 
@@ -9,7 +9,12 @@ from isaaclab.assets import Articulation, RigidObject
 from isaaclab.scene import InteractiveScene
 from isaaclab.utils import configclass
 
-from isaaclab_tasks.rans.domain_randomization import RandomizationCore, RandomizationCoreCfg, Registerable
+from isaaclab_tasks.rans.domain_randomization import (
+    PhysxPropertyWriter,
+    RandomizationCore,
+    RandomizationCoreCfg,
+    Registerable,
+)
 from isaaclab_tasks.rans.utils import PerEnvSeededRNG
 
 
@@ -38,6 +43,10 @@ class CoMRandomizationCfg(RandomizationCoreCfg):
     std: float = 0.00001
     """The standard deviation of the normal distribution to sample the delta from. (in meters) Default is 0.0001."""
 
+    write_interval: int = 1
+    """The number of env steps between two writes of the com to PhysX when it changes continuously. The changes
+    made at reset are always written at the end of the reset. Default is 1."""
+
     # Define the size of the generative space associated with the randomization
     gen_space: int = 1 if enable else 0  # DO NOT EDIT
 
@@ -102,8 +111,10 @@ class CoMRandomization(Registerable, RandomizationCore):
         if self._cfg.enable:
             self._asset: Articulation | RigidObject = self._scene[self._asset_name]
             self._body_id, _ = self._asset.find_bodies(self._cfg.body_name)
-            self._default_com: torch.Tensor = self._asset.root_physx_view.get_coms().to(self._device)
+            self.property_writer = PhysxPropertyWriter.get(self._asset, self._num_envs, self._device)
+            self._default_com: torch.Tensor = self.property_writer.read("coms")
             self._current_com = self._default_com.clone()
+            self.property_writer.register("coms", self._current_com, self._cfg.write_interval)
 
     def default_reset(self, env_ids: torch.Tensor | None = None, **kwargs) -> None:
         """The default reset function for the randomization."""
@@ -114,12 +125,6 @@ class CoMRandomization(Registerable, RandomizationCore):
         # By default, the com is set to the default com
         self._current_com[env_ids, self._body_id] = self._default_com[env_ids, self._body_id]
 
-    def default_update(self, **kwargs) -> None:
-        """The default update function for the randomization."""
-
-        # Do nothing
-        pass
-
     def fn_on_reset_uniform(
         self, env_ids: torch.Tensor | None, gen_actions: torch.Tensor | None = None, **kwargs
     ) -> None:
@@ -202,9 +207,5 @@ class CoMRandomization(Registerable, RandomizationCore):
         Args:
             ids: The ids of the environments."""
 
-        if ids is None:
-            ids_cpu = self._ALL_INDICES_CPU
-        else:
-            ids_cpu = ids.to("cpu")
-
-        self._asset.root_physx_view.set_coms(self._current_com.to("cpu"), ids_cpu)
+        # The write is performed by the property writer, at the end of the reset or of the env step.
+        self.property_writer.mark_dirty("coms", ids)
@@ -9,7 +9,12 @@ from isaaclab.assets import Articulation, RigidObject
 from isaaclab.scene import InteractiveScene
 from isaaclab.utils import configclass
 
-from isaaclab_tasks.rans.domain_randomization import RandomizationCore, RandomizationCoreCfg, Registerable
+from isaaclab_tasks.rans.domain_randomization import (
+    PhysxPropertyWriter,
+    RandomizationCore,
+    RandomizationCoreCfg,
+    Registerable,
+)
 from isaaclab_tasks.rans.utils import PerEnvSeededRNG
 
 
@@ -34,6 +39,10 @@ class InertiaRandomizationCfg(RandomizationCoreCfg):
     decay_rate: float = 0.0
     """The decay rate of the mass. Default is 0.0. (no decay)"""
 
+    write_interval: int = 1
+    """The number of env steps between two writes of the inertia to PhysX when it changes continuously. The changes
+    made at reset are always written at the end of the reset. Default is 1."""
+
     # Define the size of the generative space associated with the randomization
     gen_space: int = 1 if enable else 0  # DO NOT EDIT
 
@@ -96,8 +105,10 @@ class InertiaRandomization(Registerable, RandomizationCore):
         if self._cfg.enable:
             self._asset: Articulation | RigidObject = self._scene[self._asset_name]
             self._body_id, _ = self._asset.find_bodies(self._cfg.body_name)
-            self._default_inertia: torch.Tensor = self._asset.root_physx_view.get_inertias().to(self._device)
+            self.property_writer = PhysxPropertyWriter.get(self._asset, self._num_envs, self._device)
+            self._default_inertia: torch.Tensor = self.property_writer.read("inertias")
             self._current_inertia = self._default_inertia.clone()
+            self.property_writer.register("inertias", self._current_inertia, self._cfg.write_interval)
 
     def default_reset(self, env_ids: torch.Tensor | None, **kwargs) -> None:
         """The default reset function for the randomization."""
@@ -108,12 +119,6 @@ class InertiaRandomization(Registerable, RandomizationCore):
         # By default, the inertia is set to the default inertia.
         self._current_inertia[env_ids, self._body_id] = self._default_inertia[env_ids, self._body_id]
 
-    def default_update(self, **kwargs) -> None:
-        """The default update function for the randomization."""
-
-        # Do nothing
-        pass
-
     def fn_on_reset_uniform(
         self, env_ids: torch.Tensor | None = None, gen_actions: torch.Tensor | None = None, **kwargs
     ):
@@ -177,9 +182,5 @@ class InertiaRandomization(Registerable, RandomizationCore):
         Args:
             ids: The ids of the robot."""
 
-        if ids is None:
-            ids_cpu = self._ALL_INDICES_CPU
-        else:
-            ids_cpu = ids.to("cpu")
-
-        self._asset.root_physx_view.set_inertias(self._current_inertia.to("cpu"), ids_cpu)
+        # The write is performed by the property writer, at the end of the reset or of the env step.
+        self.property_writer.mark_dirty("inertias", ids)
@@ -9,7 +9,12 @@ from isaaclab.assets import Articulation, RigidObject
 from isaaclab.scene import InteractiveScene
 from isaaclab.utils import configclass
 
-from isaaclab_tasks.rans.domain_randomization import RandomizationCore, RandomizationCoreCfg, Registerable
+from isaaclab_tasks.rans.domain_randomization import (
+    PhysxPropertyWriter,
+    RandomizationCore,
+    RandomizationCoreCfg,
+    Registerable,
+)
 from isaaclab_tasks.rans.utils import PerEnvSeededRNG
 
 
@@ -39,6 +44,10 @@ class MassRandomizationCfg(RandomizationCoreCfg):
     max_mass: float = 1000000.0
     """The maximum mass of the rigid body. (in kg) Default is 1000000.0."""
 
+    write_interval: int = 1
+    """The number of env steps between two writes of the mass to PhysX when it changes continuously. The changes
+    made at reset are always written at the end of the reset. Default is 1."""
+
     # Define the size of the generative space associated with the randomization
     gen_space: int = 1 if enable else 0  # DO NOT EDIT
 
@@ -101,8 +110,10 @@ class MassRandomization(Registerable, RandomizationCore):
         if self._cfg.enable:
             self._asset: Articulation | RigidObject = self._scene[self._asset_name]
             self._body_id, _ = self._asset.find_bodies(self._cfg.body_name)
-            self._default_mass: torch.Tensor = self._asset.root_physx_view.get_masses().to(self._device)
+            self.property_writer = PhysxPropertyWriter.get(self._asset, self._num_envs, self._device)
+            self._default_mass: torch.Tensor = self.property_writer.read("masses")
             self._current_mass = self._default_mass.clone()
+            self.property_writer.register("masses", self._current_mass, self._cfg.write_interval)
 
     def default_reset(self, env_ids: torch.Tensor | None, **kwargs) -> None:
         """The default reset function for the randomization."""
@@ -113,12 +124,6 @@ class MassRandomization(Registerable, RandomizationCore):
         # By default, the mass is set to the default mass.
         self._current_mass[env_ids, self._body_id] = self._default_mass[env_ids, self._body_id]
 
-    def default_update(self, **kwargs) -> None:
-        """The default update function for the randomization."""
-
-        # Do nothing
-        pass
-
     def fn_on_reset_uniform(
         self, env_ids: torch.Tensor | None = None, gen_actions: torch.Tensor | None = None, **kwargs
     ):
@@ -138,7 +143,7 @@ class MassRandomization(Registerable, RandomizationCore):
             env_ids = self._ALL_INDICES
 
         self._current_mass[env_ids, self._body_id] += (gen_actions - 0.5) * 2 * self._cfg.max_delta
-        self._current_mass = torch.clamp(self._current_mass, self._cfg.min_mass, self._cfg.max_mass)
+        self._current_mass.clamp_(self._cfg.min_mass, self._cfg.max_mass)
 
     def fn_on_reset_normal(
         self, env_ids: torch.Tensor | None = None, gen_actions: torch.Tensor | None = None, **kwargs
@@ -159,7 +164,7 @@ class MassRandomization(Registerable, RandomizationCore):
             env_ids = self._ALL_INDICES
 
         self._current_mass[env_ids, self._body_id] += gen_actions * self._cfg.std
-        self._current_mass = torch.clamp(self._current_mass, self._cfg.min_mass, self._cfg.max_mass)
+        self._current_mass.clamp_(self._cfg.min_mass, self._cfg.max_mass)
 
     def fn_on_update_constant_time_decay(self, dt: float = 0.0, **kwargs):
         """Change the mass of the rigid bodies by decaying it throughout the episode.
@@ -168,7 +173,7 @@ class MassRandomization(Registerable, RandomizationCore):
             dt: The time step. (in seconds)"""
 
         self._current_mass *= 1 + self._cfg.mass_change_rate * dt
-        self._current_mass = torch.clamp(self._current_mass, self._cfg.min_mass, self._cfg.max_mass)
+        self._current_mass.clamp_(self._cfg.min_mass, self._cfg.max_mass)
 
     def fn_on_update_action_based_decay(self, actions: torch.Tensor | None = None, dt: float = 0.0, **kwargs):
         """Change the mass of the rigid bodies by decaying it throughout the episode based on the actions.
@@ -178,7 +183,7 @@ class MassRandomization(Registerable, RandomizationCore):
             dt: The time step. (in seconds)"""
 
         self._current_mass *= 1 + self._cfg.mass_change_rate * torch.norm(actions, dim=1) * dt
-        self._current_mass = torch.clamp(self._current_mass, self._cfg.min_mass, self._cfg.max_mass)
+        self._current_mass.clamp_(self._cfg.min_mass, self._cfg.max_mass)
 
     def apply_randomization(self, ids: torch.Tensor | None = None) -> None:
         """Updates the mass of the robot. The mass is in kg.
@@ -186,9 +191,5 @@ class MassRandomization(Registerable, RandomizationCore):
         Args:
             ids: The ids of the robot."""
 
-        if ids is None:
-            ids_cpu = self._ALL_INDICES_CPU
-        else:
-            ids_cpu = ids.to("cpu")
-
-        self._asset.root_physx_view.set_masses(self._current_mass.to("cpu"), ids_cpu)
+        # The write is performed by the property writer, at the end of the reset or of the env step.
+        self.property_writer.mark_dirty("masses", ids)
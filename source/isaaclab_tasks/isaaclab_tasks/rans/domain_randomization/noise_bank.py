@@ -0,0 +1,71 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import torch
+
+from isaaclab_tasks.rans.utils import PerEnvSeededRNG
+
+
+class NoiseBank:
+    def __init__(
+        self,
+        rng: PerEnvSeededRNG,
+        distribution: str,
+        num_steps: int,
+        dim: int,
+        num_envs: int = 1,
+        device: str = "cuda",
+    ) -> None:
+        """Ring buffer of pre-sampled unit noise, [num_envs, num_steps, dim].
+
+        At reset, the noise of the next `num_steps` steps of the environments is drawn in a single launch. At each
+        step, the noise of all the environments is a strided view of the bank, read at a cursor shared by all the
+        environments. The draws of an environment are written such that the environment reads them in the order
+        they were drawn, starting from its reset. Hence, the noise of an environment only depends on its seed.
+
+        Note that the noise of an episode repeats itself every `num_steps` steps.
+
+        Args:
+            rng: The random number generator.
+            distribution: The distribution of the noise, 'uniform' in [-1, 1] or 'normal' with a unit variance.
+            num_steps: The number of steps of noise stored for each environment.
+            dim: The number of values drawn at each step.
+            num_envs: The number of environments.
+            device: The device on which the bank is stored."""
+
+        assert distribution in ["uniform", "normal"], f"Invalid noise distribution: {distribution}"
+        assert num_steps > 0, "The noise bank must hold at least one step."
+
+        self._rng = rng
+        self._distribution = distribution
+        self._num_steps = num_steps
+        self._dim = dim
+        self._bank = torch.zeros((num_envs, num_steps, dim), device=device)
+        self._cursor = 0
+
+    def fill(self, env_ids: torch.Tensor) -> None:
+        """Draws the noise of the next steps of the environments.
+
+        Args:
+            env_ids: The ids of the environments."""
+
+        shape = (self._num_steps * self._dim,)
+        if self._distribution == "uniform":
+            noise = self._rng.sample_uniform_torch(-1.0, 1.0, shape, env_ids)
+        else:
+            noise = self._rng.sample_normal_torch(0.0, 1.0, shape, env_ids)
+        # The first draw goes where the cursor currently is
+        noise = noise.view(-1, self._num_steps, self._dim)
+        self._bank[env_ids] = torch.roll(noise, shifts=self._cursor, dims=1)
+
+    def next(self) -> torch.Tensor:
+        """Returns the noise of the current step, and moves the cursor to the next step.
+
+        Returns:
+            torch.Tensor: The noise, a view of the bank [num_envs, dim]."""
+
+        noise = self._bank[:, self._cursor]
+        self._cursor = (self._cursor + 1) % self._num_steps
+        return noise
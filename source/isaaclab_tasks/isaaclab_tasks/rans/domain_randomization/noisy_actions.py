@@ -8,7 +8,15 @@ import torch
 from isaaclab.scene import InteractiveScene
 from isaaclab.utils import configclass
 
-from isaaclab_tasks.rans.domain_randomization import RandomizationCore, RandomizationCoreCfg, Registerable
+from isaaclab_tasks.rans.domain_randomization import (
+    ElementwiseStage,
+    NoiseBank,
+    RandomizationCore,
+    RandomizationCoreCfg,
+    Registerable,
+    slice_bounds,
+    slice_columns,
+)
 from isaaclab_tasks.rans.utils import PerEnvSeededRNG
 
 
@@ -34,6 +42,11 @@ class NoisyActionsCfg(RandomizationCoreCfg):
     """The minimum and maximum values for the actions. Default is None (no clipping).
     The length of the list must be the same as the number of slices, unless it's set to none."""
 
+    noise_bank_size: int = 0
+    """The number of steps of noise drawn at reset for each environment. Default is 0 (the noise is drawn at every
+    step). When positive, the noise of the actions is read from a pre-sampled bank and repeats itself every
+    noise_bank_size steps of an episode."""
+
     # Define the size of the generative space associated with the randomization
     gen_space: int = 1  # DO NOT EDIT
 
@@ -119,32 +132,21 @@ class NoisyActions(Registerable, RandomizationCore):
     def fn_on_setup_uniform(self, **kwargs) -> None:
         """Setup the uniform randomization."""
 
-        # Set up the max_action_noise buffer
-        self._max_action_noise = []
-        for max_delta in self._cfg.max_delta:
-            self._max_action_noise.append(torch.zeros((self._num_envs,), device=self._device))
+        self._noise_bank = None
+        # Set up the max_action_noise buffer, each slice is a column of the packed noise amplitude.
+        # The last column stays at 0, it is used by the elements that are not in any slice.
+        self._noise_amplitude = torch.zeros((self._num_envs, len(self._cfg.slices) + 1), device=self._device)
+        self._max_action_noise = list(self._noise_amplitude[:, :-1].unbind(1))
 
     def fn_on_setup_normal(self, **kwargs) -> None:
         """Setup the normal randomization."""
 
-        # Set up the std_action_noise buffer
-        self._mean_action_noise = []
-        self._std_action_noise = []
-        for std in self._cfg.std:
-            self._std_action_noise.append(torch.zeros((self._num_envs,), device=self._device))
-            self._mean_action_noise.append(torch.zeros((self._num_envs,), device=self._device))
-
-    def default_reset(self, env_ids: torch.Tensor | None, **kwargs) -> None:
-        """The default reset function for the randomization."""
-
-        # Do nothing
-        return
-
-    def default_update(self, **kwargs) -> None:
-        """The default update function for the randomization."""
-
-        # Do nothing
-        return
+        self._noise_bank = None
+        # Set up the std_action_noise buffer, each slice is a column of the packed noise amplitude.
+        # The last column stays at 0, it is used by the elements that are not in any slice.
+        self._noise_amplitude = torch.zeros((self._num_envs, len(self._cfg.slices) + 1), device=self._device)
+        self._std_action_noise = list(self._noise_amplitude[:, :-1].unbind(1))
+        self._mean_action_noise = [torch.zeros((self._num_envs,), device=self._device) for _ in self._cfg.std]
 
     def fn_on_reset_uniform(
         self, env_ids: torch.Tensor | None = None, gen_actions: torch.Tensor | None = None, **kwargs
@@ -168,6 +170,9 @@ class NoisyActions(Registerable, RandomizationCore):
         for i, max_delta in enumerate(self._cfg.max_delta):
             self._max_action_noise[i][env_ids] = max_delta * gen_actions
 
+        if self._noise_bank is not None:
+            self._noise_bank.fill(env_ids)
+
     def fn_on_reset_normal(
         self, env_ids: torch.Tensor | None = None, gen_actions: torch.Tensor | None = None, **kwargs
     ) -> None:
@@ -189,6 +194,9 @@ class NoisyActions(Registerable, RandomizationCore):
         for i, std in enumerate(self._cfg.std):
             self._std_action_noise[i][env_ids] = std * gen_actions
 
+        if self._noise_bank is not None:
+            self._noise_bank.fill(env_ids)
+
     def fn_on_actions_uniform(self, actions: torch.Tensor | None = None, **kwargs) -> None:
         """Apply the uniform noise to the actions. This function modifies the actions in place.
 
@@ -229,6 +237,44 @@ class NoisyActions(Registerable, RandomizationCore):
                 if self._cfg.clip_actions is not None:
                     actions[:, slice[0] : slice[1]].clip_(self._cfg.clip_actions[i][0], self._cfg.clip_actions[i][1])
 
+    def elementwise_stages(self, phase: str, dim: int) -> list[ElementwiseStage] | None:
+        """The noise is sampled for all the actions at once and scaled by the amplitude of the slice of each element.
+
+        Args:
+            phase: The phase, only the actions phase is fused.
+            dim: The number of actions.
+
+        Returns:
+            list[ElementwiseStage] | None: The noise stage."""
+
+        if phase != "actions":
+            return None
+
+        columns = slice_columns(self._cfg.slices, dim, self._device)
+        low, high = slice_bounds(self._cfg.slices, self._cfg.clip_actions, dim, self._device)
+        if self._cfg.noise_bank_size > 0:
+            distribution = "uniform" if "uniform" in self._cfg.randomization_modes else "normal"
+            self._noise_bank = NoiseBank(
+                self._rng, distribution, self._cfg.noise_bank_size, dim, self._num_envs, self._device
+            )
+
+            def operand() -> torch.Tensor:
+                return self._noise_bank.next() * self._noise_amplitude[:, columns]
+
+        elif "uniform" in self._cfg.randomization_modes:
+
+            def operand() -> torch.Tensor:
+                noise = self._rng.sample_uniform_torch(-1.0, 1.0, (dim,)).view(self._num_envs, dim)
+                return noise * self._noise_amplitude[:, columns]
+
+        else:
+
+            def operand() -> torch.Tensor:
+                noise = self._rng.sample_normal_torch(0.0, 1.0, (dim,)).view(self._num_envs, dim)
+                return noise * self._noise_amplitude[:, columns]
+
+        return [ElementwiseStage("add", operand, low, high)]
+
     def apply_randomization(self, ids: torch.Tensor | None = None) -> None:
         """Everything is done in place. Nothing to update.
 
@@ -0,0 +1,144 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import torch
+import weakref
+
+from isaaclab.assets import Articulation, RigidObject
+
+
+class PhysxPropertyWriter:
+    PROPERTIES = {
+        "masses": ("get_masses", "set_masses"),
+        "coms": ("get_coms", "set_coms"),
+        "inertias": ("get_inertias", "set_inertias"),
+    }
+    _writers = weakref.WeakKeyDictionary()
+
+    def __init__(self, asset: Articulation | RigidObject, num_envs: int = 1, device: str = "cuda") -> None:
+        """Schedules the writes of the rigid body properties of an asset to PhysX.
+
+        The randomizers modify the properties on the device and mark the environments they changed as dirty. The
+        writes are then coalesced: the dirty rows of all the properties are gathered in a single copy to a pinned host
+        buffer, and each property is written for the dirty environments only. The flush is performed by the
+        :class:`RandomizationPipeline` once per env step, and at the end of each reset.
+
+        The properties changed at reset are written at the next flush. The properties changed continuously, such as
+        a decaying mass, are written every `write_interval` env step flushes.
+
+        Args:
+            asset: The asset whose properties are written.
+            num_envs: The number of environments.
+            device: The device on which the properties are stored."""
+
+        self._asset = asset
+        self._num_envs = num_envs
+        self._device = device
+        self._pin_memory = device.startswith("cuda")
+
+        self._values: dict[str, torch.Tensor] = {}
+        self._host_values: dict[str, torch.Tensor] = {}
+        self._dirty: dict[str, torch.Tensor] = {}
+        self._continuous: dict[str, bool] = {}
+        self._write_intervals: dict[str, int] = {}
+        self._staging = torch.empty((0,), pin_memory=self._pin_memory)
+        self._num_flushes = 0
+
+    @classmethod
+    def get(cls, asset: Articulation | RigidObject, num_envs: int = 1, device: str = "cuda") -> "PhysxPropertyWriter":
+        """Returns the writer of an asset, such that the randomizers of the same asset share it.
+
+        Args:
+            asset: The asset whose properties are written.
+            num_envs: The number of environments.
+            device: The device on which the properties are stored.
+
+        Returns:
+            PhysxPropertyWriter: The writer of the asset."""
+
+        if asset not in cls._writers:
+            cls._writers[asset] = cls(asset, num_envs, device)
+        return cls._writers[asset]
+
+    def read(self, name: str) -> torch.Tensor:
+        """Reads the current value of a property from PhysX.
+
+        Args:
+            name: The name of the property, one of 'masses', 'coms' or 'inertias'.
+
+        Returns:
+            torch.Tensor: The values of the property on the device."""
+
+        return getattr(self._asset.root_physx_view, self.PROPERTIES[name][0])().to(self._device)
+
+    def register(self, name: str, values: torch.Tensor, write_interval: int = 1) -> None:
+        """Registers the device tensor holding a property. The tensor must be modified in place. If the property is
+        already registered, the new tensor replaces the previous one.
+
+        Args:
+            name: The name of the property, one of 'masses', 'coms' or 'inertias'.
+            values: The values of the property, [num_envs, num_bodies, ...].
+            write_interval: The number of env step flushes between two writes of the continuous changes."""
+
+        assert name in self.PROPERTIES, f"Invalid property: {name}, available properties: {list(self.PROPERTIES)}"
+        assert write_interval > 0, "The write interval must be strictly positive."
+
+        self._values[name] = values
+        self._host_values[name] = values.cpu().pin_memory() if self._pin_memory else values.cpu().clone()
+        self._dirty[name] = torch.zeros(self._num_envs, dtype=torch.bool, device=self._device)
+        self._continuous[name] = False
+        self._write_intervals[name] = write_interval
+        width = sum(value[0].numel() for value in self._values.values())
+        self._staging = torch.empty((self._num_envs, width), pin_memory=self._pin_memory)
+
+    def mark_dirty(self, name: str, env_ids: torch.Tensor | None = None) -> None:
+        """Marks the environments whose property changed.
+
+        Args:
+            name: The name of the property.
+            env_ids: The ids of the environments. None marks a continuous change of all the environments."""
+
+        if env_ids is None:
+            self._continuous[name] = True
+        else:
+            self._dirty[name][env_ids] = True
+
+    def flush(self, step: bool = True) -> None:
+        """Writes the dirty rows of all the properties to PhysX.
+
+        Args:
+            step: Whether the flush ends an env step. Only these flushes write the continuous changes and count
+                towards their write interval."""
+
+        if step:
+            for name in self._values:
+                if self._continuous[name] and self._num_flushes % self._write_intervals[name] == 0:
+                    self._dirty[name].fill_(True)
+                    self._continuous[name] = False
+            self._num_flushes += 1
+
+        if not self._values:
+            return
+        dirty = torch.stack(list(self._dirty.values()))
+        names = [name for name, is_dirty in zip(self._dirty, dirty.any(dim=1).tolist()) if is_dirty]
+        if not names:
+            return
+
+        # Single gather and device to host copy for all the properties
+        ids = torch.nonzero(dirty.any(dim=0)).squeeze(-1)
+        packed = torch.cat([self._values[name][ids].flatten(1) for name in names], dim=1)
+        staging = self._staging[: len(ids), : packed.shape[1]]
+        staging.copy_(packed, non_blocking=True)
+        # The copy of the ids is blocking, it waits for the staging copy that precedes it on the stream
+        ids_cpu = ids.cpu()
+
+        offset = 0
+        for name in names:
+            host_values = self._host_values[name]
+            width = host_values[0].numel()
+            host_values[ids_cpu] = staging[:, offset : offset + width].reshape(len(ids), *host_values.shape[1:])
+            offset += width
+            getattr(self._asset.root_physx_view, self.PROPERTIES[name][1])(host_values, ids_cpu)
+            self._dirty[name].fill_(False)
@@ -41,6 +41,8 @@ class RandomizationCore:
         self._scene = scene
         self._num_envs = num_envs
         self._device = device
+        # Set by the randomizers writing to the rigid body properties of PhysX
+        self.property_writer = None
 
     @property
     def data(self) -> dict:
@@ -192,6 +194,52 @@ class RandomizationCore:
 
         # Note, only the observations are updated here.
 
+    def compile_hooks(self, phase: str, dim: int | None = None) -> list:
+        """Flattens the hooks called by one of the reset, update, actions or observations methods. The default hook is
+        dropped if it is not overridden, and the randomization hooks are dropped if no mode acts on that phase.
+
+        Args:
+            phase: The phase, one of 'reset', 'update', 'actions' or 'observations'.
+            dim: The width of the randomized tensor, used to build the elementwise stages.
+
+        Returns:
+            list: The hooks in the order they are called, functions or :class:`ElementwiseStage`. The functions of the
+                reset phase take the env_ids, the others take keyword arguments."""
+
+        if not self._cfg.enable:
+            return []
+
+        hooks = []
+        if getattr(type(self), "default_" + phase) is not getattr(RandomizationCore, "default_" + phase):
+            hooks.append(getattr(self, "default_" + phase))
+        if not getattr(self, "update_on_" + phase):
+            return hooks
+
+        stages = self.elementwise_stages(phase, dim) if dim is not None else None
+        if stages is not None:
+            return hooks + stages
+
+        fns = getattr(self, "on_" + phase + "_fns")
+        hooks += [fns[mode] for mode in self._cfg.randomization_modes if mode in fns]
+        if phase == "reset":
+            hooks.append(self.apply_randomization)
+        elif phase == "update":
+            hooks.append(lambda **kwargs: self.apply_randomization())
+        return hooks
+
+    def elementwise_stages(self, phase: str, dim: int) -> list | None:
+        """The randomization hooks of a phase expressed as elementwise stages, such that they can be fused.
+
+        Args:
+            phase: The phase, 'actions' or 'observations'.
+            dim: The width of the randomized tensor.
+
+        Returns:
+            list | None: The :class:`ElementwiseStage` replacing the hooks of the phase, or None if the hooks cannot be
+                expressed as elementwise stages."""
+
+        return
+
     def default_reset(self, env_ids: torch.Tensor, **kwargs) -> None:
         """The default reset function for the randomization."""
         return
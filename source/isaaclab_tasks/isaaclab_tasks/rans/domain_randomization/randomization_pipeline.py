@@ -0,0 +1,240 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import torch
+from collections.abc import Callable
+
+from .randomization_core import RandomizationCore
+
+
+class ElementwiseStage:
+    def __init__(
+        self,
+        op: str,
+        operand: Callable[[], torch.Tensor],
+        low: torch.Tensor | None = None,
+        high: torch.Tensor | None = None,
+    ) -> None:
+        """An elementwise randomization stage: x = clip(x op operand, low, high). Consecutive stages of a phase are
+        fused into a single kernel by the :class:`RandomizationPipeline`.
+
+        Args:
+            op: The operation, either 'add' or 'mul'.
+            operand: A function returning the operand, a tensor of the same shape as the randomized tensor. It is
+                called once per step, so it is where the noise is sampled.
+            low: The lower bound of each column. None disables the clipping.
+            high: The upper bound of each column. None disables the clipping."""
+
+        assert op in ["add", "mul"], f"Invalid elementwise operation: {op}"
+        self.op = op
+        self.operand = operand
+        self.low = low
+        self.high = high
+
+
+def fused_elementwise(
+    x: torch.Tensor,
+    ops: tuple[str, ...],
+    operands: list[torch.Tensor],
+    lows: list[torch.Tensor | None],
+    highs: list[torch.Tensor | None],
+) -> torch.Tensor:
+    """Applies a chain of elementwise stages. Once compiled, the chain runs as a single kernel.
+
+    Args:
+        x: The randomized tensor.
+        ops: The operation of each stage.
+        operands: The operand of each stage.
+        lows: The lower bound of each stage.
+        highs: The upper bound of each stage.
+
+    Returns:
+        torch.Tensor: The randomized tensor."""
+
+    for op, operand, low, high in zip(ops, operands, lows, highs):
+        x = x * operand if op == "mul" else x + operand
+        if low is not None:
+            x = torch.clamp(x, low, high)
+    return x
+
+
+class FusedElementwiseStages:
+    def __init__(self, stages: list[ElementwiseStage], target: str, compile: bool = True) -> None:
+        """Runs consecutive elementwise stages in a single kernel, in place.
+
+        Args:
+            stages: The stages to fuse.
+            target: The name of the keyword argument holding the randomized tensor.
+            compile: Whether to compile the chain with torch.compile. Falls back to eager mode if the compilation
+                fails."""
+
+        self._stages = stages
+        self._target = target
+        self._ops = tuple(stage.op for stage in stages)
+        self._lows = [stage.low for stage in stages]
+        self._highs = [stage.high for stage in stages]
+        self._fn = torch.compile(fused_elementwise, dynamic=False) if compile else fused_elementwise
+
+    def __call__(self, **kwargs) -> None:
+        x = kwargs[self._target]
+        operands = [stage.operand() for stage in self._stages]
+        try:
+            out = self._fn(x, self._ops, operands, self._lows, self._highs)
+        except Exception as e:
+            # torch.compile is not supported on every platform
+            if self._fn is fused_elementwise:
+                raise
+            print(f"[WARN] Could not compile the randomization stages, falling back to eager mode: {e}")
+            self._fn = fused_elementwise
+            out = self._fn(x, self._ops, operands, self._lows, self._highs)
+        x.copy_(out)
+
+
+class RandomizationPipeline:
+    PHASES = ["reset", "update", "actions", "observations"]
+
+    def __init__(
+        self,
+        randomizers: list[RandomizationCore],
+        dims: dict[str, int] | None = None,
+        compile: bool = True,
+    ) -> None:
+        """Flattens the hooks of the randomizers into one list per phase. It is built once the randomizers are set up.
+
+        The disabled randomizers, and the phases a randomizer does not act on, are removed entirely. Consecutive
+        elementwise stages, such as the action noise and the action rescaling, are fused into a single kernel.
+        The order of the hooks is the same as when calling the randomizers one after the other. The PhysX properties
+        changed by the randomizers are written at the end of the 'reset' phase, and once per env step at the end of
+        the 'actions' phase. The tasks do not have an 'actions' phase, their properties are written at reset.
+
+        Args:
+            randomizers: The randomizers, after their setup.
+            dims: The width of the tensors randomized in the 'actions' and 'observations' phases. The stages of a
+                phase without a width are not fused.
+            compile: Whether to compile the fused stages with torch.compile."""
+
+        dims = {} if dims is None else dims
+        self._hooks = {}
+        for phase in self.PHASES:
+            hooks = []
+            for randomizer in randomizers:
+                hooks += randomizer.compile_hooks(phase, dims.get(phase))
+            self._hooks[phase] = self.fuse(hooks, phase, compile)
+        # The writers shared by the randomizers of the PhysX properties, flushed at reset and once per env step
+        self._property_writers = []
+        for randomizer in randomizers:
+            writer = randomizer.property_writer
+            if randomizer._cfg.enable and writer is not None and writer not in self._property_writers:
+                self._property_writers.append(writer)
+
+    @staticmethod
+    def fuse(hooks: list, target: str, compile: bool) -> list[Callable]:
+        """Groups the consecutive elementwise stages into fused calls.
+
+        Args:
+            hooks: The hooks of a phase, functions or elementwise stages.
+            target: The name of the keyword argument holding the randomized tensor.
+            compile: Whether to compile the fused stages.
+
+        Returns:
+            list[Callable]: The functions to call, in order."""
+
+        fused, stages = [], []
+        for hook in hooks + [None]:
+            if isinstance(hook, ElementwiseStage):
+                stages.append(hook)
+                continue
+            if stages:
+                fused.append(FusedElementwiseStages(stages, target, compile))
+                stages = []
+            if hook is not None:
+                fused.append(hook)
+        return fused
+
+    def num_hooks(self, phase: str) -> int:
+        """The number of calls performed in a phase."""
+
+        return len(self._hooks[phase])
+
+    def reset(self, env_ids: torch.Tensor) -> None:
+        """Resets the randomizers, and writes the PhysX properties they changed."""
+
+        for hook in self._hooks["reset"]:
+            hook(env_ids)
+        self.flush(step=False)
+
+    def update(self, **kwargs) -> None:
+        for hook in self._hooks["update"]:
+            hook(**kwargs)
+
+    def actions(self, **kwargs) -> None:
+        """Randomizes the actions in place. Called once per env step, it also flushes the PhysX property writes."""
+
+        for hook in self._hooks["actions"]:
+            hook(**kwargs)
+        self.flush()
+
+    def flush(self, step: bool = True) -> None:
+        """Writes the PhysX properties changed since the last flush.
+
+        Args:
+            step: Whether the flush ends an env step, see :meth:`PhysxPropertyWriter.flush`."""
+
+        for writer in self._property_writers:
+            writer.flush(step)
+
+    def observations(self, **kwargs) -> None:
+        """Randomizes the observations in place."""
+
+        for hook in self._hooks["observations"]:
+            hook(**kwargs)
+
+
+def slice_columns(slices: list[tuple[int, int] | int], dim: int, device: str) -> torch.Tensor:
+    """Maps each column of a tensor to the slice it belongs to.
+
+    Args:
+        slices: The slices of the tensor.
+        dim: The width of the tensor.
+        device: The device on which the tensor is stored.
+
+    Returns:
+        torch.Tensor: The index of the slice of each column, len(slices) for the columns outside of the slices."""
+
+    columns = torch.full((dim,), len(slices), dtype=torch.long)
+    for i, slice in enumerate(slices):
+        if isinstance(slice, int):
+            columns[slice] = i
+        else:
+            assert slice[1] <= dim, f"The slice {slice} is out of bounds for a tensor of width {dim}."
+            columns[slice[0] : slice[1]] = i
+    return columns.to(device)
+
+
+def slice_bounds(
+    slices: list[tuple[int, int] | int], bounds: list[tuple[float, float]] | None, dim: int, device: str
+) -> tuple[torch.Tensor | None, torch.Tensor | None]:
+    """Expands the clipping bounds of each slice to the columns of a tensor.
+
+    Args:
+        slices: The slices of the tensor.
+        bounds: The minimum and maximum values of each slice. None disables the clipping.
+        dim: The width of the tensor.
+        device: The device on which the tensor is stored.
+
+    Returns:
+        tuple[torch.Tensor | None, torch.Tensor | None]: The lower and upper bounds of each column, unbounded outside
+            of the slices."""
+
+    if bounds is None:
+        return None, None
+    low = torch.full((dim,), -float("inf"))
+    high = torch.full((dim,), float("inf"))
+    for slice, (min_value, max_value) in zip(slices, bounds):
+        if isinstance(slice, int):
+            low[slice], high[slice] = min_value, max_value
+        else:
+            low[slice[0] : slice[1]], high[slice[0] : slice[1]] = min_value, max_value
+    return low.to(device), high.to(device)
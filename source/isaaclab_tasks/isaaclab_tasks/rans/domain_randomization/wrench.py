@@ -58,6 +58,12 @@ class WrenchRandomizationCfg(RandomizationCoreCfg):
     """The interval at which the wrench is applied. (in seconds) Default is 5."""
     max_push_interval_variation: int = 1
     """The maximum variation in the interval at which the wrench is applied. (in seconds) Default is 1."""
+    presample_kicks: bool = False
+    """Whether to draw the times and wrenches of all the kicks of the episode at reset. Default is False. The update
+    then reduces to a lookup in the schedule."""
+    max_kicks: int = 16
+    """The number of kicks drawn at reset when the kicks are pre-sampled. Once they are exhausted, the last kick
+    keeps being applied until the next reset. Default is 16."""
 
     # Constant wrenches
     constant_force_multiplier: float = 1.0
@@ -165,163 +171,189 @@ class WrenchRandomization(Registerable, RandomizationCore):
         self._kick_torque[env_ids].fill_(0.0)
         self._bool_to_kick[env_ids].fill_(False)
 
-    def default_update(self, **kwargs) -> None:
-        """The default update function for the randomization."""
-
-        # Do nothing
-        pass
-
     def fn_on_setup_kick_uniform(self) -> None:
         """Setup the uniform kick randomization."""
 
-        self._kick_time = torch.zeros((self._num_envs,), dtype=torch.int32, device=self._device)
-        self._kick_force_scale = torch.zeros((self._num_envs,), device=self._device)
-        self._kick_torque_scale = torch.zeros((self._num_envs,), device=self._device)
+        self.setup_kicks()
 
     def fn_on_reset_kick_uniform(
         self, env_ids: torch.Tensor | None = None, gen_actions: torch.Tensor | None = None, **kwargs
     ) -> None:
         """Samples a next time step to apply the kick."""
 
-        if env_ids is None:
-            env_ids = self._ALL_INDICES
+        self.reset_kicks("uniform", env_ids, gen_actions)
 
-        # Use the gen actions as a scaling factor for the force and torque
-        if gen_actions is None:
-            gen_actions = self._rng.sample_uniform_torch(0, 1, (2,), env_ids)
-        self._kick_force_scale[env_ids] = gen_actions[:, 0] * self._cfg.kick_force_multiplier
-        self._kick_torque_scale[env_ids] = gen_actions[:, 1] * self._cfg.kick_torque_multiplier
+    def fn_on_update_kick_uniform(self, **kwargs) -> None:
+        """Updates the kick force and torque."""
 
-        # Reset the kick time
-        self._kick_time[env_ids] = self._rng.sample_integer_torch(
+        self.update_kicks("uniform")
+
+    def fn_on_setup_kick_normal(self) -> None:
+        """Setup the normal kick randomization."""
+
+        self.setup_kicks()
+
+    def fn_on_reset_kick_normal(
+        self, env_ids: torch.Tensor | None = None, gen_actions: torch.Tensor | None = None, **kwargs
+    ) -> None:
+        """Samples a next time step to apply the kick."""
+
+        self.reset_kicks("normal", env_ids, gen_actions)
+
+    def fn_on_update_kick_normal(self, **kwargs) -> None:
+        """Updates the kick force and torque."""
+
+        self.update_kicks("normal")
+
+    def setup_kicks(self) -> None:
+        """Allocates the buffers of the kicks, shared by the uniform and normal kick randomizations."""
+
+        self._kick_time = torch.zeros((self._num_envs,), dtype=torch.int32, device=self._device)
+        self._kick_force_scale = torch.zeros((self._num_envs,), device=self._device)
+        self._kick_torque_scale = torch.zeros((self._num_envs,), device=self._device)
+        if self._cfg.presample_kicks:
+            # Step at which each kick happens, and the wrench applied from that step onward: [force, torque]
+            self._kick_schedule_time = torch.zeros(
+                (self._num_envs, self._cfg.max_kicks), dtype=torch.int32, device=self._device
+            )
+            self._kick_schedule = torch.zeros((self._num_envs, self._cfg.max_kicks, 6), device=self._device)
+            self._num_kicks = torch.zeros((self._num_envs,), dtype=torch.long, device=self._device)
+
+    def sample_kick_intervals(self, shape: tuple[int], ids: torch.Tensor | None = None) -> torch.Tensor:
+        """Samples the number of steps between two kicks.
+
+        Args:
+            shape: The number of intervals sampled for each environment.
+            ids: The ids of the environments. None samples for all the environments.
+
+        Returns:
+            torch.Tensor: The intervals."""
+
+        return self._rng.sample_integer_torch(
             self._cfg.push_interval - self._cfg.max_push_interval_variation,
             self._cfg.push_interval + self._cfg.max_push_interval_variation,
-            (1,),
-            env_ids,
+            shape,
+            ids,
         )
 
-    def fn_on_update_kick_uniform(self, **kwargs) -> None:
-        """Updates the kick force and torque."""
+    def sample_directions(self, magnitude: torch.Tensor, dimension: int, ids: torch.Tensor | None) -> torch.Tensor:
+        """Projects magnitudes along random directions. In 1D the direction is the z axis, in 2D it lies in the
+        xy plane.
 
-        self._kick_time -= 1
+        Args:
+            magnitude: The magnitudes, [num_envs] or [num_envs, num_samples].
+            dimension: The dimension of the space, 1, 2 or 3.
+            ids: The ids of the environments. None samples for all the environments.
+
+        Returns:
+            torch.Tensor: The vectors, [..., 3]."""
+
+        vectors = torch.zeros(magnitude.shape + (3,), device=self._device)
+        if dimension == 1:
+            vectors[..., 2] = magnitude
+            return vectors
+        shape = (1,) if magnitude.dim() == 1 else (magnitude.shape[1],)
+        theta = self._rng.sample_uniform_torch(-torch.pi, torch.pi, shape, ids=ids)
+        if dimension == 2:
+            vectors[..., 0] = torch.cos(theta) * magnitude
+            vectors[..., 1] = torch.sin(theta) * magnitude
+        else:
+            phi = self._rng.sample_uniform_torch(-torch.pi / 2, torch.pi / 2, shape, ids=ids)
+            vectors[..., 0] = torch.cos(theta) * torch.sin(phi) * magnitude
+            vectors[..., 1] = torch.sin(theta) * torch.sin(phi) * magnitude
+            vectors[..., 2] = torch.cos(phi) * magnitude
+        return vectors
 
-        # Collect the indices of the bodies to kick. Saving bool_to_kick as a class variable to avoid setting it to zero
-        # every time after the update.
-        self._bool_to_kick = self._kick_time <= 0
-        idx_to_kick = torch.argwhere(self._bool_to_kick).flatten()
+    def sample_kicks(
+        self, mode: str, shape: tuple[int], ids: torch.Tensor | None = None
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """Samples kick wrenches. The shapes are fixed, such that no synchronization with the host is needed.
 
-        # If there are any bodies to kick
-        if idx_to_kick.shape[0] > 0:
-            # Compute the norm of the force and torque
-            kick_force = self._kick_force_scale[idx_to_kick] * self._rng.sample_uniform_torch(
-                self._cfg.uniform_force[0], self._cfg.uniform_force[1], (1,), idx_to_kick
-            )
-            kick_torque = self._kick_torque_scale[idx_to_kick] * self._rng.sample_uniform_torch(
-                self._cfg.uniform_torque[0], self._cfg.uniform_torque[1], (1,), idx_to_kick
-            )
+        Args:
+            mode: The distribution of the magnitudes, 'uniform' or 'normal'.
+            shape: The number of kicks sampled for each environment.
+            ids: The ids of the environments. None samples for all the environments.
 
-            # Project the force and torque in the 2D or 3D space
-            theta = self._rng.sample_uniform_torch(-torch.pi, torch.pi, (1,), ids=idx_to_kick)
-            if self._cfg.force_dimension == 2:  # 2D
-                self._kick_force[self._bool_to_kick, 0] = torch.cos(theta) * kick_force
-                self._kick_force[self._bool_to_kick, 1] = torch.sin(theta) * kick_force
-            else:  # 3D
-                phi = self._rng.sample_uniform_torch(-torch.pi / 2, torch.pi / 2, (1,), ids=idx_to_kick)
-                self._kick_force[self._bool_to_kick, 0] = torch.cos(theta) * torch.sin(phi) * kick_force
-                self._kick_force[self._bool_to_kick, 1] = torch.sin(theta) * torch.sin(phi) * kick_force
-                self._kick_force[self._bool_to_kick, 2] = torch.cos(phi) * kick_force
+        Returns:
+            tuple[torch.Tensor, torch.Tensor]: The forces and torques, [num_envs, 3] or [num_envs, num_kicks, 3]."""
 
-            if self._cfg.torque_dimension == 1:  # 2D
-                self._kick_torque[self._bool_to_kick, 2] = kick_torque
-            else:  # 3D
-                theta = self._rng.sample_uniform_torch(-torch.pi, torch.pi, (1,), ids=idx_to_kick)
-                phi = self._rng.sample_uniform_torch(-torch.pi / 2, torch.pi / 2, (1,), ids=idx_to_kick)
-                self._kick_torque[self._bool_to_kick, 0] = torch.cos(theta) * torch.sin(phi) * kick_torque
-                self._kick_torque[self._bool_to_kick, 1] = torch.sin(theta) * torch.sin(phi) * kick_torque
-                self._kick_torque[self._bool_to_kick, 2] = torch.cos(phi) * kick_torque
-
-            # Reset the kick time
-            self._kick_time[self._bool_to_kick] = self._rng.sample_integer_torch(
-                self._cfg.push_interval - self._cfg.max_push_interval_variation,
-                self._cfg.push_interval + self._cfg.max_push_interval_variation,
-                (1,),
-                idx_to_kick,
+        if mode == "uniform":
+            force = self._rng.sample_uniform_torch(self._cfg.uniform_force[0], self._cfg.uniform_force[1], shape, ids)
+            torque = self._rng.sample_uniform_torch(
+                self._cfg.uniform_torque[0], self._cfg.uniform_torque[1], shape, ids
             )
+        else:
+            force = self._rng.sample_normal_torch(self._cfg.normal_force[0], self._cfg.normal_force[1], shape, ids)
+            torque = self._rng.sample_normal_torch(self._cfg.normal_torque[0], self._cfg.normal_torque[1], shape, ids)
 
-    def fn_on_setup_kick_normal(self) -> None:
-        """Setup the normal kick randomization."""
+        force_scale = self._kick_force_scale if ids is None else self._kick_force_scale[ids]
+        torque_scale = self._kick_torque_scale if ids is None else self._kick_torque_scale[ids]
+        if force.dim() == 2:
+            force_scale, torque_scale = force_scale.unsqueeze(-1), torque_scale.unsqueeze(-1)
+        forces = self.sample_directions(force * force_scale, self._cfg.force_dimension, ids)
+        torques = self.sample_directions(torque * torque_scale, self._cfg.torque_dimension, ids)
+        return forces, torques
 
-        self._kick_time = torch.zeros((self._num_envs), dtype=torch.int32, device=self._device)
-        self._kick_force_scale = torch.zeros((self._num_envs,), device=self._device)
-        self._kick_torque_scale = torch.zeros((self._num_envs,), device=self._device)
+    def reset_kicks(self, mode: str, env_ids: torch.Tensor | None, gen_actions: torch.Tensor | None) -> None:
+        """Samples the scale of the kicks and the time of the next kick. With the pre-sampled schedule, all the kicks
+        of the episode are drawn at once.
 
-    def fn_on_reset_kick_normal(
-        self, env_ids: torch.Tensor | None = None, gen_actions: torch.Tensor | None = None, **kwargs
-    ) -> None:
-        """Samples a next time step to apply the kick."""
+        Args:
+            mode: The distribution of the magnitudes, 'uniform' or 'normal'.
+            env_ids: The ids of the environments.
+            gen_actions: The actions taken by the agent."""
 
         if env_ids is None:
             env_ids = self._ALL_INDICES
 
-        # Use the gen actions as a scaling factor for the force and torque.
+        # Use the gen actions as a scaling factor for the force and torque
         if gen_actions is None:
             gen_actions = self._rng.sample_uniform_torch(0, 1, (2,), env_ids)
         self._kick_force_scale[env_ids] = gen_actions[:, 0] * self._cfg.kick_force_multiplier
         self._kick_torque_scale[env_ids] = gen_actions[:, 1] * self._cfg.kick_torque_multiplier
 
-        # Reset the kick time
-        self._kick_time[env_ids] = self._rng.sample_integer_torch(
-            self._cfg.push_interval - self._cfg.max_push_interval_variation,
-            self._cfg.push_interval + self._cfg.max_push_interval_variation,
-            (1,),
-            env_ids,
-        )
+        if self._cfg.presample_kicks:
+            # With a single kick the draws are not batched along the kicks, they are reshaped to [num_envs, max_kicks]
+            schedule_shape = (len(env_ids), self._cfg.max_kicks)
+            intervals = self.sample_kick_intervals((self._cfg.max_kicks,), env_ids).reshape(schedule_shape)
+            self._kick_schedule_time[env_ids] = torch.cumsum(intervals, dim=1, dtype=torch.int32)
+            forces, torques = self.sample_kicks(mode, (self._cfg.max_kicks,), env_ids)
+            self._kick_schedule[env_ids] = torch.cat([forces, torques], dim=-1).reshape(schedule_shape + (6,))
+            self._num_kicks[env_ids] = 0
+        # Reset the kick time. With the pre-sampled schedule it counts the steps since the reset.
+        self._kick_time[env_ids] = 0 if self._cfg.presample_kicks else self.sample_kick_intervals((1,), env_ids)
+
+    def update_kicks(self, mode: str) -> None:
+        """Updates the kick force and torque. All the environments are processed at once and the kicked ones are
+        selected with a mask, such that the update does not synchronize with the host.
 
-    def fn_on_update_kick_normal(self, **kwargs) -> None:
-        """Updates the kick force and torque."""
+        Args:
+            mode: The distribution of the magnitudes, 'uniform' or 'normal'."""
+
+        if self._cfg.presample_kicks:
+            self._kick_time += 1
+            # The kicks that already happened, the wrench of the last one is applied
+            num_kicks = (self._kick_schedule_time <= self._kick_time.unsqueeze(-1)).sum(dim=-1)
+            torch.ne(num_kicks, self._num_kicks, out=self._bool_to_kick)
+            self._num_kicks.copy_(num_kicks)
+            last_kick = (num_kicks - 1).clamp(min=0).view(-1, 1, 1).expand(-1, 1, 6)
+            wrench = self._kick_schedule.gather(1, last_kick).squeeze(1) * (num_kicks > 0).unsqueeze(-1)
+            self._kick_force.copy_(wrench[:, :3])
+            self._kick_torque.copy_(wrench[:, 3:])
+            return
 
         self._kick_time -= 1
+        # Saving bool_to_kick as a class variable, it is cleared once the wrench is applied.
+        torch.le(self._kick_time, 0, out=self._bool_to_kick)
+        to_kick = self._bool_to_kick.unsqueeze(-1)
 
-        # Collect the indices of the bodies to kick. Saving bool_to_kick as a class variable to avoid setting it to zero
-        # every time after the update.
-        self._bool_to_kick = self._kick_time <= 0
-        idx_to_kick = torch.argwhere(self._bool_to_kick).flatten()
+        # The kicks are sampled for all the environments, and only applied to the kicked ones
+        forces, torques = self.sample_kicks(mode, (1,))
+        self._kick_force.copy_(torch.where(to_kick, forces, self._kick_force))
+        self._kick_torque.copy_(torch.where(to_kick, torques, self._kick_torque))
 
-        # If there are any bodies to kick
-        if idx_to_kick.shape[0] > 0:
-            # Compute the norm of the force and torque
-            kick_force = self._kick_force_scale[idx_to_kick] * self._rng.sample_normal_torch(
-                self._cfg.normal_force[0], self._cfg.normal_force[1], (1,), idx_to_kick
-            )
-            kick_torque = self._kick_torque_scale[idx_to_kick] * self._rng.sample_normal_torch(
-                self._cfg.normal_torque[0], self._cfg.normal_torque[1], (1,), idx_to_kick
-            )
-
-            theta = self._rng.sample_uniform_torch(-torch.pi, torch.pi, (1,), ids=idx_to_kick)
-            if self._cfg.force_dimension == 2:  # 2D
-                self._kick_force[self._bool_to_kick, 0] = torch.cos(theta) * kick_force
-                self._kick_force[self._bool_to_kick, 1] = torch.sin(theta) * kick_force
-            else:  # 3D
-                phi = self._rng.sample_uniform_torch(-torch.pi / 2, torch.pi / 2, (1,), ids=idx_to_kick)
-                self._kick_force[self._bool_to_kick, 0] = torch.cos(theta) * torch.sin(phi) * kick_force
-                self._kick_force[self._bool_to_kick, 1] = torch.sin(theta) * torch.sin(phi) * kick_force
-                self._kick_force[self._bool_to_kick, 2] = torch.cos(phi) * kick_force
-            if self._cfg.torque_dimension == 1:  # 2D
-                self._kick_torque[self._bool_to_kick, 2] = kick_torque
-            else:  # 3D
-                theta = self._rng.sample_uniform_torch(-torch.pi, torch.pi, (1,), ids=idx_to_kick)
-                phi = self._rng.sample_uniform_torch(-torch.pi / 2, torch.pi / 2, (1,), ids=idx_to_kick)
-                self._kick_torque[self._bool_to_kick, 0] = torch.cos(theta) * torch.sin(phi) * kick_torque
-                self._kick_torque[self._bool_to_kick, 1] = torch.sin(theta) * torch.sin(phi) * kick_torque
-                self._kick_torque[self._bool_to_kick, 2] = torch.cos(phi) * kick_torque
-
-            # Reset the kick time
-            self._kick_time[self._bool_to_kick] = self._rng.sample_integer_torch(
-                self._cfg.push_interval - self._cfg.max_push_interval_variation,
-                self._cfg.push_interval + self._cfg.max_push_interval_variation,
-                (1,),
-                idx_to_kick,
-            )
+        # Reset the kick time
+        self._kick_time.copy_(torch.where(self._bool_to_kick, self.sample_kick_intervals((1,)), self._kick_time))
 
     def fn_on_setup_constant_uniform(self) -> None:
         """Setup the uniform constant randomization."""
@@ -558,6 +590,5 @@ class WrenchRandomization(Registerable, RandomizationCore):
             projected_forces, projected_torques, body_ids=self._body_id, env_ids=ids
         )
 
-        # Reset the kick force and torque if necessary
-        if self._bool_to_kick.any():
-            self._bool_to_kick[self._bool_to_kick] = False
+        # Reset the kick flags
+        self._bool_to_kick.fill_(False)
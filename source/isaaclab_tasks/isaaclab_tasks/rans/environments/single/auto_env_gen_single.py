@@ -18,6 +18,7 @@ from isaaclab.sim.spawners.from_files import GroundPlaneCfg, spawn_ground_plane
 from isaaclab.utils import configclass
 
 from isaaclab_tasks.rans import ROBOT_CFG_FACTORY, ROBOT_FACTORY, TASK_CFG_FACTORY, TASK_FACTORY
+from isaaclab_tasks.rans.utils import ScenarioBank
 
 
 @configclass
@@ -74,6 +75,9 @@ class SingleEnvCfg(DirectRLEnvCfg):
     state_space = 0
     gen_space = 0
 
+    # evaluation scenarios replayed at every reset, see ScenarioBank. If None, the episodes are drawn at random.
+    scenario_bank_path: str | None = None
+
 
 class SingleEnv(DirectRLEnv):
 
@@ -113,6 +117,23 @@ class SingleEnv(DirectRLEnv):
         self.task_api.run_setup(self.robot_api, self.scene.env_origins)
         self.set_debug_vis(self.cfg.debug_vis)
         self.task_api.register_rigid_objects()
+        self.scenario_bank = self.load_scenario_bank(self.cfg.scenario_bank_path)
+
+    def load_scenario_bank(self, path: str | None) -> ScenarioBank | None:
+        if path is None:
+            return None
+        scenario_bank = ScenarioBank.load(path, self.num_envs, self.device)
+        if (
+            scenario_bank.task_gen_space != self.task_api.num_gen_actions
+            or scenario_bank.robot_gen_space != self.robot_api.num_gen_actions
+        ):
+            raise ValueError(
+                f"The scenario bank {path} was generated for {scenario_bank.task_gen_space} task and"
+                f" {scenario_bank.robot_gen_space} robot generation actions, but {self.cfg.task_name} and"
+                f" {self.cfg.robot_name} expect {self.task_api.num_gen_actions} and"
+                f" {self.robot_api.num_gen_actions}."
+            )
+        return scenario_bank
 
     def _configure_gym_env_spaces(self):
         """Configure the action and observation spaces for the Gym environment."""
@@ -203,7 +224,19 @@ class SingleEnv(DirectRLEnv):
 
         super()._reset_idx(env_ids)
 
-        self.task_api.reset(env_ids)
+        if self.scenario_bank is None:
+            self.task_api.reset(env_ids)
+        else:
+            # Replay the next scenario of each environment
+            task_seeds, robot_seeds, task_gen_actions, robot_gen_actions = self.scenario_bank.sample(env_ids)
+            self.env_seeds[env_ids] = task_seeds
+            self.task_api.reset(
+                env_ids,
+                gen_actions=task_gen_actions,
+                env_seeds=task_seeds,
+                robot_gen_actions=robot_gen_actions,
+                robot_env_seeds=robot_seeds,
+            )
 
     def _set_debug_vis_impl(self, debug_vis: bool) -> None:
         if debug_vis:
@@ -0,0 +1,231 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import math
+import torch
+from collections.abc import Sequence
+
+from isaaclab.utils import configclass
+
+from isaaclab_tasks.rans import ROBOT_CFG_FACTORY, ROBOT_FACTORY, TASK_CFG_FACTORY, TASK_FACTORY
+from isaaclab_tasks.rans.robots.kinematic_backend import KINEMATIC_MODEL_FACTORY, KinematicRobotBackend
+
+KINEMATIC_UNSUPPORTED_TASKS = ["PushBlock", "GoToPositionWithObstacles"]
+"""Tasks that spawn rigid objects or sensors in the stage, and hence need the simulator."""
+
+
+@configclass
+class KinematicSingleEnvCfg:
+    robot_name = "Leatherback"
+    task_name = "GoToPosition"
+
+    num_envs: int = 4096
+    env_spacing: float = 7.5
+    decimation: int = 6
+    physics_dt: float = 1.0 / 60.0
+    episode_length_s: float = 20.0
+    device: str = "cpu"
+    seed: int | None = None
+
+
+class KinematicScene:
+    def __init__(self, num_envs: int, env_spacing: float, physics_dt: float, device: str) -> None:
+        """
+        Stand-in for the InteractiveScene used by the robots, the tasks and the randomizers. It only holds the
+        environment origins, the physics time step and the registered assets.
+
+        Args:
+            num_envs (int): The number of environments.
+            env_spacing (float): The distance between the environments, they are laid out on a grid.
+            physics_dt (float): The physics time step.
+            device (str): The device on which the tensors are stored."""
+
+        self.num_envs = num_envs
+        self.physics_dt = physics_dt
+        self.device = device
+        self.articulations = {}
+        self.rigid_objects = {}
+        self.sensors = {}
+
+        # Same grid as the one generated by Isaac Lab
+        num_rows = math.ceil(num_envs / int(math.sqrt(num_envs)))
+        num_cols = math.ceil(num_envs / num_rows)
+        ii, jj = torch.meshgrid(
+            torch.arange(num_rows, device=device), torch.arange(num_cols, device=device), indexing="ij"
+        )
+        self.env_origins = torch.zeros((num_envs, 3), device=device)
+        self.env_origins[:, 0] = -(ii.flatten()[:num_envs] - (num_rows - 1) / 2) * env_spacing
+        self.env_origins[:, 1] = (jj.flatten()[:num_envs] - (num_cols - 1) / 2) * env_spacing
+
+    def __getitem__(self, key: str):
+        for assets in [self.articulations, self.rigid_objects, self.sensors]:
+            if key in assets:
+                return assets[key]
+        raise KeyError(f"Scene entity with key '{key}' not found.")
+
+
+class KinematicSingleEnv:
+    """Runs a TASK_FACTORY x ROBOT_FACTORY pair on the kinematic robot backend, without the simulator.
+
+    The stepping follows the workflow of the SingleEnv:
+    - self._pre_physics_step
+    - (Loop over N skipped steps)
+        - self._apply_action
+        - self.robot.step
+    - self._get_dones
+    - self._get_rewards
+    - (Check if reset is required)
+        - self._reset_idx
+    - self._get_observations
+
+    It is meant for throughput benchmarks and fast unit tests of the task logic, the visualization markers are not
+    created."""
+
+    def __init__(self, cfg: KinematicSingleEnvCfg) -> None:
+        assert cfg.task_name not in KINEMATIC_UNSUPPORTED_TASKS, f"{cfg.task_name} requires the simulator."
+
+        if cfg.seed is not None:
+            torch.manual_seed(cfg.seed)
+
+        self.cfg = cfg
+        self.num_envs = cfg.num_envs
+        self.device = cfg.device
+        self.physics_dt = cfg.physics_dt
+        self.step_dt = cfg.physics_dt * cfg.decimation
+        self.max_episode_length = math.ceil(cfg.episode_length_s / self.step_dt)
+
+        self.robot_cfg = ROBOT_CFG_FACTORY(cfg.robot_name)
+        self.task_cfg = TASK_CFG_FACTORY(cfg.task_name)
+
+        self.scene = KinematicScene(self.num_envs, cfg.env_spacing, cfg.physics_dt, self.device)
+        self.robot = KinematicRobotBackend(
+            KINEMATIC_MODEL_FACTORY(cfg.robot_name, robot_cfg=self.robot_cfg),
+            init_state=self.robot_cfg.robot_cfg.init_state,
+            num_envs=self.num_envs,
+            device=self.device,
+        )
+        # The randomizers fetch the robot from the scene using its name.
+        self.scene.articulations[cfg.robot_name] = self.robot
+        self.scene.articulations[self.robot_cfg.robot_name] = self.robot
+
+        self.robot_api = ROBOT_FACTORY(
+            cfg.robot_name,
+            scene=self.scene,
+            robot_cfg=self.robot_cfg,
+            robot_uid=0,
+            num_envs=self.num_envs,
+            decimation=cfg.decimation,
+            device=self.device,
+        )
+        self.task_api = TASK_FACTORY(
+            cfg.task_name,
+            scene=self.scene,
+            task_cfg=self.task_cfg,
+            task_uid=0,
+            num_envs=self.num_envs,
+            device=self.device,
+        )
+        self.task_api.register_robot(self.robot_api)
+        self.robot_api.run_setup(self.robot)
+        self.task_api.run_setup(self.robot_api, self.scene.env_origins)
+
+        self.episode_length_buf = torch.zeros(self.num_envs, dtype=torch.long, device=self.device)
+        self.reset_terminated = torch.zeros(self.num_envs, dtype=torch.bool, device=self.device)
+        self.reset_time_outs = torch.zeros_like(self.reset_terminated)
+        self.reset_buf = torch.zeros_like(self.reset_terminated)
+        self.reward_buf = torch.zeros(self.num_envs, dtype=torch.float32, device=self.device)
+        self.extras = {}
+
+    @staticmethod
+    def seed(seed: int) -> int:
+        """Set the seed of the global torch generator, from which the task and the robot draw their seeds at reset.
+
+        Args:
+            seed (int): The seed.
+
+        Returns:
+            int: The seed used."""
+
+        torch.manual_seed(seed)
+        return seed
+
+    def reset(self) -> tuple[dict, dict]:
+        """Reset all the environments.
+
+        Returns:
+            tuple[dict, dict]: The observations and the extras."""
+
+        self._reset_idx(None)
+        return self._get_observations(), self.extras
+
+    def step(self, actions: torch.Tensor) -> tuple[dict, torch.Tensor, torch.Tensor, torch.Tensor, dict]:
+        """Step the environments.
+
+        Args:
+            actions (torch.Tensor): The actions of the robots.
+
+        Returns:
+            tuple[dict, torch.Tensor, torch.Tensor, torch.Tensor, dict]: The observations, the rewards, the
+                terminated and truncated flags, and the extras."""
+
+        self._pre_physics_step(actions.to(self.device))
+        for _ in range(self.cfg.decimation):
+            self._apply_action()
+            self.robot.write_data_to_sim()
+            self.robot.step(self.physics_dt)
+
+        self.episode_length_buf += 1
+        self.reset_terminated[:], self.reset_time_outs[:] = self._get_dones()
+        self.reset_buf = self.reset_terminated | self.reset_time_outs
+        self.reward_buf = self._get_rewards()
+
+        reset_env_ids = self.reset_buf.nonzero(as_tuple=False).squeeze(-1)
+        if len(reset_env_ids) > 0:
+            self._reset_idx(reset_env_ids)
+
+        return self._get_observations(), self.reward_buf, self.reset_terminated, self.reset_time_outs, self.extras
+
+    def _pre_physics_step(self, actions: torch.Tensor) -> None:
+        self.robot_api.process_actions(actions)
+
+    def _apply_action(self) -> None:
+        self.robot_api.apply_actions()
+
+    def _get_observations(self) -> dict:
+        task_obs = self.task_api.get_observations()
+        observations = {"policy": task_obs}
+        return observations
+
+    def _get_rewards(self) -> torch.Tensor:
+        return self.task_api.compute_rewards()
+
+    def _get_dones(self) -> tuple[torch.Tensor, torch.Tensor]:
+        robot_early_termination, robot_clean_termination = self.robot_api.get_dones()
+        task_early_termination, task_clean_termination = self.task_api.get_dones()
+
+        time_out = self.episode_length_buf >= self.max_episode_length - 1
+        early_termination = robot_early_termination | task_early_termination
+        clean_termination = robot_clean_termination | task_clean_termination | time_out
+        return early_termination, clean_termination
+
+    def _reset_idx(self, env_ids: Sequence[int] | None):
+        if (env_ids is None) or (len(env_ids) == self.num_envs):
+            env_ids = self.robot._ALL_INDICES
+
+        # Logging
+        self.task_api.reset_logs(env_ids, self.episode_length_buf)
+        task_extras = self.task_api.compute_logs()
+        self.robot_api.reset_logs(env_ids, self.episode_length_buf)
+        robot_extras = self.robot_api.compute_logs()
+        self.extras["log"] = dict()
+        self.extras["log"].update(task_extras)
+        self.extras["log"].update(robot_extras)
+
+        self.robot.reset(env_ids)
+        self.episode_length_buf[env_ids] = 0
+
+        self.task_api.reset(env_ids)
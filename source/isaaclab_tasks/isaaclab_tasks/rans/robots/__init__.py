@@ -3,22 +3,33 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
-from isaaclab_tasks.rans.utils.misc import factory
+# The robots are imported on first access, and by the factory on first create.
+from isaaclab_tasks.rans.utils.misc import factory, lazy_exports
 
-from .floating_platform import FloatingPlatformRobot
-from .intball2 import IntBall2Robot
-from .jetbot import JetbotRobot
-from .kingfisher import KingfisherRobot
-from .leatherback import LeatherbackRobot
-from .modular_freeflyer import ModularFreeflyerRobot
-from .robot_core import RobotCore
-from .turtlebot2 import TurtleBot2Robot
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "FloatingPlatformRobot": ".floating_platform",
+        "IntBall2Robot": ".intball2",
+        "JetbotRobot": ".jetbot",
+        "KINEMATIC_MODEL_FACTORY": ".kinematic_backend",
+        "KinematicModelCfg": ".kinematic_backend",
+        "KinematicRobotBackend": ".kinematic_backend",
+        "KingfisherRobot": ".kingfisher",
+        "KingfisherPhysics": ".kingfisher_physics",
+        "LeatherbackRobot": ".leatherback",
+        "ModularFreeflyerRobot": ".modular_freeflyer",
+        "RobotCore": ".robot_core",
+        "ThrusterAllocation": ".thruster_allocation",
+        "TurtleBot2Robot": ".turtlebot2",
+    },
+)
 
 ROBOT_FACTORY = factory()
-ROBOT_FACTORY.register("Jetbot", JetbotRobot)
-ROBOT_FACTORY.register("Leatherback", LeatherbackRobot)
-ROBOT_FACTORY.register("FloatingPlatform", FloatingPlatformRobot)
-ROBOT_FACTORY.register("ModularFreeflyer", ModularFreeflyerRobot)
-ROBOT_FACTORY.register("Kingfisher", KingfisherRobot)
-ROBOT_FACTORY.register("Turtlebot2", TurtleBot2Robot)
-ROBOT_FACTORY.register("IntBall2", IntBall2Robot)
+ROBOT_FACTORY.register("Jetbot", f"{__name__}.jetbot:JetbotRobot")
+ROBOT_FACTORY.register("Leatherback", f"{__name__}.leatherback:LeatherbackRobot")
+ROBOT_FACTORY.register("FloatingPlatform", f"{__name__}.floating_platform:FloatingPlatformRobot")
+ROBOT_FACTORY.register("ModularFreeflyer", f"{__name__}.modular_freeflyer:ModularFreeflyerRobot")
+ROBOT_FACTORY.register("Kingfisher", f"{__name__}.kingfisher:KingfisherRobot")
+ROBOT_FACTORY.register("Turtlebot2", f"{__name__}.turtlebot2:TurtleBot2Robot")
+ROBOT_FACTORY.register("IntBall2", f"{__name__}.intball2:IntBall2Robot")
@@ -27,7 +27,14 @@ class FloatingPlatformRobot(RobotCore):
         decimation: int = 6,
         device: str = "cuda",
     ):
-        super().__init__(scene=scene, robot_uid=robot_uid, num_envs=num_envs, decimation=decimation, device=device)
+        super().__init__(
+            scene=scene,
+            robot_uid=robot_uid,
+            num_envs=num_envs,
+            decimation=decimation,
+            device=device,
+            rng_backend=robot_cfg.rng_backend,
+        )
         self._robot_cfg = robot_cfg
         # Available for use robot_cfg.is_reaction_wheel,robot_cfg.split_thrust,robot_cfg.rew_reaction_wheel_scale
         self._dim_robot_obs = self._robot_cfg.observation_space
@@ -136,8 +143,7 @@ class FloatingPlatformRobot(RobotCore):
         self._unaltered_actions = actions.clone()
 
         # Apply action randomizers
-        for randomizer in self.randomizers:
-            randomizer.actions(dt=self.scene.physics_dt, actions=actions)
+        self.randomization_pipeline.actions(dt=self.scene.physics_dt, actions=actions)
 
         self._previous_actions = self._actions.clone()
         self._actions = actions
@@ -181,8 +187,7 @@ class FloatingPlatformRobot(RobotCore):
     def apply_actions(self):
         # Compute the physics
         super().apply_actions()
-        for randomizer in self.randomizers:
-            randomizer.update(dt=self.scene.physics_dt, actions=self._actions)
+        self.randomization_pipeline.update(dt=self.scene.physics_dt, actions=self._actions)
 
         self._robot.set_external_force_and_torque(
             self._thrust_action, torch.zeros_like(self._thrust_action), body_ids=self._thrusters_dof_idx
@@ -13,6 +13,7 @@ from isaaclab.utils import math as math_utils
 from isaaclab_tasks.rans import IntBall2RobotCfg
 
 from .robot_core import RobotCore
+from .thruster_allocation import ThrusterAllocation
 
 # from isaaclab.sensors import ContactSensor
 
@@ -28,7 +29,14 @@ class IntBall2Robot(RobotCore):
         decimation: int = 4,
         device: str = "cuda",
     ) -> None:
-        super().__init__(scene=scene, robot_uid=robot_uid, num_envs=num_envs, decimation=decimation, device=device)
+        super().__init__(
+            scene=scene,
+            robot_uid=robot_uid,
+            num_envs=num_envs,
+            decimation=decimation,
+            device=device,
+            rng_backend=robot_cfg.rng_backend,
+        )
         self._robot_cfg = robot_cfg
         self._dim_robot_obs = self._robot_cfg.observation_space
         self._dim_robot_act = self._robot_cfg.action_space
@@ -49,11 +57,10 @@ class IntBall2Robot(RobotCore):
             device=self._device,
             dtype=torch.float32,
         )
-        self._transforms = torch.zeros(
-            (self._num_envs, 3, 4),
-            device=self._device,
-            dtype=torch.float32,
+        self._thrust_scale_factors = torch.tensor(
+            self._robot_cfg.thrust_scale_factors, device=self._device, dtype=torch.float32
         )
+        self._thrust_wrench = torch.zeros((self._num_envs, 1, 6), device=self._device, dtype=torch.float32)
         self._thrust_forces = torch.zeros(
             (self._num_envs, self._robot_cfg.num_thrusters, 3),
             device=self._device,
@@ -80,8 +87,13 @@ class IntBall2Robot(RobotCore):
         self._thruster_ids, _ = self._robot.find_bodies("propeller_.*")
         # Get the index of the root body (used to get the state of the robot)
         self._root_idx = self._robot.find_bodies(self._robot_cfg.root_body_name)[0]
-        # Get the thrust generator
-        self._thrust_generator = ThrustGenerator(self._robot_cfg, self._num_envs, self._device)
+        # Get the allocation of the thrusters, shared by all the environments
+        self._thrust_allocation = ThrusterAllocation.from_transforms_3d(
+            self._robot_cfg.thruster_transforms,
+            self._robot_cfg.thruster_max_thrust,
+            num_envs=self._num_envs,
+            device=self._device,
+        )
 
     def create_logs(self) -> None:
         super().create_logs()
@@ -103,7 +115,7 @@ class IntBall2Robot(RobotCore):
     def compute_rewards(self) -> torch.Tensor:
         # Compute
         action_rate = torch.sum(torch.square(self._unaltered_actions - self._previous_unaltered_actions), dim=1)
-        observed_torque = torch.sum(torch.abs(self._thrust_torques), dim=(1, 2))
+        observed_torque = self._thrust_allocation.compute_torque_norms(self._thrust_actions)
 
         # Log data
         self.scalar_logger.log("robot_state", "AVG/action_rate", action_rate)
@@ -131,8 +143,8 @@ class IntBall2Robot(RobotCore):
         super().reset(env_ids, gen_actions, env_seeds)
         self._previous_actions[env_ids] = 0
         self._thrust_forces[env_ids] = 0
-        self._thrust_positions[env_ids] = 0
         self._thrust_torques[env_ids] = 0
+        self._thrust_wrench[env_ids] = 0
 
     def set_initial_conditions(self, env_ids: torch.Tensor | None = None) -> None:
         # IntBall2 has no controllable joints yet
@@ -161,8 +173,7 @@ class IntBall2Robot(RobotCore):
         self._unaltered_actions = actions.clone()
 
         # Apply the action randomizers
-        for randomizer in self.randomizers:
-            randomizer.actions(dt=self.scene.physics_dt, actions=actions)
+        self.randomization_pipeline.actions(dt=self.scene.physics_dt, actions=actions)
 
         # Clone previous actions
         self._previous_actions = self._actions.clone()
@@ -177,26 +188,35 @@ class IntBall2Robot(RobotCore):
             self._thrust_actions = (self._actions > 0).float()  # binary action
 
         # Compute the scaled torque using the defined thrust scale factors
-        self._thrust_actions *= torch.tensor(
-            self._robot_cfg.thrust_scale_factors, device=self._device, dtype=torch.float32
-        )
+        self._thrust_actions *= self._thrust_scale_factors
         self.scalar_logger.log("robot_state", "AVG/thrust", torch.sum(self._thrust_actions, dim=1))
 
     def compute_physics(self) -> None:
-        self._thrust_positions, self._thrust_forces, self._thrust_torques = (
-            self._thrust_generator.cast_actions_to_thrust(self._thrust_actions)
-        )
+        if self._robot_cfg.aggregate_thrust_wrench:
+            self._thrust_wrench[:, 0] = self._thrust_allocation.compute_wrench(self._thrust_actions)
+        else:
+            self._thrust_positions, self._thrust_forces, self._thrust_torques = (
+                self._thrust_allocation.compute_thruster_forces(self._thrust_actions)
+            )
         # print(f"Thrust actions: \n {self._thrust_actions[0]}")
 
     def apply_actions(self) -> None:
         # self.compute_physics()
         super().apply_actions()
-        for randomizer in self.randomizers:
-            randomizer.update(dt=self.scene.physics_dt, actions=self._actions)
+        self.randomization_pipeline.update(dt=self.scene.physics_dt, actions=self._actions)
 
-        self._robot.set_external_force_and_torque(
-            self._thrust_forces, self._thrust_torques, positions=self._thrust_positions, body_ids=self._thruster_ids
-        )
+        if self._robot_cfg.aggregate_thrust_wrench:
+            # A single wrench applied on the root body, instead of one force per thruster
+            self._robot.set_external_force_and_torque(
+                self._thrust_wrench[..., :3], self._thrust_wrench[..., 3:], body_ids=self._root_idx
+            )
+        else:
+            self._robot.set_external_force_and_torque(
+                self._thrust_forces,
+                self._thrust_torques,
+                positions=self._thrust_positions,
+                body_ids=self._thruster_ids,
+            )
 
     def set_pose(
         self,
@@ -254,103 +274,3 @@ class IntBall2Robot(RobotCore):
         roll, pitch, yaw = math_utils.euler_xyz_from_quat(self.root_quat_w)
 
         return torch.stack([roll, pitch, yaw], dim=-1)
-
-
-class ThrustGenerator:
-    def __init__(self, robot_cfg: IntBall2RobotCfg, num_envs: int, device: str):
-
-        self._num_envs = num_envs
-        self._device = device
-        self._robot_cfg = robot_cfg
-
-        self.initialize_buffers()
-        self.get_transforms_from_cfg()
-
-    def initialize_buffers(self):
-        self._transforms3D = torch.zeros(
-            (self._num_envs, self._robot_cfg.num_thrusters, 4, 4),
-            dtype=torch.float,
-            device=self._device,
-        )
-        self._transforms = torch.zeros(
-            (self._num_envs, self._robot_cfg.num_thrusters, 7),
-            dtype=torch.float,
-            device=self._device,
-        )
-        self._thrust_force = torch.zeros(
-            (self._num_envs, self._robot_cfg.num_thrusters), device=self._device, dtype=torch.float32
-        )
-        # self._drag_torque_factors = torch.zeros(
-        #     (self._num_envs, self._robot_cfg.num_thrusters),
-        #     device=self._device,
-        #     dtype=torch.float32,
-        # )
-        self.unit_vector = torch.zeros(
-            (self._num_envs, self._robot_cfg.num_thrusters, 3),
-            device=self._device,
-            dtype=torch.float32,
-        )
-        # self.unit_vector[:, :, 2] = 1.0  # Default thrust direction is Z
-
-    def get_transforms_from_cfg(self):
-        """Extracts thruster positions and orientations from the config."""
-
-        assert (
-            len(self._robot_cfg.thruster_transforms) == self._robot_cfg.num_thrusters
-        ), "Number of thruster transforms must match the number of thrusters."
-
-        # Convert each thruster's defined position and rotation into transformation matrices
-        for i, trsfrm in enumerate(self._robot_cfg.thruster_transforms):
-            x, y, z, rot_x, rot_y, rot_z = trsfrm  # extract components
-
-            R = math_utils.matrix_from_euler(
-                torch.tensor([rot_x, rot_y, rot_z], device=self._device).unsqueeze(0), convention="XYZ"
-            )
-
-            # define the 3D transformation matrix
-            self._transforms3D[:, i, :3, :3] = R
-            self._transforms3D[:, i, :3, 3] = torch.tensor([x, y, z], device=self._device)
-            self._transforms3D[:, i, 3, 3] = 1.0
-
-            # thrust direction (outward normal)
-            normal = R[:, 2]  # Z-axis of thruster frame
-            self.unit_vector[:, i, :] = normal
-
-            # Assign thrust scaled defined in config
-            self._thrust_force[:, i] = self._robot_cfg.thruster_max_thrust[i]
-
-    def cast_actions_to_thrust(self, actions):
-        """
-        Projects the thrusts for IntBall2 into world coordinates.
-        Converts thrust commands into real-world forces and torques.
-        """
-
-        # Scale thrust actions by their maximum thrust values
-        rand_forces = actions * self._thrust_force
-        # Split transforms into translation and rotation
-        R = self._transforms3D[:, :, :3, :3].reshape(-1, 3, 3)  # Extract 3x3 rotation matrices
-        T = self._transforms3D[:, :, :3, 3].reshape(-1, 3)  # Extract translation (position) vectors
-        # Compute thrust force directions using unit vectors (Z-axis of thruster frame)
-        force_vector = -self.unit_vector * rand_forces.view(-1, self._robot_cfg.num_thrusters, 1)
-        # Rotate the forces from local frame (thruster) to world frame
-        rotated_forces = torch.matmul(R, force_vector.view(-1, 3, 1)).squeeze(-1)  # Shape: (num_envs, num_thrusters, 3)
-
-        # Compute torques
-        torques = torch.cross(T, rotated_forces, dim=-1)  # Shape: (num_envs, num_thrusters, 3)
-
-        # Return forces and torques applied at thruster positions
-        return (
-            T.reshape(-1, self._robot_cfg.num_thrusters, 3),
-            rotated_forces.reshape(-1, self._robot_cfg.num_thrusters, 3),
-            torques.reshape(-1, self._robot_cfg.num_thrusters, 3),
-        )
-
-    @property
-    def compact_transforms(self):
-        """Returns the compact representation of thruster transforms."""
-        return self._transforms  # Shape: (num_envs, num_thrusters, 6)
-
-    @property
-    def transforms3D(self):
-        """Returns the full 3D transformation matrices of thrusters."""
-        return self._transforms3D  # Shape: (num_envs, num_thrusters, 4, 4)
@@ -26,7 +26,14 @@ class JetbotRobot(RobotCore):
         decimation: int = 4,
         device: str = "cuda",
     ):
-        super().__init__(scene=scene, robot_uid=robot_uid, num_envs=num_envs, decimation=decimation, device=device)
+        super().__init__(
+            scene=scene,
+            robot_uid=robot_uid,
+            num_envs=num_envs,
+            decimation=decimation,
+            device=device,
+            rng_backend=robot_cfg.rng_backend,
+        )
         self._robot_cfg = robot_cfg
         self._dim_robot_obs = self._robot_cfg.observation_space
         self._dim_robot_act = self._robot_cfg.action_space
@@ -119,8 +126,7 @@ class JetbotRobot(RobotCore):
         self._unaltered_actions = actions.clone()
 
         # Apply action randomizers
-        for randomizer in self.randomizers:
-            randomizer.actions(dt=self.scene.physics_dt, actions=actions)
+        self.randomization_pipeline.actions(dt=self.scene.physics_dt, actions=actions)
 
         self._previous_actions = self._actions.clone()
         self._actions = actions
@@ -137,8 +143,7 @@ class JetbotRobot(RobotCore):
     def apply_actions(self):
         # Compute the physics
         super().apply_actions()
-        for randomizer in self.randomizers:
-            randomizer.update(dt=self.scene.physics_dt, actions=self._actions)
+        self.randomization_pipeline.update(dt=self.scene.physics_dt, actions=self._actions)
 
         # Scale the actions
         wheel_action = torch.cat((self.left_wheel_action.unsqueeze(-1), self.right_wheel_action.unsqueeze(-1)), dim=1)
@@ -0,0 +1,890 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import math
+import re
+import torch
+from collections.abc import Sequence
+from dataclasses import MISSING
+
+from isaaclab.utils import configclass
+from isaaclab.utils import math as math_utils
+from isaaclab.utils.string import resolve_matching_names
+
+from isaaclab_tasks.rans.utils.misc import factory
+
+
+@configclass
+class KinematicModelCfg:
+    """Description of a robot for the kinematic backend."""
+
+    dynamics: str = MISSING
+    """The integrator used to move the robot. One of ["differential_drive", "ackermann", "planar", "rigid_body"]."""
+
+    body_names: list[str] = MISSING
+    """The names of the bodies of the articulation. Only the bodies used by the robots and randomizers are needed."""
+
+    root_body_name: str = MISSING
+    """The name of the body that moves. It is the articulation root, unless the articulation is anchored."""
+
+    joint_names: list[str] = []
+    """The names of the joints of the articulation."""
+
+    anchored: bool = False
+    """Whether the articulation root is a fixed anchor body, to which the moving body is attached with planar lock
+    joints (x, y, yaw). This is how the 2D floating platforms are built."""
+
+    planar_joint_names: list[str] = []
+    """The names of the x, y and yaw lock joints of an anchored articulation, in that order."""
+
+    body_offsets: dict[str, tuple[float, float, float]] = {}
+    """The positions of the bodies in the frame of the moving body. Missing bodies are at the origin."""
+
+    body_rotations: dict[str, tuple[float, float, float, float]] = {}
+    """The orientations (w, x, y, z) of the bodies in the frame of the moving body. Missing bodies are aligned."""
+
+    mass: float = 1.0
+    """The default mass of the moving body [kg]."""
+
+    inertia: tuple[float, float, float] = (1.0, 1.0, 1.0)
+    """The default diagonal inertia of the moving body [kg.m^2]."""
+
+    wheel_joint_names: list[str] = []
+    """The wheel joints, [left, right] for a differential drive, the driven wheels for an ackermann."""
+
+    steering_joint_names: list[str] = []
+    """The steering joints of an ackermann."""
+
+    position_joint_names: list[str] = []
+    """The joints tracking their position target. All the other joints track their velocity target."""
+
+    wheel_radius: float = 0.0
+    """The radius of the wheels [m]."""
+
+    wheel_separation: float = 0.0
+    """The distance between the left and right wheels of a differential drive [m]."""
+
+    wheel_base: float = 0.0
+    """The distance between the front and rear axles of an ackermann [m]."""
+
+    yaw_sign: float = 1.0
+    """The sign of the yaw rate of a differential drive. -1 when the wheel joints are mirrored."""
+
+    linear_damping: float = 0.0
+    """Viscous damping on the linear velocity of the thruster-driven bodies [1/s]."""
+
+    angular_damping: float = 0.0
+    """Viscous damping on the angular velocity of the thruster-driven bodies [1/s]."""
+
+
+class KinematicPhysxView:
+    def __init__(self, num_envs: int, num_bodies: int, mass: float, inertia: tuple[float, float, float]) -> None:
+        """
+        Mimics the mass properties getters and setters of the PhysX articulation view. Like PhysX, the values live
+        on the CPU. This lets the mass, CoM and inertia randomizers run against the kinematic backend.
+
+        Args:
+            num_envs (int): The number of environments.
+            num_bodies (int): The number of bodies of the articulation.
+            mass (float): The mass of the bodies.
+            inertia (tuple[float, float, float]): The diagonal inertia of the bodies."""
+
+        self._masses = torch.full((num_envs, num_bodies), mass, dtype=torch.float32)
+        self._coms = torch.zeros((num_envs, num_bodies, 7), dtype=torch.float32)
+        self._coms[..., 3] = 1.0
+        self._inertias = torch.zeros((num_envs, num_bodies, 9), dtype=torch.float32)
+        self._inertias[..., 0], self._inertias[..., 4], self._inertias[..., 8] = inertia
+        self.version = 0
+
+    def get_masses(self) -> torch.Tensor:
+        return self._masses.clone()
+
+    def set_masses(self, masses: torch.Tensor, indices: torch.Tensor) -> None:
+        self._masses[indices] = masses[indices].cpu()
+        self.version += 1
+
+    def get_coms(self) -> torch.Tensor:
+        return self._coms.clone()
+
+    def set_coms(self, coms: torch.Tensor, indices: torch.Tensor) -> None:
+        self._coms[indices] = coms[indices].cpu()
+        self.version += 1
+
+    def get_inertias(self) -> torch.Tensor:
+        return self._inertias.clone()
+
+    def set_inertias(self, inertias: torch.Tensor, indices: torch.Tensor) -> None:
+        self._inertias[indices] = inertias[indices].cpu()
+        self.version += 1
+
+
+class KinematicArticulationData:
+    def __init__(
+        self,
+        num_envs: int,
+        body_names: list[str],
+        joint_names: list[str],
+        root_idx: int,
+        anchored: bool,
+        body_offsets: torch.Tensor,
+        body_rotations: torch.Tensor,
+        device: str,
+    ) -> None:
+        """
+        Batched state of a kinematic articulation. It exposes the same properties as the ArticulationData of
+        Isaac Lab, so that the robots and the tasks can read it without knowing about the backend.
+
+        The state is held by the pose and velocity of the moving body (link frame, the CoM is assumed to be at the
+        origin of the link). The other bodies are rigidly attached to it, except for the anchor of an anchored
+        articulation, which is the articulation root and does not move.
+
+        Args:
+            num_envs (int): The number of environments.
+            body_names (list[str]): The names of the bodies.
+            joint_names (list[str]): The names of the joints.
+            root_idx (int): The index of the moving body.
+            anchored (bool): Whether the articulation root is a fixed anchor.
+            body_offsets (torch.Tensor): The positions of the bodies in the frame of the moving body. Shape is
+                (num_bodies, 3).
+            body_rotations (torch.Tensor): The orientations of the bodies in the frame of the moving body. Shape is
+                (num_bodies, 4).
+            device (str): The device on which the tensors are stored."""
+
+        self._num_envs = num_envs
+        self._device = device
+        self.body_names = body_names
+        self.joint_names = joint_names
+        self._root_idx = root_idx
+        self._anchored = anchored
+        num_bodies = len(body_names)
+        num_joints = len(joint_names)
+
+        self._body_offsets = body_offsets.to(device).unsqueeze(0).expand(num_envs, -1, -1)
+        self._body_rotations = body_rotations.to(device).unsqueeze(0).expand(num_envs, -1, -1)
+        # The anchor (if any) is the articulation root, and is not attached to the moving body.
+        self._is_attached = torch.ones((1, num_bodies, 1), dtype=torch.bool, device=device)
+        if anchored:
+            self._is_attached[:, 0] = False
+
+        self.FORWARD_VEC_B = torch.tensor((1.0, 0.0, 0.0), device=device).repeat(num_envs, 1)
+        self.GRAVITY_VEC_W = torch.tensor((0.0, 0.0, -1.0), device=device).repeat(num_envs, 1)
+
+        # Moving body state
+        self._link_pose_w = torch.zeros((num_envs, 7), device=device)
+        self._link_pose_w[:, 3] = 1.0
+        self._link_vel_w = torch.zeros((num_envs, 6), device=device)
+        self._link_acc_w = torch.zeros((num_envs, 6), device=device)
+        # Anchor state, only used by anchored articulations
+        self._anchor_pose_w = self._link_pose_w.clone()
+
+        # Joints
+        self.joint_pos = torch.zeros((num_envs, num_joints), device=device)
+        self.joint_vel = torch.zeros((num_envs, num_joints), device=device)
+        self.joint_acc = torch.zeros((num_envs, num_joints), device=device)
+        self.joint_pos_target = torch.zeros((num_envs, num_joints), device=device)
+        self.joint_vel_target = torch.zeros((num_envs, num_joints), device=device)
+        self.joint_effort_target = torch.zeros((num_envs, num_joints), device=device)
+
+        # Defaults
+        self.default_root_state = torch.zeros((num_envs, 13), device=device)
+        self.default_root_state[:, 3] = 1.0
+        self.default_joint_pos = torch.zeros((num_envs, num_joints), device=device)
+        self.default_joint_vel = torch.zeros((num_envs, num_joints), device=device)
+
+    ##
+    # Root state. The root is the anchor of anchored articulations, and the moving body otherwise.
+    ##
+
+    @property
+    def root_link_state_w(self) -> torch.Tensor:
+        """Root state ``[pos, quat, lin_vel, ang_vel]`` in simulation world frame. Shape is (num_instances, 13)."""
+        if self._anchored:
+            return torch.cat((self._anchor_pose_w, torch.zeros_like(self._link_vel_w)), dim=-1)
+        return torch.cat((self._link_pose_w, self._link_vel_w), dim=-1)
+
+    @property
+    def root_state_w(self) -> torch.Tensor:
+        return self.root_link_state_w
+
+    @property
+    def root_com_state_w(self) -> torch.Tensor:
+        return self.root_link_state_w
+
+    @property
+    def root_link_pos_w(self) -> torch.Tensor:
+        return self.root_link_state_w[:, :3]
+
+    @property
+    def root_link_quat_w(self) -> torch.Tensor:
+        return self.root_link_state_w[:, 3:7]
+
+    @property
+    def root_link_vel_w(self) -> torch.Tensor:
+        return self.root_link_state_w[:, 7:13]
+
+    @property
+    def root_link_lin_vel_w(self) -> torch.Tensor:
+        return self.root_link_state_w[:, 7:10]
+
+    @property
+    def root_link_ang_vel_w(self) -> torch.Tensor:
+        return self.root_link_state_w[:, 10:13]
+
+    @property
+    def root_link_lin_vel_b(self) -> torch.Tensor:
+        return math_utils.quat_rotate_inverse(self.root_link_quat_w, self.root_link_lin_vel_w)
+
+    @property
+    def root_link_ang_vel_b(self) -> torch.Tensor:
+        return math_utils.quat_rotate_inverse(self.root_link_quat_w, self.root_link_ang_vel_w)
+
+    root_pos_w = root_com_pos_w = root_link_pos_w
+    root_quat_w = root_com_quat_w = root_link_quat_w
+    root_vel_w = root_com_vel_w = root_link_vel_w
+    root_lin_vel_w = root_com_lin_vel_w = root_link_lin_vel_w
+    root_ang_vel_w = root_com_ang_vel_w = root_link_ang_vel_w
+    root_lin_vel_b = root_com_lin_vel_b = root_link_lin_vel_b
+    root_ang_vel_b = root_com_ang_vel_b = root_link_ang_vel_b
+
+    @property
+    def projected_gravity_b(self) -> torch.Tensor:
+        """Projection of the gravity direction on base frame. Shape is (num_instances, 3)."""
+        return math_utils.quat_rotate_inverse(self.root_link_quat_w, self.GRAVITY_VEC_W)
+
+    @property
+    def heading_w(self) -> torch.Tensor:
+        """Yaw heading of the base frame (in radians). Shape is (num_instances,)."""
+        forward_w = math_utils.quat_apply(self.root_link_quat_w, self.FORWARD_VEC_B)
+        return torch.atan2(forward_w[:, 1], forward_w[:, 0])
+
+    ##
+    # Bodies state
+    ##
+
+    @property
+    def body_link_state_w(self) -> torch.Tensor:
+        """State of all bodies ``[pos, quat, lin_vel, ang_vel]`` in simulation world frame.
+        Shape is (num_instances, num_bodies, 13)."""
+
+        num_bodies = self._body_offsets.shape[1]
+        link_quat = self._link_pose_w[:, 3:7].unsqueeze(1).expand(-1, num_bodies, -1)
+        offsets_w = math_utils.quat_apply(link_quat, self._body_offsets)
+        pos = self._link_pose_w[:, :3].unsqueeze(1) + offsets_w
+        quat = math_utils.quat_mul(link_quat, self._body_rotations)
+        ang_vel = self._link_vel_w[:, 3:].unsqueeze(1).expand(-1, num_bodies, -1)
+        lin_vel = self._link_vel_w[:, :3].unsqueeze(1) + torch.cross(ang_vel, offsets_w, dim=-1)
+        state = torch.cat((pos, quat, lin_vel, ang_vel), dim=-1)
+        if self._anchored:
+            anchor = torch.cat((self._anchor_pose_w, torch.zeros_like(self._link_vel_w)), dim=-1).unsqueeze(1)
+            state = torch.where(self._is_attached, state, anchor)
+        return state
+
+    @property
+    def body_state_w(self) -> torch.Tensor:
+        return self.body_link_state_w
+
+    @property
+    def body_com_state_w(self) -> torch.Tensor:
+        return self.body_link_state_w
+
+    @property
+    def body_acc_w(self) -> torch.Tensor:
+        """Acceleration of all bodies. Shape is (num_instances, num_bodies, 6)."""
+        return torch.where(self._is_attached, self._link_acc_w.unsqueeze(1), 0.0)
+
+    @property
+    def body_link_pos_w(self) -> torch.Tensor:
+        return self.body_link_state_w[..., :3]
+
+    @property
+    def body_link_quat_w(self) -> torch.Tensor:
+        return self.body_link_state_w[..., 3:7]
+
+    @property
+    def body_link_vel_w(self) -> torch.Tensor:
+        return self.body_link_state_w[..., 7:13]
+
+    @property
+    def body_link_lin_vel_w(self) -> torch.Tensor:
+        return self.body_link_state_w[..., 7:10]
+
+    @property
+    def body_link_ang_vel_w(self) -> torch.Tensor:
+        return self.body_link_state_w[..., 10:13]
+
+    @property
+    def body_lin_acc_w(self) -> torch.Tensor:
+        return self.body_acc_w[..., :3]
+
+    @property
+    def body_ang_acc_w(self) -> torch.Tensor:
+        return self.body_acc_w[..., 3:]
+
+    body_pos_w = body_com_pos_w = body_link_pos_w
+    body_quat_w = body_com_quat_w = body_link_quat_w
+    body_vel_w = body_com_vel_w = body_link_vel_w
+    body_lin_vel_w = body_com_lin_vel_w = body_link_lin_vel_w
+    body_ang_vel_w = body_com_ang_vel_w = body_link_ang_vel_w
+
+
+class KinematicRobotBackend:
+    _SUPPORTED_DYNAMICS = ["differential_drive", "ackermann", "planar", "rigid_body"]
+
+    def __init__(
+        self,
+        model_cfg: KinematicModelCfg,
+        init_state=None,
+        num_envs: int = 1,
+        device: str = "cpu",
+    ) -> None:
+        """
+        Physics-free stand-in for the Isaac Lab Articulation used by the RANS robots.
+
+        It implements the part of the Articulation API the robots rely on (find_joints/find_bodies, the joint
+        targets, the external wrenches and the writes to the simulation) on top of batched torch integrators:
+        - differential_drive: unicycle driven by the velocity targets of the left and right wheels.
+        - ackermann: bicycle driven by the velocity targets of the wheels and the position targets of the steering.
+        - planar: rigid body moving in the xy plane under the external wrenches.
+        - rigid_body: 6-DoF rigid body under the external wrenches, without gravity.
+        The actuators are ideal: the joints reach their targets within one physics step. Contacts are not modeled.
+
+        Args:
+            model_cfg (KinematicModelCfg): The description of the robot.
+            init_state: The initial state of the articulation, i.e. ArticulationCfg.InitialStateCfg. If None, the
+                robot starts at the origin.
+            num_envs (int): The number of environments.
+            device (str): The device on which the tensors are stored."""
+
+        assert model_cfg.dynamics in self._SUPPORTED_DYNAMICS, f"Invalid dynamics: {model_cfg.dynamics}"
+        assert not model_cfg.anchored or len(model_cfg.planar_joint_names) == 3, "Anchored robots need 3 lock joints."
+
+        self.cfg = model_cfg
+        self._num_envs = num_envs
+        self._device = device
+        self._ALL_INDICES = torch.arange(num_envs, dtype=torch.long, device=device)
+
+        self._body_names = list(model_cfg.body_names)
+        self._joint_names = list(model_cfg.joint_names)
+        self._root_idx = self._body_names.index(model_cfg.root_body_name)
+        if model_cfg.anchored:
+            assert self._root_idx != 0, "The first body of an anchored articulation is the anchor."
+
+        body_offsets = torch.zeros((self.num_bodies, 3))
+        body_rotations = torch.zeros((self.num_bodies, 4))
+        body_rotations[:, 0] = 1.0
+        for name, offset in model_cfg.body_offsets.items():
+            body_offsets[self._body_names.index(name)] = torch.tensor(offset)
+        for name, rotation in model_cfg.body_rotations.items():
+            body_rotations[self._body_names.index(name)] = torch.tensor(rotation)
+        self._body_offsets = body_offsets.to(device)
+        self._body_rotations = body_rotations.to(device)
+
+        self._data = KinematicArticulationData(
+            num_envs,
+            self._body_names,
+            self._joint_names,
+            self._root_idx,
+            model_cfg.anchored,
+            body_offsets,
+            body_rotations,
+            device,
+        )
+        self.root_physx_view = KinematicPhysxView(num_envs, self.num_bodies, model_cfg.mass, model_cfg.inertia)
+        self._physx_version = -1
+
+        # External wrenches, in the local frame of the bodies
+        self._external_force_b = torch.zeros((num_envs, self.num_bodies, 3), device=device)
+        self._external_torque_b = torch.zeros((num_envs, self.num_bodies, 3), device=device)
+        self._external_wrench_positions_b = torch.zeros((num_envs, self.num_bodies, 3), device=device)
+        self.has_external_wrench = False
+
+        # Joints driven by the integrators
+        self._wheel_ids = self._joint_ids(model_cfg.wheel_joint_names)
+        self._steering_ids = self._joint_ids(model_cfg.steering_joint_names)
+        self._planar_ids = self._joint_ids(model_cfg.planar_joint_names)
+        self._position_ids = self._joint_ids(model_cfg.position_joint_names)
+        self._velocity_ids = [
+            i for i in range(self.num_joints) if (i not in self._position_ids) and (i not in self._planar_ids)
+        ]
+
+        self._set_default_state(init_state)
+        self.reset()
+
+    @property
+    def data(self) -> KinematicArticulationData:
+        return self._data
+
+    @property
+    def num_instances(self) -> int:
+        return self._num_envs
+
+    @property
+    def num_bodies(self) -> int:
+        return len(self._body_names)
+
+    @property
+    def num_joints(self) -> int:
+        return len(self._joint_names)
+
+    @property
+    def body_names(self) -> list[str]:
+        return self._body_names
+
+    @property
+    def joint_names(self) -> list[str]:
+        return self._joint_names
+
+    @property
+    def device(self) -> str:
+        return self._device
+
+    def _joint_ids(self, names: list[str]) -> list[int]:
+        return [self._joint_names.index(name) for name in names]
+
+    def _set_default_state(self, init_state) -> None:
+        """Fill the default root and joint states from the initial state of the ArticulationCfg."""
+
+        if init_state is None:
+            return
+        default_root_state = torch.tensor(
+            tuple(init_state.pos) + tuple(init_state.rot) + tuple(init_state.lin_vel) + tuple(init_state.ang_vel),
+            dtype=torch.float32,
+            device=self._device,
+        )
+        self._data.default_root_state[:] = default_root_state
+        for pattern, value in init_state.joint_pos.items():
+            for i, name in enumerate(self._joint_names):
+                if re.fullmatch(pattern, name):
+                    self._data.default_joint_pos[:, i] = value
+        for pattern, value in init_state.joint_vel.items():
+            for i, name in enumerate(self._joint_names):
+                if re.fullmatch(pattern, name):
+                    self._data.default_joint_vel[:, i] = value
+
+    ##
+    # Articulation API
+    ##
+
+    def find_bodies(self, name_keys: str | Sequence[str], preserve_order: bool = False) -> tuple[list[int], list[str]]:
+        return resolve_matching_names(name_keys, self._body_names, preserve_order)
+
+    def find_joints(
+        self, name_keys: str | Sequence[str], joint_subset: list[str] | None = None, preserve_order: bool = False
+    ) -> tuple[list[int], list[str]]:
+        if joint_subset is None:
+            joint_subset = self._joint_names
+        return resolve_matching_names(name_keys, joint_subset, preserve_order)
+
+    def reset(self, env_ids: Sequence[int] | None = None) -> None:
+        if env_ids is None:
+            env_ids = slice(None)
+        self._external_force_b[env_ids] = 0.0
+        self._external_torque_b[env_ids] = 0.0
+        self._external_wrench_positions_b[env_ids] = 0.0
+
+    def write_data_to_sim(self) -> None:
+        pass
+
+    def update(self, dt: float) -> None:
+        pass
+
+    def _resolve_env_ids(self, env_ids: Sequence[int] | torch.Tensor | None) -> torch.Tensor | slice:
+        if env_ids is None:
+            return slice(None)
+        if not isinstance(env_ids, torch.Tensor):
+            return torch.tensor(env_ids, dtype=torch.long, device=self._device)
+        return env_ids.long()
+
+    def _resolve_joint_index(
+        self, env_ids: Sequence[int] | slice | None, joint_ids: Sequence[int] | slice | None
+    ) -> tuple[torch.Tensor | slice, torch.Tensor | slice]:
+        """Build the index of a [num_envs, num_joints] buffer. Like in Isaac Lab, the env and joint ids are
+        broadcasted against each other when both are given."""
+
+        env_ids = slice(None) if isinstance(env_ids, slice) else self._resolve_env_ids(env_ids)
+        if joint_ids is None or isinstance(joint_ids, slice):
+            return env_ids, slice(None) if joint_ids is None else joint_ids
+        joint_ids = torch.as_tensor(joint_ids, dtype=torch.long, device=self._device)
+        if isinstance(env_ids, slice):
+            return env_ids, joint_ids
+        return env_ids[:, None], joint_ids
+
+    def write_root_state_to_sim(self, root_state: torch.Tensor, env_ids: Sequence[int] | None = None) -> None:
+        self.write_root_pose_to_sim(root_state[:, :7], env_ids=env_ids)
+        self.write_root_velocity_to_sim(root_state[:, 7:], env_ids=env_ids)
+
+    def write_root_pose_to_sim(self, root_pose: torch.Tensor, env_ids: Sequence[int] | None = None) -> None:
+        env_ids = self._resolve_env_ids(env_ids)
+        if self.cfg.anchored:
+            # Moving the root of the articulation moves the whole articulation, the lock joints are unchanged.
+            self._data._anchor_pose_w[env_ids] = root_pose.float()
+            self._sync_link_from_joints(env_ids)
+        else:
+            self._data._link_pose_w[env_ids] = root_pose.float()
+
+    def write_root_velocity_to_sim(self, root_velocity: torch.Tensor, env_ids: Sequence[int] | None = None) -> None:
+        if self.cfg.anchored:
+            # The anchor is fixed
+            return
+        env_ids = self._resolve_env_ids(env_ids)
+        self._data._link_vel_w[env_ids] = root_velocity.float()
+        self._data._link_acc_w[env_ids] = 0.0
+
+    write_root_link_state_to_sim = write_root_com_state_to_sim = write_root_state_to_sim
+    write_root_link_pose_to_sim = write_root_com_pose_to_sim = write_root_pose_to_sim
+    write_root_link_velocity_to_sim = write_root_com_velocity_to_sim = write_root_velocity_to_sim
+
+    def write_joint_state_to_sim(
+        self,
+        position: torch.Tensor,
+        velocity: torch.Tensor,
+        joint_ids: Sequence[int] | slice | None = None,
+        env_ids: Sequence[int] | slice | None = None,
+    ) -> None:
+        self.write_joint_position_to_sim(position, joint_ids=joint_ids, env_ids=env_ids)
+        self.write_joint_velocity_to_sim(velocity, joint_ids=joint_ids, env_ids=env_ids)
+
+    def write_joint_position_to_sim(
+        self,
+        position: torch.Tensor,
+        joint_ids: Sequence[int] | slice | None = None,
+        env_ids: Sequence[int] | slice | None = None,
+    ) -> None:
+        index = self._resolve_joint_index(env_ids, joint_ids)
+        self._data.joint_pos[index] = position.float()
+        self._sync_link_from_joints(self._resolve_env_ids(env_ids))
+
+    def write_joint_velocity_to_sim(
+        self,
+        velocity: torch.Tensor,
+        joint_ids: Sequence[int] | slice | None = None,
+        env_ids: Sequence[int] | slice | None = None,
+    ) -> None:
+        index = self._resolve_joint_index(env_ids, joint_ids)
+        self._data.joint_vel[index] = velocity.float()
+        self._data.joint_acc[index] = 0.0
+        self._sync_link_from_joints(self._resolve_env_ids(env_ids))
+
+    def set_joint_position_target(
+        self, target: torch.Tensor, joint_ids: Sequence[int] | slice | None = None, env_ids: Sequence[int] | None = None
+    ) -> None:
+        self._data.joint_pos_target[self._resolve_joint_index(env_ids, joint_ids)] = target.float()
+
+    def set_joint_velocity_target(
+        self, target: torch.Tensor, joint_ids: Sequence[int] | slice | None = None, env_ids: Sequence[int] | None = None
+    ) -> None:
+        self._data.joint_vel_target[self._resolve_joint_index(env_ids, joint_ids)] = target.float()
+
+    def set_joint_effort_target(
+        self, target: torch.Tensor, joint_ids: Sequence[int] | slice | None = None, env_ids: Sequence[int] | None = None
+    ) -> None:
+        self._data.joint_effort_target[self._resolve_joint_index(env_ids, joint_ids)] = target.float()
+
+    def set_external_force_and_torque(
+        self,
+        forces: torch.Tensor,
+        torques: torch.Tensor,
+        positions: torch.Tensor | None = None,
+        body_ids: Sequence[int] | slice | None = None,
+        env_ids: Sequence[int] | None = None,
+    ) -> None:
+        """Set the external forces and torques applied on the bodies, in their local frame. The wrenches are kept
+        until they are overwritten, like in Isaac Lab."""
+
+        self.has_external_wrench = bool(forces.any() or torques.any())
+        env_ids = self._ALL_INDICES if env_ids is None else self._resolve_env_ids(env_ids)
+        if body_ids is None:
+            body_ids = slice(None)
+        body_ids = torch.arange(self.num_bodies, dtype=torch.long, device=self._device)[body_ids]
+        self._external_force_b[env_ids[:, None], body_ids] = forces.float()
+        self._external_torque_b[env_ids[:, None], body_ids] = torques.float()
+        if positions is not None:
+            self._external_wrench_positions_b[env_ids[:, None], body_ids] = positions.float()
+        else:
+            self._external_wrench_positions_b[env_ids[:, None], body_ids] = 0.0
+
+    ##
+    # Integrators
+    ##
+
+    def _sync_link_from_joints(self, env_ids: torch.Tensor | slice) -> None:
+        """Place the moving body of an anchored articulation from the state of its lock joints."""
+
+        if not self.cfg.anchored:
+            return
+        data = self._data
+        anchor_pose = data._anchor_pose_w[env_ids]
+        q = data.joint_pos[env_ids][:, self._planar_ids]
+        qd = data.joint_vel[env_ids][:, self._planar_ids]
+        zeros = torch.zeros_like(q[:, 0])
+        offset = torch.stack((q[:, 0], q[:, 1], zeros), dim=-1)
+        yaw = math_utils.quat_from_euler_xyz(zeros, zeros, q[:, 2])
+        data._link_pose_w[env_ids, :3] = anchor_pose[:, :3] + math_utils.quat_apply(anchor_pose[:, 3:], offset)
+        data._link_pose_w[env_ids, 3:] = math_utils.quat_mul(anchor_pose[:, 3:], yaw)
+        lin_vel = math_utils.quat_apply(anchor_pose[:, 3:], torch.stack((qd[:, 0], qd[:, 1], zeros), dim=-1))
+        data._link_vel_w[env_ids] = torch.cat((lin_vel, torch.stack((zeros, zeros, qd[:, 2]), dim=-1)), dim=-1)
+
+    def _sync_joints_from_link(self) -> None:
+        """Compute the state of the lock joints of an anchored articulation from the pose of its moving body."""
+
+        data = self._data
+        anchor_quat = data._anchor_pose_w[:, 3:]
+        offset = math_utils.quat_rotate_inverse(anchor_quat, data._link_pose_w[:, :3] - data._anchor_pose_w[:, :3])
+        lin_vel = math_utils.quat_rotate_inverse(anchor_quat, data._link_vel_w[:, :3])
+        relative_quat = math_utils.quat_mul(math_utils.quat_conjugate(anchor_quat), data._link_pose_w[:, 3:])
+        _, _, yaw = math_utils.euler_xyz_from_quat(relative_quat)
+        q = torch.stack((offset[:, 0], offset[:, 1], math_utils.wrap_to_pi(yaw)), dim=-1)
+        qd = torch.stack((lin_vel[:, 0], lin_vel[:, 1], data._link_vel_w[:, 5]), dim=-1)
+        data.joint_acc[:, self._planar_ids] = (qd - data.joint_vel[:, self._planar_ids]) / self._dt
+        data.joint_pos[:, self._planar_ids] = q
+        data.joint_vel[:, self._planar_ids] = qd
+
+    def _update_mass_properties(self) -> None:
+        """Fetch the mass and inertia of the moving body when they were changed through the PhysX view."""
+
+        if self._physx_version == self.root_physx_view.version:
+            return
+        self._physx_version = self.root_physx_view.version
+        self._mass = self.root_physx_view._masses[:, self._root_idx].to(self._device).unsqueeze(-1)
+        inertias = self.root_physx_view._inertias[:, self._root_idx].to(self._device)
+        self._inertia = inertias[:, [0, 4, 8]]
+
+    def _compute_link_wrench(self) -> tuple[torch.Tensor, torch.Tensor]:
+        """Sum the external wrenches of all the bodies attached to the moving body, in its frame."""
+
+        rotations = self._body_rotations.unsqueeze(0).expand(self._num_envs, -1, -1)
+        torques = self._external_torque_b + torch.cross(
+            self._external_wrench_positions_b, self._external_force_b, dim=-1
+        )
+        forces = math_utils.quat_apply(rotations, self._external_force_b)
+        torques = math_utils.quat_apply(rotations, torques) + torch.cross(
+            self._body_offsets.unsqueeze(0).expand_as(forces), forces, dim=-1
+        )
+        attached = self._data._is_attached.float()
+        return torch.sum(forces * attached, dim=1), torch.sum(torques * attached, dim=1)
+
+    def _step_joints(self, dt: float) -> None:
+        """Ideal actuators: the velocity-driven joints run at their target velocity, the position-driven joints
+        are at their target position."""
+
+        data = self._data
+        if self._velocity_ids:
+            ids = self._velocity_ids
+            data.joint_acc[:, ids] = (data.joint_vel_target[:, ids] - data.joint_vel[:, ids]) / dt
+            data.joint_vel[:, ids] = data.joint_vel_target[:, ids]
+            data.joint_pos[:, ids] += data.joint_vel[:, ids] * dt
+        if self._position_ids:
+            ids = self._position_ids
+            joint_vel = (data.joint_pos_target[:, ids] - data.joint_pos[:, ids]) / dt
+            data.joint_acc[:, ids] = (joint_vel - data.joint_vel[:, ids]) / dt
+            data.joint_vel[:, ids] = joint_vel
+            data.joint_pos[:, ids] = data.joint_pos_target[:, ids]
+
+    def _step_unicycle(self, lin_vel_b: torch.Tensor, yaw_rate: torch.Tensor, dt: float) -> torch.Tensor:
+        """Move the robot forward along its heading and turn it in place. Returns the new velocity."""
+
+        data = self._data
+        heading = data.heading_w
+        zeros = torch.zeros_like(heading)
+        lin_vel_w = torch.stack((lin_vel_b * torch.cos(heading), lin_vel_b * torch.sin(heading), zeros), dim=-1)
+        data._link_pose_w[:, :3] += lin_vel_w * dt
+        yaw = math_utils.quat_from_euler_xyz(zeros, zeros, yaw_rate * dt)
+        data._link_pose_w[:, 3:] = math_utils.quat_mul(yaw, data._link_pose_w[:, 3:])
+        return torch.cat((lin_vel_w, torch.stack((zeros, zeros, yaw_rate), dim=-1)), dim=-1)
+
+    def _step_planar(self, dt: float) -> torch.Tensor:
+        """Semi-implicit Euler integration of a rigid body constrained to the xy plane. Returns the new velocity."""
+
+        data = self._data
+        forces_b, torques_b = self._compute_link_wrench()
+        forces_w = math_utils.quat_apply(data._link_pose_w[:, 3:], forces_b)
+        vel = data._link_vel_w.clone()
+        vel[:, :2] += (forces_w[:, :2] / self._mass - self.cfg.linear_damping * vel[:, :2]) * dt
+        vel[:, 5] += (torques_b[:, 2] / self._inertia[:, 2] - self.cfg.angular_damping * vel[:, 5]) * dt
+        vel[:, 2:5] = 0.0
+        data._link_pose_w[:, :2] += vel[:, :2] * dt
+        zeros = torch.zeros_like(vel[:, 5])
+        yaw = math_utils.quat_from_euler_xyz(zeros, zeros, vel[:, 5] * dt)
+        data._link_pose_w[:, 3:] = math_utils.quat_mul(yaw, data._link_pose_w[:, 3:])
+        return vel
+
+    def _step_rigid_body(self, dt: float) -> torch.Tensor:
+        """Semi-implicit Euler integration of a free-floating rigid body. Returns the new velocity."""
+
+        data = self._data
+        quat = data._link_pose_w[:, 3:]
+        forces_b, torques_b = self._compute_link_wrench()
+        vel = data._link_vel_w.clone()
+        lin_acc = math_utils.quat_apply(quat, forces_b) / self._mass - self.cfg.linear_damping * vel[:, :3]
+        vel[:, :3] += lin_acc * dt
+        # Euler's equations in the body frame
+        ang_vel_b = math_utils.quat_rotate_inverse(quat, vel[:, 3:])
+        gyroscopic = torch.cross(ang_vel_b, self._inertia * ang_vel_b, dim=-1)
+        ang_vel_b += ((torques_b - gyroscopic) / self._inertia - self.cfg.angular_damping * ang_vel_b) * dt
+        vel[:, 3:] = math_utils.quat_apply(quat, ang_vel_b)
+        data._link_pose_w[:, :3] += vel[:, :3] * dt
+        # q_dot = 0.5 * q x (0, w_b)
+        half_ang_vel = torch.cat((torch.zeros_like(ang_vel_b[:, :1]), 0.5 * ang_vel_b * dt), dim=-1)
+        data._link_pose_w[:, 3:] = math_utils.normalize(quat + math_utils.quat_mul(quat, half_ang_vel))
+        return vel
+
+    def step(self, dt: float) -> None:
+        """Advance the articulation by one physics step.
+
+        Args:
+            dt (float): The physics time step."""
+
+        self._dt = dt
+        self._update_mass_properties()
+        self._step_joints(dt)
+
+        data = self._data
+        if self.cfg.dynamics == "differential_drive":
+            wheel_vel = data.joint_vel[:, self._wheel_ids]
+            lin_vel = self.cfg.wheel_radius * (wheel_vel[:, 0] + wheel_vel[:, 1]) / 2.0
+            yaw_rate = (
+                self.cfg.yaw_sign * self.cfg.wheel_radius * (wheel_vel[:, 1] - wheel_vel[:, 0])
+            ) / self.cfg.wheel_separation
+            vel = self._step_unicycle(lin_vel, yaw_rate, dt)
+        elif self.cfg.dynamics == "ackermann":
+            lin_vel = self.cfg.wheel_radius * torch.mean(data.joint_vel[:, self._wheel_ids], dim=-1)
+            steering = torch.mean(data.joint_pos[:, self._steering_ids], dim=-1)
+            vel = self._step_unicycle(lin_vel, lin_vel * torch.tan(steering) / self.cfg.wheel_base, dt)
+        elif self.cfg.dynamics == "planar":
+            vel = self._step_planar(dt)
+        else:
+            vel = self._step_rigid_body(dt)
+
+        data._link_acc_w = (vel - data._link_vel_w) / dt
+        data._link_vel_w = vel
+        if self.cfg.anchored:
+            self._sync_joints_from_link()
+
+
+##
+# Kinematic models of the RANS robots
+##
+
+
+def _planar_thruster_rotation(angle: float) -> tuple[float, float, float, float]:
+    """Orientation of a thruster pushing along its local z axis, such that it pushes along the given angle in the
+    xy plane of the body."""
+
+    # Pitch by 90 degrees (z -> x), then yaw by the angle.
+    pitch = torch.tensor([[math.cos(math.pi / 4), 0.0, math.sin(math.pi / 4), 0.0]])
+    yaw = torch.tensor([[math.cos(angle / 2), 0.0, 0.0, math.sin(angle / 2)]])
+    return tuple(math_utils.quat_mul(yaw, pitch)[0].tolist())
+
+
+def jetbot_kinematic_model(robot_cfg) -> KinematicModelCfg:
+    return KinematicModelCfg(
+        dynamics="differential_drive",
+        body_names=["chassis"],
+        root_body_name="chassis",
+        joint_names=list(robot_cfg.wheels_dof_names),
+        wheel_joint_names=list(robot_cfg.wheels_dof_names),
+        wheel_radius=1.0 / robot_cfg.wheel_scale,
+        wheel_separation=0.12,
+        mass=0.5,
+    )
+
+
+def turtlebot2_kinematic_model(robot_cfg) -> KinematicModelCfg:
+    # The wheel targets of the turtlebot are computed as (v + w * r) for the left wheel, the yaw rate is inverted.
+    return KinematicModelCfg(
+        dynamics="differential_drive",
+        body_names=["core"],
+        root_body_name="core",
+        joint_names=list(robot_cfg.wheels_dof_names),
+        wheel_joint_names=list(robot_cfg.wheels_dof_names),
+        wheel_radius=robot_cfg.wheel_radius,
+        wheel_separation=2 * robot_cfg.offset_wheel_space_radius,
+        yaw_sign=-1.0,
+        mass=2.4,
+    )
+
+
+def leatherback_kinematic_model(robot_cfg) -> KinematicModelCfg:
+    return KinematicModelCfg(
+        dynamics="ackermann",
+        body_names=["chassis"],
+        root_body_name="chassis",
+        joint_names=list(robot_cfg.throttle_dof_name) + list(robot_cfg.steering_dof_name),
+        wheel_joint_names=list(robot_cfg.throttle_dof_name),
+        steering_joint_names=list(robot_cfg.steering_dof_name),
+        position_joint_names=list(robot_cfg.steering_dof_name),
+        wheel_radius=0.06,
+        wheel_base=0.32,
+        mass=2.0,
+    )
+
+
+def floating_platform_kinematic_model(robot_cfg) -> KinematicModelCfg:
+    # Same 8 thrusters layout as the modular freeflyer: 4 pairs on the corners of a 0.44m square.
+    angles = [-math.pi / 4, math.pi * 3 / 4, math.pi / 4, math.pi * 5 / 4] * 2
+    corners = [(0.2192031, 0.2192031), (-0.2192031, 0.2192031), (-0.2192031, -0.2192031), (0.2192031, -0.2192031)]
+    thrusters = list(robot_cfg.thrusters_dof_name)
+    lock_joints = ["x_lock_joint", "y_lock_joint", "z_lock_joint"]
+    reaction_wheel = list(robot_cfg.reaction_wheel_dof_name) if robot_cfg.has_reaction_wheel else []
+    return KinematicModelCfg(
+        dynamics="planar",
+        body_names=["anchor", robot_cfg.root_id_name] + thrusters,
+        root_body_name=robot_cfg.root_id_name,
+        joint_names=lock_joints + reaction_wheel,
+        anchored=True,
+        planar_joint_names=lock_joints,
+        body_offsets={name: corners[i // 2] + (0.0,) for i, name in enumerate(thrusters)},
+        body_rotations={name: _planar_thruster_rotation(angles[i]) for i, name in enumerate(thrusters)},
+        mass=5.32,
+        inertia=(0.3, 0.3, 0.25),
+    )
+
+
+def modular_freeflyer_kinematic_model(robot_cfg) -> KinematicModelCfg:
+    # The thrust generator passes the positions and directions of the thrusters in the frame of the body.
+    lock_joints = [robot_cfg.x_lock_name, robot_cfg.y_lock_name, robot_cfg.z_lock_name]
+    return KinematicModelCfg(
+        dynamics="planar",
+        body_names=["anchor", robot_cfg.root_body_name] + [f"thruster_{i}" for i in range(robot_cfg.num_thrusters)],
+        root_body_name=robot_cfg.root_body_name,
+        joint_names=lock_joints,
+        anchored=True,
+        planar_joint_names=lock_joints,
+        mass=5.32,
+        inertia=(0.3, 0.3, 0.25),
+    )
+
+
+def kingfisher_kinematic_model(robot_cfg) -> KinematicModelCfg:
+    # The hydrodynamics are computed by the robot and applied on the root, the boat is kept flat on the water.
+    return KinematicModelCfg(
+        dynamics="planar",
+        body_names=[robot_cfg.root_id_name, "thruster_left", "thruster_right", "disturbance_body"],
+        root_body_name=robot_cfg.root_id_name,
+        body_offsets={"thruster_left": (-0.6, 0.35, 0.0), "thruster_right": (-0.6, -0.35, 0.0)},
+        mass=robot_cfg.hydrostatics_cfg.mass,
+        inertia=(3.0, 5.0, 7.8),
+    )
+
+
+def intball2_kinematic_model(robot_cfg) -> KinematicModelCfg:
+    # The thrust generator passes the positions and directions of the propellers in the frame of the body.
+    return KinematicModelCfg(
+        dynamics="rigid_body",
+        body_names=[robot_cfg.root_body_name] + [f"propeller_{i + 1}" for i in range(robot_cfg.num_thrusters)],
+        root_body_name=robot_cfg.root_body_name,
+        mass=3.0,
+        inertia=(0.02, 0.02, 0.02),
+    )
+
+
+KINEMATIC_MODEL_FACTORY = factory()
+KINEMATIC_MODEL_FACTORY.register("Jetbot", jetbot_kinematic_model)
+KINEMATIC_MODEL_FACTORY.register("Leatherback", leatherback_kinematic_model)
+KINEMATIC_MODEL_FACTORY.register("FloatingPlatform", floating_platform_kinematic_model)
+KINEMATIC_MODEL_FACTORY.register("ModularFreeflyer", modular_freeflyer_kinematic_model)
+KINEMATIC_MODEL_FACTORY.register("Kingfisher", kingfisher_kinematic_model)
+KINEMATIC_MODEL_FACTORY.register("Turtlebot2", turtlebot2_kinematic_model)
+KINEMATIC_MODEL_FACTORY.register("IntBall2", intball2_kinematic_model)
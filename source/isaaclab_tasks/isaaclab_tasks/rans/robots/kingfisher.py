@@ -7,14 +7,12 @@ import numpy as np
 import torch
 from gymnasium import spaces, vector
 
-from isaaclab.actuator_force.actuator_force import PropellerActuator
 from isaaclab.assets import Articulation
-from isaaclab.physics.hydrodynamics import Hydrodynamics
-from isaaclab.physics.hydrostatics import Hydrostatics
 from isaaclab.scene import InteractiveScene
 
 from isaaclab_tasks.rans import KingfisherRobotCfg
 
+from .kingfisher_physics import KingfisherPhysics
 from .robot_core import RobotCore
 
 
@@ -29,20 +27,30 @@ class KingfisherRobot(RobotCore):
         decimation: int = 5,
         device: str = "cuda",
     ):
-        super().__init__(scene=scene, robot_uid=robot_uid, num_envs=num_envs, decimation=decimation, device=device)
+        super().__init__(
+            scene=scene,
+            robot_uid=robot_uid,
+            num_envs=num_envs,
+            decimation=decimation,
+            device=device,
+            rng_backend=robot_cfg.rng_backend,
+        )
         self._robot_cfg = robot_cfg
         self._dim_robot_obs = self._robot_cfg.observation_space
         self._dim_robot_act = self._robot_cfg.action_space
         self._dim_gen_act = self._robot_cfg.gen_space
 
-        # Hydrostatics, Hydrodynamics, and Thruster Dynamics
-        self._hydrostatics = Hydrostatics(num_envs, device, self._robot_cfg.hydrostatics_cfg)
-        self._hydrodynamics = Hydrodynamics(num_envs, device, self._robot_cfg.hydrodynamics_cfg)
-        self._thruster_dynamics_left = PropellerActuator(
-            num_envs=num_envs, device=device, dt=self._physics_dt, cfg=self._robot_cfg.propeller_cfg
-        )
-        self._thruster_dynamics_right = PropellerActuator(
-            num_envs=num_envs, device=device, dt=self._physics_dt, cfg=self._robot_cfg.propeller_cfg
+        # Hydrostatics, Hydrodynamics, and Thruster Dynamics, computed by a single fused function
+        self._physics = KingfisherPhysics(
+            self._robot_cfg.hydrostatics_cfg,
+            self._robot_cfg.hydrodynamics_cfg,
+            self._robot_cfg.propeller_cfg,
+            self._rng,
+            num_envs=num_envs,
+            dt=self._physics_dt,
+            device=device,
+            backend=self._robot_cfg.physics_backend,
+            compile=self._robot_cfg.compile_physics,
         )
 
         # Buffers
@@ -54,10 +62,10 @@ class KingfisherRobot(RobotCore):
         self._previous_actions = torch.zeros(
             (self._num_envs, self._dim_robot_act), device=self._device, dtype=torch.float32
         )
-        self._hydrostatic_force = torch.zeros((self._num_envs, 1, 6), device=self._device, dtype=torch.float32)
-        self._hydrodynamic_force = torch.zeros((self._num_envs, 1, 6), device=self._device, dtype=torch.float32)
-        self._thruster_forces_left = torch.zeros(self._num_envs, 1, 3, device=self._device, dtype=torch.float32)
-        self._thruster_forces_right = torch.zeros(self._num_envs, 1, 3, device=self._device, dtype=torch.float32)
+        # Views of the outputs of the physics
+        self._root_wrench = self._physics.root_wrench
+        self._thruster_forces_left = self._physics.thruster_forces[:, 0:1]
+        self._thruster_forces_right = self._physics.thruster_forces[:, 1:2]
         self._no_torque = torch.zeros(self._num_envs, 1, 3, device=self._device, dtype=torch.float32)
 
     def run_setup(self, robot: Articulation):
@@ -118,8 +126,7 @@ class KingfisherRobot(RobotCore):
     ):
         super().reset(env_ids, gen_actions, env_seeds)
         self._previous_actions[env_ids] = 0
-        self._thruster_dynamics_left.reset(env_ids)
-        self._thruster_dynamics_right.reset(env_ids)
+        self._physics.reset(env_ids)
 
     def set_initial_conditions(self, env_ids: torch.Tensor | None = None):
         pass
@@ -133,40 +140,27 @@ class KingfisherRobot(RobotCore):
         self._unaltered_actions = actions.clone()
 
         # Apply action randomizers
-        for randomizer in self.randomizers:
-            randomizer.actions(dt=self.scene.physics_dt, actions=actions)
+        self.randomization_pipeline.actions(dt=self.scene.physics_dt, actions=actions)
 
         self._previous_actions = self._actions.clone()
         self._actions = actions
-        self._thruster_dynamics_left.set_target_cmd(self._actions[:, 0])
-        self._thruster_dynamics_right.set_target_cmd(self._actions[:, 1])
+        self._physics.set_target_cmds(self._actions)
 
         self.scalar_logger.log("robot_state", "AVG/thruster_left", torch.linalg.norm(actions[:, 0]))
         self.scalar_logger.log("robot_state", "AVG/thruster_right", torch.linalg.norm(actions[:, 1]))
 
     def compute_physics(self):
-        # Compute hydrostatics
-        self._hydrostatic_force[:, 0, :] = self._hydrostatics.compute_archimedes_metacentric_local(
-            self.root_pos_w, self.root_quat_w
-        )
-
-        # Compute hydrodynamics
-        self._hydrodynamic_force[:, 0, :] = self._hydrodynamics.ComputeHydrodynamicsEffects(
-            self.root_quat_w, self.root_vel_w
-        )
-
-        # Compute thruster dynamics.
-        self._thruster_forces_left[:, 0] = self._thruster_dynamics_left.update_forces()
-        self._thruster_forces_right[:, 0] = self._thruster_dynamics_right.update_forces()
+        # Compute the hydrostatics, the hydrodynamics and the thruster dynamics into the buffers of the physics
+        self._physics.update(self.root_pos_w, self.root_quat_w, self.root_vel_w)
 
     def apply_actions(self):
         # Compute the physics
         super().apply_actions()
-        for randomizer in self.randomizers:
-            randomizer.update(dt=self.scene.physics_dt, actions=self._actions)
+        self.randomization_pipeline.update(dt=self.scene.physics_dt, actions=self._actions)
 
-        combined = self._hydrostatic_force + self._hydrodynamic_force
-        self._robot.set_external_force_and_torque(combined[..., :3], combined[..., 3:], body_ids=self._root_idx)
+        self._robot.set_external_force_and_torque(
+            self._root_wrench[..., :3], self._root_wrench[..., 3:], body_ids=self._root_idx
+        )
         # only apply thruster forces if they are not zero, otherwise it disables external previous forces.
         if self._thruster_forces_left.any():
             self._robot.set_external_force_and_torque(
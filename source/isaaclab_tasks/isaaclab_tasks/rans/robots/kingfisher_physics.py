@@ -0,0 +1,391 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import torch
+
+import warp as wp
+
+from isaaclab.actuator_force.actuator_force import PropellerActuatorCfg
+from isaaclab.physics.hydrodynamics import HydrodynamicsCfg
+from isaaclab.physics.hydrostatics import HydrostaticsCfg
+
+from isaaclab_tasks.rans.utils import PerEnvSeededRNG
+
+
+def kingfisher_physics(
+    root_pos: torch.Tensor,
+    root_quat: torch.Tensor,
+    root_vel: torch.Tensor,
+    target_cmds: torch.Tensor,
+    current_cmds: torch.Tensor,
+    linear_damping: torch.Tensor,
+    quadratic_damping: torch.Tensor,
+    propeller_factors: torch.Tensor,
+    interp_forces: torch.Tensor,
+    buoyancy: torch.Tensor,
+    drag: torch.Tensor,
+    root_wrench: torch.Tensor,
+    thruster_forces: torch.Tensor,
+    buoyancy_coeff: float,
+    draught_offset: float,
+    max_draught: float,
+    roll_torque_coeff: float,
+    pitch_torque_coeff: float,
+    max_cmd_delta: float,
+    interp_resolution: int,
+) -> None:
+    """Computes the buoyancy, the drag and the propeller forces of the Kingfisher, in place.
+
+    Same model as :class:`Hydrostatics`, :class:`Hydrodynamics` and :class:`PropellerActuator`, without the
+    quaternion to euler and matrix conversions. Once compiled, it runs as a handful of fused kernels.
+
+    Args:
+        root_pos: The position of the root in the world frame [num_envs, 3].
+        root_quat: The orientation (w, x, y, z) of the root in the world frame [num_envs, 4].
+        root_vel: The linear and angular velocities of the root in the world frame [num_envs, 6].
+        target_cmds: The target commands of the left and right propellers [num_envs, 2].
+        current_cmds: The current commands of the propellers, updated in place [num_envs, 2].
+        linear_damping: The linear damping, offsets and scaling included [num_envs or 1, 6].
+        quadratic_damping: The quadratic damping, offsets and scaling included [num_envs or 1, 6].
+        propeller_factors: The randomization factors of the propeller forces [num_envs, 2].
+        interp_forces: The force of the propellers, sampled over the command range [interp_resolution].
+        buoyancy: The output buoyancy wrench in the body frame [num_envs, 6].
+        drag: The output drag wrench in the body frame [num_envs, 6].
+        root_wrench: The output sum of the buoyancy and the drag [num_envs, 1, 6].
+        thruster_forces: The output forces of the left and right propellers [num_envs, 2, 3].
+        buoyancy_coeff: The buoyancy force per meter of draught, -rho * g * waterplane_area.
+        draught_offset: The distance from the root to the bottom of the hull.
+        max_draught: The maximum draught of the hull.
+        roll_torque_coeff: The restoring roll torque at a roll of 90 degrees.
+        pitch_torque_coeff: The restoring pitch torque at a pitch of 90 degrees.
+        max_cmd_delta: The maximum change of the propeller commands per physics step.
+        interp_resolution: The number of samples of the propeller forces."""
+
+    q_w, q_x, q_y, q_z = root_quat[:, 0:1], root_quat[:, 1:2], root_quat[:, 2:3], root_quat[:, 3:4]
+    q_vec = root_quat[:, 1:]
+
+    # Buoyancy: the vertical archimedes force expressed in the body frame, and the metacentric restoring torques
+    draught = torch.clamp(draught_offset - root_pos[:, 2:3], 0.0, max_draught)
+    world_z_b = torch.cat(
+        [2.0 * (q_x * q_z - q_w * q_y), 2.0 * (q_y * q_z + q_w * q_x), 1.0 - 2.0 * (q_x * q_x + q_y * q_y)], dim=-1
+    )
+    sin_roll = torch.sin(torch.atan2(2.0 * (q_w * q_x + q_y * q_z), 1.0 - 2.0 * (q_x * q_x + q_y * q_y)))
+    sin_pitch = torch.clamp(2.0 * (q_w * q_y - q_z * q_x), -1.0, 1.0)
+    buoyancy[:, :3] = buoyancy_coeff * draught * world_z_b
+    buoyancy[:, 3:4] = roll_torque_coeff * sin_roll
+    buoyancy[:, 4:5] = pitch_torque_coeff * sin_pitch
+
+    # Drag: linear and quadratic damping of the velocities expressed in the body frame
+    scale = 2.0 * q_w * q_w - 1.0
+    lin_vel, ang_vel = root_vel[:, :3], root_vel[:, 3:]
+    lin_vel_b = (
+        lin_vel * scale
+        - torch.cross(q_vec, lin_vel, dim=-1) * (2.0 * q_w)
+        + q_vec * (2.0 * torch.sum(q_vec * lin_vel, dim=-1, keepdim=True))
+    )
+    ang_vel_b = (
+        ang_vel * scale
+        - torch.cross(q_vec, ang_vel, dim=-1) * (2.0 * q_w)
+        + q_vec * (2.0 * torch.sum(q_vec * ang_vel, dim=-1, keepdim=True))
+    )
+    vel_b = torch.cat([lin_vel_b, ang_vel_b], dim=-1)
+    drag[:] = -(linear_damping + quadratic_damping * torch.abs(vel_b)) * vel_b
+    root_wrench[:, 0] = buoyancy + drag
+
+    # Propellers: rate limited commands, mapped to forces along the x axis of the propellers
+    current_cmds.add_(torch.clamp(target_cmds - current_cmds, -max_cmd_delta, max_cmd_delta))
+    idx = torch.round((current_cmds + 1) / 2 * (interp_resolution - 1)).to(torch.long)
+    thruster_forces[..., 0] = interp_forces[idx] * propeller_factors
+
+
+@wp.kernel
+def kingfisher_physics_kernel(
+    root_pos: wp.array2d(dtype=wp.float32),
+    root_quat: wp.array2d(dtype=wp.float32),
+    root_vel: wp.array2d(dtype=wp.float32),
+    target_cmds: wp.array2d(dtype=wp.float32),
+    current_cmds: wp.array2d(dtype=wp.float32),
+    linear_damping: wp.array2d(dtype=wp.float32),
+    quadratic_damping: wp.array2d(dtype=wp.float32),
+    damping_per_env: int,
+    propeller_factors: wp.array2d(dtype=wp.float32),
+    interp_forces: wp.array(dtype=wp.float32),
+    buoyancy: wp.array2d(dtype=wp.float32),
+    drag: wp.array2d(dtype=wp.float32),
+    root_wrench: wp.array3d(dtype=wp.float32),
+    thruster_forces: wp.array3d(dtype=wp.float32),
+    buoyancy_coeff: float,
+    draught_offset: float,
+    max_draught: float,
+    roll_torque_coeff: float,
+    pitch_torque_coeff: float,
+    max_cmd_delta: float,
+    interp_resolution: int,
+):
+    """Warp implementation of :func:`kingfisher_physics`, one thread per environment."""
+    i = wp.tid()
+    q_w = root_quat[i, 0]
+    q_vec = wp.vec3(root_quat[i, 1], root_quat[i, 2], root_quat[i, 3])
+
+    # Buoyancy
+    draught = wp.clamp(draught_offset - root_pos[i, 2], 0.0, max_draught)
+    world_z_b = wp.vec3(
+        2.0 * (q_vec[0] * q_vec[2] - q_w * q_vec[1]),
+        2.0 * (q_vec[1] * q_vec[2] + q_w * q_vec[0]),
+        1.0 - 2.0 * (q_vec[0] * q_vec[0] + q_vec[1] * q_vec[1]),
+    )
+    sin_roll = wp.sin(
+        wp.atan2(2.0 * (q_w * q_vec[0] + q_vec[1] * q_vec[2]), 1.0 - 2.0 * (q_vec[0] * q_vec[0] + q_vec[1] * q_vec[1]))
+    )
+    sin_pitch = wp.clamp(2.0 * (q_w * q_vec[1] - q_vec[2] * q_vec[0]), -1.0, 1.0)
+    force = buoyancy_coeff * draught * world_z_b
+    for j in range(3):
+        buoyancy[i, j] = force[j]
+    buoyancy[i, 3] = roll_torque_coeff * sin_roll
+    buoyancy[i, 4] = pitch_torque_coeff * sin_pitch
+    buoyancy[i, 5] = 0.0
+
+    # Drag
+    scale = 2.0 * q_w * q_w - 1.0
+    lin_vel = wp.vec3(root_vel[i, 0], root_vel[i, 1], root_vel[i, 2])
+    ang_vel = wp.vec3(root_vel[i, 3], root_vel[i, 4], root_vel[i, 5])
+    lin_vel_b = lin_vel * scale - wp.cross(q_vec, lin_vel) * (2.0 * q_w) + q_vec * (2.0 * wp.dot(q_vec, lin_vel))
+    ang_vel_b = ang_vel * scale - wp.cross(q_vec, ang_vel) * (2.0 * q_w) + q_vec * (2.0 * wp.dot(q_vec, ang_vel))
+    row = i * damping_per_env
+    for j in range(6):
+        v = 0.0
+        if j < 3:
+            v = lin_vel_b[j]
+        else:
+            v = ang_vel_b[j - 3]
+        drag[i, j] = -(linear_damping[row, j] + quadratic_damping[row, j] * wp.abs(v)) * v
+        root_wrench[i, 0, j] = buoyancy[i, j] + drag[i, j]
+
+    # Propellers
+    for k in range(2):
+        cmd = current_cmds[i, k] + wp.clamp(target_cmds[i, k] - current_cmds[i, k], -max_cmd_delta, max_cmd_delta)
+        current_cmds[i, k] = cmd
+        idx = int(wp.rint((cmd + 1.0) / 2.0 * float(interp_resolution - 1)))
+        thruster_forces[i, k, 0] = interp_forces[idx] * propeller_factors[i, k]
+
+
+class KingfisherPhysics:
+    def __init__(
+        self,
+        hydrostatics_cfg: HydrostaticsCfg,
+        hydrodynamics_cfg: HydrodynamicsCfg,
+        propeller_cfg: PropellerActuatorCfg,
+        rng: PerEnvSeededRNG,
+        num_envs: int = 1,
+        dt: float = 0.01,
+        device: str = "cuda",
+        backend: str = "torch",
+        compile: bool = True,
+    ) -> None:
+        """Buoyancy, drag and propeller forces of the Kingfisher, computed by a single fused function per physics
+        step and written into preallocated buffers.
+
+        The drag coefficients are only stored per environment when they are randomized. The randomizations of the
+        drag and of the propellers are drawn from the per-environment seeded RNG of the robot at reset.
+
+        Args:
+            hydrostatics_cfg: The configuration of the hydrostatics.
+            hydrodynamics_cfg: The configuration of the hydrodynamics.
+            propeller_cfg: The configuration of the left and right propellers.
+            rng: The per-environment seeded RNG of the robot.
+            num_envs: The number of environments.
+            dt: The physics time step.
+            device: The device to use.
+            backend: The implementation of the fused function, 'torch' or 'warp'.
+            compile: Whether to compile the torch implementation with torch.compile. Falls back to eager mode if
+                the compilation fails."""
+
+        assert backend in ["torch", "warp"], f"Invalid backend: {backend}"
+        self._hydrostatics_cfg = hydrostatics_cfg
+        self._hydrodynamics_cfg = hydrodynamics_cfg
+        self._propeller_cfg = propeller_cfg
+        self._rng = rng
+        self._num_envs = num_envs
+        self._device = device
+        self._backend = backend
+
+        # Constants of the model, the offsets and the scaling of the damping are folded in the coefficients
+        hydrostatics_torque = hydrostatics_cfg.average_hydrostatics_force * hydrostatics_cfg.amplify_torque
+        self._params = (
+            -hydrostatics_cfg.water_density * hydrostatics_cfg.gravity * hydrostatics_cfg.waterplane_area,
+            hydrostatics_cfg.draught_offset,
+            hydrostatics_cfg.max_draught,
+            -hydrostatics_cfg.width / 2.0 * hydrostatics_torque,
+            -hydrostatics_cfg.length / 2.0 * hydrostatics_torque,
+            propeller_cfg.command_rate * dt,
+            propeller_cfg.interp_resolution,
+        )
+        self._linear_offset = (
+            hydrodynamics_cfg.offset_linear_damping
+            - torch.tensor(hydrodynamics_cfg.linear_damping_forward_speed, device=device)
+            - hydrodynamics_cfg.offset_lin_forward_damping_speed
+        )
+        self._base_linear_damping = torch.tensor([hydrodynamics_cfg.linear_damping], device=device)
+        self._base_quadratic_damping = torch.tensor([hydrodynamics_cfg.quadratic_damping], device=device)
+        self._linear_rand = torch.tensor(hydrodynamics_cfg.linear_damping_rand, device=device)
+        self._quadratic_rand = torch.tensor(hydrodynamics_cfg.quadratic_damping_rand, device=device)
+        num_damping = num_envs if hydrodynamics_cfg.use_drag_randomization else 1
+        self._linear_damping = torch.zeros((num_damping, 6), device=device)
+        self._quadratic_damping = torch.zeros((num_damping, 6), device=device)
+        self.set_damping(self._base_linear_damping, self._base_quadratic_damping)
+
+        forces = torch.tensor(propeller_cfg.forces, device=device)
+        self._interp_forces = torch.nn.functional.interpolate(
+            forces.view(1, 1, -1), size=propeller_cfg.interp_resolution, mode="linear", align_corners=True
+        ).squeeze()
+
+        # State and outputs
+        self._target_cmds = torch.zeros((num_envs, 2), device=device)
+        self._current_cmds = torch.zeros((num_envs, 2), device=device)
+        self._propeller_factors = torch.ones((num_envs, 2), device=device)
+        self._buoyancy = torch.zeros((num_envs, 6), device=device)
+        self._drag = torch.zeros((num_envs, 6), device=device)
+        self._root_wrench = torch.zeros((num_envs, 1, 6), device=device)
+        self._thruster_forces = torch.zeros((num_envs, 2, 3), device=device)
+
+        if backend == "warp":
+            # Zero-copy views of the buffers, created once, in the order of the arguments of the kernel
+            self._wp_args = [
+                wp.from_torch(self._target_cmds),
+                wp.from_torch(self._current_cmds),
+                wp.from_torch(self._linear_damping),
+                wp.from_torch(self._quadratic_damping),
+                int(num_damping > 1),
+                wp.from_torch(self._propeller_factors),
+                wp.from_torch(self._interp_forces),
+                wp.from_torch(self._buoyancy),
+                wp.from_torch(self._drag),
+                wp.from_torch(self._root_wrench),
+                wp.from_torch(self._thruster_forces),
+                *self._params,
+            ]
+        self._fn = torch.compile(kingfisher_physics, dynamic=False) if compile else kingfisher_physics
+
+    @property
+    def buoyancy(self) -> torch.Tensor:
+        """The buoyancy wrench in the body frame [num_envs, 6]."""
+        return self._buoyancy
+
+    @property
+    def drag(self) -> torch.Tensor:
+        """The drag wrench in the body frame [num_envs, 6]."""
+        return self._drag
+
+    @property
+    def root_wrench(self) -> torch.Tensor:
+        """The sum of the buoyancy and the drag, applied on the root [num_envs, 1, 6]."""
+        return self._root_wrench
+
+    @property
+    def thruster_forces(self) -> torch.Tensor:
+        """The forces of the left and right propellers in their frames [num_envs, 2, 3]."""
+        return self._thruster_forces
+
+    @property
+    def propeller_factors(self) -> torch.Tensor:
+        """The randomization factors of the forces of the left and right propellers [num_envs, 2]."""
+        return self._propeller_factors
+
+    @property
+    def current_cmds(self) -> torch.Tensor:
+        """The current commands of the left and right propellers [num_envs, 2]."""
+        return self._current_cmds
+
+    def set_damping(
+        self, linear_damping: torch.Tensor, quadratic_damping: torch.Tensor, env_ids: torch.Tensor | None = None
+    ) -> None:
+        """Sets the damping coefficients, before their offsets and scaling.
+
+        Args:
+            linear_damping: The linear damping [len(env_ids) or 1, 6].
+            quadratic_damping: The quadratic damping [len(env_ids) or 1, 6].
+            env_ids: The ids of the environments. If None, all the environments are set."""
+
+        cfg = self._hydrodynamics_cfg
+        linear_damping = (linear_damping + self._linear_offset) * cfg.scaling_damping
+        quadratic_damping = (quadratic_damping + cfg.offset_nonlin_damping) * cfg.scaling_damping
+        if env_ids is None:
+            self._linear_damping[:] = linear_damping
+            self._quadratic_damping[:] = quadratic_damping
+        else:
+            self._linear_damping[env_ids] = linear_damping
+            self._quadratic_damping[env_ids] = quadratic_damping
+
+    def set_target_cmds(self, commands: torch.Tensor) -> None:
+        """Sets the target commands of the left and right propellers.
+
+        Args:
+            commands: The commands in [-1, 1] [num_envs, 2]."""
+
+        torch.clamp(commands[:, :2], -1.0, 1.0, out=self._target_cmds)
+
+    def reset(self, env_ids: torch.Tensor) -> None:
+        """Resets the propellers and draws the randomizations of the environments.
+
+        Args:
+            env_ids: The ids of the environments to reset."""
+
+        self._current_cmds[env_ids] = 0.0
+        self._target_cmds[env_ids] = 0.0
+
+        if self._propeller_cfg.enable_randomization:
+            randomization = self._rng.sample_uniform_torch(-1.0, 1.0, (2,), ids=env_ids)
+            self._propeller_factors[env_ids] = randomization * self._propeller_cfg.randomization_range + 1
+
+        if self._hydrodynamics_cfg.use_drag_randomization:
+            noise = self._rng.sample_uniform_torch(-1.0, 1.0, (2, 6), ids=env_ids)
+            self.set_damping(
+                self._base_linear_damping * (1 + noise[:, 0] * self._linear_rand),
+                self._base_quadratic_damping * (1 + noise[:, 1] * self._quadratic_rand),
+                env_ids,
+            )
+
+    def update(self, root_pos: torch.Tensor, root_quat: torch.Tensor, root_vel: torch.Tensor) -> None:
+        """Computes the forces of the current physics step into the buffers.
+
+        Args:
+            root_pos: The position of the root in the world frame [num_envs, 3].
+            root_quat: The orientation (w, x, y, z) of the root in the world frame [num_envs, 4].
+            root_vel: The linear and angular velocities of the root in the world frame [num_envs, 6]."""
+
+        if self._backend == "warp":
+            wp.launch(
+                kingfisher_physics_kernel,
+                dim=self._num_envs,
+                inputs=[wp.from_torch(root_pos), wp.from_torch(root_quat), wp.from_torch(root_vel), *self._wp_args],
+                device=self._device,
+            )
+            return
+
+        args = (
+            root_pos,
+            root_quat,
+            root_vel,
+            self._target_cmds,
+            self._current_cmds,
+            self._linear_damping,
+            self._quadratic_damping,
+            self._propeller_factors,
+            self._interp_forces,
+            self._buoyancy,
+            self._drag,
+            self._root_wrench,
+            self._thruster_forces,
+            *self._params,
+        )
+        try:
+            self._fn(*args)
+        except Exception as e:
+            # torch.compile is not supported on every platform
+            if self._fn is kingfisher_physics:
+                raise
+            print(f"[WARN] Could not compile the Kingfisher physics, falling back to eager mode: {e}")
+            self._fn = kingfisher_physics
+            self._fn(*args)
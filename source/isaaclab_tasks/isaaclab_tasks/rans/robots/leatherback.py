@@ -26,7 +26,14 @@ class LeatherbackRobot(RobotCore):
         decimation: int = 4,
         device: str = "cuda",
     ):
-        super().__init__(scene=scene, robot_uid=robot_uid, num_envs=num_envs, decimation=decimation, device=device)
+        super().__init__(
+            scene=scene,
+            robot_uid=robot_uid,
+            num_envs=num_envs,
+            decimation=decimation,
+            device=device,
+            rng_backend=robot_cfg.rng_backend,
+        )
         self._robot_cfg = robot_cfg
         self._dim_robot_obs = self._robot_cfg.observation_space
         self._dim_robot_act = self._robot_cfg.action_space
@@ -129,8 +136,7 @@ class LeatherbackRobot(RobotCore):
         self._unaltered_actions = actions.clone()
 
         # Apply action randomizers
-        for randomizer in self.randomizers:
-            randomizer.actions(dt=self.scene.physics_dt, actions=actions)
+        self.randomization_pipeline.actions(dt=self.scene.physics_dt, actions=actions)
 
         self._previous_actions = self._actions.clone()
         self._actions = actions
@@ -151,8 +157,7 @@ class LeatherbackRobot(RobotCore):
     def apply_actions(self):
         # Compute the physics
         super().apply_actions()
-        for randomizer in self.randomizers:
-            randomizer.update(dt=self.scene.physics_dt, actions=self._actions)
+        self.randomization_pipeline.update(dt=self.scene.physics_dt, actions=self._actions)
 
         self._robot.set_joint_velocity_target(self._throttle_action, joint_ids=self._throttle_dof_idx)
         self._robot.set_joint_position_target(self._steering_action, joint_ids=self._steering_dof_idx)
@@ -3,7 +3,6 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
-import math
 import torch
 from gymnasium import spaces, vector
 
@@ -14,6 +13,7 @@ from isaaclab.utils import math as math_utils
 from isaaclab_tasks.rans import ModularFreeflyerRobotCfg
 
 from .robot_core import RobotCore
+from .thruster_allocation import ThrusterAllocation
 
 
 class ModularFreeflyerRobot(RobotCore):
@@ -26,7 +26,14 @@ class ModularFreeflyerRobot(RobotCore):
         decimation: int = 6,
         device: str = "cuda",
     ) -> None:
-        super().__init__(scene=scene, robot_uid=robot_uid, num_envs=num_envs, decimation=decimation, device=device)
+        super().__init__(
+            scene=scene,
+            robot_uid=robot_uid,
+            num_envs=num_envs,
+            decimation=decimation,
+            device=device,
+            rng_backend=robot_cfg.rng_backend,
+        )
         self._robot_cfg = robot_cfg
         self._dim_robot_obs = self._robot_cfg.observation_space
         self._dim_robot_act = self._robot_cfg.action_space
@@ -48,7 +55,7 @@ class ModularFreeflyerRobot(RobotCore):
             dtype=torch.float32,
         )
         self._reaction_wheel_actions = torch.zeros((self._num_envs, 1), device=self._device, dtype=torch.float32)
-        self._transforms = torch.zeros((self._num_envs, 3, 4), device=self._device, dtype=torch.float32)
+        self._thrust_wrench = torch.zeros((self._num_envs, 1, 6), device=self._device, dtype=torch.float32)
         self._thrust_forces = torch.zeros(
             (self._num_envs, self._robot_cfg.num_thrusters, 3),
             device=self._device,
@@ -78,8 +85,13 @@ class ModularFreeflyerRobot(RobotCore):
         self._thrusters_ids, _ = self._robot.find_bodies("thruster_.*")
         # Get the index of the root body (used to get the state of the robot)
         self._root_idx = self._robot.find_bodies(self._robot_cfg.root_body_name)[0]
-        # Get the thrust generator
-        self._thrust_generator = ThrustGenerator(self._robot_cfg, self._num_envs, self._device)
+        # Get the allocation of the thrusters, shared by all the environments
+        self._thrust_allocation = ThrusterAllocation.from_transforms_2d(
+            self._robot_cfg.thruster_transforms,
+            self._robot_cfg.thruster_max_thrust,
+            num_envs=self._num_envs,
+            device=self._device,
+        )
 
     def create_logs(self) -> None:
         super().create_logs()
@@ -125,7 +137,7 @@ class ModularFreeflyerRobot(RobotCore):
         super().reset(env_ids, gen_actions, env_seeds)
         self._previous_actions[env_ids] = 0
         self._thrust_forces[env_ids] = 0
-        self._thrust_positions[env_ids] = 0
+        self._thrust_wrench[env_ids] = 0
 
     def set_initial_conditions(self, env_ids: torch.Tensor | None = None) -> None:
         # Create zero tensor
@@ -159,8 +171,7 @@ class ModularFreeflyerRobot(RobotCore):
         self._unaltered_actions = actions.clone()
 
         # Apply action randomizers
-        for randomizer in self.randomizers:
-            randomizer.actions(dt=self.scene.physics_dt, actions=actions)
+        self.randomization_pipeline.actions(dt=self.scene.physics_dt, actions=actions)
 
         self._previous_actions = self._actions.clone()
         self._actions = actions
@@ -178,19 +189,31 @@ class ModularFreeflyerRobot(RobotCore):
         self.scalar_logger.log("robot_state", "AVG/thrust", torch.sum(self._thrust_actions, dim=-1))
 
     def compute_physics(self) -> None:
-        self._thrust_positions, self._thrust_forces = self._thrust_generator.cast_actions_to_thrust(
-            self._thrust_actions
-        )
+        if self._robot_cfg.aggregate_thrust_wrench:
+            self._thrust_wrench[:, 0] = self._thrust_allocation.compute_wrench(self._thrust_actions)
+        else:
+            # The forces are applied at the thrusters, their torques result from the positions
+            self._thrust_positions, self._thrust_forces, _ = self._thrust_allocation.compute_thruster_forces(
+                self._thrust_actions
+            )
 
     def apply_actions(self) -> None:
         # Compute the physics
         super().apply_actions()
-        for randomizer in self.randomizers:
-            randomizer.update(dt=self.scene.physics_dt, actions=self._actions)
+        self.randomization_pipeline.update(dt=self.scene.physics_dt, actions=self._actions)
 
-        self._robot.set_external_force_and_torque(
-            self._thrust_forces, self._thrust_torques, positions=self._thrust_positions, body_ids=self._thrusters_ids
-        )
+        if self._robot_cfg.aggregate_thrust_wrench:
+            # A single wrench applied on the root body, instead of one force per thruster
+            self._robot.set_external_force_and_torque(
+                self._thrust_wrench[..., :3], self._thrust_wrench[..., 3:], body_ids=self._root_idx
+            )
+        else:
+            self._robot.set_external_force_and_torque(
+                self._thrust_forces,
+                self._thrust_torques,
+                positions=self._thrust_positions,
+                body_ids=self._thrusters_ids,
+            )
 
     def set_pose(
         self,
@@ -427,88 +450,3 @@ class ModularFreeflyerRobot(RobotCore):
         rigid body's actor frame.
         """
         return math_utils.quat_rotate_inverse(self.root_com_quat_w, self.root_com_ang_vel_w)
-
-
-class ThrustGenerator:
-    def __init__(self, robot_cfg: ModularFreeflyerRobotCfg, num_envs: int, device: str):
-
-        self._num_envs = num_envs
-        self._device = device
-        self._robot_cfg = robot_cfg
-
-        self.initialize_buffers()
-        self.get_transforms_from_cfg()
-
-    def initialize_buffers(self):
-        self._transforms2D = torch.zeros(
-            (self._num_envs, self._robot_cfg.num_thrusters, 3, 3),
-            dtype=torch.float,
-            device=self._device,
-        )
-        self._transforms = torch.zeros(
-            (self._num_envs, self._robot_cfg.num_thrusters, 5),
-            dtype=torch.float,
-            device=self._device,
-        )
-        self._thrust_force = torch.zeros(
-            (self._num_envs, self._robot_cfg.num_thrusters),
-            device=self._device,
-            dtype=torch.float32,
-        )
-        self.unit_vector = torch.zeros(
-            (self._num_envs, self._robot_cfg.num_thrusters, 2),
-            device=self._device,
-            dtype=torch.float32,
-        )
-        self.unit_vector[:, :, 0] = 1.0
-
-    def get_transforms_from_cfg(self):
-        assert (
-            len(self._robot_cfg.thruster_transforms) == self._robot_cfg.num_thrusters
-        ), "Number of thruster transforms does not match the number of thrusters"
-        # Transforms are stored in [x,y,theta,F] format, they need to be converted to 2D transforms, and a compact representation
-        for i, trsfrm in enumerate(self._robot_cfg.thruster_transforms):
-            # 2D transforms used to project the forces
-            self._transforms2D[:, i, 0, 0] = math.cos(trsfrm[2])
-            self._transforms2D[:, i, 0, 1] = math.sin(-trsfrm[2])
-            self._transforms2D[:, i, 1, 0] = math.sin(trsfrm[2])
-            self._transforms2D[:, i, 1, 1] = math.cos(trsfrm[2])
-            self._transforms2D[:, i, 2, 0] = trsfrm[0]
-            self._transforms2D[:, i, 2, 1] = trsfrm[1]
-            self._transforms2D[:, i, 2, 2] = 1.0
-            # Compact transform representation to inform the network
-            self._transforms[:, i, 0] = math.cos(trsfrm[2])
-            self._transforms[:, i, 1] = math.sin(trsfrm[2])
-            self._transforms[:, i, 2] = trsfrm[0]
-            self._transforms[:, i, 3] = trsfrm[1]
-            self._transforms[:, i, 4] = self._robot_cfg.thruster_max_thrust[i]
-            # Maximum thrust force
-            self._thrust_force[:, i] = self._robot_cfg.thruster_max_thrust[i]
-
-    def cast_actions_to_thrust(self, actions):
-        """
-        Projects the forces on the platform."""
-
-        rand_forces = actions * self._thrust_force
-        # Split transforms into translation and rotation
-        R = self._transforms2D[:, :, :2, :2].reshape(-1, 2, 2)
-        T = self._transforms2D[:, :, 2, :2].reshape(-1, 2)
-        # Create a zero tensor to add 3rd dimension
-        zero = torch.zeros((T.shape[0], 1), device=self._device, dtype=torch.float32)
-        # Generate positions
-        positions = torch.cat([T, zero], dim=-1)
-        # Project forces
-        force_vector = self.unit_vector * rand_forces.view(-1, self._robot_cfg.num_thrusters, 1)
-        rotated_forces = torch.matmul(R.reshape(-1, 2, 2), force_vector.view(-1, 2, 1))
-        projected_forces = torch.cat([rotated_forces[:, :, 0], zero], dim=-1)
-        return positions.reshape(-1, self._robot_cfg.num_thrusters, 3), projected_forces.reshape(
-            -1, self._robot_cfg.num_thrusters, 3
-        )
-
-    @property
-    def compact_transforms(self):
-        return self._transforms
-
-    @property
-    def transforms2D(self):
-        return self._transforms2D
@@ -9,8 +9,15 @@ from dataclasses import MISSING
 from isaaclab.assets import Articulation
 from isaaclab.scene import InteractiveScene
 
-from isaaclab_tasks.rans import RandomizationCore, RandomizationCoreCfg, RandomizerFactory, RobotCoreCfg, ScalarLogger
-from isaaclab_tasks.rans.utils import PerEnvSeededRNG
+from isaaclab_tasks.rans import (
+    RandomizationCore,
+    RandomizationCoreCfg,
+    RandomizationPipeline,
+    RandomizerFactory,
+    RobotCoreCfg,
+    ScalarLogger,
+)
+from isaaclab_tasks.rans.utils import RNG_FACTORY
 
 
 class RobotCore:
@@ -21,6 +28,7 @@ class RobotCore:
         num_envs: int = 1,
         decimation: int = 1,
         device: str = "cuda",
+        rng_backend: str = "warp",
     ):
         """Initializes the robot core.
 
@@ -28,7 +36,8 @@ class RobotCore:
             robot_cfg: The configuration of the robot.
             robot_uid: The unique id of the robot.
             num_envs: The number of environments.
-            device: The device on which the tensors are stored."""
+            device: The device on which the tensors are stored.
+            rng_backend: The backend of the random number generator, see :attr:`RobotCoreCfg.rng_backend`."""
 
         self.scene: InteractiveScene = scene
 
@@ -54,7 +63,7 @@ class RobotCore:
 
         # RNG
         seeds = torch.randint(0, 2**31, (self._num_envs,), dtype=torch.int32, device=self._device)
-        self._rng = PerEnvSeededRNG(seeds, self._num_envs, self._device)
+        self._rng = RNG_FACTORY(rng_backend, seeds=seeds, num_envs=self._num_envs, device=self._device)
 
         # Logs
         self.create_logs()
@@ -154,6 +163,8 @@ class RobotCore:
         # Run the setup functions of the randomizers
         for randomizer in self.randomizers:
             randomizer.setup()
+        # Flatten the hooks of the enabled randomizers, the action noise and rescaling are fused
+        self.randomization_pipeline = RandomizationPipeline(self.randomizers, dims={"actions": self._dim_robot_act})
 
     def get_observations(self):
         """Returns the observations of the robot."""
@@ -194,8 +205,7 @@ class RobotCore:
             self._gen_actions[env_ids] = gen_actions
 
         # Reset the randomizers
-        for randomizer in self.randomizers:
-            randomizer.reset(env_ids)
+        self.randomization_pipeline.reset(env_ids)
 
         self.set_initial_conditions(env_ids)
 
@@ -0,0 +1,188 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import math
+import torch
+
+from isaaclab.utils import math as math_utils
+
+
+class ThrusterAllocation:
+    def __init__(
+        self,
+        positions: torch.Tensor,
+        directions: torch.Tensor,
+        max_thrust: torch.Tensor,
+        num_envs: int = 1,
+        device: str = "cuda",
+    ) -> None:
+        """Maps the thrust actions of a set of fixed thrusters to the wrench they apply on the robot.
+
+        The geometry of the thrusters does not change with the environments, it is stored once and broadcast over
+        them. Each thruster i, located at p_i and pushing along the unit direction d_i, contributes the column
+        [d_i, p_i x d_i] of the [6, num_thrusters] allocation matrix. The wrench applied on the robot is then
+        obtained with a single matmul of the thrusts with the allocation matrix. Per-environment thrust scales are
+        only allocated when they are set, e.g. by a randomization.
+
+        Args:
+            positions: The positions of the thrusters in the root frame [num_thrusters, 3].
+            directions: The unit directions of the thrust in the root frame [num_thrusters, 3].
+            max_thrust: The maximum thrust of each thruster [num_thrusters].
+            num_envs: The number of environments.
+            device: The device to use."""
+
+        self._num_envs = num_envs
+        self._device = device
+
+        self._positions = torch.as_tensor(positions, dtype=torch.float32, device=device).reshape(-1, 3)
+        self._directions = torch.as_tensor(directions, dtype=torch.float32, device=device).reshape(-1, 3)
+        self._max_thrust = torch.as_tensor(max_thrust, dtype=torch.float32, device=device).reshape(-1)
+        self._num_thrusters = self._positions.shape[0]
+        assert (
+            self._directions.shape[0] == self._num_thrusters and self._max_thrust.shape[0] == self._num_thrusters
+        ), "The positions, directions and maximum thrusts must be given for each thruster."
+
+        # Wrench of each thruster at unit thrust [num_thrusters, 6], and at maximum thrust
+        self._unit_wrenches = torch.cat(
+            [self._directions, torch.cross(self._positions, self._directions, dim=-1)], dim=-1
+        )
+        self._wrenches = self._unit_wrenches * self._max_thrust.unsqueeze(-1)
+        # L1 norm of the torque of each thruster at maximum thrust, used to penalize the torques
+        self._torque_norms = self._wrenches[:, 3:].abs().sum(dim=-1)
+        # Per-environment thrust scales [num_envs, num_thrusters], only allocated when set
+        self._thrust_scales = None
+
+    @classmethod
+    def from_transforms_3d(
+        cls, transforms: list[list[float]], max_thrust: list[float], num_envs: int = 1, device: str = "cuda"
+    ) -> "ThrusterAllocation":
+        """Builds the allocation from thrusters defined as [x, y, z, rot_x, rot_y, rot_z].
+
+        The rotation is given as XYZ euler angles. The thrust is applied along R @ -R[2], as done by the IntBall2.
+
+        Args:
+            transforms: The transforms of the thrusters in the root frame.
+            max_thrust: The maximum thrust of each thruster.
+            num_envs: The number of environments.
+            device: The device to use.
+
+        Returns:
+            ThrusterAllocation: The allocation of the thrusters."""
+
+        transforms = torch.tensor(transforms, dtype=torch.float32, device=device).reshape(-1, 6)
+        R = math_utils.matrix_from_euler(transforms[:, 3:], convention="XYZ")
+        directions = torch.matmul(R, -R[:, 2].unsqueeze(-1)).squeeze(-1)
+        return cls(transforms[:, :3], directions, max_thrust, num_envs=num_envs, device=device)
+
+    @classmethod
+    def from_transforms_2d(
+        cls, transforms: list[list[float]], max_thrust: list[float], num_envs: int = 1, device: str = "cuda"
+    ) -> "ThrusterAllocation":
+        """Builds the allocation from planar thrusters defined as [x, y, theta].
+
+        The thrust is applied in the plane, along (cos(theta), sin(theta), 0).
+
+        Args:
+            transforms: The transforms of the thrusters in the root frame.
+            max_thrust: The maximum thrust of each thruster.
+            num_envs: The number of environments.
+            device: The device to use.
+
+        Returns:
+            ThrusterAllocation: The allocation of the thrusters."""
+
+        positions = [[x, y, 0.0] for x, y, _ in transforms]
+        directions = [[math.cos(theta), math.sin(theta), 0.0] for _, _, theta in transforms]
+        return cls(positions, directions, max_thrust, num_envs=num_envs, device=device)
+
+    @property
+    def num_thrusters(self) -> int:
+        return self._num_thrusters
+
+    @property
+    def allocation_matrix(self) -> torch.Tensor:
+        """The wrench applied by each thruster at maximum thrust [6, num_thrusters]."""
+        return self._wrenches.T
+
+    @property
+    def positions(self) -> torch.Tensor:
+        """The positions of the thrusters broadcast over the environments [num_envs, num_thrusters, 3].
+
+        This is a view, nothing is copied."""
+        return self._positions.expand(self._num_envs, -1, -1)
+
+    @property
+    def thrust_scales(self) -> torch.Tensor | None:
+        """The per-environment thrust scales [num_envs, num_thrusters], None if they were never set."""
+        return self._thrust_scales
+
+    def set_thrust_scales(self, scales: torch.Tensor, env_ids: torch.Tensor | None = None) -> None:
+        """Sets the scales of the maximum thrusts of the environments.
+
+        Args:
+            scales: The scales of the thrusters [len(env_ids), num_thrusters].
+            env_ids: The ids of the environments. If None, all the environments are set."""
+
+        if self._thrust_scales is None:
+            self._thrust_scales = torch.ones(
+                (self._num_envs, self._num_thrusters), dtype=torch.float32, device=self._device
+            )
+        if env_ids is None:
+            self._thrust_scales[:] = scales
+        else:
+            self._thrust_scales[env_ids] = scales
+
+    def thrusts(self, actions: torch.Tensor) -> torch.Tensor:
+        """Computes the thrust of each thruster.
+
+        Args:
+            actions: The thrust actions in [0, 1] [num_envs, num_thrusters].
+
+        Returns:
+            torch.Tensor: The thrusts [num_envs, num_thrusters]."""
+
+        thrusts = actions * self._max_thrust
+        if self._thrust_scales is not None:
+            thrusts = thrusts * self._thrust_scales
+        return thrusts
+
+    def compute_wrench(self, actions: torch.Tensor) -> torch.Tensor:
+        """Computes the wrench applied by the thrusters on the root of the robot.
+
+        Args:
+            actions: The thrust actions in [0, 1] [num_envs, num_thrusters].
+
+        Returns:
+            torch.Tensor: The forces and the torques about the origin of the root frame [num_envs, 6]."""
+
+        if self._thrust_scales is None:
+            return torch.matmul(actions, self._wrenches)
+        return torch.matmul(actions * self._thrust_scales, self._wrenches)
+
+    def compute_thruster_forces(self, actions: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """Computes the wrench applied by each thruster.
+
+        Args:
+            actions: The thrust actions in [0, 1] [num_envs, num_thrusters].
+
+        Returns:
+            tuple[torch.Tensor, torch.Tensor, torch.Tensor]: The positions, the forces, and the torques about the
+                origin of the root frame of each thruster [num_envs, num_thrusters, 3]."""
+
+        wrenches = self.thrusts(actions).unsqueeze(-1) * self._unit_wrenches
+        return self.positions, wrenches[..., :3], wrenches[..., 3:]
+
+    def compute_torque_norms(self, actions: torch.Tensor) -> torch.Tensor:
+        """Computes the sum of the L1 norms of the torques of the thrusters, without forming them.
+
+        Args:
+            actions: The thrust actions [num_envs, num_thrusters].
+
+        Returns:
+            torch.Tensor: The sum of the L1 norms of the torques [num_envs]."""
+
+        if self._thrust_scales is None:
+            return torch.matmul(actions.abs(), self._torque_norms)
+        return torch.matmul((actions * self._thrust_scales).abs(), self._torque_norms)
@@ -3,25 +3,28 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
-# isort: off
-from .robot_core_cfg import RobotCoreCfg  # noqa: F401, F403
+# The configurations are imported on first access, and by the factory on first create.
+from isaaclab_tasks.rans.utils.misc import factory, lazy_exports
 
-# # isort: on
-from .leatherback_cfg import LeatherbackRobotCfg  # noqa: F401, F403
-from .floating_platform_cfg import FloatingPlatformRobotCfg  # noqa: F401, F403
-from .jetbot_cfg import JetbotRobotCfg  # noqa: F401, F403
-from .modular_freeflyer_cfg import ModularFreeflyerRobotCfg  # noqa: F401, F403
-from .kingfisher_cfg import KingfisherRobotCfg  # noqa: F401, F403
-from .turtlebot2_cfg import TurtleBot2RobotCfg  # noqa: F401, F403
-from .intball2_cfg import IntBall2RobotCfg  # noqa: F401, F403
-
-from isaaclab_tasks.rans.utils.misc import factory
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "RobotCoreCfg": ".robot_core_cfg",
+        "LeatherbackRobotCfg": ".leatherback_cfg",
+        "FloatingPlatformRobotCfg": ".floating_platform_cfg",
+        "JetbotRobotCfg": ".jetbot_cfg",
+        "ModularFreeflyerRobotCfg": ".modular_freeflyer_cfg",
+        "KingfisherRobotCfg": ".kingfisher_cfg",
+        "TurtleBot2RobotCfg": ".turtlebot2_cfg",
+        "IntBall2RobotCfg": ".intball2_cfg",
+    },
+)
 
 ROBOT_CFG_FACTORY = factory()
-ROBOT_CFG_FACTORY.register("Jetbot", JetbotRobotCfg)
-ROBOT_CFG_FACTORY.register("Leatherback", LeatherbackRobotCfg)
-ROBOT_CFG_FACTORY.register("FloatingPlatform", FloatingPlatformRobotCfg)
-ROBOT_CFG_FACTORY.register("ModularFreeflyer", ModularFreeflyerRobotCfg)
-ROBOT_CFG_FACTORY.register("Kingfisher", KingfisherRobotCfg)
-ROBOT_CFG_FACTORY.register("Turtlebot2", TurtleBot2RobotCfg)
-ROBOT_CFG_FACTORY.register("IntBall2", IntBall2RobotCfg)
+ROBOT_CFG_FACTORY.register("Jetbot", f"{__name__}.jetbot_cfg:JetbotRobotCfg")
+ROBOT_CFG_FACTORY.register("Leatherback", f"{__name__}.leatherback_cfg:LeatherbackRobotCfg")
+ROBOT_CFG_FACTORY.register("FloatingPlatform", f"{__name__}.floating_platform_cfg:FloatingPlatformRobotCfg")
+ROBOT_CFG_FACTORY.register("ModularFreeflyer", f"{__name__}.modular_freeflyer_cfg:ModularFreeflyerRobotCfg")
+ROBOT_CFG_FACTORY.register("Kingfisher", f"{__name__}.kingfisher_cfg:KingfisherRobotCfg")
+ROBOT_CFG_FACTORY.register("Turtlebot2", f"{__name__}.turtlebot2_cfg:TurtleBot2RobotCfg")
+ROBOT_CFG_FACTORY.register("IntBall2", f"{__name__}.intball2_cfg:IntBall2RobotCfg")
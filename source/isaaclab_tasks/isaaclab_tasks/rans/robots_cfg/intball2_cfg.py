@@ -58,6 +58,9 @@ class IntBall2RobotCfg(RobotCoreCfg):
     thrust_scale_factors = [0.8] * num_thrusters  # Placeholder
     # drag_torque_factors = [0.1] * num_thrusters  # Placeholder, needs tuning
     split_thrust = True  # Thrusters work in coordinated pairs
+    # Apply the resultant wrench of the thrusters on the root body, instead of one force per thruster. Assumes the
+    # thruster transforms are expressed in the root frame.
+    aggregate_thrust_wrench = False
 
     # # Sensors
     # body_contact_forces: ContactSensorCfg = ContactSensorCfg(
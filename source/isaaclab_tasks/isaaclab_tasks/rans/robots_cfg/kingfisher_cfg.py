@@ -59,6 +59,10 @@ class KingfisherRobotCfg(RobotCoreCfg):
         quadratic_damping_rand=[0.1, 0.1, 0.0, 0.0, 0.0, 0.1],
     )
 
+    # Implementation of the fused physics, 'torch' or 'warp', and whether to compile the torch implementation
+    physics_backend: str = "torch"
+    compile_physics: bool = True
+
     # Thruster dynamics
     propeller_cfg: PropellerActuatorCfg = PropellerActuatorCfg(
         cmd_lower_range=-1.0,
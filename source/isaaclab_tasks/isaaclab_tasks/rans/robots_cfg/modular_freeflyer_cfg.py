@@ -55,6 +55,9 @@ class ModularFreeflyerRobotCfg(RobotCoreCfg):
     thruster_max_thrust = [1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0]
 
     split_thrust = True  # Split max thrust force among thrusters
+    # Apply the resultant wrench of the thrusters on the root body, instead of one force per thruster. Assumes the
+    # thruster transforms are expressed in the root frame.
+    aggregate_thrust_wrench = False
 
     # Randomization
     mass_rand_cfg: MassRandomizationCfg = MassRandomizationCfg(
@@ -17,5 +17,8 @@ class RobotCoreCfg:
     ema_coeff: float = 0.9
     """Exponential moving average coefficient used to update some of the logs."""
 
+    rng_backend: str = "warp"
+    """Backend of the random number generator of the robot, 'warp' or 'philox'. Philox runs in pure torch."""
+
     contact_sensor_active: bool = False
     """Flag to enable the contact sensor."""
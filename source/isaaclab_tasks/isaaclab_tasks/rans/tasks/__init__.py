@@ -3,43 +3,48 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
-# isort: off
-from .task_core import TaskCore  # noqa: F401, F403
+# The tasks are imported on first access, and by the factory on first create.
+from isaaclab_tasks.rans.utils.misc import factory, lazy_exports
 
-# isort: on
-
-from isaaclab_tasks.rans.utils.misc import factory
-
-from .go_through_poses import GoThroughPosesTask  # noqa: F401, F403
-from .go_through_poses_6DoF import GoThroughPoses3DTask  # noqa: F401, F403
-from .go_through_positions import GoThroughPositionsTask  # noqa: F401, F403
-from .go_through_positions_6DoF import GoThroughPositions3DTask  # noqa: F401, F403
-from .go_to_pose import GoToPoseTask  # noqa: F401, F403
-from .go_to_pose_6DoF import GoToPose3DTask  # noqa: F401, F403
-from .go_to_position import GoToPositionTask  # noqa: F401, F403
-from .go_to_position_6DoF import GoToPosition3DTask  # noqa: F401, F403
-from .go_to_position_with_obstacles import GoToPositionWithObstaclesTask  # noqa: F401, F403
-from .push_block import PushBlockTask  # noqa: F401, F403
-from .race_gates import RaceGatesTask  # noqa: F401, F403
-from .race_waypoints import RaceWaypointsTask  # noqa: F401, F403
-from .race_wayposes import RaceWayposesTask  # noqa: F401, F403
-from .task_core import TaskCore  # noqa: F401, F403
-from .track_velocities import TrackVelocitiesTask  # noqa: F401, F403
-from .track_velocities_6DoF import TrackVelocities3DTask  # noqa: F401, F403
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "TaskCore": ".task_core",
+        "GoThroughPoses3DTask": ".go_through_poses_6DoF",
+        "GoThroughPosesTask": ".go_through_poses",
+        "GoThroughPositions3DTask": ".go_through_positions_6DoF",
+        "GoThroughPositionsTask": ".go_through_positions",
+        "GoToPose3DTask": ".go_to_pose_6DoF",
+        "GoToPoseTask": ".go_to_pose",
+        "GoToPosition3DTask": ".go_to_position_6DoF",
+        "GoToPositionTask": ".go_to_position",
+        "GoalLookAhead": ".look_ahead",
+        "GoToPositionWithObstaclesTask": ".go_to_position_with_obstacles",
+        "PushBlockTask": ".push_block",
+        "RaceGatesTask": ".race_gates",
+        "RaceWaypointsTask": ".race_waypoints",
+        "RaceWayposesTask": ".race_wayposes",
+        "RobotStateCache": ".look_ahead",
+        "TrackVelocities3DTask": ".track_velocities_6DoF",
+        "TrackVelocitiesTask": ".track_velocities",
+    },
+)
 
 TASK_FACTORY = factory()
-TASK_FACTORY.register("GoThroughPoses", GoThroughPosesTask)
-TASK_FACTORY.register("GoThroughPoses3D", GoThroughPoses3DTask)
-TASK_FACTORY.register("GoThroughPositions", GoThroughPositionsTask)
-TASK_FACTORY.register("GoThroughPositions3D", GoThroughPositions3DTask)
-TASK_FACTORY.register("GoToPose", GoToPoseTask)
-TASK_FACTORY.register("GoToPose3D", GoToPose3DTask)
-TASK_FACTORY.register("GoToPosition", GoToPositionTask)
-TASK_FACTORY.register("GoToPosition3D", GoToPosition3DTask)
-TASK_FACTORY.register("PushBlock", PushBlockTask)
-TASK_FACTORY.register("RaceWaypoints", RaceWaypointsTask)
-TASK_FACTORY.register("RaceWayposes", RaceWayposesTask)
-TASK_FACTORY.register("TrackVelocities", TrackVelocitiesTask)
-TASK_FACTORY.register("TrackVelocities3D", TrackVelocities3DTask)
-TASK_FACTORY.register("GoToPositionWithObstacles", GoToPositionWithObstaclesTask)
-TASK_FACTORY.register("RaceGates", RaceGatesTask)
+TASK_FACTORY.register("GoThroughPoses", f"{__name__}.go_through_poses:GoThroughPosesTask")
+TASK_FACTORY.register("GoThroughPoses3D", f"{__name__}.go_through_poses_6DoF:GoThroughPoses3DTask")
+TASK_FACTORY.register("GoThroughPositions", f"{__name__}.go_through_positions:GoThroughPositionsTask")
+TASK_FACTORY.register("GoThroughPositions3D", f"{__name__}.go_through_positions_6DoF:GoThroughPositions3DTask")
+TASK_FACTORY.register("GoToPose", f"{__name__}.go_to_pose:GoToPoseTask")
+TASK_FACTORY.register("GoToPose3D", f"{__name__}.go_to_pose_6DoF:GoToPose3DTask")
+TASK_FACTORY.register("GoToPosition", f"{__name__}.go_to_position:GoToPositionTask")
+TASK_FACTORY.register("GoToPosition3D", f"{__name__}.go_to_position_6DoF:GoToPosition3DTask")
+TASK_FACTORY.register("PushBlock", f"{__name__}.push_block:PushBlockTask")
+TASK_FACTORY.register("RaceWaypoints", f"{__name__}.race_waypoints:RaceWaypointsTask")
+TASK_FACTORY.register("RaceWayposes", f"{__name__}.race_wayposes:RaceWayposesTask")
+TASK_FACTORY.register("TrackVelocities", f"{__name__}.track_velocities:TrackVelocitiesTask")
+TASK_FACTORY.register("TrackVelocities3D", f"{__name__}.track_velocities_6DoF:TrackVelocities3DTask")
+TASK_FACTORY.register(
+    "GoToPositionWithObstacles", f"{__name__}.go_to_position_with_obstacles:GoToPositionWithObstaclesTask"
+)
+TASK_FACTORY.register("RaceGates", f"{__name__}.race_gates:RaceGatesTask")
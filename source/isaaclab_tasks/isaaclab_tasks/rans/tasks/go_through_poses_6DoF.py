@@ -12,6 +12,7 @@ from isaaclab.utils import math as math_utils
 
 from isaaclab_tasks.rans import GoThroughPoses3DCfg
 
+from .look_ahead import GoalLookAhead, RobotStateCache, rotation_6d
 from .task_core import TaskCore
 
 EPS = 1e-6  # small constant to avoid divisions by 0 and log(0)
@@ -42,7 +43,14 @@ class GoThroughPoses3DTask(TaskCore):
             task_id: The id of the task.
             env_ids: The ids of the environments used by this task."""
 
-        super().__init__(scene=scene, task_uid=task_uid, num_envs=num_envs, device=device, env_ids=env_ids)
+        super().__init__(
+            scene=scene,
+            task_uid=task_uid,
+            num_envs=num_envs,
+            device=device,
+            env_ids=env_ids,
+            rng_backend=task_cfg.rng_backend,
+        )
 
         # Task and reward parameters
         self._task_cfg = task_cfg
@@ -81,6 +89,8 @@ class GoThroughPoses3DTask(TaskCore):
         self._trajectory_completed = torch.zeros((self._num_envs,), device=self._device, dtype=torch.bool)
         self._num_goals = torch.zeros((self._num_envs,), device=self._device, dtype=torch.long)
         self._ALL_INDICES = torch.arange(self._num_envs, dtype=torch.long, device=self._device)
+        self._robot_state = RobotStateCache(self._num_envs, self._device, planar=False)
+        self._look_ahead = GoalLookAhead(self._task_cfg.num_subsequent_goals, self._device, wrap=self._task_cfg.loop)
 
     def create_logs(self) -> None:
         """
@@ -129,11 +139,10 @@ class GoThroughPoses3DTask(TaskCore):
 
         # position error in world frame
         self._position_error = (
-            self._target_positions[self._ALL_INDICES, self._target_index]
-            - self._robot.root_link_pos_w[self._env_ids, :3]
+            self._target_positions[self._ALL_INDICES, self._target_index] - self._robot_state.position
         )
         # rotate into robot's local frame via inverse of current orientation
-        current_quat_w = self._robot.root_link_quat_w[self._env_ids]
+        current_quat_w = self._robot_state.quat
         self._local_pos_error = math_utils.quat_rotate_inverse(current_quat_w, self._position_error)
 
         # log the global distance for debugging
@@ -148,18 +157,8 @@ class GoThroughPoses3DTask(TaskCore):
             math_utils.quat_conjugate(current_quat_w), target_quat_w
         )  # rotation from robot's orientation to target's orientation in robot local frame
 
-        # Rotation matrix magic:
-        rel_mat = math_utils.matrix_from_quat(rel_quat)
-        # Extract the first two columns
-        col0 = rel_mat[:, :, 0]  # shape [N, 3]
-        col1 = rel_mat[:, :, 1]  # shape [N, 3]
-        # Re-orthonormalize using Gram-Schmidt:
-        col0 = torch.nn.functional.normalize(col0, dim=-1)
-        proj = (col1 * col0).sum(dim=-1, keepdim=True)
-        col1 = col1 - proj * col0
-        col1 = torch.nn.functional.normalize(col1, dim=-1)
-        # Stack to get 6D representation
-        rel_mat_6 = torch.cat([col0, col1], dim=-1)  # shape [N, 6]
+        # 6D representation of the rotation, re-orthonormalized using Gram-Schmidt
+        rel_mat_6 = rotation_6d(rel_quat)  # shape [N, 6]
 
         # Store in buffer [position_dist, rotation error, linear_vel_xyz, angular_vel_xyz]
         self._task_data[:, 0:3] = self._local_pos_error
@@ -172,47 +171,19 @@ class GoThroughPoses3DTask(TaskCore):
         current_quat_w = torch.nn.functional.normalize(current_quat_w, dim=-1, eps=EPS)
         self._orientation_error[self._env_ids] = math_utils.quat_error_magnitude(target_quat_w, current_quat_w)
 
-        # We compute the observations of the subsequent goals in the previous goal's frame.
-        for i in range(self._task_cfg.num_subsequent_goals - 1):
-            next_indices = torch.where(
-                (self._target_index + i + 1) >= self._num_goals,
-                torch.zeros_like(self._target_index),  # Set to 0 if overflowing
-                self._target_index + i + 1,
-            )
-
-            if self._task_cfg.loop:
-                next_indices = (self._target_index + i + 1) % self._num_goals
-
-            # Compute position error between nth and (n+1)th goal
-            subsequent_goal = self._target_positions[self._ALL_INDICES, next_indices, :]
-            subsequent_error = subsequent_goal - self._target_positions[self._ALL_INDICES, self._target_index]
-            local_subsequent_error = math_utils.quat_rotate_inverse(current_quat_w, subsequent_error)
-
-            # Compute orientation error between nth and (n+1)th goal in the current goal's frame
-            next_goal_quat_w = self._target_orientations[self._ALL_INDICES, next_indices]
-            goal_rel_quat = math_utils.quat_mul(math_utils.quat_conjugate(target_quat_w), next_goal_quat_w)
-
-            # Convert to 3x3 rot matrix, stored as 6 floats
-            goal_rel_mat = math_utils.matrix_from_quat(goal_rel_quat)
-            col0g = goal_rel_mat[:, :, 0]
-            col1g = goal_rel_mat[:, :, 1]
-            col0g = torch.nn.functional.normalize(col0g, dim=-1, eps=EPS)
-            projg = (col1g * col0g).sum(dim=-1, keepdim=True)
-            col1g = col1g - projg * col0g
-            col1g = torch.nn.functional.normalize(col1g, dim=-1, eps=EPS)
-            goal_rel_mat_6 = torch.cat([col0g, col1g], dim=-1)  # shape [N, 6]
-
-            # If looping is disabled, set error to zero where indices overflow
-            if not self._task_cfg.loop:
-                # valid = torch.logical_not((self._target_index + i + 1) >= self._num_goals).unsqueeze(-1)
-                valid_mask = ((self._target_index + i + 1) < self._num_goals).unsqueeze(-1)
-                local_subsequent_error = local_subsequent_error * valid_mask
-                goal_rel_mat_6 = goal_rel_mat_6 * valid_mask
-
-            # Store in buffer
-            start_idx = 15 + 9 * i
-            self._task_data[:, start_idx : start_idx + 3] = local_subsequent_error  # Position error
-            self._task_data[:, start_idx + 3 : start_idx + 9] = goal_rel_mat_6  # rotation to next goal
+        # We compute the observations of the subsequent goals in the current goal's frame, all at once: the position
+        # error between the current and the next goals, and the rotation to the next goals. If the task is not set to
+        # loop, the goals beyond the last one are set to 0.
+        num_look_ahead = self._look_ahead.num_look_ahead
+        self._look_ahead.goal_frame_3d(
+            self._task_data[:, 15 : 15 + 9 * num_look_ahead].unflatten(1, (num_look_ahead, 9)),
+            self._target_positions,
+            self._target_orientations,
+            self._target_index,
+            self._num_goals,
+            current_quat_w,
+            mask_overflow=not self._task_cfg.loop,
+        )
 
         # Concatenate task observations with robot's internal observations
         return torch.concat((self._task_data, self._robot.get_observations()), dim=-1)
@@ -301,7 +272,12 @@ class GoThroughPoses3DTask(TaskCore):
         return total_reward
 
     def reset(
-        self, env_ids: torch.Tensor, gen_actions: torch.Tensor | None = None, env_seeds: torch.Tensor | None = None
+        self,
+        env_ids: torch.Tensor,
+        gen_actions: torch.Tensor | None = None,
+        env_seeds: torch.Tensor | None = None,
+        robot_gen_actions: torch.Tensor | None = None,
+        robot_env_seeds: torch.Tensor | None = None,
     ) -> None:
         """
         Resets the task to its initial state.
@@ -333,22 +309,30 @@ class GoThroughPoses3DTask(TaskCore):
             gen_actions (torch.Tensor | None): The task-specific generation actions for sampling initial conditions.
                 If None, defaults to uniform random sampling.
             env_seeds (torch.Tensor | None): The seeds for the environments to ensure reproducibility. Defaults to None.
+            robot_gen_actions (torch.Tensor | None): The generation actions of the robot. Defaults to None.
+            robot_env_seeds (torch.Tensor | None): The seeds of the robot. Defaults to None.
         """
-        super().reset(env_ids, gen_actions=gen_actions, env_seeds=env_seeds)
+        super().reset(
+            env_ids,
+            gen_actions=gen_actions,
+            env_seeds=env_seeds,
+            robot_gen_actions=robot_gen_actions,
+            robot_env_seeds=robot_env_seeds,
+        )
 
         # Reset the target index and trajectory completed
         self._target_index[env_ids] = 0
         self._trajectory_completed[env_ids] = False
 
-        # Make sure the position error and position dist are up to date after the reset
+        # Make sure the robot state, position error and position dist are up to date after the reset
+        self._robot_state.update(self._robot, self._env_ids, env_ids)
         self._position_error[env_ids] = (
-            self._target_positions[env_ids, self._target_index[env_ids]]
-            - self._robot.root_link_pos_w[self._env_ids][env_ids]
+            self._target_positions[env_ids, self._target_index[env_ids]] - self._robot_state.position[env_ids]
         )
         self._position_dist[env_ids] = torch.linalg.norm(self._position_error[env_ids], dim=-1)
         self._previous_position_dist[env_ids] = self._position_dist[env_ids].clone()
         # Make sure the orientation error is also updated
-        current_quat = self._robot.root_link_quat_w[self._env_ids][env_ids]  # Current robot orientation
+        current_quat = self._robot_state.quat[env_ids]  # Current robot orientation
         target_quat = self._target_orientations[env_ids, self._target_index[env_ids]]  # Target orientation
         self._orientation_error[env_ids] = math_utils.quat_error_magnitude(target_quat, current_quat)
 
@@ -369,13 +353,16 @@ class GoThroughPoses3DTask(TaskCore):
             task_failed (torch.Tensor): Environments where the robot has exceeded max distance.
             task_completed (torch.Tensor): Environments where the goal has been reached for enough steps.
         """
+        # get_dones is the first call after the physics steps, the robot state is read once here for the whole step.
+        self._robot_state.update(self._robot, self._env_ids)
+
         # Compute position error in world frame (extend to 3D)
         self._position_error = (
-            self._target_positions[self._ALL_INDICES, self._target_index] - self._robot.root_link_pos_w[self._env_ids]
+            self._target_positions[self._ALL_INDICES, self._target_index] - self._robot_state.position
         )
         self._previous_position_dist = self._position_dist.clone()
         self._position_dist = torch.linalg.norm(self._position_error, dim=-1)
-        current_quat = self._robot.root_quat_w[self._env_ids]  # (w, x, y, z)
+        current_quat = self._robot_state.quat  # (w, x, y, z)
         target_quat = self._target_orientations[self._env_ids, self._target_index[self._env_ids]]  # (w, x, y, z)
         self._orientation_error = math_utils.quat_error_magnitude(target_quat, current_quat)
 
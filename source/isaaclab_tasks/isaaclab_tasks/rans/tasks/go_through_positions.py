@@ -11,6 +11,7 @@ from isaaclab.scene import InteractiveScene
 
 from isaaclab_tasks.rans import GoThroughPositionsCfg
 
+from .look_ahead import GoalLookAhead, RobotStateCache, wrap_angle
 from .task_core import TaskCore
 
 EPS = 1e-6  # small constant to avoid divisions by 0 and log(0)
@@ -42,7 +43,14 @@ class GoThroughPositionsTask(TaskCore):
             env_ids: The ids of the environments used by this task.
         """
 
-        super().__init__(scene=scene, task_uid=task_uid, num_envs=num_envs, device=device, env_ids=env_ids)
+        super().__init__(
+            scene=scene,
+            task_uid=task_uid,
+            num_envs=num_envs,
+            device=device,
+            env_ids=env_ids,
+            rng_backend=task_cfg.rng_backend,
+        )
 
         # Task and reward parameters
         self._task_cfg = task_cfg
@@ -54,6 +62,16 @@ class GoThroughPositionsTask(TaskCore):
         # Buffers
         self.initialize_buffers()
 
+        # All the draws needed to generate the goals are sampled in a single kernel launch
+        self._goals_plan = self._rng.create_draw_plan()
+        self._goals_plan.add_integer("num_goals", self._task_cfg.min_num_goals, self._task_cfg.max_num_goals, 1)
+        self._goals_plan.add_uniform(
+            "first_goal", -self._task_cfg.goal_max_dist_from_origin, self._task_cfg.goal_max_dist_from_origin, 2
+        )
+        for i in range(1, self._task_cfg.max_num_goals):
+            self._goals_plan.add_uniform(f"radius_{i}", 0.0, 1.0, 1)
+            self._goals_plan.add_uniform(f"theta_{i}", 0.0, math.pi, 1)
+
     def initialize_buffers(self, env_ids: torch.Tensor | None = None) -> None:
         """
         Initializes the buffers used by the task.
@@ -79,6 +97,8 @@ class GoThroughPositionsTask(TaskCore):
         self._trajectory_completed = torch.zeros((self._num_envs,), device=self._device, dtype=torch.bool)
         self._num_goals = torch.zeros((self._num_envs,), device=self._device, dtype=torch.long)
         self._ALL_INDICES = torch.arange(self._num_envs, dtype=torch.long, device=self._device)
+        self._robot_state = RobotStateCache(self._num_envs, self._device)
+        self._look_ahead = GoalLookAhead(self._task_cfg.num_subsequent_goals, self._device)
 
     def create_logs(self) -> None:
         """
@@ -127,60 +147,25 @@ class GoThroughPositionsTask(TaskCore):
         Returns:
             torch.Tensor: The observation tensor."""
 
-        # position error
-        self._position_error = (
-            self._target_positions[self._ALL_INDICES, self._target_index]
-            - self._robot.root_link_pos_w[self._env_ids, :2]
+        # The current and subsequent goals are observed in the robot frame as the goals are not oriented. The error to
+        # the current goal is refreshed as compute_rewards may have moved the target index.
+        goals = self._task_data[:, 3 : 6 + 3 * self._look_ahead.num_look_ahead].unflatten(1, (-1, 3))
+        self._position_error, self._position_dist = self._look_ahead.robot_frame_2d(
+            goals,
+            self._target_positions,
+            self._target_index,
+            self._num_goals,
+            self._robot_state.position[:, :2],
+            self._robot_state.heading,
+            # If the task is not set to loop, the goals beyond the last one are set to 0.
+            mask_overflow=not self._task_cfg.loop,
         )
-        self._position_dist = torch.linalg.norm(self._position_error, dim=-1)
-
-        # position error expressed as distance and angular error (to the position)
-        heading = self._robot.heading_w[self._env_ids]
-        target_heading_w = torch.atan2(
-            self._target_positions[self._ALL_INDICES, self._target_index, 1]
-            - self._robot.root_link_pos_w[self._env_ids, 1],
-            self._target_positions[self._ALL_INDICES, self._target_index, 0]
-            - self._robot.root_link_pos_w[self._env_ids, 0],
-        )
-        target_heading_error = torch.atan2(torch.sin(target_heading_w - heading), torch.cos(target_heading_w - heading))
 
         # Store in buffer
         self._task_data[:, 0:2] = self._robot.root_com_lin_vel_b[self._env_ids, :2]
         self._task_data[:, 2] = self._robot.root_com_ang_vel_w[self._env_ids, -1]
-        self._task_data[:, 3] = self._position_dist
-        self._task_data[:, 4] = torch.cos(target_heading_error)
-        self._task_data[:, 5] = torch.sin(target_heading_error)
-        # We compute the observations of the subsequent goals in the robot frame as the goals are not oriented.
-        for i in range(self._task_cfg.num_subsequent_goals - 1):
-            # Check if the index is looking beyond the number of goals
-            overflowing = (self._target_index + i + 1) >= self._num_goals
-            # If it is, then set the next index to 0 (Loop around)
-            indices = (self._target_index + i + 1) * torch.logical_not(overflowing)
-            # Compute the distance between the nth goal, and the robot
-            goal_distance = torch.linalg.norm(
-                self._robot.root_link_pos_w[self._env_ids, :2] - self._target_positions[self._ALL_INDICES, indices],
-                dim=-1,
-            )
-            # Compute the heading distance between the nth goal, and the robot
-            target_heading_w = torch.atan2(
-                self._target_positions[self._ALL_INDICES, indices, 1] - self._robot.root_link_pos_w[self._env_ids, 1],
-                self._target_positions[self._ALL_INDICES, indices, 0] - self._robot.root_link_pos_w[self._env_ids, 0],
-            )
-            target_heading_error = torch.atan2(
-                torch.sin(target_heading_w - heading),
-                torch.cos(target_heading_w - heading),
-            )
-            # If the task is not set to loop, we set the next goal to be 0.
-            if not self._task_cfg.loop:
-                goal_distance = goal_distance * torch.logical_not(overflowing)
-                target_heading_error = target_heading_error * torch.logical_not(overflowing)
-            # Add to buffer
-            self._task_data[:, 6 + 3 * i] = goal_distance
-            self._task_data[:, 7 + 3 * i] = torch.cos(target_heading_error)
-            self._task_data[:, 8 + 3 * i] = torch.sin(target_heading_error)
-
-        for randomizer in self.randomizers:
-            randomizer.observations(observations=self._task_data)
+
+        self.randomization_pipeline.observations(observations=self._task_data)
 
         # Concatenate the task observations with the robot observations
         return torch.concat((self._task_data, self._robot.get_observations()), dim=-1)
@@ -193,14 +178,8 @@ class GoThroughPositionsTask(TaskCore):
             torch.Tensor: The reward for the current state of the robot."""
 
         # position error expressed as distance and angular error (to the position)
-        heading = self._robot.heading_w[self._env_ids]
-        target_heading_w = torch.atan2(
-            self._target_positions[self._ALL_INDICES, self._target_index, 1]
-            - self._robot.root_link_pos_w[self._env_ids, 1],
-            self._target_positions[self._ALL_INDICES, self._target_index, 0]
-            - self._robot.root_link_pos_w[self._env_ids, 0],
-        )
-        target_heading_error = torch.atan2(torch.sin(target_heading_w - heading), torch.cos(target_heading_w - heading))
+        target_heading_w = torch.atan2(self._position_error[:, 1], self._position_error[:, 0])
+        target_heading_error = wrap_angle(target_heading_w - self._robot_state.heading)
         heading_dist = torch.abs(target_heading_error)
         # boundary distance
         boundary_dist = torch.abs(self._task_cfg.maximum_robot_distance - self._position_dist)
@@ -275,6 +254,8 @@ class GoThroughPositionsTask(TaskCore):
         env_ids: torch.Tensor,
         gen_actions: torch.Tensor | None = None,
         env_seeds: torch.Tensor | None = None,
+        robot_gen_actions: torch.Tensor | None = None,
+        robot_env_seeds: torch.Tensor | None = None,
     ) -> None:
         """
         Resets the task to its initial state.
@@ -291,18 +272,26 @@ class GoThroughPositionsTask(TaskCore):
             env_ids (torch.Tensor): The ids of the environments.
             task_actions (torch.Tensor | None): The actions for the task. Defaults to None.
             env_seeds (torch.Tensor | None): The seeds for the environments. Defaults to None.
+            robot_gen_actions (torch.Tensor | None): The generation actions of the robot. Defaults to None.
+            robot_env_seeds (torch.Tensor | None): The seeds of the robot. Defaults to None.
         """
 
-        super().reset(env_ids, gen_actions=gen_actions, env_seeds=env_seeds)
+        super().reset(
+            env_ids,
+            gen_actions=gen_actions,
+            env_seeds=env_seeds,
+            robot_gen_actions=robot_gen_actions,
+            robot_env_seeds=robot_env_seeds,
+        )
 
         # Reset the target index and trajectory completed
         self._target_index[env_ids] = 0
         self._trajectory_completed[env_ids] = False
 
-        # Make sure the position error and position dist are up to date after the reset
+        # Make sure the robot state, position error and position dist are up to date after the reset
+        self._robot_state.update(self._robot, self._env_ids, env_ids)
         self._position_error[env_ids] = (
-            self._target_positions[env_ids, self._target_index[env_ids]]
-            - self._robot.root_link_pos_w[self._env_ids, :2][env_ids]
+            self._target_positions[env_ids, self._target_index[env_ids]] - self._robot_state.position[env_ids, :2]
         )
         self._position_dist[env_ids] = torch.linalg.norm(self._position_error[env_ids], dim=-1)
         self._previous_position_dist[env_ids] = self._position_dist[env_ids].clone()
@@ -322,10 +311,12 @@ class GoThroughPositionsTask(TaskCore):
         Returns:
             torch.Tensor: Whether the platforms should be killed or not."""
 
+        # get_dones is the first call after the physics steps, the robot state is read once here for the whole step.
+        self._robot_state.update(self._robot, self._env_ids)
+
         # Kill robots that would stray too far from the target.
         self._position_error = (
-            self._target_positions[self._ALL_INDICES, self._target_index]
-            - self._robot.root_link_pos_w[self._env_ids, :2]
+            self._target_positions[self._ALL_INDICES, self._target_index] - self._robot_state.position[:, :2]
         )
         self._previous_position_dist = self._position_dist.clone()
         self._position_dist = torch.linalg.norm(self._position_error, dim=-1)
@@ -368,10 +359,14 @@ class GoThroughPositionsTask(TaskCore):
         Returns:
             Tuple[torch.Tensor, torch.Tensor]: The target positions and orientations."""
 
+        # Sample all the random values needed to generate the goals at once.
+        radius_bounds = (self._gen_actions[env_ids, 0], self._gen_actions[env_ids, 1])
+        draws = self._goals_plan.sample(
+            env_ids, bounds={f"radius_{i}": radius_bounds for i in range(1, self._task_cfg.max_num_goals)}
+        )
+
         # Select how many random goals we want to generate.
-        self._num_goals[env_ids] = self._rng.sample_integer_torch(
-            self._task_cfg.min_num_goals, self._task_cfg.max_num_goals, 1, ids=env_ids
-        ).to(torch.long)
+        self._num_goals[env_ids] = draws["num_goals"].to(torch.long)
 
         # Since we are using tensor operations, we cannot have different number of goals per environment: the
         # tensor containing the target positions must have the same number of goals for all environments.
@@ -380,26 +375,15 @@ class GoThroughPositionsTask(TaskCore):
             if i == 0:
                 # Randomize the first goal
                 # The position is picked randomly in a square centered on the origin
-                self._target_positions[env_ids, i] = (
-                    self._rng.sample_uniform_torch(
-                        -self._task_cfg.goal_max_dist_from_origin,
-                        self._task_cfg.goal_max_dist_from_origin,
-                        2,
-                        ids=env_ids,
-                    )
-                    + self._env_origins[env_ids, :2]
-                )
+                self._target_positions[env_ids, i] = draws["first_goal"] + self._env_origins[env_ids, :2]
             else:
                 # If needed, randomize the next goals
                 r = (
-                    self._rng.sample_uniform_torch(
-                        self._gen_actions[env_ids, 0], self._gen_actions[env_ids, 1], 1, ids=env_ids
-                    )
-                    * (self._task_cfg.goal_max_dist - self._task_cfg.goal_min_dist)
+                    draws[f"radius_{i}"] * (self._task_cfg.goal_max_dist - self._task_cfg.goal_min_dist)
                     + self._task_cfg.goal_min_dist
                 )
                 # Theta is taken at random
-                theta = self._rng.sample_uniform_torch(0, math.pi, 1, ids=env_ids)
+                theta = draws[f"theta_{i}"]
                 self._target_positions[env_ids, i, 0] = r * torch.cos(theta) + self._target_positions[env_ids, i - 1, 0]
                 self._target_positions[env_ids, i, 1] = r * torch.sin(theta) + self._target_positions[env_ids, i - 1, 1]
 
@@ -41,7 +41,14 @@ class GoToPoseTask(TaskCore):
             task_id: The id of the task.
             env_ids: The ids of the environments used by this task."""
 
-        super().__init__(scene=scene, task_uid=task_uid, num_envs=num_envs, device=device, env_ids=env_ids)
+        super().__init__(
+            scene=scene,
+            task_uid=task_uid,
+            num_envs=num_envs,
+            device=device,
+            env_ids=env_ids,
+            rng_backend=task_cfg.rng_backend,
+        )
 
         # Task and reward parameters
         self._task_cfg = task_cfg
@@ -141,8 +148,7 @@ class GoToPoseTask(TaskCore):
         self._task_data[:, 5:7] = self._robot.root_com_lin_vel_b[self._env_ids, :2]
         self._task_data[:, 7] = self._robot.root_com_ang_vel_w[self._env_ids, -1]
 
-        for randomizer in self.randomizers:
-            randomizer.observations(observations=self._task_data)
+        self.randomization_pipeline.observations(observations=self._task_data)
 
         # Concatenate the task observations with the robot observations
         return torch.concat((self._task_data, self._robot.get_observations()), dim=-1)
@@ -227,6 +233,8 @@ class GoToPoseTask(TaskCore):
         env_ids: torch.Tensor,
         gen_actions: torch.Tensor | None = None,
         env_seeds: torch.Tensor | None = None,
+        robot_gen_actions: torch.Tensor | None = None,
+        robot_env_seeds: torch.Tensor | None = None,
     ) -> None:
         """
         Resets the task to its initial state.
@@ -245,9 +253,17 @@ class GoToPoseTask(TaskCore):
             env_ids (torch.Tensor): The ids of the environments.
             task_actions (torch.Tensor | None): The actions for the task. Defaults to None.
             env_seeds (torch.Tensor | None): The seeds for the environments. Defaults to None.
+            robot_gen_actions (torch.Tensor | None): The generation actions of the robot. Defaults to None.
+            robot_env_seeds (torch.Tensor | None): The seeds of the robot. Defaults to None.
         """
 
-        super().reset(env_ids, gen_actions=gen_actions, env_seeds=env_seeds)
+        super().reset(
+            env_ids,
+            gen_actions=gen_actions,
+            env_seeds=env_seeds,
+            robot_gen_actions=robot_gen_actions,
+            robot_env_seeds=robot_env_seeds,
+        )
 
         # Make sure the position error and position dist are up to date after the reset
         self._position_error[env_ids] = (
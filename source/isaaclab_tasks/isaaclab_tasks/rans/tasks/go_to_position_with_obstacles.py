@@ -298,8 +298,8 @@ class GoToPositionWithObstaclesTask(GoToPositionTask):
             + collision_penalty_rew
         ) + self._robot.compute_rewards()
 
-    def reset(self, env_ids, gen_actions=None, env_seeds=None):
-        super().reset(env_ids, gen_actions, env_seeds)
+    def reset(self, env_ids, gen_actions=None, env_seeds=None, robot_gen_actions=None, robot_env_seeds=None):
+        super().reset(env_ids, gen_actions, env_seeds, robot_gen_actions, robot_env_seeds)
         self._previous_position_dist[env_ids] = self._position_dist[env_ids].clone()
 
     def get_dones(self) -> tuple[torch.Tensor, torch.Tensor]:
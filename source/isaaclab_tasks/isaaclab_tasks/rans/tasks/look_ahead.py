@@ -0,0 +1,299 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import torch
+
+from isaaclab.utils import math as math_utils
+
+from isaaclab_tasks.rans import RobotCore
+
+EPS = 1e-6  # small constant to avoid divisions by 0 and log(0)
+
+
+def wrap_angle(angle: torch.Tensor) -> torch.Tensor:
+    """Wraps angles to [-pi, pi]."""
+    return torch.atan2(torch.sin(angle), torch.cos(angle))
+
+
+def rotation_6d(quat: torch.Tensor, eps: float = 1e-12) -> torch.Tensor:
+    """Continuous 6D representation of rotations: the first two columns of their rotation matrix, re-orthonormalized
+    with Gram-Schmidt.
+
+    Args:
+        quat: The rotations as quaternions (w, x, y, z). Shape is (..., 4).
+        eps: The epsilon of the normalizations.
+    Returns:
+        The 6D representation of the rotations. Shape is (..., 6)."""
+
+    mat = math_utils.matrix_from_quat(quat)
+    col0 = torch.nn.functional.normalize(mat[..., :, 0], dim=-1, eps=eps)
+    col1 = mat[..., :, 1]
+    col1 = col1 - (col1 * col0).sum(dim=-1, keepdim=True) * col0
+    col1 = torch.nn.functional.normalize(col1, dim=-1, eps=eps)
+    return torch.cat([col0, col1], dim=-1)
+
+
+class RobotStateCache:
+    """Root pose of the robot, read once per step and shared by the dones, the rewards and the observations.
+
+    The environments call get_dones first once the physics steps are done, the tasks refresh the cache there. The
+    reset moves the robots, the tasks also refresh the cache of the reset environments at the end of their reset."""
+
+    def __init__(self, num_envs: int, device: str, planar: bool = True) -> None:
+        """
+        Args:
+            num_envs: The number of environments.
+            device: The device on which the tensors are stored.
+            planar: Whether the heading of the robot is cached. The 3D tasks only use its orientation."""
+
+        self._planar = planar
+        self.position = torch.zeros((num_envs, 3), device=device, dtype=torch.float32)
+        self.quat = torch.zeros((num_envs, 4), device=device, dtype=torch.float32)
+        self.quat[:, 0] = 1.0
+        self.heading = torch.zeros((num_envs,), device=device, dtype=torch.float32)
+
+    def update(self, robot: RobotCore, robot_ids: torch.Tensor, env_ids: torch.Tensor | None = None) -> None:
+        """Reads the root pose of the robot.
+
+        Args:
+            robot: The robot of the task.
+            robot_ids: The ids of the environments of the task in the robot buffers, i.e. the task's _env_ids.
+            env_ids: The environments to refresh. Defaults to all the environments."""
+
+        if env_ids is None:
+            self.position[:] = robot.root_link_pos_w[robot_ids]
+            self.quat[:] = robot.root_link_quat_w[robot_ids]
+            if self._planar:
+                self.heading[:] = robot.heading_w[robot_ids]
+        else:
+            self.position[env_ids] = robot.root_link_pos_w[robot_ids][env_ids]
+            self.quat[env_ids] = robot.root_link_quat_w[robot_ids][env_ids]
+            if self._planar:
+                self.heading[env_ids] = robot.heading_w[robot_ids][env_ids]
+
+
+class GoalLookAhead:
+    """Observations of the current goal and of the K goals that follow it, for the multi-goal tasks.
+
+    All the goals are gathered at once with a [num_envs, K + 1] index tensor, and their distances and bearings are
+    computed as a batch, so the cost of the observations does not grow with the number of goals in the look-ahead.
+    The outputs are views on the task data, the observations are written in place."""
+
+    def __init__(self, num_subsequent_goals: int, device: str, wrap: bool = False) -> None:
+        """
+        Args:
+            num_subsequent_goals: The number of goals observed, including the current one.
+            device: The device on which the tensors are stored.
+            wrap: How the goals beyond the last one are picked. If True, the look-ahead loops around the trajectory,
+                i.e. (target_index + k) % num_goals. Otherwise, they are replaced by the first goal."""
+
+        self._num_look_ahead = max(num_subsequent_goals - 1, 0)
+        self._offsets = torch.arange(self._num_look_ahead + 1, device=device, dtype=torch.long)
+        self._wrap = wrap
+
+    @property
+    def num_look_ahead(self) -> int:
+        """The number of goals observed after the current one."""
+        return self._num_look_ahead
+
+    def indices(self, target_index: torch.Tensor, num_goals: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+        """Computes the index of the current goal followed by the ones of the next K goals.
+
+        Args:
+            target_index: The index of the current goal. Shape is (num_envs,).
+            num_goals: The number of goals of each environment. Shape is (num_envs,).
+        Returns:
+            The indices of the goals, and whether they are within the trajectory. Shapes are (num_envs, K + 1)."""
+
+        next_index = target_index.unsqueeze(-1) + self._offsets
+        valid = next_index < num_goals.unsqueeze(-1)
+        if self._wrap:
+            indices = torch.remainder(next_index, num_goals.unsqueeze(-1))
+        else:
+            indices = next_index * valid
+        # The current goal is used as is
+        indices[:, 0] = target_index
+        valid[:, 0] = True
+        return indices, valid
+
+    @staticmethod
+    def gather(goals: torch.Tensor, indices: torch.Tensor) -> torch.Tensor:
+        """Gathers goals with a single torch.gather.
+
+        Args:
+            goals: The goals of each environment. Shape is (num_envs, max_num_goals) or (num_envs, max_num_goals, D).
+            indices: The indices of the goals to gather. Shape is (num_envs, K).
+        Returns:
+            The gathered goals. Shape is (num_envs, K) or (num_envs, K, D)."""
+
+        if goals.dim() == 2:
+            return torch.gather(goals, 1, indices)
+        return torch.gather(goals, 1, indices.unsqueeze(-1).expand(-1, -1, goals.shape[-1]))
+
+    def robot_frame_2d(
+        self,
+        out: torch.Tensor,
+        positions: torch.Tensor,
+        target_index: torch.Tensor,
+        num_goals: torch.Tensor,
+        robot_position: torch.Tensor,
+        robot_heading: torch.Tensor,
+        mask_overflow: bool,
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """Observations of unoriented goals, expressed in the robot frame.
+
+        For each goal, out holds the distance between the robot and the goal, and the cosine and sine of the angle
+        between the robot heading and the goal.
+
+        Args:
+            out: The observation buffer. Shape is (num_envs, K + 1, 3).
+            positions: The positions of the goals. Shape is (num_envs, max_num_goals, 2).
+            target_index: The index of the current goal. Shape is (num_envs,).
+            num_goals: The number of goals of each environment. Shape is (num_envs,).
+            robot_position: The position of the robot. Shape is (num_envs, 2).
+            robot_heading: The heading of the robot. Shape is (num_envs,).
+            mask_overflow: Whether the observations of the goals beyond the last one are set to 0.
+        Returns:
+            The position error and the distance to the current goal, before noise is applied to the observations."""
+
+        indices, valid = self.indices(target_index, num_goals)
+        position_error = self.gather(positions, indices) - robot_position.unsqueeze(1)
+        distance = torch.linalg.norm(position_error, dim=-1)
+        bearing = wrap_angle(torch.atan2(position_error[..., 1], position_error[..., 0]) - robot_heading.unsqueeze(-1))
+        if mask_overflow:
+            out[..., 0] = distance * valid
+            bearing = bearing * valid
+        else:
+            out[..., 0] = distance
+        out[..., 1] = torch.cos(bearing)
+        out[..., 2] = torch.sin(bearing)
+        return position_error[:, 0], distance[:, 0]
+
+    def goal_frame_2d(
+        self,
+        out: torch.Tensor,
+        positions: torch.Tensor,
+        headings: torch.Tensor,
+        target_index: torch.Tensor,
+        num_goals: torch.Tensor,
+        robot_position: torch.Tensor,
+        robot_heading: torch.Tensor,
+        mask_overflow: bool,
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """Observations of oriented goals, each expressed in the frame of the previous one.
+
+        The current goal is expressed in the robot frame, the next ones in the frame of the goal before them. For
+        each goal, out holds the distance to the goal, the cosine and sine of the angle between the heading of the
+        frame and the goal, and the cosine and sine of the heading of the goal in the frame.
+
+        Args:
+            out: The observation buffer. Shape is (num_envs, K + 1, 5).
+            positions: The positions of the goals. Shape is (num_envs, max_num_goals, 2).
+            headings: The headings of the goals. Shape is (num_envs, max_num_goals).
+            target_index: The index of the current goal. Shape is (num_envs,).
+            num_goals: The number of goals of each environment. Shape is (num_envs,).
+            robot_position: The position of the robot. Shape is (num_envs, 2).
+            robot_heading: The heading of the robot. Shape is (num_envs,).
+            mask_overflow: Whether the distance and bearing of the goals beyond the last one are set to 0.
+        Returns:
+            The position error and the distance to the current goal, before noise is applied to the observations."""
+
+        indices, valid = self.indices(target_index, num_goals)
+        num_goals_observed = indices.shape[1]
+        # Goal before each of the next goals. Like python indexing, the index -1 is the last goal of the buffer.
+        previous = torch.remainder(indices[:, 1:] - 1, positions.shape[1])
+        goal_indices = torch.cat((indices, previous), dim=1)
+        goal_positions = self.gather(positions, goal_indices)
+        goal_headings = self.gather(headings, goal_indices)
+        # Frames the goals are expressed in: the robot, then the previous goals
+        frame_positions = torch.cat((robot_position.unsqueeze(1), goal_positions[:, num_goals_observed:]), dim=1)
+        frame_headings = torch.cat((robot_heading.unsqueeze(1), goal_headings[:, num_goals_observed:]), dim=1)
+
+        position_error = goal_positions[:, :num_goals_observed] - frame_positions
+        distance = torch.linalg.norm(position_error, dim=-1)
+        bearing = wrap_angle(torch.atan2(position_error[..., 1], position_error[..., 0]) - frame_headings)
+        heading = wrap_angle(goal_headings[:, :num_goals_observed] - frame_headings)
+        if mask_overflow:
+            out[..., 0] = distance * valid
+            bearing = bearing * valid
+        else:
+            out[..., 0] = distance
+        out[..., 1] = torch.cos(bearing)
+        out[..., 2] = torch.sin(bearing)
+        out[..., 3] = torch.cos(heading)
+        out[..., 4] = torch.sin(heading)
+        return position_error[:, 0], distance[:, 0]
+
+    def robot_frame_3d(
+        self,
+        positions: torch.Tensor,
+        target_index: torch.Tensor,
+        num_goals: torch.Tensor,
+        robot_position: torch.Tensor,
+        robot_quat: torch.Tensor,
+        mask_overflow: bool,
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """Position errors of the goals, expressed in the robot frame.
+
+        Args:
+            positions: The positions of the goals. Shape is (num_envs, max_num_goals, 3).
+            target_index: The index of the current goal. Shape is (num_envs,).
+            num_goals: The number of goals of each environment. Shape is (num_envs,).
+            robot_position: The position of the robot. Shape is (num_envs, 3).
+            robot_quat: The orientation of the robot (w, x, y, z). Shape is (num_envs, 4).
+            mask_overflow: Whether the errors of the goals beyond the last one are set to 0.
+        Returns:
+            The position error to the current goal in the world frame, and the position errors of the current and
+            next goals in the robot frame. Shapes are (num_envs, 3) and (num_envs, K + 1, 3)."""
+
+        indices, valid = self.indices(target_index, num_goals)
+        position_error = self.gather(positions, indices) - robot_position.unsqueeze(1)
+        robot_quat = robot_quat.unsqueeze(1).expand(-1, indices.shape[1], -1)
+        local_error = math_utils.quat_rotate_inverse(robot_quat, position_error)
+        if mask_overflow:
+            local_error = local_error * valid.unsqueeze(-1)
+        return position_error[:, 0], local_error
+
+    def goal_frame_3d(
+        self,
+        out: torch.Tensor,
+        positions: torch.Tensor,
+        orientations: torch.Tensor,
+        target_index: torch.Tensor,
+        num_goals: torch.Tensor,
+        robot_quat: torch.Tensor,
+        mask_overflow: bool,
+    ) -> None:
+        """Observations of the next oriented goals, relative to the current goal.
+
+        For each of the next goals, out holds the position error between the current goal and the goal in the robot
+        frame, followed by the 6D representation of the rotation from the current goal to the goal.
+
+        Args:
+            out: The observation buffer. Shape is (num_envs, K, 9).
+            positions: The positions of the goals. Shape is (num_envs, max_num_goals, 3).
+            orientations: The orientations of the goals (w, x, y, z). Shape is (num_envs, max_num_goals, 4).
+            target_index: The index of the current goal. Shape is (num_envs,).
+            num_goals: The number of goals of each environment. Shape is (num_envs,).
+            robot_quat: The normalized orientation of the robot (w, x, y, z). Shape is (num_envs, 4).
+            mask_overflow: Whether the observations of the goals beyond the last one are set to 0."""
+
+        if self._num_look_ahead == 0:
+            return
+        indices, valid = self.indices(target_index, num_goals)
+        goal_positions = self.gather(positions, indices)
+        goal_orientations = self.gather(orientations, indices)
+        next_shape = (-1, self._num_look_ahead, 4)
+
+        position_error = goal_positions[:, 1:] - goal_positions[:, :1]
+        local_error = math_utils.quat_rotate_inverse(robot_quat.unsqueeze(1).expand(next_shape), position_error)
+        current_quat = torch.nn.functional.normalize(goal_orientations[:, :1], dim=-1, eps=EPS).expand(next_shape)
+        relative_quat = math_utils.quat_mul(math_utils.quat_conjugate(current_quat), goal_orientations[:, 1:])
+        relative_rotation = rotation_6d(relative_quat, eps=EPS)
+        if mask_overflow:
+            local_error = local_error * valid[:, 1:].unsqueeze(-1)
+            relative_rotation = relative_rotation * valid[:, 1:].unsqueeze(-1)
+        out[..., :3] = local_error
+        out[..., 3:] = relative_rotation
@@ -11,8 +11,9 @@ from isaaclab.scene import InteractiveScene
 from isaaclab.utils.math import sample_random_sign
 
 from isaaclab_tasks.rans import RaceWayposesCfg
-from isaaclab_tasks.rans.utils import TrackGenerator
+from isaaclab_tasks.rans.utils import TrackBank, TrackGenerator
 
+from .look_ahead import GoalLookAhead, RobotStateCache
 from .task_core import TaskCore
 
 EPS = 1e-6  # small constant to avoid divisions by 0 and log(0)
@@ -43,7 +44,14 @@ class RaceWayposesTask(TaskCore):
             task_id: The id of the task.
             env_ids: The ids of the environments used by this task."""
 
-        super().__init__(scene=scene, task_uid=task_uid, num_envs=num_envs, device=device, env_ids=env_ids)
+        super().__init__(
+            scene=scene,
+            task_uid=task_uid,
+            num_envs=num_envs,
+            device=device,
+            env_ids=env_ids,
+            rng_backend=task_cfg.rng_backend,
+        )
 
         # Task and reward parameters
         self._task_cfg = task_cfg
@@ -55,8 +63,27 @@ class RaceWayposesTask(TaskCore):
             edgy=self._task_cfg.edgy,
             max_num_points=self._task_cfg.max_num_corners,
             min_num_points=self._task_cfg.min_num_corners,
+            rng=self._rng,
+            device=self._device,
         )
 
+        # Optionally, gather the tracks from a precomputed bank instead of generating them at every reset
+        self._track_bank = None
+        if self._task_cfg.track_bank_size > 0:
+            self._track_bank = TrackBank(
+                num_tracks=self._task_cfg.track_bank_size,
+                path=self._task_cfg.track_bank_path,
+                refresh_fraction=self._task_cfg.track_bank_refresh_fraction,
+                refresh_interval=self._task_cfg.track_bank_refresh_interval,
+                device=self._device,
+                rng_backend=self._task_cfg.rng_backend,
+                scale=self._task_cfg.scale,
+                rad=self._task_cfg.rad,
+                edgy=self._task_cfg.edgy,
+                max_num_points=self._task_cfg.max_num_corners,
+                min_num_points=self._task_cfg.min_num_corners,
+            )
+
         # Defines the observation and actions space sizes for this task
         self._dim_task_obs = self._task_cfg.observation_space
         self._dim_gen_act = self._task_cfg.gen_space
@@ -89,6 +116,8 @@ class RaceWayposesTask(TaskCore):
         self._trajectory_completed = torch.zeros((self._num_envs,), device=self._device, dtype=torch.bool)
         self._num_goals = torch.zeros((self._num_envs,), device=self._device, dtype=torch.long)
         self._ALL_INDICES = torch.arange(self._num_envs, dtype=torch.long, device=self._device)
+        self._robot_state = RobotStateCache(self._num_envs, self._device)
+        self._look_ahead = GoalLookAhead(self._task_cfg.num_subsequent_goals, self._device)
 
     def create_logs(self) -> None:
         """
@@ -143,84 +172,26 @@ class RaceWayposesTask(TaskCore):
         Returns:
             torch.Tensor: The observation tensor."""
 
-        # position error
-        self._position_error = (
-            self._target_positions[self._ALL_INDICES, self._target_index]
-            - self._robot.root_link_pos_w[self._env_ids, :2]
-        )
-        self._position_dist = torch.linalg.norm(self._position_error, dim=-1)
-
-        # position error expressed as distance and angular error (to the position)
-        heading = self._robot.heading_w[self._env_ids]
-        target_heading_w = torch.atan2(
-            self._target_positions[self._ALL_INDICES, self._target_index, 1]
-            - self._robot.root_link_pos_w[self._env_ids, 1],
-            self._target_positions[self._ALL_INDICES, self._target_index, 0]
-            - self._robot.root_link_pos_w[self._env_ids, 0],
-        )
-        target_heading_error = torch.atan2(torch.sin(target_heading_w - heading), torch.cos(target_heading_w - heading))
-        heading_error = torch.atan2(
-            torch.sin(self._target_heading[self._ALL_INDICES, self._target_index] - heading),
-            torch.cos(self._target_heading[self._ALL_INDICES, self._target_index] - heading),
+        # The current goal is observed in the robot frame, and the subsequent goals in the previous goal's frame. The
+        # error to the current goal is refreshed as compute_rewards may have moved the target index.
+        goals = self._task_data[:, 3 : 8 + 5 * self._look_ahead.num_look_ahead].unflatten(1, (-1, 5))
+        self._position_error, self._position_dist = self._look_ahead.goal_frame_2d(
+            goals,
+            self._target_positions,
+            self._target_heading,
+            self._target_index,
+            self._num_goals,
+            self._robot_state.position[:, :2],
+            self._robot_state.heading,
+            # If the task is not set to loop, the goals beyond the last one are set to 0.
+            mask_overflow=not self._task_cfg.loop,
         )
 
         # Store in buffer
         self._task_data[:, 0:2] = self._robot.root_com_lin_vel_b[self._env_ids, :2]
         self._task_data[:, 2] = self._robot.root_com_ang_vel_w[self._env_ids, -1]
-        self._task_data[:, 3] = self._position_dist
-        self._task_data[:, 4] = torch.cos(target_heading_error)
-        self._task_data[:, 5] = torch.sin(target_heading_error)
-        self._task_data[:, 6] = torch.cos(heading_error)
-        self._task_data[:, 7] = torch.sin(heading_error)
-
-        # We compute the observations of the subsequent goals in the previous goal's frame.
-        for i in range(self._task_cfg.num_subsequent_goals - 1):
-            # Check if the index is looking beyond the number of goals
-            overflowing = (self._target_index + i + 1) >= self._num_goals
-            # If it is, then set the next index to 0 (Loop around)
-            indices = (self._target_index + i + 1) * torch.logical_not(overflowing)
-            # Compute the distance between the nth-1 goal, and the nth goal
-            goal_distance = torch.linalg.norm(
-                self._target_positions[self._ALL_INDICES, indices - 1]
-                - self._target_positions[self._ALL_INDICES, indices],
-                dim=-1,
-            )
-            # Compute the angular distance between the nth-1 goal, and the nth goal (world goal frame)
-            target_heading_w = torch.atan2(
-                self._target_positions[self._ALL_INDICES, indices, 1]
-                - self._target_positions[self._ALL_INDICES, indices - 1, 1],
-                self._target_positions[self._ALL_INDICES, indices, 0]
-                - self._target_positions[self._ALL_INDICES, indices - 1, 0],
-            )
-            # Compute the heading in the nth-1 goal frame
-            target_heading_error = torch.atan2(
-                torch.sin(target_heading_w - self._target_heading[self._ALL_INDICES, indices - 1]),
-                torch.cos(target_heading_w - self._target_heading[self._ALL_INDICES, indices - 1]),
-            )
-            # Compute the heading delta between the nth-1 goal, and the nth goal
-            heading_error = torch.atan2(
-                torch.sin(
-                    self._target_heading[self._ALL_INDICES, indices]
-                    - self._target_heading[self._ALL_INDICES, indices - 1]
-                ),
-                torch.cos(
-                    self._target_heading[self._ALL_INDICES, indices]
-                    - self._target_heading[self._ALL_INDICES, indices - 1]
-                ),
-            )
-            # If the task is not set to loop, we set the next goal to be 0.
-            if not self._task_cfg.loop:
-                goal_distance = goal_distance * torch.logical_not(overflowing)
-                target_heading_error = target_heading_error * torch.logical_not(overflowing)
-            # Add to buffer
-            self._task_data[:, 8 + 5 * i] = goal_distance
-            self._task_data[:, 9 + 5 * i] = torch.cos(target_heading_error)
-            self._task_data[:, 10 + 5 * i] = torch.sin(target_heading_error)
-            self._task_data[:, 11 + 5 * i] = torch.cos(heading_error)
-            self._task_data[:, 12 + 5 * i] = torch.sin(heading_error)
-
-        for randomizer in self.randomizers:
-            randomizer.observations(observations=self._task_data)
+
+        self.randomization_pipeline.observations(observations=self._task_data)
 
         # Concatenate the task observations with the robot observations
         return torch.concat((self._task_data, self._robot.get_observations()), dim=-1)
@@ -233,7 +204,7 @@ class RaceWayposesTask(TaskCore):
             torch.Tensor: The reward for the current state of the robot."""
 
         # position error expressed as distance and angular error (to the position)
-        heading = self._robot.heading_w[self._env_ids]
+        heading = self._robot_state.heading
         heading_error = torch.atan2(
             torch.sin(self._target_heading[self._ALL_INDICES, self._target_index] - heading),
             torch.cos(self._target_heading[self._ALL_INDICES, self._target_index] - heading),
@@ -241,12 +212,7 @@ class RaceWayposesTask(TaskCore):
         heading_dist = torch.abs(heading_error)
 
         # position error expressed as distance and angular error (to the position)
-        target_heading_w = torch.atan2(
-            self._target_positions[self._ALL_INDICES, self._target_index, 1]
-            - self._robot.root_link_pos_w[self._env_ids, 1],
-            self._target_positions[self._ALL_INDICES, self._target_index, 0]
-            - self._robot.root_link_pos_w[self._env_ids, 0],
-        )
+        target_heading_w = torch.atan2(self._position_error[:, 1], self._position_error[:, 0])
         target_heading_error = torch.atan2(torch.sin(target_heading_w - heading), torch.cos(target_heading_w - heading))
         target_heading_dist = torch.abs(target_heading_error)
         # boundary distance
@@ -328,6 +294,8 @@ class RaceWayposesTask(TaskCore):
         env_ids: torch.Tensor,
         gen_actions: torch.Tensor | None = None,
         env_seeds: torch.Tensor | None = None,
+        robot_gen_actions: torch.Tensor | None = None,
+        robot_env_seeds: torch.Tensor | None = None,
     ) -> None:
         """
         Resets the task to its initial state.
@@ -352,18 +320,26 @@ class RaceWayposesTask(TaskCore):
             env_ids (torch.Tensor): The ids of the environments.
             gen_actions (torch.Tensor | None): The actions for the task. Defaults to None.
             env_seeds (torch.Tensor | None): The seeds for the environments. Defaults to None.
+            robot_gen_actions (torch.Tensor | None): The generation actions of the robot. Defaults to None.
+            robot_env_seeds (torch.Tensor | None): The seeds of the robot. Defaults to None.
         """
 
-        super().reset(env_ids, gen_actions=gen_actions, env_seeds=env_seeds)
+        super().reset(
+            env_ids,
+            gen_actions=gen_actions,
+            env_seeds=env_seeds,
+            robot_gen_actions=robot_gen_actions,
+            robot_env_seeds=robot_env_seeds,
+        )
 
         # Reset the target index and trajectory completed
         self._target_index[env_ids] = 0
         self._trajectory_completed[env_ids] = False
 
-        # Make sure the position error and position dist are up to date after the reset
+        # Make sure the robot state, position error and position dist are up to date after the reset
+        self._robot_state.update(self._robot, self._env_ids, env_ids)
         self._position_error[env_ids] = (
-            self._target_positions[env_ids, self._target_index[env_ids]]
-            - self._robot.root_link_pos_w[self._env_ids, :2][env_ids]
+            self._target_positions[env_ids, self._target_index[env_ids]] - self._robot_state.position[env_ids, :2]
         )
         self._position_dist[env_ids] = torch.linalg.norm(self._position_error[env_ids], dim=-1)
         self._previous_position_dist[env_ids] = self._position_dist[env_ids].clone()
@@ -383,10 +359,12 @@ class RaceWayposesTask(TaskCore):
         Returns:
             torch.Tensor: Whether the platforms should be killed or not."""
 
+        # get_dones is the first call after the physics steps, the robot state is read once here for the whole step.
+        self._robot_state.update(self._robot, self._env_ids)
+
         # Kill robots that would stray too far from the target.
         self._position_error = (
-            self._target_positions[self._ALL_INDICES, self._target_index]
-            - self._robot.root_link_pos_w[self._env_ids, :2]
+            self._target_positions[self._ALL_INDICES, self._target_index] - self._robot_state.position[:, :2]
         )
         self._previous_position_dist = self._position_dist.clone()
         self._position_dist = torch.linalg.norm(self._position_error, dim=-1)
@@ -437,7 +415,10 @@ class RaceWayposesTask(TaskCore):
 
         num_goals = len(env_ids)
 
-        points, tangents, num_goals = self._track_generator.generate_tracks_points_non_fixed_points(num_goals)
+        if self._track_bank is not None:
+            points, tangents, num_goals = self._track_bank.sample(self._rng, env_ids)
+        else:
+            points, tangents, num_goals = self._track_generator.generate_tracks_points_non_fixed_points(env_ids)
 
         # Set the goals' positions:
         self._target_positions[env_ids] = points + self._env_origins[env_ids, :2].unsqueeze(1)
@@ -9,9 +9,10 @@ from dataclasses import MISSING
 from isaaclab.scene import InteractiveScene
 
 from isaaclab_tasks.rans import (
-    PerEnvSeededRNG,
+    RNG_FACTORY,
     RandomizationCore,
     RandomizationCoreCfg,
+    RandomizationPipeline,
     RandomizerFactory,
     RobotCore,
     ScalarLogger,
@@ -31,6 +32,7 @@ class TaskCore:
         num_envs: int = 1,
         device: str = "cuda",
         env_ids: torch.Tensor | None = None,
+        rng_backend: str = "warp",
     ) -> None:
         """
         The base class for the different subtasks.
@@ -40,7 +42,8 @@ class TaskCore:
             task_uid: The unique id of the task.
             num_envs (int): The number of environments.
             device (str): The device on which the tensors are stored.
-            env_ids: The ids of the environments used by this task."""
+            env_ids: The ids of the environments used by this task.
+            rng_backend: The backend of the random number generator, see :attr:`TaskCoreCfg.rng_backend`."""
 
         self.scene = scene
 
@@ -60,7 +63,7 @@ class TaskCore:
 
         # RNG
         seeds = torch.randint(0, 2**31, (self._num_envs,), dtype=torch.int32, device=self._device)
-        self._rng = PerEnvSeededRNG(seeds, self._num_envs, self._device)
+        self._rng = RNG_FACTORY(rng_backend, seeds=seeds, num_envs=self._num_envs, device=self._device)
 
         # Logs
         self.create_logs()
@@ -151,6 +154,8 @@ class TaskCore:
         # Run the setup functions of the randomizers
         for randomizer in self.randomizers:
             randomizer.setup()
+        # Flatten the hooks of the enabled randomizers, the observation noises are fused
+        self.randomization_pipeline = RandomizationPipeline(self.randomizers, dims={"observations": self._dim_task_obs})
 
     def get_observations(self) -> torch.Tensor:
         raise NotImplementedError
@@ -172,16 +177,21 @@ class TaskCore:
         env_ids: torch.Tensor,
         gen_actions: torch.Tensor | None = None,
         env_seeds: torch.Tensor | None = None,
+        robot_gen_actions: torch.Tensor | None = None,
+        robot_env_seeds: torch.Tensor | None = None,
     ) -> None:
         """
         Resets the task to its initial state.
 
         If gen_actions is None, then the environment is generated at random. This is the default mode.
         If env_seeds is None, then the seed is generated at random. This is the default mode.
+        The same applies to the robot, which is reset with robot_gen_actions and robot_env_seeds.
 
         Args:
             task_actions (torch.Tensor | None): The actions to be taken to generate the env.
             env_seed (torch.Tensor | None): The seed to used in each environment.
+            robot_gen_actions (torch.Tensor | None): The actions to be taken to generate the robot.
+            robot_env_seeds (torch.Tensor | None): The seed of the robot in each environment.
             env_ids (torch.Tensor): The ids of the environments."""
 
         # Updates the seed
@@ -194,7 +204,7 @@ class TaskCore:
         self._rng.set_seeds(self._seeds[env_ids], env_ids)
 
         # Reset the robot
-        self._robot.reset(env_ids)
+        self._robot.reset(env_ids, gen_actions=robot_gen_actions, env_seeds=robot_env_seeds)
 
         # Updates the task actions
         if gen_actions is None:
@@ -203,8 +213,7 @@ class TaskCore:
             self._gen_actions[env_ids] = gen_actions
 
         # Reset the randomizers
-        for randomizer in self.randomizers:
-            randomizer.reset(env_ids)
+        self.randomization_pipeline.reset(env_ids)
 
         # Randomizes goals and initial conditions
         self.set_goals(env_ids)
@@ -44,7 +44,14 @@ class TrackVelocities3DTask(TaskCore):
             env_ids: The ids of the environments used by this task.
         """
 
-        super().__init__(scene=scene, task_uid=task_uid, num_envs=num_envs, device=device, env_ids=env_ids)
+        super().__init__(
+            scene=scene,
+            task_uid=task_uid,
+            num_envs=num_envs,
+            device=device,
+            env_ids=env_ids,
+            rng_backend=task_cfg.rng_backend,
+        )
 
         # Task and reward parameters
         self._task_cfg = task_cfg
@@ -56,6 +63,13 @@ class TrackVelocities3DTask(TaskCore):
         # Buffers
         self.initialize_buffers()
 
+        # All the draws needed to refresh the goals are sampled in a single kernel launch
+        self._goals_plan = self._rng.create_draw_plan()
+        if len(self._enabled_velocities) > 0:
+            self._goals_plan.add_sign("signs", "float", len(self._enabled_velocities))
+        self._goals_plan.add_uniform("smoothing_factor", 0.0, 1.0, 1)
+        self._goals_plan.add_integer("interval", self._task_cfg.interval[0], self._task_cfg.interval[1], 1)
+
     def create_logs(self) -> None:
         """
         Creates a dictionary to store the training statistics for the task.
@@ -93,20 +107,51 @@ class TrackVelocities3DTask(TaskCore):
             env_ids: The ids of the environments used by this task."""
 
         super().initialize_buffers(env_ids)
-        # Target velocities
-        self._linear_velocity_target = torch.zeros((self._num_envs), device=self._device, dtype=torch.float32)
-        self._lateral_velocity_target = torch.zeros((self._num_envs), device=self._device, dtype=torch.float32)
-        self._vertical_velocity_target = torch.zeros((self._num_envs), device=self._device, dtype=torch.float32)
-        self._yaw_velocity_target = torch.zeros((self._num_envs), device=self._device, dtype=torch.float32)
-        self._pitch_velocity_target = torch.zeros((self._num_envs), device=self._device, dtype=torch.float32)
-        self._roll_velocity_target = torch.zeros((self._num_envs), device=self._device, dtype=torch.float32)
-        # Desired velocities
-        self._linear_velocity_desired = torch.zeros((self._num_envs), device=self._device, dtype=torch.float32)
-        self._lateral_velocity_desired = torch.zeros((self._num_envs), device=self._device, dtype=torch.float32)
-        self._vertical_velocity_desired = torch.zeros((self._num_envs), device=self._device, dtype=torch.float32)
-        self._yaw_velocity_desired = torch.zeros((self._num_envs), device=self._device, dtype=torch.float32)
-        self._pitch_velocity_desired = torch.zeros((self._num_envs), device=self._device, dtype=torch.float32)
-        self._roll_velocity_desired = torch.zeros((self._num_envs), device=self._device, dtype=torch.float32)
+        # Target and desired velocities, packed as (linear, lateral, vertical, yaw, pitch, roll)
+        self._velocity_target = torch.zeros((self._num_envs, 6), device=self._device, dtype=torch.float32)
+        self._velocity_desired = torch.zeros((self._num_envs, 6), device=self._device, dtype=torch.float32)
+        # Views on the packed velocities
+        self._linear_velocity_target = self._velocity_target[:, 0]
+        self._lateral_velocity_target = self._velocity_target[:, 1]
+        self._vertical_velocity_target = self._velocity_target[:, 2]
+        self._yaw_velocity_target = self._velocity_target[:, 3]
+        self._pitch_velocity_target = self._velocity_target[:, 4]
+        self._roll_velocity_target = self._velocity_target[:, 5]
+        self._linear_velocity_desired = self._velocity_desired[:, 0]
+        self._lateral_velocity_desired = self._velocity_desired[:, 1]
+        self._vertical_velocity_desired = self._velocity_desired[:, 2]
+        self._yaw_velocity_desired = self._velocity_desired[:, 3]
+        self._pitch_velocity_desired = self._velocity_desired[:, 4]
+        self._roll_velocity_desired = self._velocity_desired[:, 5]
+        # Range of the desired velocities, the disabled velocities are always 0
+        enabled = [
+            self._task_cfg.enable_linear_velocity,
+            self._task_cfg.enable_lateral_velocity,
+            self._task_cfg.enable_vertical_velocity,
+            self._task_cfg.enable_yaw_velocity,
+            self._task_cfg.enable_pitch_velocity,
+            self._task_cfg.enable_roll_velocity,
+        ]
+        self._enabled_velocities = torch.tensor(
+            [i for i, is_enabled in enumerate(enabled) if is_enabled], device=self._device, dtype=torch.long
+        )
+        goal_vel = [
+            (self._task_cfg.goal_min_lin_vel, self._task_cfg.goal_max_lin_vel),
+            (self._task_cfg.goal_min_lat_vel, self._task_cfg.goal_max_lat_vel),
+            (self._task_cfg.goal_min_ver_vel, self._task_cfg.goal_max_ver_vel),
+            (self._task_cfg.goal_min_yaw_vel, self._task_cfg.goal_max_yaw_vel),
+            (self._task_cfg.goal_min_pitch_vel, self._task_cfg.goal_max_pitch_vel),
+            (self._task_cfg.goal_min_roll_vel, self._task_cfg.goal_max_roll_vel),
+        ]
+        self._goal_min_vel = torch.tensor(
+            [low * is_enabled for (low, _), is_enabled in zip(goal_vel, enabled)], device=self._device
+        )
+        self._goal_range_vel = torch.tensor(
+            [(high - low) * is_enabled for (low, high), is_enabled in zip(goal_vel, enabled)], device=self._device
+        )
+        # Magnitude of the desired velocities, set by the generation actions
+        self._velocity_magnitude = torch.zeros((self._num_envs, 6), device=self._device, dtype=torch.float32)
+        self._velocity_signs = torch.ones((self._num_envs, 6), device=self._device, dtype=torch.float32)
         # Number of steps (used to compute when to change goals)
         self._num_steps = torch.zeros((self._num_envs), device=self._device, dtype=torch.int32)
         self._smoothing_factor = torch.zeros((self._num_envs), device=self._device, dtype=torch.float32)
@@ -295,6 +340,8 @@ class TrackVelocities3DTask(TaskCore):
         env_ids: torch.Tensor,
         gen_actions: torch.Tensor | None = None,
         env_seeds: torch.Tensor | None = None,
+        robot_gen_actions: torch.Tensor | None = None,
+        robot_env_seeds: torch.Tensor | None = None,
     ) -> None:
         """
         Resets the task to its initial state.
@@ -312,9 +359,17 @@ class TrackVelocities3DTask(TaskCore):
         Args:
             task_actions (torch.Tensor): The actions for the task.
             env_seeds (torch.Tensor): The seeds for the environments.
+            robot_gen_actions (torch.Tensor): The generation actions of the robot.
+            robot_env_seeds (torch.Tensor): The seeds of the robot.
             env_ids (torch.Tensor): The ids of the environments.
         """
-        super().reset(env_ids, gen_actions=gen_actions, env_seeds=env_seeds)
+        super().reset(
+            env_ids,
+            gen_actions=gen_actions,
+            env_seeds=env_seeds,
+            robot_gen_actions=robot_gen_actions,
+            robot_env_seeds=robot_env_seeds,
+        )
 
         self._num_steps[env_ids] = 0
         self.update_goals()
@@ -364,151 +419,64 @@ class TrackVelocities3DTask(TaskCore):
             env_ids (torch.Tensor): The ids of the environments.
         """
         # Set velocity targets
-        if self._task_cfg.enable_linear_velocity:
-            self._linear_velocity_target[env_ids] = (
-                self._gen_actions[env_ids, 0] * (self._task_cfg.goal_max_lin_vel - self._task_cfg.goal_min_lin_vel)
-                + self._task_cfg.goal_min_lin_vel
-            ) * self._rng.sample_sign_torch("float", 1, ids=env_ids)
-            self._linear_velocity_desired[env_ids] = self._linear_velocity_target.clone()
-        if self._task_cfg.enable_lateral_velocity:
-            self._lateral_velocity_target[env_ids] = (
-                self._gen_actions[env_ids, 1] * (self._task_cfg.goal_max_lat_vel - self._task_cfg.goal_min_lat_vel)
-                + self._task_cfg.goal_min_lat_vel
-            ) * self._rng.sample_sign_torch("float", 1, ids=env_ids)
-            self._lateral_velocity_desired[env_ids] = self._lateral_velocity_target.clone()
-        if self._task_cfg.enable_vertical_velocity:
-            self._vertical_velocity_target[env_ids] = (
-                self._gen_actions[env_ids, 2] * (self._task_cfg.goal_max_ver_vel - self._task_cfg.goal_min_ver_vel)
-                + self._task_cfg.goal_min_ver_vel
-            ) * self._rng.sample_sign_torch("float", 1, ids=env_ids)
-            self._vertical_velocity_desired[env_ids] = self._vertical_velocity_target.clone()
-        if self._task_cfg.enable_yaw_velocity:
-            self._yaw_velocity_target[env_ids] = (
-                self._gen_actions[env_ids, 3] * (self._task_cfg.goal_max_yaw_vel - self._task_cfg.goal_min_yaw_vel)
-                + self._task_cfg.goal_min_yaw_vel
-            ) * self._rng.sample_sign_torch("float", 1, ids=env_ids)
-            self._yaw_velocity_desired[env_ids] = self._yaw_velocity_target.clone()
-        if self._task_cfg.enable_pitch_velocity:
-            self._pitch_velocity_target[env_ids] = (
-                self._gen_actions[env_ids, 4] * (self._task_cfg.goal_max_pitch_vel - self._task_cfg.goal_min_pitch_vel)
-                + self._task_cfg.goal_min_pitch_vel
-            ) * self._rng.sample_sign_torch("float", 1, ids=env_ids)
-            self._pitch_velocity_desired[env_ids] = self._pitch_velocity_target.clone()
-        if self._task_cfg.enable_roll_velocity:
-            self._roll_velocity_target[env_ids] = (
-                self._gen_actions[env_ids, 5] * (self._task_cfg.goal_max_roll_vel - self._task_cfg.goal_min_roll_vel)
-                + self._task_cfg.goal_min_roll_vel
-            ) * self._rng.sample_sign_torch("float", 1, ids=env_ids)
-            self._roll_velocity_desired[env_ids] = self._roll_velocity_target.clone()
-
+        self._velocity_magnitude[env_ids] = self._gen_actions[env_ids, :6] * self._goal_range_vel + self._goal_min_vel
+        desired_velocity, smoothing_factor, interval = self.sample_goal_updates(env_ids)
+        self._velocity_target[env_ids] = desired_velocity
+        self._velocity_desired[env_ids] = desired_velocity
         # Pick a random smoothing factor
-        self._smoothing_factor[env_ids] = (
-            self._rng.sample_uniform_torch(0.0, 1.0, 1, ids=env_ids)
-            * (self._task_cfg.smoothing_factor[1] - self._task_cfg.smoothing_factor[0])
-            + self._task_cfg.smoothing_factor[0]
-        )
+        self._smoothing_factor[env_ids] = smoothing_factor
         # Pick a random number of steps to update the goals
-        self._update_after_n_steps[env_ids] = self._rng.sample_integer_torch(
-            self._task_cfg.interval[0],
-            self._task_cfg.interval[1],
-            1,
-            ids=env_ids,
+        self._update_after_n_steps[env_ids] = interval
+
+    def sample_goal_updates(
+        self, env_ids: torch.Tensor | None = None, mask: torch.Tensor | None = None
+    ) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """
+        Samples the desired velocities, the smoothing factors and the update intervals with a single kernel launch.
+
+        Args:
+            env_ids (torch.Tensor, optional): The ids of the environments. Defaults to all the environments.
+            mask (torch.Tensor, optional): The environments that consume their draws, see DrawPlan.sample.
+
+        Returns:
+            tuple[torch.Tensor, torch.Tensor, torch.Tensor]: The desired velocities, the smoothing factors and the
+            number of steps before the next update.
+        """
+
+        draws = self._goals_plan.sample(env_ids, mask=mask)
+        num_ids = self._num_envs if env_ids is None else env_ids.shape[0]
+        magnitude = self._velocity_magnitude if env_ids is None else self._velocity_magnitude[env_ids]
+        signs = self._velocity_signs[:num_ids]
+        if "signs" in draws:
+            signs[:, self._enabled_velocities] = draws["signs"].reshape(num_ids, -1)
+        smoothing_factor = (
+            draws["smoothing_factor"] * (self._task_cfg.smoothing_factor[1] - self._task_cfg.smoothing_factor[0])
+            + self._task_cfg.smoothing_factor[0]
         )
+        return magnitude * signs, smoothing_factor, draws["interval"]
 
     def update_goals(self) -> None:
         """
         Updates the goals for the task.
+
+        The update has a fixed shape and does not synchronize with the host: new goals are drawn for all the
+        environments, and only kept, and consumed from the random streams, by the ones that reached their update
+        interval.
         """
 
         # Update the number of steps
         self._num_steps += 1
 
         # Use EMA to update the target velocities
-        if self._task_cfg.enable_linear_velocity:
-            self._linear_velocity_target = (
-                self._linear_velocity_desired * (1 - self._smoothing_factor)
-                + self._linear_velocity_target * self._smoothing_factor
-            )  # slowly increase the target velocity
-        if self._task_cfg.enable_lateral_velocity:
-            self._lateral_velocity_target = (
-                self._lateral_velocity_desired * (1 - self._smoothing_factor)
-                + self._lateral_velocity_target * self._smoothing_factor
-            )
-        if self._task_cfg.enable_vertical_velocity:
-            self._vertical_velocity_target = (
-                self._vertical_velocity_desired * (1 - self._smoothing_factor)
-                + self._vertical_velocity_target * self._smoothing_factor
-            )
-        if self._task_cfg.enable_yaw_velocity:
-            self._yaw_velocity_target = (
-                self._yaw_velocity_desired * (1 - self._smoothing_factor)
-                + self._yaw_velocity_target * self._smoothing_factor
-            )
-        if self._task_cfg.enable_pitch_velocity:
-            self._pitch_velocity_target = (
-                self._pitch_velocity_desired * (1 - self._smoothing_factor)
-                + self._pitch_velocity_target * self._smoothing_factor
-            )
-        if self._task_cfg.enable_roll_velocity:
-            self._roll_velocity_target = (
-                self._roll_velocity_desired * (1 - self._smoothing_factor)
-                + self._roll_velocity_target * self._smoothing_factor
-            )
+        self._velocity_target.lerp_(self._velocity_desired, (1 - self._smoothing_factor).unsqueeze(-1))
+
         # Check if the goals should be updated
-        idx_to_update = torch.where(self._update_after_n_steps < self._num_steps)[0]
-        num_updates = len(idx_to_update)
-        if num_updates > 0:
-            # Update the desired velocities
-            if self._task_cfg.enable_linear_velocity:
-                self._linear_velocity_desired[idx_to_update] = (
-                    self._gen_actions[idx_to_update, 0]
-                    * (self._task_cfg.goal_max_lin_vel - self._task_cfg.goal_min_lin_vel)
-                    + self._task_cfg.goal_min_lin_vel
-                ) * self._rng.sample_sign_torch("float", 1, ids=idx_to_update)
-            if self._task_cfg.enable_lateral_velocity:
-                self._lateral_velocity_desired[idx_to_update] = (
-                    self._gen_actions[idx_to_update, 1]
-                    * (self._task_cfg.goal_max_lat_vel - self._task_cfg.goal_min_lat_vel)
-                    + self._task_cfg.goal_min_lat_vel
-                ) * self._rng.sample_sign_torch("float", 1, ids=idx_to_update)
-            if self._task_cfg.enable_vertical_velocity:
-                self._vertical_velocity_desired[idx_to_update] = (
-                    self._gen_actions[idx_to_update, 2]
-                    * (self._task_cfg.goal_max_ver_vel - self._task_cfg.goal_min_ver_vel)
-                    + self._task_cfg.goal_min_ver_vel
-                ) * self._rng.sample_sign_torch("float", 1, ids=idx_to_update)
-            if self._task_cfg.enable_yaw_velocity:
-                self._yaw_velocity_desired[idx_to_update] = (
-                    self._gen_actions[idx_to_update, 3]
-                    * (self._task_cfg.goal_max_yaw_vel - self._task_cfg.goal_min_yaw_vel)
-                    + self._task_cfg.goal_min_yaw_vel
-                ) * self._rng.sample_sign_torch("float", 1, ids=idx_to_update)
-            if self._task_cfg.enable_pitch_velocity:
-                self._pitch_velocity_desired[idx_to_update] = (
-                    self._gen_actions[idx_to_update, 4]
-                    * (self._task_cfg.goal_max_pitch_vel - self._task_cfg.goal_min_pitch_vel)
-                    + self._task_cfg.goal_min_pitch_vel
-                ) * self._rng.sample_sign_torch("float", 1, ids=idx_to_update)
-            if self._task_cfg.enable_roll_velocity:
-                self._roll_velocity_desired[idx_to_update] = (
-                    self._gen_actions[idx_to_update, 5]
-                    * (self._task_cfg.goal_max_roll_vel - self._task_cfg.goal_min_roll_vel)
-                    + self._task_cfg.goal_min_roll_vel
-                ) * self._rng.sample_sign_torch("float", 1, ids=idx_to_update)
-            # Pick a random smoothing factor
-            self._smoothing_factor[idx_to_update] = (
-                self._rng.sample_uniform_torch(0.0, 1.0, 1, ids=idx_to_update)
-                * (self._task_cfg.smoothing_factor[1] - self._task_cfg.smoothing_factor[0])
-                + self._task_cfg.smoothing_factor[0]
-            )
-            # Pick a random number of steps to update the goals
-            self._update_after_n_steps[idx_to_update] = self._rng.sample_integer_torch(
-                self._task_cfg.interval[0],
-                self._task_cfg.interval[1],
-                1,
-                ids=idx_to_update,
-            )
-            self._num_steps[idx_to_update] = 0
+        to_update = self._update_after_n_steps < self._num_steps
+        desired_velocity, smoothing_factor, interval = self.sample_goal_updates(mask=to_update)
+        torch.where(to_update.unsqueeze(-1), desired_velocity, self._velocity_desired, out=self._velocity_desired)
+        torch.where(to_update, smoothing_factor, self._smoothing_factor, out=self._smoothing_factor)
+        torch.where(to_update, interval, self._update_after_n_steps, out=self._update_after_n_steps)
+        self._num_steps.masked_fill_(to_update, 0)
 
     def set_initial_conditions(self, env_ids: torch.Tensor) -> None:
         """
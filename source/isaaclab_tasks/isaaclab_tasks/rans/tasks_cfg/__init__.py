@@ -3,40 +3,45 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
-# isort: off
-from .task_core_cfg import TaskCoreCfg  # noqa: F401, F403
+# The configurations are imported on first access, and by the factory on first create.
+from isaaclab_tasks.rans.utils.misc import factory, lazy_exports
 
-# isort: on
-from isaaclab_tasks.rans.utils.misc import factory
-
-from .go_through_poses_6DoF_cfg import GoThroughPoses3DCfg  # noqa: F401, F403
-from .go_through_poses_cfg import GoThroughPosesCfg  # noqa: F401, F403
-from .go_through_positions_6DoF_cfg import GoThroughPositions3DCfg  # noqa: F401, F403
-from .go_through_positions_cfg import GoThroughPositionsCfg  # noqa: F401, F403
-from .go_to_pose_6DoF_cfg import GoToPose3DCfg  # noqa: F401, F403
-from .go_to_pose_cfg import GoToPoseCfg  # noqa: F401, F403
-from .go_to_position_6DoF_cfg import GoToPosition3DCfg  # noqa: F401, F403
-from .go_to_position_cfg import GoToPositionCfg  # noqa: F401, F403
-from .go_to_position_with_obstacles_cfg import GoToPositionWithObstaclesCfg
-from .push_block_cfg import PushBlockCfg  # noqa: F401, F403
-from .race_gates_cfg import RaceGatesCfg  # noqa: F401, F403
-from .race_waypoints_cfg import RaceWaypointsCfg  # noqa: F401, F403
-from .race_wayposes_cfg import RaceWayposesCfg  # noqa: F401, F403
-from .track_velocities_6DoF_cfg import TrackVelocities3DCfg  # noqa: F401, F403
-from .track_velocities_cfg import TrackVelocitiesCfg  # noqa: F401, F403
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "TaskCoreCfg": ".task_core_cfg",
+        "GoThroughPoses3DCfg": ".go_through_poses_6DoF_cfg",
+        "GoThroughPosesCfg": ".go_through_poses_cfg",
+        "GoThroughPositions3DCfg": ".go_through_positions_6DoF_cfg",
+        "GoThroughPositionsCfg": ".go_through_positions_cfg",
+        "GoToPose3DCfg": ".go_to_pose_6DoF_cfg",
+        "GoToPoseCfg": ".go_to_pose_cfg",
+        "GoToPosition3DCfg": ".go_to_position_6DoF_cfg",
+        "GoToPositionCfg": ".go_to_position_cfg",
+        "GoToPositionWithObstaclesCfg": ".go_to_position_with_obstacles_cfg",
+        "PushBlockCfg": ".push_block_cfg",
+        "RaceGatesCfg": ".race_gates_cfg",
+        "RaceWaypointsCfg": ".race_waypoints_cfg",
+        "RaceWayposesCfg": ".race_wayposes_cfg",
+        "TrackVelocities3DCfg": ".track_velocities_6DoF_cfg",
+        "TrackVelocitiesCfg": ".track_velocities_cfg",
+    },
+)
 
 TASK_CFG_FACTORY = factory()
-TASK_CFG_FACTORY.register("GoThroughPoses", GoThroughPosesCfg)
-TASK_CFG_FACTORY.register("GoThroughPoses3D", GoThroughPoses3DCfg)
-TASK_CFG_FACTORY.register("GoThroughPositions", GoThroughPositionsCfg)
-TASK_CFG_FACTORY.register("GoToPose", GoToPoseCfg)
-TASK_CFG_FACTORY.register("GoToPose3D", GoToPose3DCfg)
-TASK_CFG_FACTORY.register("GoToPosition", GoToPositionCfg)
-TASK_CFG_FACTORY.register("GoToPosition3D", GoToPosition3DCfg)
-TASK_CFG_FACTORY.register("PushBlock", PushBlockCfg)
-TASK_CFG_FACTORY.register("RaceWaypoints", RaceWaypointsCfg)
-TASK_CFG_FACTORY.register("RaceWayposes", RaceWayposesCfg)
-TASK_CFG_FACTORY.register("TrackVelocities", TrackVelocitiesCfg)
-TASK_CFG_FACTORY.register("TrackVelocities3D", TrackVelocities3DCfg)
-TASK_CFG_FACTORY.register("GoToPositionWithObstacles", GoToPositionWithObstaclesCfg)
-TASK_CFG_FACTORY.register("RaceGates", RaceGatesCfg)
+TASK_CFG_FACTORY.register("GoThroughPoses", f"{__name__}.go_through_poses_cfg:GoThroughPosesCfg")
+TASK_CFG_FACTORY.register("GoThroughPoses3D", f"{__name__}.go_through_poses_6DoF_cfg:GoThroughPoses3DCfg")
+TASK_CFG_FACTORY.register("GoThroughPositions", f"{__name__}.go_through_positions_cfg:GoThroughPositionsCfg")
+TASK_CFG_FACTORY.register("GoToPose", f"{__name__}.go_to_pose_cfg:GoToPoseCfg")
+TASK_CFG_FACTORY.register("GoToPose3D", f"{__name__}.go_to_pose_6DoF_cfg:GoToPose3DCfg")
+TASK_CFG_FACTORY.register("GoToPosition", f"{__name__}.go_to_position_cfg:GoToPositionCfg")
+TASK_CFG_FACTORY.register("GoToPosition3D", f"{__name__}.go_to_position_6DoF_cfg:GoToPosition3DCfg")
+TASK_CFG_FACTORY.register("PushBlock", f"{__name__}.push_block_cfg:PushBlockCfg")
+TASK_CFG_FACTORY.register("RaceWaypoints", f"{__name__}.race_waypoints_cfg:RaceWaypointsCfg")
+TASK_CFG_FACTORY.register("RaceWayposes", f"{__name__}.race_wayposes_cfg:RaceWayposesCfg")
+TASK_CFG_FACTORY.register("TrackVelocities", f"{__name__}.track_velocities_cfg:TrackVelocitiesCfg")
+TASK_CFG_FACTORY.register("TrackVelocities3D", f"{__name__}.track_velocities_6DoF_cfg:TrackVelocities3DCfg")
+TASK_CFG_FACTORY.register(
+    "GoToPositionWithObstacles", f"{__name__}.go_to_position_with_obstacles_cfg:GoToPositionWithObstaclesCfg"
+)
+TASK_CFG_FACTORY.register("RaceGates", f"{__name__}.race_gates_cfg:RaceGatesCfg")
@@ -70,6 +70,17 @@ class RaceGatesCfg(TaskCoreCfg):
     """A coefficient that affects the edginess of the track. Defaults to 0.0."""
     loop: bool = True
     """Whether the track should loop or not. Defaults to True."""
+    track_bank_size: int = 0
+    """Number of tracks precomputed in the track bank. When positive, the tracks are gathered from the bank at reset
+    instead of being generated. Defaults to 0, the tracks are generated at every reset."""
+    track_bank_path: str | None = None
+    """Memory-mapped file holding the track bank, created if it does not exist. Defaults to None, the bank is
+    generated at startup."""
+    track_bank_refresh_fraction: float = 0.0
+    """Fraction of the least recently used tracks regenerated in the background at each refresh of the bank.
+    Defaults to 0.0, the bank is never refreshed."""
+    track_bank_refresh_interval: int = 100
+    """Number of resets between two refreshes of the track bank. Defaults to 100."""
     gate_width: float = 0.75
 
     # Observation
@@ -16,3 +16,5 @@ class TaskCoreCfg:
     """Maximal distance between the robot and the target pose."""
     ema_coeff: float = 0.9
     """Exponential moving average coefficient used to update some of the logs."""
+    rng_backend: str = "warp"
+    """Backend of the random number generators of the task, 'warp' or 'philox'. Philox runs in pure torch."""
@@ -3,7 +3,24 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
-from .logger import ScalarLogger
-from .object_storage import ObjectStorage
-from .rng_utils import PerEnvSeededRNG
-from .track_generator import TrackGenerator
+# The utilities are imported on first access, see lazy_exports.
+from .misc import factory, lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ScalarLogger": ".logger",
+        "ObjectStorage": ".object_storage",
+        "PhiloxPerEnvSeededRNG": ".rng_philox",
+        "DrawPlan": ".rng_utils",
+        "PerEnvSeededRNG": ".rng_utils",
+        "ScenarioBank": ".scenario_bank",
+        "TrackBank": ".track_bank",
+        "TrackGenerator": ".track_generator",
+    },
+)
+
+# The backends of the random number generators. Creating a philox generator does not import warp.
+RNG_FACTORY = factory()
+RNG_FACTORY.register("warp", f"{__name__}.rng_utils:PerEnvSeededRNG")
+RNG_FACTORY.register("philox", f"{__name__}.rng_philox:PhiloxPerEnvSeededRNG")
@@ -10,8 +10,10 @@ class ScalarLogger:
     def __init__(self, num_envs: int, device: str, type: str) -> None:
         """
         Class for logging.
+        All the logs are packed in two [num_logs, num_envs] buffers, each log being a row:
         - _step_logs: Logs data on a per-step basis.
         - _episode_logs: Logs data at the end of each episode.
+        - _logs_index: Holds the row of each log in the buffers.
         - _logs_operation: Holds operation to indicate how certain episode-level logs
         should be computed.
 
@@ -25,9 +27,11 @@ class ScalarLogger:
         self._device = device
         self._type = type
 
-        self._step_logs = {f"{self._type}_state": {}, f"{self._type}_reward": {}}
-        self._episode_logs = {f"{self._type}_state": {}, f"{self._type}_reward": {}}
+        self._step_logs = torch.zeros((0, self._num_envs), dtype=torch.float32, device=self._device)
+        self._episode_logs = torch.zeros((0, self._num_envs), dtype=torch.float32, device=self._device)
+        self._logs_index = {f"{self._type}_state": {}, f"{self._type}_reward": {}}
         self._logs_operation = {f"{self._type}_state": {}, f"{self._type}_reward": {}}
+        self._logs_names = []
 
         self._supported_ops = ["sum", "mean", "max", "min", "ema"]
         self._operations_map = {
@@ -37,8 +41,11 @@ class ScalarLogger:
             "max": self.max_logs,
             "min": self.min_logs,
         }
+        # Value of the step logs at the beginning of an episode
+        self._reset_values_map = {"sum": 0.0, "mean": 0.0, "ema": 0.0, "max": -float("inf"), "min": float("inf")}
 
         self.ema_coeff = 0.9
+        self._build_masks()
 
     def torch_zeros(self) -> torch.Tensor:
         """Create a tensor of zeros with the same shape as the number of environments.
@@ -53,6 +60,18 @@ class ScalarLogger:
             requires_grad=False,
         )
 
+    def _build_masks(self) -> None:
+        """Build the per-log masks used to reset and aggregate all the logs at once."""
+
+        ops = [self._logs_operation[type][name] for type, name in self._logs_names]
+        self._reset_values = torch.tensor(
+            [self._reset_values_map[op] for op in ops], dtype=torch.float32, device=self._device
+        ).unsqueeze(1)
+        self._is_mean = torch.tensor([op == "mean" for op in ops], dtype=torch.bool, device=self._device).unsqueeze(1)
+        self._is_extremum = torch.tensor(
+            [op in ["max", "min"] for op in ops], dtype=torch.bool, device=self._device
+        ).unsqueeze(1)
+
     def add_log(self, type: str, name: str, operation: str) -> None:
         """Add a log to the logger.
 
@@ -63,12 +82,19 @@ class ScalarLogger:
 
         assert type in [f"{self._type}_state", f"{self._type}_reward"], f"Invalid log type: {type}"
         assert operation in self._supported_ops, f"Invalid operation: {operation}"
-        self._step_logs[type][name] = self.torch_zeros()
-        self._episode_logs[type][name] = self.torch_zeros()
+        if name not in self._logs_index[type]:
+            # Logs are registered once when the task and the robot are created, the buffers only grow then.
+            self._logs_index[type][name] = len(self._logs_names)
+            self._logs_names.append((type, name))
+            self._step_logs = torch.cat((self._step_logs, self.torch_zeros().unsqueeze(0)), dim=0)
+            self._episode_logs = torch.cat((self._episode_logs, self.torch_zeros().unsqueeze(0)), dim=0)
         self._logs_operation[type][name] = operation
+        self._step_logs[self._logs_index[type][name]] = self._reset_values_map[operation]
+        self._episode_logs[self._logs_index[type][name]] = 0
+        self._build_masks()
 
     def log(self, type: str, name: str, value: torch.Tensor) -> None:
-        """Log a value.
+        """Log a value. The step log is updated in place.
 
         Args:
             type (str): The type of log. It's solely used for naming purposes, it can be "robot" or "task" for instance.
@@ -76,80 +102,87 @@ class ScalarLogger:
             value (torch.Tensor): The value to be logged."""
 
         op = self._logs_operation[type][name]
-        self._step_logs[type][name] = self._operations_map[op](type, name, value)
+        self._operations_map[op](self._step_logs[self._logs_index[type][name]], value)
 
     @property
     def get_step_logs(self) -> dict:
-        """Get the step logs."""
-        return self._step_logs
+        """Get the step logs. The tensors are views on the packed buffer."""
+        return self._unpack(self._step_logs)
 
     @property
     def get_episode_logs(self) -> dict:
-        """Get the episode logs."""
-        return self._episode_logs
+        """Get the episode logs. The tensors are views on the packed buffer."""
+        return self._unpack(self._episode_logs)
+
+    @property
+    def logs_names(self) -> list[str]:
+        """Get the names of the logs, in the order of the rows of the buffers."""
+        return [type + "/" + name for type, name in self._logs_names]
+
+    def _unpack(self, buffer: torch.Tensor) -> dict:
+        logs = {key: {} for key in self._logs_index}
+        for type, name in self._logs_names:
+            logs[type][name] = buffer[self._logs_index[type][name]]
+        return logs
 
     def reset(self, env_ids: torch.Tensor, episode_length_buf: torch.Tensor) -> None:
         """Reset the logs of the given environments based on their ids.
         The mean is computed by dividing the sum by the episode length buffer passed as an argument.
+        The max and min are the extrema reached during the episode, or 0 if nothing was logged.
         # TODO: Decide if we built-in our own counter.
 
         Args:
             env_ids (torch.Tensor): The environment IDs.
             episode_length_buf (torch.Tensor): The episode length buffer."""
 
-        for rew_state_key in self._step_logs:
-            for key in self._step_logs[rew_state_key]:
-                op = self._logs_operation[rew_state_key][key]
-                if op == "mean":
-                    # Avoid division by zero
-                    episode_length = episode_length_buf[env_ids] + (episode_length_buf[env_ids] == 0) * 1e-7
-                    self._episode_logs[rew_state_key][key][env_ids] = torch.div(
-                        self._step_logs[rew_state_key][key][env_ids], episode_length
-                    )
-                elif op == "max":
-                    self._episode_logs[rew_state_key][key][env_ids] = self._step_logs[rew_state_key][key][env_ids].max()
-                elif op == "min":
-                    self._episode_logs[rew_state_key][key][env_ids] = self._step_logs[rew_state_key][key][env_ids].min()
-                else:
-                    self._episode_logs[rew_state_key][key][env_ids] = self._step_logs[rew_state_key][key][env_ids]
-
-                self._step_logs[rew_state_key][key][env_ids] = 0
+        if len(self._logs_names) == 0:
+            return
+        values = self._step_logs[:, env_ids]
+        # Avoid division by zero
+        episode_length = episode_length_buf[env_ids] + (episode_length_buf[env_ids] == 0) * 1e-7
+        values = torch.where(self._is_mean, values / episode_length, values)
+        values = torch.where(self._is_extremum & torch.isinf(values), 0.0, values)
+        self._episode_logs[:, env_ids] = values
+        self._step_logs[:, env_ids] = self._reset_values
+
+    def compute_extras_tensor(self) -> torch.Tensor:
+        """Average the episode logs over the environments.
+
+        Returns:
+            torch.Tensor: The stacked averages, in the order of :attr:`logs_names`."""
+
+        return self._episode_logs.mean(dim=1)
 
     def compute_extras(self) -> dict:
         """The function used to format the logs to be returned to the environment and used by tensorboard or
         wandb."""
 
-        extras = dict()
-        for rew_state_key in self._episode_logs.keys():
-            for key in self._episode_logs[rew_state_key]:
-                extras[rew_state_key + "/" + key] = self._episode_logs[rew_state_key][key].mean()
-
-        return extras
+        return dict(zip(self.logs_names, self.compute_extras_tensor().unbind(0)))
 
-    def min_logs(self, type, name, value):
+    def min_logs(self, step_log: torch.Tensor, value: torch.Tensor) -> torch.Tensor:
         """Minimum operation when adding a new data point to the logs."""
 
-        return value
+        return torch.minimum(step_log, value, out=step_log)
 
-    def max_logs(self, type, name, value):
+    def max_logs(self, step_log: torch.Tensor, value: torch.Tensor) -> torch.Tensor:
         """Maximum operation when adding a new data point to the logs."""
 
-        return value
+        return torch.maximum(step_log, value, out=step_log)
 
-    def sum_logs(self, type, name, value):
+    def sum_logs(self, step_log: torch.Tensor, value: torch.Tensor) -> torch.Tensor:
         """Sum operation when adding a new data point to the logs."""
 
-        return self._step_logs[type][name] + value
+        return step_log.add_(value)
 
-    def ema_logs(self, type, name, value):
+    def ema_logs(self, step_log: torch.Tensor, value: torch.Tensor) -> torch.Tensor:
         """Exponential moving average operation when adding a new data point to the logs."""
 
-        return value * (1 - self.ema_coeff) + self._step_logs[type][name] * self.ema_coeff
+        return step_log.mul_(self.ema_coeff).add_(value, alpha=1 - self.ema_coeff)
 
-    def mean_logs(self, type, name, value):
+    def mean_logs(self, step_log: torch.Tensor, value: torch.Tensor) -> torch.Tensor:
         """Mean operation when adding a new data point to the logs."""
 
-        return self._step_logs[type][name] + value
+        return step_log.add_(value)
 
     def set_ema_coeff(self, ema_coeff):
         """Set the exponential moving average coefficient."""
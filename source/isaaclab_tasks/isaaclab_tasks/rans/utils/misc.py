@@ -3,6 +3,45 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+import importlib
+import sys
+
+
+def import_from_path(path: str):
+    """Imports an attribute from its "module:attribute" path.
+
+    Args:
+        path: The path of the attribute, e.g. "isaaclab_tasks.rans.robots.jetbot:JetbotRobot".
+    Returns:
+        The attribute."""
+
+    module_name, attribute = path.split(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def lazy_exports(package: str, exports: dict[str, str]):
+    """Creates the module-level ``__getattr__`` and ``__dir__`` of a package whose attributes are only imported on
+    first access (PEP 562).
+
+    Args:
+        package: The name of the package, usually ``__name__``.
+        exports: The names of the attributes, mapped to the module they are defined in, relative to the package.
+    Returns:
+        The ``__getattr__`` and ``__dir__`` functions of the package."""
+
+    def __getattr__(name: str):
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(exports[name], package), name)
+        # Cache the attribute on the package, __getattr__ is not called again for it
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
+
 
 class factory:
     def __init__(self):
@@ -17,10 +56,18 @@ class factory:
 
     @property
     def get_values(self):
-        return self._pairs.values()
+        return [self.resolve(key) for key in self._pairs]
 
     def register(self, key, value):
+        """Registers a value, or the "module:attribute" path of a value that is imported on first use."""
         self._pairs[key] = value
 
+    def resolve(self, key):
+        value = self._pairs[key]
+        if isinstance(value, str):
+            value = import_from_path(value)
+            self._pairs[key] = value
+        return value
+
     def create(self, key, **kwargs):
-        return self._pairs[key](**kwargs)
+        return self.resolve(key)(**kwargs)
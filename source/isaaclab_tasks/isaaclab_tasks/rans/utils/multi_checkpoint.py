@@ -0,0 +1,108 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import glob
+import numpy as np
+import os
+import re
+import torch
+from collections.abc import Callable
+
+
+def resolve_checkpoints(patterns: list[str]) -> list[str]:
+    """Expand a list of checkpoint paths and glob patterns.
+
+    The matches of each pattern are sorted in natural order (run_2 before run_10), and the duplicates are dropped.
+
+    Args:
+        patterns (list[str]): The paths or glob patterns of the checkpoints.
+
+    Returns:
+        list[str]: The absolute paths of the checkpoints, in the order of the patterns."""
+
+    def natural_key(path: str) -> list:
+        return [int(s) if s.isdigit() else s for s in re.split(r"(\d+)", path)]
+
+    checkpoints = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(os.path.expanduser(pattern)), key=natural_key)
+        if not matches:
+            raise FileNotFoundError(f"No checkpoint matches: {pattern}")
+        for match in matches:
+            path = os.path.abspath(match)
+            if path not in checkpoints:
+                checkpoints.append(path)
+    return checkpoints
+
+
+def partition_envs(num_envs: int, num_policies: int) -> list[slice]:
+    """Split the environments into contiguous slices, one per policy.
+
+    The slices differ by at most one environment, the first ones being the largest.
+
+    Args:
+        num_envs (int): The number of environments.
+        num_policies (int): The number of policies sharing the environments.
+
+    Returns:
+        list[slice]: The slice of the environments of each policy."""
+
+    assert num_policies > 0, "At least one policy is required."
+    assert num_envs >= num_policies, f"Cannot share {num_envs} environments between {num_policies} policies."
+    sizes = [num_envs // num_policies + (1 if i < num_envs % num_policies else 0) for i in range(num_policies)]
+    starts = np.cumsum([0] + sizes)
+    return [slice(int(starts[i]), int(starts[i + 1])) for i in range(num_policies)]
+
+
+def act_partitioned(
+    policies: list[Callable[[torch.Tensor], torch.Tensor]], obs: torch.Tensor, env_slices: list[slice]
+) -> torch.Tensor:
+    """Compute the actions of the policies sharing the environments.
+
+    Each policy runs a single batched forward pass over the observations of its slice of the environments.
+
+    Args:
+        policies (list[Callable[[torch.Tensor], torch.Tensor]]): The policies, mapping a batch of observations to a
+            batch of actions.
+        obs (torch.Tensor): The observations of all the environments.
+        env_slices (list[slice]): The slice of the environments of each policy, see :func:`partition_envs`.
+
+    Returns:
+        torch.Tensor: The actions of all the environments."""
+
+    return torch.cat([policy(obs[env_slice]) for policy, env_slice in zip(policies, env_slices)], dim=0)
+
+
+def split_episode_data(ep_data: dict[str, np.ndarray], env_slices: list[slice]) -> list[dict[str, np.ndarray]]:
+    """Split recorded [T, N, ...] arrays along the environments.
+
+    The arrays are sliced without any copy, such that memory-mapped recordings stay lazy.
+
+    Args:
+        ep_data (dict[str, np.ndarray]): The recorded data, see :meth:`RolloutRecorder.data`.
+        env_slices (list[slice]): The slice of the environments of each policy, see :func:`partition_envs`.
+
+    Returns:
+        list[dict[str, np.ndarray]]: The recorded data of each slice."""
+
+    return [{name: value[:, env_slice] for name, value in ep_data.items()} for env_slice in env_slices]
+
+
+def reseed_env(env, seed: int) -> None:
+    """Seed the random number generators before a reset of the environment.
+
+    Called before each evaluation of a sequence, such that all the evaluations start from the same initial conditions.
+    The task and the robot draw the seeds of their per-environment generators from the global torch generator when
+    they are reset, or replay them from the scenario bank. The seeding hence only takes effect through a full reset of
+    the unwrapped environment, which must follow.
+
+    Args:
+        env (DirectRLEnv): The unwrapped environment.
+        seed (int): The seed of the random number generators."""
+
+    env.seed(seed)
+    # the scenarios are replayed from the start
+    if getattr(env, "scenario_bank", None) is not None:
+        env.scenario_bank.rewind()
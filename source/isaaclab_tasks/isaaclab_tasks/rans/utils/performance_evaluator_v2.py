@@ -5,11 +5,14 @@
 
 import numpy as np
 import os
+import torch
 from pathlib import Path
 from typing import Any
 
 import pandas as pd
 
+from .rollout_recorder import RolloutRecorder
+
 
 class PerformanceEvaluatorV2:
     THRESH_DIST = 0.20
@@ -24,19 +27,23 @@ class PerformanceEvaluatorV2:
         task_name: str,
         robot_name: str,
         rl_lib: str,
-        episode_data: dict[str, np.ndarray],
+        episode_data: dict[str, np.ndarray] | str,
         max_horizon: int,
         combo_id: str,
         seed: int = 0,
+        results_dir: str = RESULTS_DIR,
     ):
         self.task = task_name
         self.robot = robot_name
         self.lib = rl_lib
-        self.data = episode_data
+        # A path to a recording is opened lazily, the arrays are memory-mapped
+        self.data = RolloutRecorder.load(episode_data) if isinstance(episode_data, str) else episode_data
         self.T = max_horizon
         self.combo = combo_id  # e.g. FloatingPlatform_GoToPose_skrl
         self.seed = seed
+        self.results_dir = results_dir  # directory of the per-run CSV files
         self.res: dict[str, Any] = {}
+        self._goal_tracking: dict[str, np.ndarray] | None = None
 
     def _control_variation(self, actions: np.ndarray) -> float:
         # Sum of control signal variations over time
@@ -73,45 +80,22 @@ class PerformanceEvaluatorV2:
         Evaluate GoThroughPositions task with ordered goal tracking.
         """
 
-        T, N, D = obs.shape
-        num_goals = (D - 6) // 3  # Number of waypoints encoded in obs
-        goal_idx = np.zeros(N, dtype=int)  # Tracks current goal index per env
-        goals_reached = np.zeros(N, dtype=int)
-
-        for t in range(T):
-            for n in range(N):
-                g = goal_idx[n]
-                if g >= num_goals:
-                    continue  # All goals already reached
-
-                dist_idx = 6 + g * 3
-                dist_to_goal = obs[t, n, dist_idx]
-
-                if dist_to_goal < self.THRESH_DIST:
-                    goal_idx[n] += 1  # Move to next
-                    goals_reached[n] += 1
-
-        self.res["num_goals_reached"] = np.mean(goals_reached)
+        tracking = self._track_goals(obs)
+        self.res["num_goals_reached"] = np.mean(tracking["goals_reached"])
 
         # Final distance to current (or last) goal
-        final_d = np.array([obs[-1, n, 6 + min(goal_idx[n], num_goals - 1) * 3] for n in range(N)])
+        final_d = tracking["final_distance"]
         self.res["final_distance_error"] = np.mean(final_d)
         self.res["success_rate"] = np.mean(final_d < self.THRESH_DIST)
 
         # First time current goal was reached
-        reach_mask = np.zeros((T, N), dtype=bool)
-        for t in range(T):
-            for n in range(N):
-                g = goal_idx[n]
-                if g < num_goals:
-                    dist_idx = 6 + g * 3
-                    reach_mask[t, n] = obs[t, n, dist_idx] < self.THRESH_DIST
-
-        first_hit = reach_mask.argmax(axis=0)
-        hit_any = reach_mask.any(axis=0)
-        times = np.where(hit_any, first_hit, self.T)
+        self.res["avg_time_to_target"] = np.mean(tracking["time_to_target"])
 
-        self.res["avg_time_to_target"] = np.mean(times)
+    def _track_goals(self, obs: np.ndarray) -> dict[str, np.ndarray]:
+        # The tracking is shared by evaluate and save_csv, it is only computed once.
+        if self._goal_tracking is None:
+            self._goal_tracking = track_ordered_goals(obs, self.THRESH_DIST, self.T)
+        return self._goal_tracking
 
     def _track_velocities(self, obs):
         # : tracking linear/angular velocity within ϵv and ϵw during the episode
@@ -146,7 +130,7 @@ class PerformanceEvaluatorV2:
         <results>/<combo>_run-<seed>.csv
         Columns: metric, mean, std, and metadata like robot/task/lib/seed
         """
-        Path(self.RESULTS_DIR).mkdir(exist_ok=True)
+        Path(self.results_dir).mkdir(parents=True, exist_ok=True)
         obs = self.data["obs"]
         acts = self.data["act"]
         T, N, _ = obs.shape
@@ -159,13 +143,8 @@ class PerformanceEvaluatorV2:
 
         # --- final distance ---
         if "final_distance_error" in self.res:
-            goal_idx = np.zeros(N, dtype=int)
-            T, N, D = obs.shape
-            num_goals = (D - 6) // 3
             if self.task == "GoThroughPositions":
-                final_d = np.array([obs[-1, n, 6 + min(goal_idx[n], num_goals - 1) * 3] for n in range(N)])
-                stds["final_distance_error_std"] = np.std(final_d)
-
+                stds["final_distance_error_std"] = np.std(self._track_goals(obs)["final_distance"])
             else:
                 stds["final_distance_error_std"] = np.std(obs[-1, :, 0])
 
@@ -190,23 +169,6 @@ class PerformanceEvaluatorV2:
             stds["linear_velocity_error_std"] = np.std(lin_err)
             stds["angular_velocity_error_std"] = np.std(ang_err)
 
-        # --- goals reached ---
-        if self.task == "GoThroughPositions" and "num_goals_reached" in self.res:
-            T, N, D = obs.shape
-            num_goals = (D - 6) // 3
-            goal_idx = np.zeros(N, dtype=int)
-            for t in range(T):
-                for n in range(N):
-                    g = goal_idx[n]
-                    if g >= num_goals:
-                        continue
-                    dist_idx = 6 + g * 3
-                    dist = obs[t, n, dist_idx]
-                    if dist < self.THRESH_DIST:
-                        goal_idx[n] += 1
-            final_d = np.array([obs[-1, n, 6 + min(goal_idx[n], num_goals - 1) * 3] for n in range(N)])
-            stds["final_distance_error_std"] = np.std(final_d)
-
         # --- success rate ---
         if "success_rate" in self.res:
             stds["success_rate_std"] = np.sqrt(self.res["success_rate"] * (1 - self.res["success_rate"]) / N)
@@ -223,64 +185,141 @@ class PerformanceEvaluatorV2:
         }
 
         df = pd.DataFrame([merged])
-        out_path = Path(self.RESULTS_DIR) / f"{self.combo}_run-{self.seed}.csv"
+        out_path = Path(self.results_dir) / f"{self.combo}_run-{self.seed}.csv"
         df.to_csv(out_path, index=False)
         print(f"[Evaluator] saved {out_path}")
 
     # ---------------------------------------------------------------------
 
-    def export_timeseries_metrics(self, path="timeseries"):
+    def timeseries_metrics(self) -> dict[str, np.ndarray]:
         """
-        Export per-timestep, per-env values to long-format CSV
-        Columns: timestep, env_id, metric, value, robot, task, rl_lib, seed
+        Compute the per-timestep, per-env metrics of the task.
+
+        Returns:
+            dict[str, np.ndarray]: One [T, N] array per metric.
         """
-        Path(path).mkdir(exist_ok=True)
         obs = self.data["obs"]  # [T, N, D] - where T = timesteps, N = envs, D = dimensions
-        T, N, _ = obs.shape
+        metrics = {}
+
+        if self.task in ["GoToPosition", "GoToPose"]:
+            metrics["distance_error"] = obs[:, :, 0]
+
+        if self.task == "GoToPose":
+            metrics["heading_error"] = np.rad2deg(self._heading_error(obs[:, :, 3], obs[:, :, 4]))
+
+        if self.task == "TrackVelocities":
+            metrics["vx_error"] = obs[:, :, 0]
+            metrics["vy_error"] = obs[:, :, 1]
+            metrics["omega_error"] = obs[:, :, 2]
+            metrics["velocity_error"] = np.linalg.norm(obs[:, :, 0:3], axis=-1)
 
-        rows = []
-
-        for t in range(T):
-            for n in range(N):
-                if self.task in ["GoToPosition", "GoToPose"]:
-                    dist = obs[t, n, 0]
-                    rows.append([t, n, "distance_error", dist])
-
-                if self.task == "GoToPose":
-                    cos_h, sin_h = obs[t, n, 3], obs[t, n, 4]
-                    heading = np.abs(np.arctan2(sin_h, cos_h))
-                    heading_deg = np.rad2deg(heading)
-                    rows.append([t, n, "heading_error", heading_deg])
-
-                if self.task == "TrackVelocities":
-                    vx_err = obs[t, n, 0]
-                    vy_err = obs[t, n, 1]
-                    w_err = obs[t, n, 2]
-                    rows.append([t, n, "vx_error", vx_err])
-                    rows.append([t, n, "vy_error", vy_err])
-                    rows.append([t, n, "omega_error", w_err])
-                    v_err = np.linalg.norm([vx_err, vy_err, w_err])
-                    rows.append([t, n, "velocity_error", v_err])
-
-                if self.task == "GoThroughPositions":
-                    dist = obs[t, n, 3]
-                    rows.append([t, n, "distance_error", dist])
-                    hit = float(dist < self.THRESH_DIST)
-                    rows.append([t, n, "cumulative_goals", hit])
-
-        # cumulative goals sum per env
-        df = pd.DataFrame(rows, columns=["timestep", "env_id", "metric", "value"])
         if self.task == "GoThroughPositions":
-            mask = df["metric"] == "cumulative_goals"
-            df.loc[mask, "value"] = df[mask].groupby("env_id")["value"].cumsum()
+            dist = obs[:, :, 3]
+            metrics["distance_error"] = dist
+            # cumulative goals sum per env
+            metrics["cumulative_goals"] = np.cumsum(dist < self.THRESH_DIST, axis=0, dtype=np.float32)
 
-        # Add context columns and write
-        df["robot"] = self.robot
-        df["task"] = self.task
-        df["rl_lib"] = self.lib
-        df["seed"] = self.seed
-        df.to_csv(Path(path) / f"{self.combo}_run-{self.seed}.csv", index=False)
-        print(f"[Timeseries] saved {self.combo}_run-{self.seed}.csv")
+        return {name: np.asarray(value, dtype=np.float32) for name, value in metrics.items()}
+
+    def export_timeseries_metrics(
+        self,
+        path: str = "timeseries",
+        file_format: str = "npz",
+        time_stride: int = 1,
+        env_stride: int = 1,
+        chunk_size: int = 64,
+    ) -> Path:
+        """
+        Export the per-timestep, per-env metrics.
+
+        - npz: wide format, one compressed [T, N] array per metric, plus the timesteps, the env ids and the context
+          (robot, task, rl_lib, seed).
+        - parquet: long format, columns: timestep, env_id, metric, value, robot, task, rl_lib, seed. The metric and
+          the context columns are dictionary-encoded, and the rows are written in row groups of chunk_size timesteps.
+
+        Args:
+            path: The directory in which the file is written.
+            file_format: The file format, "npz" or "parquet".
+            time_stride: Only every time_stride-th timestep is exported.
+            env_stride: Only every env_stride-th env is exported.
+            chunk_size: The number of timesteps per row group (parquet only).
+
+        Returns:
+            Path: The path of the written file.
+        """
+        assert file_format in ["npz", "parquet"], f"Unknown time-series format: {file_format}"
+        Path(path).mkdir(exist_ok=True)
+
+        metrics = {name: value[::time_stride, ::env_stride] for name, value in self.timeseries_metrics().items()}
+        T, N, _ = self.data["obs"].shape
+        timesteps = np.arange(0, T, time_stride, dtype=np.int32)
+        env_ids = np.arange(0, N, env_stride, dtype=np.int32)
+        out_path = Path(path) / f"{self.combo}_run-{self.seed}.{file_format}"
+
+        if file_format == "npz":
+            np.savez_compressed(
+                out_path,
+                timestep=timesteps,
+                env_id=env_ids,
+                robot=np.array(self.robot),
+                task=np.array(self.task),
+                rl_lib=np.array(self.lib),
+                seed=np.array(self.seed),
+                **metrics,
+            )
+        else:
+            self._write_timeseries_parquet(out_path, metrics, timesteps, env_ids, chunk_size)
+
+        print(f"[Timeseries] saved {out_path.name}")
+        return out_path
+
+    def _write_timeseries_parquet(
+        self,
+        out_path: Path,
+        metrics: dict[str, np.ndarray],
+        timesteps: np.ndarray,
+        env_ids: np.ndarray,
+        chunk_size: int,
+    ) -> None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Pyarrow is not installed. Please install it by running 'pip install pyarrow'.")
+
+        names = list(metrics.keys())
+        num_envs = len(env_ids)
+        num_metrics = len(names)
+
+        def constant(value, num_rows: int) -> pa.DictionaryArray:
+            return pa.DictionaryArray.from_arrays(pa.array(np.zeros(num_rows, dtype=np.int8)), pa.array([value]))
+
+        schema = None
+        writer = None
+        for start in range(0, len(timesteps), chunk_size):
+            # Rows are ordered by timestep, env and metric
+            values = np.stack([metrics[name][start : start + chunk_size] for name in names], axis=-1)  # [t, N, M]
+            num_steps = values.shape[0]
+            num_rows = values.size
+            columns = {
+                "timestep": pa.array(np.repeat(timesteps[start : start + num_steps], num_envs * num_metrics)),
+                "env_id": pa.array(np.tile(np.repeat(env_ids, num_metrics), num_steps)),
+                "metric": pa.DictionaryArray.from_arrays(
+                    pa.array(np.tile(np.arange(num_metrics, dtype=np.int8), num_steps * num_envs)), pa.array(names)
+                ),
+                "value": pa.array(values.reshape(-1)),
+                "robot": constant(self.robot, num_rows),
+                "task": constant(self.task, num_rows),
+                "rl_lib": constant(self.lib, num_rows),
+                "seed": pa.array(np.full(num_rows, self.seed, dtype=np.int32)),
+            }
+            table = pa.table(columns)
+            if writer is None:
+                schema = table.schema
+                writer = pq.ParquetWriter(out_path, schema)
+            writer.write_table(table)
+        if writer is not None:
+            writer.close()
 
     # -------------------------------------------------------------------------
     # Helper to aggregate all run-CSVs into the big comparison table
@@ -294,7 +333,9 @@ class PerformanceEvaluatorV2:
             print("No run-level CSVs found.")
             return
 
-        big = pd.concat([pd.read_csv(f) for f in run_files], ignore_index=True)
+        # Only the combo and the metrics are aggregated, the other context columns are not read
+        context = {"robot", "task", "rl_lib", "seed"}
+        big = pd.concat([pd.read_csv(f, usecols=lambda c: c not in context) for f in run_files], ignore_index=True)
         agg = big.groupby("combo").mean(numeric_only=True).reset_index()
 
         template = pd.read_csv(template_csv)
@@ -310,3 +351,92 @@ class PerformanceEvaluatorV2:
 
         template.to_csv("Evaluation_Metrics_Filled.csv", index=False)
         print("[Aggregator] saved Evaluation_Metrics_Filled.csv")
+
+
+def track_ordered_goals(
+    obs: np.ndarray | torch.Tensor, threshold: float, max_horizon: int
+) -> dict[str, np.ndarray | torch.Tensor]:
+    """
+    Track the progression through the ordered goals of the GoThroughPositions task.
+
+    The goals must be reached in order: the goal k can only be reached strictly after the goal k-1 was reached.
+    Instead of stepping through time, the goals are scanned one after the other: the time at which each goal is
+    reached is the first time its distance is below the threshold after the previous goal was reached. This takes
+    one [T, N] array operation per goal. Works on both numpy arrays and torch tensors (on any device).
+
+    Args:
+        obs: The observations of shape [T, N, D]. The distance to the goal k is at index 6 + 3 * k.
+        threshold: The distance below which a goal is reached.
+        max_horizon: The time reported for the environments that never reached their current goal.
+
+    Returns:
+        A dictionary with, for each environment:
+        - goals_reached: The number of goals reached.
+        - final_distance: The final distance to the current goal (or the last one if all were reached).
+        - time_to_target: The first time the current goal was within the threshold, max_horizon if never.
+    """
+
+    use_torch = isinstance(obs, torch.Tensor)
+    T, N, D = obs.shape
+    num_goals = (D - 6) // 3
+    below = obs[:, :, 6 : 6 + 3 * num_goals : 3] < threshold  # [T, N, G]
+
+    if use_torch:
+        steps = torch.arange(T, device=obs.device).unsqueeze(1)
+        env_ids = torch.arange(N, device=obs.device)
+        goal_idx = torch.zeros(N, dtype=torch.int64, device=obs.device)
+        prev_hit = torch.full((N,), -1, dtype=torch.int64, device=obs.device)
+    else:
+        steps = np.arange(T)[:, None]
+        env_ids = np.arange(N)
+        goal_idx = np.zeros(N, dtype=int)
+        prev_hit = np.full(N, -1, dtype=int)
+
+    def first_true(mask):
+        if use_torch:
+            return mask.to(torch.uint8).argmax(dim=0), mask.any(dim=0)
+        return mask.argmax(axis=0), mask.any(axis=0)
+
+    for k in range(num_goals):
+        first_hit, hit_any = first_true(below[:, :, k] & (steps > prev_hit))
+        goal_idx += hit_any
+        # Environments that missed this goal cannot reach the next ones.
+        prev_hit = first_hit * hit_any + T * ~hit_any
+
+    last_goal = goal_idx.clip(max=num_goals - 1)
+    final_distance = obs[-1, env_ids, 6 + 3 * last_goal]
+
+    first_hit, hit_any = first_true(below[:, env_ids, last_goal] & (goal_idx < num_goals))
+    time_to_target = first_hit * hit_any + max_horizon * ~hit_any
+    return {"goals_reached": goal_idx, "final_distance": final_distance, "time_to_target": time_to_target}
+
+
+def load_timeseries_metrics(
+    path: str, metrics: list[str] | None = None, env_ids: list[int] | None = None
+) -> dict[str, np.ndarray] | pd.DataFrame:
+    """
+    Read back a time-series written by :meth:`PerformanceEvaluatorV2.export_timeseries_metrics`, only loading the
+    requested metrics.
+
+    Args:
+        path: The path of the .npz or .parquet file.
+        metrics: The metrics to load. If None, all the metrics are loaded.
+        env_ids: The envs to load (parquet only). If None, all the envs are loaded.
+
+    Returns:
+        dict[str, np.ndarray] | pd.DataFrame: For npz files, the [T, N] arrays of the metrics along with the
+        timesteps, env ids and context. For parquet files, the long-format data frame.
+    """
+    if path.endswith(".npz"):
+        context = ["timestep", "env_id", "robot", "task", "rl_lib", "seed"]
+        with np.load(path) as data:
+            # Arrays of an npz archive are only decompressed when accessed
+            names = metrics if metrics is not None else [name for name in data.files if name not in context]
+            return {name: data[name] for name in context + names}
+
+    filters = []
+    if metrics is not None:
+        filters.append(("metric", "in", metrics))
+    if env_ids is not None:
+        filters.append(("env_id", "in", env_ids))
+    return pd.read_parquet(path, filters=filters if filters else None)
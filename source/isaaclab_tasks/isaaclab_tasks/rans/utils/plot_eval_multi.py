@@ -12,8 +12,10 @@ import pandas as pd
 import seaborn as sns
 from mpl_toolkits.axes_grid1.inset_locator import inset_axes, mark_inset
 
+from .rollout_recorder import RolloutRecorder
 
-def plot_episode_data_virtual(ep_data: dict, save_dir: str, all_agents: bool = False, task: str = "") -> None:
+
+def plot_episode_data_virtual(ep_data: dict | str, save_dir: str, all_agents: bool = False, task: str = "") -> None:
     """
     Plots the evaluation data for a single agent across a set of evaluation episodes.
     The following metrics are aggregated across all episodes:
@@ -24,12 +26,15 @@ def plot_episode_data_virtual(ep_data: dict, save_dir: str, all_agents: bool = F
     - trajectories: XY positions, no heading.
 
     Args:
-    ep_data: dict: dictionary containing episode data
+    ep_data: dict | str: dictionary containing episode data, or the path to a recording made with RolloutRecorder
     save_dir: str: directory where to save the plots
     all_agents: bool: if True, plot average results over all agents, if False only the first agent is plotted
     """
     print("Plotting episode data for task: ", task)
 
+    if isinstance(ep_data, str):
+        ep_data = RolloutRecorder.load(ep_data)
+
     reward_history = ep_data["rews"]
     control_history = ep_data["act"]
     state_history = ep_data["obs"]
@@ -54,17 +59,17 @@ def plot_episode_data_virtual(ep_data: dict, save_dir: str, all_agents: bool = F
         )
         # plot best and worst episodes data
         plot_one_episode(
-            {k: np.array([v[best_agent] for v in vals]) for k, vals in ep_data.items()},
+            {k: np.array(np.asarray(vals)[:, best_agent]) for k, vals in ep_data.items()},
             save_dir + "/best_ep/",
             task=task,
         )
         plot_one_episode(
-            {k: np.array([v[worst_agent] for v in vals]) for k, vals in ep_data.items()},
+            {k: np.array(np.asarray(vals)[:, worst_agent]) for k, vals in ep_data.items()},
             save_dir + "/worst_ep/",
             task=task,
         )
         plot_one_episode(
-            {k: np.array([v[rand_agent] for v in vals]) for k, vals in ep_data.items()},
+            {k: np.array(np.asarray(vals)[:, rand_agent]) for k, vals in ep_data.items()},
             save_dir + f"/rand_ep_{rand_agent}/",
             task=task,
         )
@@ -144,7 +149,7 @@ def plot_episode_data_virtual(ep_data: dict, save_dir: str, all_agents: bool = F
 
     else:
         fig_count = plot_one_episode(
-            {k: np.array([v[0] for v in vals]) for k, vals in ep_data.items()},
+            {k: np.array(np.asarray(vals)[:, 0]) for k, vals in ep_data.items()},
             save_dir + "_single_ep/",
             task=task,
         )
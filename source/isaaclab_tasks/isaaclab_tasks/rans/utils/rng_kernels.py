@@ -1542,3 +1542,319 @@ def quaternion(states: wp.array, new_states: wp.array, ids: wp.array, shape: tup
             raise ValueError("Invalid shape, must be 1, 2 or 3 dimensions")
     wp.copy(states, new_states)
     return outputs
+
+
+###################
+# UNIQUE INTEGERS
+###################
+# Sampling without replacement is done using Floyd's algorithm followed by a Fisher-Yates shuffle of the selected
+# values. This only requires num random draws per environment and no scratch buffer of size (high - low), which
+# keeps the kernel cheap even when the sampling range is large.
+
+
+@wp.func
+def rand_unique_integers(
+    state: wp.uint32,
+    low: wp.int32,
+    high: wp.int32,
+    num: wp.int32,
+    output: wp.array(dtype=wp.int32, ndim=2),
+    row: wp.int32,
+):
+    """Sample num unique integers in [low, high) and write them in a random order into a row of the output.
+    The first num states are used by Floyd's algorithm, the next num states are used by the shuffle.
+    Args:
+        state: The state of the environment.
+        low: The lower bound of the distribution.
+        high: The upper bound of the distribution (excluded).
+        num: The number of unique integers to sample.
+        output: The output tensor.
+        row: The row of the output tensor to write to."""
+    n = high - low
+    # Floyd's algorithm: picks a uniformly distributed subset of size num
+    for j in range(num):
+        k = n - num + j
+        t = wp.randi(state + wp.uint32(j), 0, k + 1)
+        already_sampled = int(0)
+        for m in range(j):
+            if output[row, m] == t:
+                already_sampled = 1
+        if already_sampled == 1:
+            t = k
+        output[row, j] = t
+    # Fisher-Yates shuffle: Floyd's algorithm does not produce a uniformly random order
+    for j in range(num - 1, 0, -1):
+        r = wp.randi(state + wp.uint32(num + j), 0, j + 1)
+        tmp = output[row, j]
+        output[row, j] = output[row, r]
+        output[row, r] = tmp
+    for j in range(num):
+        output[row, j] = output[row, j] + low
+
+
+@wp.kernel
+def rand_unique_int_2D(
+    low: wp.int32,
+    high: wp.int32,
+    num: wp.int32,
+    states: wp.array(dtype=wp.uint32),
+    new_states: wp.array(dtype=wp.uint32),
+    ids: wp.array(dtype=wp.int32),
+    output: wp.array(dtype=wp.int32, ndim=2),
+):
+    """Sample unique integer values from a uniform distribution. 2D version.
+    The state for each environment is updated automatically.
+    Args:
+        low: The lower bound of the uniform distribution.
+        high: The upper bound of the uniform distribution.
+        num: The number of unique integers to sample.
+        states: The state for each environment.
+        new_states: The new state for each environment.
+        ids: The ids of the selected environments.
+        output: The output tensor."""
+    tid = wp.tid()
+    rand_unique_integers(states[ids[tid]], low, high, num, output, tid)
+    new_states[ids[tid]] = states[ids[tid]] + wp.uint32(2 * num)
+
+
+@wp.kernel
+def rand_unique_int_2D_tensorized(
+    low: wp.array(dtype=wp.int32),
+    high: wp.array(dtype=wp.int32),
+    num: wp.int32,
+    states: wp.array(dtype=wp.uint32),
+    new_states: wp.array(dtype=wp.uint32),
+    ids: wp.array(dtype=wp.int32),
+    output: wp.array(dtype=wp.int32, ndim=2),
+):
+    """Sample unique integer values from a uniform distribution. 2D version.
+    The state for each environment is updated automatically.
+    Args:
+        low: The lower bound of the uniform distribution for each environments.
+        high: The upper bound of the uniform distribution for each environments.
+        num: The number of unique integers to sample.
+        states: The state for each environment.
+        new_states: The new state for each environment.
+        ids: The ids of the selected environments.
+        output: The output tensor."""
+    tid = wp.tid()
+    rand_unique_integers(states[ids[tid]], low[tid], high[tid], num, output, tid)
+    new_states[ids[tid]] = states[ids[tid]] + wp.uint32(2 * num)
+
+
+def unique_integers_single(
+    low: int, high: int, num: int, states: wp.array, new_states: wp.array, ids: wp.array, device="cuda"
+) -> wp.array:
+    """Sample unique integers between two bounds.
+    The final shape is defined as: (ids.shape[0], num).
+    The kernel will automatically update the state for each environment after sampling.
+    Args:
+        low: The lower bound of the uniform distribution.
+        high: The upper bound of the uniform distribution.
+        num: The number of unique integers to sample.
+        states: The state for each environment.
+        new_states: The new state for each environment.
+        ids: The ids of the selected environments.
+        device: The device to be used for the computation.
+    Returns:
+        The sampled values."""
+    outputs = wp.empty((ids.shape[0], num), dtype=wp.int32, device=device)
+    wp.launch(
+        kernel=rand_unique_int_2D,
+        dim=ids.shape[0],
+        inputs=[low, high, num, states, new_states, ids, outputs],
+        device=device,
+    )
+    wp.copy(states, new_states)
+    return outputs
+
+
+def unique_integers_tensorized(
+    low: wp.array, high: wp.array, num: int, states: wp.array, new_states: wp.array, ids: wp.array, device="cuda"
+) -> wp.array:
+    """Sample unique integers between two bounds. The bounds are defined for each environment.
+    The final shape is defined as: (ids.shape[0], num).
+    The kernel will automatically update the state for each environment after sampling.
+    Args:
+        low: The lower bound of the uniform distribution.
+        high: The upper bound of the uniform distribution.
+        num: The number of unique integers to sample.
+        states: The state for each environment.
+        new_states: The new state for each environment.
+        ids: The ids of the selected environments.
+        device: The device to be used for the computation.
+    Returns:
+        The sampled values."""
+    outputs = wp.empty((ids.shape[0], num), dtype=wp.int32, device=device)
+    wp.launch(
+        kernel=rand_unique_int_2D_tensorized,
+        dim=ids.shape[0],
+        inputs=[low, high, num, states, new_states, ids, outputs],
+        device=device,
+    )
+    wp.copy(states, new_states)
+    return outputs
+
+
+def unique_integers(
+    low: int | wp.array,
+    high: int | wp.array,
+    num: int,
+    states: wp.array,
+    new_states: wp.array,
+    ids: wp.array,
+    device="cuda",
+) -> wp.array:
+    """Sample unique integers between two bounds, without replacement.
+    The final shape is defined as: (ids.shape[0], num).
+    The kernel will automatically update the state for each environment after sampling.
+    Args:
+        low: The lower bound of the uniform distribution.
+        high: The upper bound of the uniform distribution.
+        num: The number of unique integers to sample.
+        states: The state for each environment.
+        new_states: The new state for each environment.
+        ids: The ids of the selected environments.
+        device: The device to be used for the computation.
+    Returns:
+        The sampled values."""
+    if isinstance(low, wp.array) and isinstance(high, wp.array):
+        return unique_integers_tensorized(low, high, num, states, new_states, ids, device=device)
+    if isinstance(low, int) and isinstance(high, int):
+        return unique_integers_single(low, high, num, states, new_states, ids, device=device)
+    if isinstance(high, wp.array) and isinstance(low, int):
+        raise ValueError("The low value must be a tensor if the high value is a tensor.")
+    if isinstance(low, wp.array) and isinstance(high, int):
+        raise ValueError("The high value must be a tensor if the low value is a tensor.")
+    raise TypeError(
+        f"The bounds must both be integers or both be tensors, got {type(low).__name__} and {type(high).__name__}."
+    )
+
+
+###################
+# DRAW PLAN
+###################
+# A draw plan bundles several draws (uniform, normal, integer, sign, quaternion) into a single kernel launch.
+# Each element of each draw is described by its kind, its state counter (relative to the state of the environment),
+# the draw it belongs to (used to fetch its parameters), and the column it must be written to. The state counters
+# mirror the ones used by the per-call kernels above, so a plan yields the exact same values as the equivalent
+# sequence of individual calls.
+
+DRAW_UNIFORM = wp.constant(0)
+DRAW_NORMAL = wp.constant(1)
+DRAW_INTEGER = wp.constant(2)
+DRAW_SIGN_INT = wp.constant(3)
+DRAW_SIGN_FLOAT = wp.constant(4)
+DRAW_QUATERNION = wp.constant(5)
+
+
+@wp.kernel
+def rand_draw_plan(
+    states: wp.array(dtype=wp.uint32),
+    new_states: wp.array(dtype=wp.uint32),
+    ids: wp.array(dtype=wp.int32),
+    kinds: wp.array(dtype=wp.int32),
+    counters: wp.array(dtype=wp.uint32),
+    draws: wp.array(dtype=wp.int32),
+    columns: wp.array(dtype=wp.int32),
+    params: wp.array(dtype=wp.float32, ndim=3),
+    offset: wp.uint32,
+    advance: wp.array(dtype=wp.int32),
+    float_output: wp.array(dtype=wp.float32, ndim=2),
+    int_output: wp.array(dtype=wp.int32, ndim=2),
+):
+    """Sample all the elements of a draw plan. One thread per environment.
+    Since a single thread handles all the draws of an environment, the state is updated in place. The new state is
+    written too, such that the copy ending the other samplers does not rewind the environments advanced by the plan.
+    Args:
+        states: The state for each environment.
+        new_states: The new state for each environment.
+        ids: The ids of the selected environments.
+        kinds: The kind of distribution of each element.
+        counters: The state counter of each element.
+        draws: The index of the draw each element belongs to.
+        columns: The column of the output each element is written to.
+        params: The parameters of each draw for each selected environment. Shape (num_ids, num_draws, 2).
+        offset: The total number of states consumed by the plan.
+        advance: Whether the state of each selected environment is advanced. If not, the draws are discarded.
+        float_output: The output tensor for float draws.
+        int_output: The output tensor for integer draws."""
+    tid = wp.tid()
+    state = states[ids[tid]]
+    for e in range(kinds.shape[0]):
+        kind = kinds[e]
+        col = columns[e]
+        a = params[tid, draws[e], 0]
+        b = params[tid, draws[e], 1]
+        if kind == DRAW_UNIFORM:
+            float_output[tid, col] = wp.randf(state + counters[e], a, b)
+        elif kind == DRAW_NORMAL:
+            float_output[tid, col] = a + wp.randn(state + counters[e]) * b
+        elif kind == DRAW_INTEGER:
+            int_output[tid, col] = wp.randi(state + counters[e], wp.int32(a), wp.int32(b))
+        elif kind == DRAW_SIGN_INT:
+            int_output[tid, col] = rand_sign(state + counters[e])
+        elif kind == DRAW_SIGN_FLOAT:
+            float_output[tid, col] = wp.float32(rand_sign(state + counters[e]))
+        elif kind == DRAW_QUATERNION:
+            vec3f_unit_sphere = wp.sample_unit_sphere(state + counters[e])
+            angle = wp.randf(state + counters[e], 0.0, 2.0 * 4.0 * wp.atan(1.0))
+            q = wp.quat_from_axis_angle(vec3f_unit_sphere, angle)
+            for c in range(4):
+                float_output[tid, col + c] = q[c]
+    if advance[tid] != 0:
+        states[ids[tid]] = state + offset
+        new_states[ids[tid]] = state + offset
+
+
+def draw_plan(
+    states: wp.array,
+    new_states: wp.array,
+    ids: wp.array,
+    kinds: wp.array,
+    counters: wp.array,
+    draws: wp.array,
+    columns: wp.array,
+    params: wp.array,
+    offset: int,
+    advance: wp.array,
+    float_output: wp.array,
+    int_output: wp.array,
+    device="cuda",
+) -> None:
+    """Sample all the elements of a draw plan with a single kernel launch.
+    The outputs are preallocated and the state of each selected environment is advanced by offset, if its advance
+    flag is set.
+    Args:
+        states: The state for each environment.
+        new_states: The new state for each environment.
+        ids: The ids of the selected environments.
+        kinds: The kind of distribution of each element.
+        counters: The state counter of each element.
+        draws: The index of the draw each element belongs to.
+        columns: The column of the output each element is written to.
+        params: The parameters of each draw for each selected environment.
+        offset: The total number of states consumed by the plan.
+        advance: Whether the state of each selected environment is advanced.
+        float_output: The output tensor for float draws.
+        int_output: The output tensor for integer draws.
+        device: The device to be used for the computation."""
+    wp.launch(
+        kernel=rand_draw_plan,
+        dim=ids.shape[0],
+        inputs=[
+            states,
+            new_states,
+            ids,
+            kinds,
+            counters,
+            draws,
+            columns,
+            params,
+            offset,
+            advance,
+            float_output,
+            int_output,
+        ],
+        device=device,
+    )
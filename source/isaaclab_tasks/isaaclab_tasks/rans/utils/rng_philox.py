@@ -0,0 +1,498 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import math
+import numpy as np
+import torch
+
+# This module must not depend on warp: it provides a random number generator that runs anywhere torch runs.
+
+###################
+# PHILOX 4x32-10
+###################
+# Counter-based random number generator from "Parallel random numbers: as easy as 1, 2, 3" (Salmon et al. 2011).
+# uint32 values are stored in int64 tensors, as torch has no uint32 arithmetic on all devices. The 32x32 -> 64 bits
+# multiplications are split in 16 bits halves so that no intermediate value overflows an int64.
+
+PHILOX_M0 = 0xD2511F53
+PHILOX_M1 = 0xCD9E8D57
+PHILOX_W0 = 0x9E3779B9
+PHILOX_W1 = 0xBB67AE85
+PHILOX_ROUNDS = 10
+MASK_32 = 0xFFFFFFFF
+
+
+def mulhilo(a: torch.Tensor, m: int) -> tuple[torch.Tensor, torch.Tensor]:
+    """Compute the high and low 32 bits of the product of a 32 bits tensor with a 32 bits constant.
+    Args:
+        a: The tensor, uint32 values stored as int64.
+        m: The constant.
+    Returns:
+        The high and low 32 bits of the product."""
+    p_lo = (a & 0xFFFF) * m
+    p_hi = (a >> 16) * m
+    mid = p_lo + ((p_hi & 0xFFFF) << 16)
+    return (p_hi >> 16) + (mid >> 32), mid & MASK_32
+
+
+def philox4x32(
+    c0: torch.Tensor, c1: torch.Tensor, c2: torch.Tensor, c3: torch.Tensor, k0: torch.Tensor, k1: torch.Tensor
+) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
+    """Philox 4x32 with 10 rounds. All the inputs must be broadcastable to the same shape.
+    Args:
+        c0: The first word of the counter.
+        c1: The second word of the counter.
+        c2: The third word of the counter.
+        c3: The fourth word of the counter.
+        k0: The first word of the key.
+        k1: The second word of the key.
+    Returns:
+        Four tensors of random uint32 values stored as int64."""
+    for i in range(PHILOX_ROUNDS):
+        hi0, lo0 = mulhilo(c0, PHILOX_M0)
+        hi1, lo1 = mulhilo(c2, PHILOX_M1)
+        c0, c1, c2, c3 = hi1 ^ c1 ^ k0, lo1, hi0 ^ c3 ^ k1, lo0
+        if i < PHILOX_ROUNDS - 1:
+            k0 = (k0 + PHILOX_W0) & MASK_32
+            k1 = (k1 + PHILOX_W1) & MASK_32
+    return c0, c1, c2, c3
+
+
+def to_unit_float(x: torch.Tensor) -> torch.Tensor:
+    """Map uint32 values to float32 values in [0, 1). Uses the 24 most significant bits."""
+    return (x >> 8).to(torch.float32) * (1.0 / 16777216.0)
+
+
+def to_unit_float_open(x: torch.Tensor) -> torch.Tensor:
+    """Map uint32 values to float32 values in (0, 1]. Uses the 24 most significant bits."""
+    return ((x >> 8) + 1).to(torch.float32) * (1.0 / 16777216.0)
+
+
+class PhiloxPerEnvSeededRNG:
+    """Per environment seeded random number generator, pure torch backend.
+
+    Unlike the warp backend, this generator is stateless: every draw is a function of the seed of the environment,
+    the number of draws already performed by that environment, and the index of the value within the draw. Sampling
+    only increments a per-environment draw counter, it never copies a state array. The generator runs on any device
+    supported by torch and does not import warp.
+
+    The methods mirror the ones of the warp backend, the values are not the same but follow the same distributions.
+    """
+
+    def __init__(self, seeds: int | torch.Tensor, num_envs: int, device: str):
+        """Initialize the random number generator.
+        Args:
+            seeds: The seeds for each environment.
+            num_envs: The number of environments.
+            device: The device to use."""
+
+        self._device = device
+        self._num_envs = num_envs
+
+        # Instantiate buffers
+        if isinstance(seeds, int):
+            self._seeds = torch.full((num_envs,), seeds, dtype=torch.int32, device=device)
+        else:
+            self._seeds = seeds.to(dtype=torch.int32, device=device).clone()
+        self._counters = torch.zeros((num_envs,), dtype=torch.int64, device=device)
+        self._ALL_INDICES = torch.arange(num_envs, dtype=torch.long, device=device)
+
+    @property
+    def seeds_torch(self) -> torch.Tensor:
+        """Get the seeds for each environment."""
+        return self._seeds
+
+    @property
+    def seeds_numpy(self) -> np.ndarray:
+        """Get the seeds for each environment."""
+        return self._seeds.cpu().numpy()
+
+    @property
+    def states_torch(self) -> torch.Tensor:
+        """Get the states (number of draws since the last seeding) for each environment."""
+        return self._counters
+
+    @property
+    def states_numpy(self) -> np.ndarray:
+        """Get the states (number of draws since the last seeding) for each environment."""
+        return self._counters.cpu().numpy()
+
+    @staticmethod
+    def to_tuple(shape: int | tuple[int]) -> tuple:
+        """Casts to a tuple."""
+        if isinstance(shape, int):
+            return (shape,)
+        else:
+            return shape
+
+    @staticmethod
+    def output_shape(num_ids: int, shape: tuple[int]) -> tuple:
+        """Get the shape of the output. Follows the convention of the warp backend: (num_ids,) if the shape is (1,),
+        (num_ids,) + shape otherwise."""
+        if shape[0] == 1 and len(shape) == 1:
+            return (num_ids,)
+        return (num_ids,) + shape
+
+    def create_draw_plan(self) -> "PhiloxDrawPlan":
+        """Create an empty draw plan bound to this random number generator.
+        Returns:
+            The draw plan."""
+        return PhiloxDrawPlan(self)
+
+    def set_seeds(self, seeds: torch.Tensor, ids: torch.Tensor | None) -> None:
+        """Set the seeds for each environment and reset their draw counters.
+        If ids is None, the seeds are set for all environments. No checks are performed on the input tensors,
+        It is the user's responsibility to ensure that the tensors are of the correct shape.
+        Args:
+            seeds: The seeds for each environment.
+            ids: The ids of the environments."""
+
+        if ids is None:
+            self._seeds[:] = seeds.to(torch.int32)
+            self._counters[:] = 0
+        else:
+            ids = ids.to(device=self._device, dtype=torch.long)
+            self._seeds[ids] = seeds.to(device=self._device, dtype=torch.int32)
+            self._counters[ids] = 0
+
+    def set_seeds_numpy(self, seeds: np.ndarray, ids: np.ndarray | None) -> None:
+        """Set the seeds for each environment.
+        Args:
+            seeds: The seeds for each environment.
+            ids: The ids of the environments."""
+
+        self.set_seeds(
+            torch.as_tensor(seeds, device=self._device),
+            None if ids is None else torch.as_tensor(ids, device=self._device),
+        )
+
+    def _random_bits(self, ids: torch.Tensor | None, num_elements: int) -> tuple[torch.Tensor, ...]:
+        """Generate four uint32 words for each element of a draw, and advance the counters.
+        Args:
+            ids: The ids of the environments.
+            num_elements: The number of elements drawn for each environment.
+        Returns:
+            Four tensors of shape (num_ids, num_elements)."""
+
+        if ids is None:
+            seeds = self._seeds
+            counters = self._counters.clone()
+            self._counters += 1
+        else:
+            ids = ids.to(device=self._device, dtype=torch.long)
+            seeds = self._seeds[ids]
+            counters = self._counters[ids]
+            self._counters[ids] += 1
+
+        # Counter: (element index, draw counter low, draw counter high, 0). Key: (seed, 0).
+        c0 = torch.arange(num_elements, dtype=torch.int64, device=self._device).unsqueeze(0)
+        c1 = (counters & MASK_32).unsqueeze(1)
+        c2 = (counters >> 32).unsqueeze(1)
+        c3 = torch.zeros_like(c1)
+        k0 = (seeds.to(torch.int64) & MASK_32).unsqueeze(1)
+        k1 = torch.zeros_like(k0)
+        return philox4x32(c0.expand(c1.shape[0], -1), c1, c2, c3, k0, k1)
+
+    @staticmethod
+    def _broadcast(value: float | torch.Tensor, shape: tuple) -> float | torch.Tensor:
+        """Reshape a per-environment parameter so that it broadcasts against the output."""
+        if isinstance(value, torch.Tensor):
+            return value.reshape((-1,) + (1,) * (len(shape) - 1))
+        return value
+
+    def _num_ids(self, ids: torch.Tensor | None) -> int:
+        return self._num_envs if ids is None else ids.shape[0]
+
+    def sample_uniform_torch(
+        self,
+        low: float | torch.Tensor,
+        high: float | torch.Tensor,
+        shape: tuple | int,
+        ids: torch.Tensor | None = None,
+    ) -> torch.Tensor:
+        """Sample from a uniform distribution.
+        Args:
+            low: The lower bound of the distribution.
+            high: The upper bound of the distribution.
+            shape: The shape of the output tensor.
+            ids: The ids of the environments.
+        Returns:
+            The sampled values."""
+        shape = self.to_tuple(shape)
+        out_shape = self.output_shape(self._num_ids(ids), shape)
+        x, _, _, _ = self._random_bits(ids, math.prod(shape))
+        u = to_unit_float(x).reshape(out_shape)
+        low = self._broadcast(low, out_shape)
+        high = self._broadcast(high, out_shape)
+        return low + u * (high - low)
+
+    def sample_sign_torch(self, dtype: str, shape: tuple | int, ids: torch.Tensor | None = None) -> torch.Tensor:
+        """Sample a sign.
+        Args:
+            dtype: The data type of the output tensor.
+            shape: The shape of the output tensor.
+            ids: The ids of the environments.
+        Returns:
+            The sampled values."""
+        assert dtype in ["int", "float"], "The data type must be either 'int' or 'float'."
+        shape = self.to_tuple(shape)
+        out_shape = self.output_shape(self._num_ids(ids), shape)
+        x, _, _, _ = self._random_bits(ids, math.prod(shape))
+        sign = ((x >> 31) * 2 - 1).reshape(out_shape)
+        return sign.to(torch.int32 if dtype == "int" else torch.float32)
+
+    def sample_integer_torch(
+        self, low: int | torch.Tensor, high: int | torch.Tensor, shape: tuple | int, ids: torch.Tensor | None = None
+    ) -> torch.Tensor:
+        """Sample for a random integer in [low, high).
+        Args:
+            low: The lower bound of the distribution.
+            high: The upper bound of the distribution.
+            shape: The shape of the output tensor.
+            ids: The ids of the environments.
+        Returns:
+            torch.Tensor: The sampled values."""
+        shape = self.to_tuple(shape)
+        out_shape = self.output_shape(self._num_ids(ids), shape)
+        x, _, _, _ = self._random_bits(ids, math.prod(shape))
+        x = x.reshape(out_shape)
+        if isinstance(low, torch.Tensor):
+            low = self._broadcast(low.to(torch.int64), out_shape)
+        if isinstance(high, torch.Tensor):
+            high = self._broadcast(high.to(torch.int64), out_shape)
+        # Multiply-shift mapping of a uint32 to [0, high - low)
+        return (low + ((x * (high - low)) >> 32)).to(torch.int32)
+
+    def sample_normal_torch(
+        self,
+        mean: float | torch.Tensor,
+        std: float | torch.Tensor,
+        shape: tuple | int,
+        ids: torch.Tensor | None = None,
+    ) -> torch.Tensor:
+        """Sample from a normal distribution. Uses the Box-Muller transform.
+        Args:
+            mean: The mean of the distribution.
+            std: The standard deviation of the distribution.
+            shape: The shape of the output tensor.
+            ids: The ids of the environments.
+        Returns:
+            torch.Tensor: The sampled values."""
+        shape = self.to_tuple(shape)
+        out_shape = self.output_shape(self._num_ids(ids), shape)
+        x0, x1, _, _ = self._random_bits(ids, math.prod(shape))
+        u0 = to_unit_float_open(x0)
+        u1 = to_unit_float(x1)
+        z = (torch.sqrt(-2.0 * torch.log(u0)) * torch.cos(2.0 * math.pi * u1)).reshape(out_shape)
+        mean = self._broadcast(mean, out_shape)
+        std = self._broadcast(std, out_shape)
+        return mean + z * std
+
+    def sample_poisson_torch(
+        self, lam: float | torch.Tensor, shape: tuple | int, ids: torch.Tensor | None = None
+    ) -> torch.Tensor:
+        """Sample from a poisson distribution.
+        Uses the inversion method for rates below 100, and a rounded normal approximation above.
+        Args:
+            lam: The rate of the distribution.
+            shape: The shape of the output tensor.
+            ids: The ids of the environments.
+        Returns:
+            The sampled values."""
+        shape = self.to_tuple(shape)
+        out_shape = self.output_shape(self._num_ids(ids), shape)
+        x0, x1, x2, _ = self._random_bits(ids, math.prod(shape))
+        u = to_unit_float(x0).reshape(out_shape).to(torch.float64)
+        if isinstance(lam, torch.Tensor):
+            # Bounding the number of iterations requires the largest rate, this synchronizes with the host.
+            lam = self._broadcast(lam.to(torch.float64), out_shape).expand(out_shape)
+            max_lam = min(float(lam.max()), 100.0) if lam.numel() > 0 else 0.0
+        else:
+            max_lam = min(float(lam), 100.0)
+            lam = torch.full(out_shape, float(lam), dtype=torch.float64, device=self._device)
+        # Inversion, the number of iterations is bounded so that the missed mass is negligible.
+        small_lam = torch.clamp(lam, max=100.0)
+        k = torch.zeros(out_shape, dtype=torch.int64, device=self._device)
+        p = torch.exp(-small_lam)
+        cdf = p.clone()
+        for i in range(int(max_lam + 10.0 * math.sqrt(max_lam) + 10.0)):
+            k += u > cdf
+            p = p * small_lam / (i + 1)
+            cdf = cdf + p
+        # Normal approximation for large rates
+        z = torch.sqrt(-2.0 * torch.log(to_unit_float_open(x1))) * torch.cos(2.0 * math.pi * to_unit_float(x2))
+        approx = torch.clamp(torch.round(lam + torch.sqrt(lam) * z.reshape(out_shape)), min=0).to(torch.int64)
+        return torch.where(lam < 100.0, k, approx).to(torch.int32)
+
+    def sample_quaternion_torch(self, shape: tuple | int, ids: torch.Tensor | None = None) -> torch.Tensor:
+        """Sample a quaternion, using a random axis on the unit sphere and a random angle in [0, 2pi).
+        The quaternions are given as (x, y, z, w), like the warp backend.
+        Args:
+            shape: The shape of the output tensor.
+            ids: The ids of the environments.
+        Returns:
+            torch.Tensor: The sampled values."""
+        shape = self.to_tuple(shape)
+        out_shape = self.output_shape(self._num_ids(ids), shape)
+        x0, x1, x2, _ = self._random_bits(ids, math.prod(shape))
+        z = 2.0 * to_unit_float(x0) - 1.0
+        phi = 2.0 * math.pi * to_unit_float(x1)
+        half_angle = math.pi * to_unit_float(x2)
+        r = torch.sqrt(torch.clamp(1.0 - z * z, min=0.0))
+        s = torch.sin(half_angle)
+        quat = torch.stack([r * torch.cos(phi) * s, r * torch.sin(phi) * s, z * s, torch.cos(half_angle)], dim=-1)
+        return quat.reshape(out_shape + (4,))
+
+    def sample_unique_integers_torch(
+        self, min: int | torch.Tensor, max: int | torch.Tensor, num: int, ids: torch.Tensor | None = None
+    ) -> torch.Tensor:
+        """Sample unique integers in [min, max). Uses Floyd's algorithm followed by a random shuffle.
+        No checks are performed on tensors as this would require a synchronization with the host.
+        Args:
+            min: The minimum value.
+            max: The maximum value (excluded).
+            num: The number of unique integers to sample.
+            ids: The ids of the environments.
+        Returns:
+            torch.Tensor: The sampled values. Shape (num_envs, num)."""
+        if isinstance(min, int):
+            assert isinstance(max, int), "min and max must have the same type"
+            assert min < max, "min must be less than max"
+            assert num <= max - min, "num must be less than or equal to max - min"
+        num_ids = self._num_ids(ids)
+        x0, x1, _, _ = self._random_bits(ids, num)
+        n = max - min
+        if isinstance(n, torch.Tensor):
+            n = n.to(torch.int64).unsqueeze(1)
+        output = torch.zeros((num_ids, num), dtype=torch.int64, device=self._device)
+        for j in range(num):
+            k = n - num + j
+            t = (x0[:, j : j + 1] * (k + 1)) >> 32
+            already_sampled = torch.any(output[:, :j] == t, dim=1, keepdim=True)
+            output[:, j : j + 1] = torch.where(already_sampled, k, t)
+        # Floyd's algorithm does not produce a uniformly random order
+        order = torch.argsort(x1, dim=1)
+        output = torch.gather(output, 1, order)
+        if isinstance(min, torch.Tensor):
+            min = min.to(torch.int64).unsqueeze(1)
+        return (output + min).to(torch.int32)
+
+    def sample_uniform_numpy(
+        self, low: float | np.ndarray, high: float | np.ndarray, shape: tuple | int, ids: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Sample from a uniform distribution. Numpy implementation."""
+        low, high, ids = self._from_numpy(low, high, ids)
+        return self.sample_uniform_torch(low, high, shape, ids).cpu().numpy()
+
+    def sample_sign_numpy(self, dtype: str, shape: tuple | int, ids: np.ndarray | None = None) -> np.ndarray:
+        """Sample a sign. Numpy implementation."""
+        return self.sample_sign_torch(dtype, shape, self._from_numpy(ids)[0]).cpu().numpy()
+
+    def sample_integer_numpy(
+        self, low: int | np.ndarray, high: int | np.ndarray, shape: tuple | int, ids: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Sample for a random integer. Numpy implementation."""
+        low, high, ids = self._from_numpy(low, high, ids)
+        return self.sample_integer_torch(low, high, shape, ids).cpu().numpy()
+
+    def sample_normal_numpy(
+        self, mean: float | np.ndarray, std: float | np.ndarray, shape: tuple | int, ids: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Sample from a normal distribution. Numpy implementation."""
+        mean, std, ids = self._from_numpy(mean, std, ids)
+        return self.sample_normal_torch(mean, std, shape, ids).cpu().numpy()
+
+    def sample_poisson_numpy(self, lam: float | np.ndarray, shape: tuple | int, ids: np.ndarray | None) -> np.ndarray:
+        """Sample from a poisson distribution. Numpy implementation."""
+        lam, ids = self._from_numpy(lam, ids)
+        return self.sample_poisson_torch(lam, shape, ids).cpu().numpy()
+
+    def sample_quaternion_numpy(self, shape: tuple | int, ids: np.ndarray | None = None) -> np.ndarray:
+        """Sample a quaternion. Numpy implementation."""
+        return self.sample_quaternion_torch(shape, self._from_numpy(ids)[0]).cpu().numpy()
+
+    def sample_unique_integers_numpy(
+        self, min: int | np.ndarray, max: int | np.ndarray, num: int, ids: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Sample unique integers. Numpy implementation."""
+        if isinstance(min, np.ndarray):
+            assert isinstance(max, np.ndarray), "min and max must have the same type"
+            assert (min < max).all(), "min must be less than max"
+            assert (num <= max - min).all(), "num must be less than or equal to max - min"
+        min, max, ids = self._from_numpy(min, max, ids)
+        return self.sample_unique_integers_torch(min, max, num, ids).cpu().numpy()
+
+    def _from_numpy(self, *values) -> list:
+        """Move numpy arrays to torch tensors on the device of the generator, leave the other values untouched."""
+        return [torch.from_numpy(v).to(self._device) if isinstance(v, np.ndarray) else v for v in values]
+
+
+class PhiloxDrawPlan:
+    """A set of draws sampled from a counter-based random number generator.
+
+    Exposes the same interface as the warp DrawPlan. Since the counter-based generator does not copy any state
+    when sampling, the draws are simply performed one after the other.
+    """
+
+    def __init__(self, rng: PhiloxPerEnvSeededRNG):
+        """Initialize the draw plan.
+        Args:
+            rng: The random number generator the plan draws from."""
+        self._rng = rng
+        self._draws = {}
+
+    def _add(self, name: str, fn, args: tuple, defaults: tuple) -> None:
+        if name in self._draws:
+            raise ValueError(f"A draw named {name} already exists in the plan.")
+        self._draws[name] = (fn, args, defaults)
+
+    def add_uniform(self, name: str, low: float, high: float, shape: tuple | int) -> None:
+        """Add a draw from a uniform distribution."""
+        self._add(name, self._rng.sample_uniform_torch, (shape,), (low, high))
+
+    def add_normal(self, name: str, mean: float, std: float, shape: tuple | int) -> None:
+        """Add a draw from a normal distribution."""
+        self._add(name, self._rng.sample_normal_torch, (shape,), (mean, std))
+
+    def add_integer(self, name: str, low: int, high: int, shape: tuple | int) -> None:
+        """Add a draw of random integers."""
+        self._add(name, self._rng.sample_integer_torch, (shape,), (low, high))
+
+    def add_sign(self, name: str, dtype: str, shape: tuple | int) -> None:
+        """Add a draw of random signs."""
+        self._add(name, self._rng.sample_sign_torch, (dtype, shape), ())
+
+    def add_quaternion(self, name: str, shape: tuple | int) -> None:
+        """Add a draw of random quaternions."""
+        self._add(name, self._rng.sample_quaternion_torch, (shape,), ())
+
+    def sample(
+        self,
+        ids: torch.Tensor | None = None,
+        bounds: dict[str, tuple[float | torch.Tensor, float | torch.Tensor]] | None = None,
+        mask: torch.Tensor | None = None,
+    ) -> dict[str, torch.Tensor]:
+        """Sample all the draws of the plan.
+        Args:
+            ids: The ids of the environments.
+            bounds: Optional per-call parameters of the draws, indexed by name.
+            mask: Optional boolean mask with the same length as the ids. Only the masked environments advance
+                their counters.
+        Returns:
+            The sampled values indexed by name."""
+        bounds = {} if bounds is None else bounds
+        if mask is not None:
+            counters = self._rng._counters if ids is None else self._rng._counters[ids.long()]
+            counters = counters.clone()
+        outputs = {
+            name: fn(*bounds.get(name, defaults), *args, ids=ids) for name, (fn, args, defaults) in self._draws.items()
+        }
+        if mask is not None:
+            # Roll back the counters of the environments that are not masked
+            if ids is None:
+                self._rng._counters.copy_(torch.where(mask, self._rng._counters, counters))
+            else:
+                self._rng._counters[ids.long()] = torch.where(mask, self._rng._counters[ids.long()], counters)
+        return outputs
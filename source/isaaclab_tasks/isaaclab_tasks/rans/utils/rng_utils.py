@@ -3,21 +3,60 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+import math
 import numpy as np
 import torch
 
 import warp as wp
 
-from .rng_kernels import integer, normal, poisson, quaternion, rand_sign_fn, set_states, uniform
+from . import RNG_FACTORY
+from .rng_kernels import (
+    DRAW_INTEGER,
+    DRAW_NORMAL,
+    DRAW_QUATERNION,
+    DRAW_SIGN_FLOAT,
+    DRAW_SIGN_INT,
+    DRAW_UNIFORM,
+    draw_plan,
+    integer,
+    normal,
+    poisson,
+    quaternion,
+    rand_sign_fn,
+    set_states,
+    uniform,
+    unique_integers,
+)
 
 
 class PerEnvSeededRNG:
-    def __init__(self, seeds: int | torch.Tensor, num_envs: int, device: str):
+    def __new__(cls, seeds: int | torch.Tensor, num_envs: int, device: str, backend: str = "warp"):
+        """Select the backend of the random number generator.
+
+        - warp: stateful generator implemented with warp kernels. This is the default.
+        - philox: stateless counter-based generator implemented in pure torch, see :class:`PhiloxPerEnvSeededRNG`.
+
+        The backends are created by the RNG_FACTORY, which should be preferred when warp must not be imported.
+
+        Args:
+            seeds: The seeds for each environment.
+            num_envs: The number of environments.
+            device: The device to use.
+            backend: The backend to use, either 'warp' or 'philox'."""
+
+        if backend == "warp":
+            return super().__new__(cls)
+        if backend not in RNG_FACTORY.get_keys:
+            raise ValueError(f"Unknown random number generator backend: {backend}. Must be 'warp' or 'philox'.")
+        return RNG_FACTORY(backend, seeds=seeds, num_envs=num_envs, device=device)
+
+    def __init__(self, seeds: int | torch.Tensor, num_envs: int, device: str, backend: str = "warp"):
         """Initialize the random number generator.
         Args:
             seeds: The seeds for each environment.
             num_envs: The number of environments.
-            device: The device to use."""
+            device: The device to use.
+            backend: The backend to use. Only 'warp' reaches this point."""
 
         self._device = device
         self._num_envs = num_envs
@@ -32,9 +71,6 @@ class PerEnvSeededRNG:
         self._new_states = wp.zeros(self._seeds.shape, dtype=wp.uint32, device=device)
         self._ALL_INDICES = wp.array(np.arange(num_envs), dtype=wp.int32, device=device)
 
-        self._use_numpy_rng = False
-        self._numpy_rng_is_initialized = False
-
     @property
     def seeds_warp(self) -> wp.array:
         """Get the seeds for each environment."""
@@ -81,25 +117,11 @@ class PerEnvSeededRNG:
             out *= i
         return out
 
-    def initialize_numpy_rng(self) -> None:
-        """Initialize the numpy random number generator."""
-
-        self._numpy_rngs = [np.random.default_rng(seed) for seed in self.seeds_numpy]
-
-        self._use_numpy_rng = True
-        self._numpy_rng_is_initialized = True
-
-    def set_numpy_rng_seeds(self, seeds: wp.array, ids: wp.array | None) -> None:
-        """When using distributions that are not yet supported by our custom warp kernels, we fall
-        back to numpy. This function sets the seeds for each environments."""
-        if ids is None:
-            ids = self._ALL_INDICES
-
-        ids = ids.numpy()
-        seeds = seeds.numpy()
-
-        for i, seed in enumerate(seeds):
-            self._numpy_rngs[i] = np.random.default_rng(seed)
+    def create_draw_plan(self) -> "DrawPlan":
+        """Create an empty draw plan bound to this random number generator.
+        Returns:
+            The draw plan."""
+        return DrawPlan(self)
 
     def set_seeds_warp(self, seeds: wp.array, ids: wp.array | None) -> None:
         """Set the seeds for each environment.
@@ -118,9 +140,6 @@ class PerEnvSeededRNG:
             device=self._device,
         )
 
-        if self._use_numpy_rng:
-            self.set_numpy_rng_seeds(seeds, ids)
-
     def set_seeds(self, seeds: torch.Tensor, ids: torch.Tensor | None) -> None:
         """Set the seeds for each environment.
         If ids is None, the seeds are set for all environments. No checks are performed on the input tensors,
@@ -481,87 +500,301 @@ class PerEnvSeededRNG:
         output = self.sample_quaternion_warp(shape, ids)
         return output.numpy()
 
-    def sample_unique_integers_numpy(
-        self, min: int | np.ndarray, max: int | np.ndarray, num: int, ids: np.ndarray | None = None
-    ) -> np.array:
-        """Sample unique integers. Numpy implementation, numpy backend.
+    def sample_unique_integers_warp(
+        self, min: int | wp.array, max: int | wp.array, num: int, ids: wp.array | None = None
+    ) -> wp.array:
+        """Sample unique integers in [min, max). Warp implementation.
+
+        If min and max are arrays, their shapes need to match that of the ids. No checks are performed on arrays
+        as this would require a synchronization with the host, it is the user's responsibility to ensure that
+        min < max and num <= max - min.
+
         Args:
             min: The minimum value.
-            max: The maximum value.
+            max: The maximum value (excluded).
             num: The number of unique integers to sample.
             ids: The ids of the environments.
         Returns:
-            torch.Tensor: The sampled values. Shape (num_envs, num)."""
-
-        if self._numpy_rng_is_initialized is False:
-            self.initialize_numpy_rng()
-
-        if ids is None:
-            ids = self._ALL_INDICES.numpy()
-
-        if type(min) is np.ndarray:
-            assert type(max) is np.ndarray, "min and max must have the same type"
-            assert (min < max).all(), "min must be less than max"
-            assert (num <= max - min).all(), "num must be less than or equal to max - min"
-            outputs = [
-                self._numpy_rngs[id].choice(np.arange(min[i], max[i]), num, replace=False) for i, id in enumerate(ids)
-            ]
-
-        elif type(min) is int:
-            assert type(max) is int, "min and max must have the same type"
+            The sampled values. Shape (num_envs, num)."""
+        if isinstance(min, int):
+            assert isinstance(max, int), "min and max must have the same type"
             assert min < max, "min must be less than max"
             assert num <= max - min, "num must be less than or equal to max - min"
-            outputs = [self._numpy_rngs[id].choice(np.arange(min, max), num, replace=False) for id in ids]
-
-        else:
-            raise ValueError("min and max must be either int or np.ndarray")
-
-        return np.array(outputs, dtype=np.int32)
+        if ids is None:
+            ids = self._ALL_INDICES
+        return unique_integers(min, max, num, self._states, self._new_states, ids, self._device)
 
     def sample_unique_integers_torch(
         self, min: int | torch.Tensor, max: int | torch.Tensor, num: int, ids: torch.Tensor | None = None
     ) -> torch.Tensor:
-        """Sample unique integers. Torch implementation, numpy backend.
+        """Sample unique integers in [min, max). Torch implementation.
         Args:
             min: The minimum value.
-            max: The maximum value.
+            max: The maximum value (excluded).
             num: The number of unique integers to sample.
             ids: The ids of the environments.
         Returns:
             torch.Tensor: The sampled values. Shape (num_envs, num)."""
-
-        if isinstance(ids, torch.Tensor):
-            ids = ids.detach().cpu().numpy()
-
+        if ids is not None:
+            ids = wp.from_torch(ids.to(torch.int32), dtype=wp.int32)
         if isinstance(min, torch.Tensor):
-            min = min.detach().cpu().numpy()
+            min = wp.from_torch(min.to(torch.int32), dtype=wp.int32)
+        else:
+            min = int(min)
         if isinstance(max, torch.Tensor):
-            max = max.detach().cpu().numpy()
-
-        outputs = self.sample_unique_integers_numpy(min, max, num, ids)
-
-        return torch.from_numpy(outputs).to(self._device)
+            max = wp.from_torch(max.to(torch.int32), dtype=wp.int32)
+        else:
+            max = int(max)
+        output = self.sample_unique_integers_warp(min, max, num, ids)
+        return wp.to_torch(output)
 
-    def sample_unique_integers_warp(
-        self, min: int | wp.array, max: int | wp.array, num: int, ids: wp.array | None = None
-    ) -> wp.array:
-        """Sample unique integers. Warp implementation, numpy backend.
+    def sample_unique_integers_numpy(
+        self, min: int | np.ndarray, max: int | np.ndarray, num: int, ids: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Sample unique integers in [min, max). Numpy implementation.
         Args:
             min: The minimum value.
-            max: The maximum value.
+            max: The maximum value (excluded).
             num: The number of unique integers to sample.
             ids: The ids of the environments.
         Returns:
-            torch.Tensor: The sampled values. Shape (num_envs, num)."""
+            np.ndarray: The sampled values. Shape (num_envs, num)."""
+        if ids is not None:
+            ids = wp.array(ids.astype(np.int32), dtype=wp.int32, device=self._device)
+        if isinstance(min, np.ndarray):
+            assert isinstance(max, np.ndarray), "min and max must have the same type"
+            assert (min < max).all(), "min must be less than max"
+            assert (num <= max - min).all(), "num must be less than or equal to max - min"
+            min = wp.array(min, dtype=wp.int32, device=self._device)
+            max = wp.array(max, dtype=wp.int32, device=self._device)
+        else:
+            min = int(min)
+            max = int(max)
+        output = self.sample_unique_integers_warp(min, max, num, ids)
+        return output.numpy()
+
+
+class DrawPlan:
+    """A set of draws sampled with a single kernel launch.
+
+    Draws are declared once, using the add_* methods, and the plan is then sampled as many times as needed. All the
+    draws of a plan are generated by a single kernel launch, that writes into preallocated buffers and advances the
+    state of each environment once. The values are identical to the ones that would be obtained by calling the
+    matching sample_* methods of the random number generator in the order the draws were declared.
+
+    Example:
+        plan = rng.create_draw_plan()
+        plan.add_integer("num_goals", 1, 5, 1)
+        plan.add_uniform("radius", 0.0, 1.0, 4)
+        plan.add_quaternion("orientation", 1)
+        draws = plan.sample(ids, bounds={"radius": (low, high)})
+    """
+
+    def __init__(self, rng: PerEnvSeededRNG):
+        """Initialize the draw plan.
+        Args:
+            rng: The random number generator the plan draws from."""
+
+        self._rng = rng
+        self._device = rng._device
+        self._num_envs = rng._num_envs
+        self._draws = []
+        self._names = {}
+        self._is_compiled = False
+        self._overridden = set()
+
+    def _add(self, name: str, kind: int, shape: tuple | int, a: float, b: float) -> None:
+        """Register a draw.
+        Args:
+            name: The name of the draw.
+            kind: The kind of distribution.
+            shape: The shape of the draw for a single environment.
+            a: The first parameter of the distribution.
+            b: The second parameter of the distribution."""
+
+        if self._is_compiled:
+            raise RuntimeError("Draws cannot be added to a plan that was already sampled.")
+        if name in self._names:
+            raise ValueError(f"A draw named {name} already exists in the plan.")
+        shape = PerEnvSeededRNG.to_tuple(shape)
+        if len(shape) not in (1, 2):
+            raise ValueError("Invalid shape, must be 1 or 2 dimensions")
+        self._names[name] = len(self._draws)
+        self._draws.append((name, kind, shape, float(a), float(b)))
+
+    def add_uniform(self, name: str, low: float, high: float, shape: tuple | int) -> None:
+        """Add a draw from a uniform distribution.
+        Args:
+            name: The name of the draw.
+            low: The lower bound of the distribution. Can be overridden when sampling.
+            high: The upper bound of the distribution. Can be overridden when sampling.
+            shape: The shape of the draw for a single environment."""
+        self._add(name, DRAW_UNIFORM, shape, low, high)
+
+    def add_normal(self, name: str, mean: float, std: float, shape: tuple | int) -> None:
+        """Add a draw from a normal distribution.
+        Args:
+            name: The name of the draw.
+            mean: The mean of the distribution. Can be overridden when sampling.
+            std: The standard deviation of the distribution. Can be overridden when sampling.
+            shape: The shape of the draw for a single environment."""
+        self._add(name, DRAW_NORMAL, shape, mean, std)
+
+    def add_integer(self, name: str, low: int, high: int, shape: tuple | int) -> None:
+        """Add a draw of random integers.
+        Args:
+            name: The name of the draw.
+            low: The lower bound of the distribution. Can be overridden when sampling.
+            high: The upper bound of the distribution. Can be overridden when sampling.
+            shape: The shape of the draw for a single environment."""
+        self._add(name, DRAW_INTEGER, shape, low, high)
+
+    def add_sign(self, name: str, dtype: str, shape: tuple | int) -> None:
+        """Add a draw of random signs.
+        Args:
+            name: The name of the draw.
+            dtype: The data type of the output tensor. Either 'int' or 'float'.
+            shape: The shape of the draw for a single environment."""
+        assert dtype in ["int", "float"], "The data type must be either 'int' or 'float'."
+        self._add(name, DRAW_SIGN_INT if dtype == "int" else DRAW_SIGN_FLOAT, shape, 0.0, 0.0)
+
+    def add_quaternion(self, name: str, shape: tuple | int) -> None:
+        """Add a draw of random quaternions.
+        Args:
+            name: The name of the draw.
+            shape: The shape of the draw for a single environment. A trailing dimension of size 4 is added."""
+        self._add(name, DRAW_QUATERNION, shape, 0.0, 0.0)
+
+    @property
+    def state_offset(self) -> int:
+        """The number of states consumed by the plan for each environment."""
+        return sum(math.prod(shape) for _, _, shape, _, _ in self._draws)
+
+    def compile(self) -> None:
+        """Build the element tables and preallocate the buffers. Called automatically on the first sample."""
+
+        kinds, counters, draws, columns = [], [], [], []
+        self._views = {}
+        num_floats = 0
+        num_ints = 0
+        base = 0
+        for d, (name, kind, shape, _, _) in enumerate(self._draws):
+            is_int = kind in (DRAW_INTEGER, DRAW_SIGN_INT)
+            width = 4 if kind == DRAW_QUATERNION else 1
+            start = num_ints if is_int else num_floats
+            for e in range(math.prod(shape)):
+                kinds.append(kind)
+                draws.append(d)
+                columns.append(start + e * width)
+                # Mirrors the state counters of the 1D, 2D and 3D per-call kernels.
+                if len(shape) == 1:
+                    counters.append(base + e)
+                else:
+                    counters.append(base + (e // shape[1]) * shape[0] + e % shape[1])
+            size = math.prod(shape) * width
+            if is_int:
+                num_ints += size
+            else:
+                num_floats += size
+            self._views[name] = (is_int, start, size, shape, width)
+            base += math.prod(shape)
+
+        self._kinds = wp.array(np.array(kinds, dtype=np.int32), dtype=wp.int32, device=self._device)
+        self._counters = wp.array(np.array(counters, dtype=np.uint32), dtype=wp.uint32, device=self._device)
+        self._draw_ids = wp.array(np.array(draws, dtype=np.int32), dtype=wp.int32, device=self._device)
+        self._columns = wp.array(np.array(columns, dtype=np.int32), dtype=wp.int32, device=self._device)
+        self._offset = base
+
+        # Preallocated buffers, shared between torch and warp
+        self._default_params = torch.tensor(
+            [[a, b] for _, _, _, a, b in self._draws], dtype=torch.float32, device=self._device
+        )
+        self._params = self._default_params.unsqueeze(0).repeat(self._num_envs, 1, 1)
+        self._float_output = torch.zeros((self._num_envs, max(num_floats, 1)), dtype=torch.float32, device=self._device)
+        self._int_output = torch.zeros((self._num_envs, max(num_ints, 1)), dtype=torch.int32, device=self._device)
+        self._params_warp = wp.from_torch(self._params, dtype=wp.float32)
+        self._float_output_warp = wp.from_torch(self._float_output, dtype=wp.float32)
+        self._int_output_warp = wp.from_torch(self._int_output, dtype=wp.int32)
+        self._advance = torch.ones(self._num_envs, dtype=torch.int32, device=self._device)
+        self._advance_warp = wp.from_torch(self._advance, dtype=wp.int32)
+        self._is_masked = False
+        self._is_compiled = True
+
+    def sample(
+        self,
+        ids: torch.Tensor | None = None,
+        bounds: dict[str, tuple[float | torch.Tensor, float | torch.Tensor]] | None = None,
+        mask: torch.Tensor | None = None,
+    ) -> dict[str, torch.Tensor]:
+        """Sample all the draws of the plan with a single kernel launch.
+
+        The returned tensors are views on buffers owned by the plan: they are overwritten by the next call to sample.
+        Clone them if they need to outlive that call.
 
-        if isinstance(ids, wp.array):
-            ids = ids.numpy()
+        With a mask, the draws keep a fixed shape: the values are generated for all the ids, but only the
+        environments where the mask is set advance their state. The values of the other environments must be
+        discarded, the random stream of each environment is then the same as if only the masked ids were sampled.
 
-        if isinstance(min, wp.array):
-            min = min.numpy()
-        if isinstance(max, wp.array):
-            max = max.numpy()
+        Args:
+            ids: The ids of the environments.
+            bounds: Optional per-call parameters of the draws, indexed by name. Tensors must have the same length
+                as the ids, floats are broadcasted to all the environments.
+            mask: Optional boolean mask with the same length as the ids. Only the masked environments consume
+                their draws.
+        Returns:
+            The sampled values indexed by name. The shape of each draw follows the one of the sample_* methods."""
 
-        outputs = self.sample_unique_integers_numpy(min, max, num, ids)
+        if not self._is_compiled:
+            self.compile()
+        if ids is None:
+            num_ids = self._num_envs
+            ids = self._rng._ALL_INDICES
+        else:
+            num_ids = ids.shape[0]
+            ids = wp.from_torch(ids.to(torch.int32), dtype=wp.int32)
+
+        # Update the parameters of the draws: restore the defaults of the ones that are no longer overridden.
+        bounds = {} if bounds is None else bounds
+        for name in self._overridden - bounds.keys():
+            d = self._names[name]
+            self._params[:, d] = self._default_params[d]
+        for name, (a, b) in bounds.items():
+            d = self._names[name]
+            self._params[:num_ids, d, 0] = a
+            self._params[:num_ids, d, 1] = b
+        self._overridden = set(bounds.keys())
+
+        # Only rewrite the advance flags when a mask is used, or when the previous call used one
+        if mask is not None:
+            self._advance[:num_ids] = mask
+            self._is_masked = True
+        elif self._is_masked:
+            self._advance.fill_(1)
+            self._is_masked = False
+
+        if num_ids > 0:
+            draw_plan(
+                self._rng.states_warp,
+                self._rng._new_states,
+                ids,
+                self._kinds,
+                self._counters,
+                self._draw_ids,
+                self._columns,
+                self._params_warp,
+                self._offset,
+                self._advance_warp,
+                self._float_output_warp,
+                self._int_output_warp,
+                self._device,
+            )
 
-        return wp.array(outputs, dtype=wp.int32, device=self._device)
+        outputs = {}
+        for name, (is_int, start, size, shape, width) in self._views.items():
+            buffer = self._int_output if is_int else self._float_output
+            view = buffer[:num_ids, start : start + size]
+            if shape == (1,):
+                outputs[name] = view if width == 4 else view[:, 0]
+            else:
+                outputs[name] = view.unflatten(1, shape + ((width,) if width == 4 else ()))
+        return outputs
@@ -0,0 +1,230 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import json
+import numpy as np
+import os
+import torch
+
+
+class RolloutRecorder:
+    METADATA_FILE = "metadata.json"
+
+    def __init__(
+        self,
+        num_steps: int,
+        num_envs: int,
+        device: str,
+        save_path: str | None = None,
+        chunk_size: int = 32,
+        fields: list[str] | None = None,
+        float_dtype: torch.dtype | None = None,
+    ) -> None:
+        """
+        Records rollouts into [T, N, ...] arrays without synchronizing the device at every step.
+
+        The data of each step is written by index into a chunk of preallocated buffers living on the device. Once a
+        chunk is full, it is copied asynchronously to (pinned) host memory on a side stream while the next chunk is
+        being recorded. Two chunks are used in turn, so the host only waits for a copy one chunk after it was
+        launched. The host copies end up either in memory, or in memory-mapped .npy files (one per field) when a
+        save path is provided. The memory-mapped files can be re-opened lazily with :meth:`load`.
+
+        Args:
+            num_steps (int): The maximum number of steps to record.
+            num_envs (int): The number of environments.
+            device (str): The device the recorded tensors live on.
+            save_path (str | None): The directory in which the .npy files are written. If None, the data is kept in
+                memory.
+            chunk_size (int): The number of steps held on the device before being flushed to the host.
+            fields (list[str] | None): The subset of fields to record. If None, all the fields passed to
+                :meth:`record` are recorded.
+            float_dtype (torch.dtype | None): If set, floating point fields are stored with this dtype (e.g.
+                torch.float16) to reduce the memory footprint.
+        """
+
+        assert num_steps > 0, "The number of steps must be greater than 0."
+        assert chunk_size > 0, "The chunk size must be greater than 0."
+
+        self._num_steps = num_steps
+        self._num_envs = num_envs
+        self._device = device
+        self._save_path = save_path
+        self._chunk_size = min(chunk_size, num_steps)
+        self._fields = fields
+        self._float_dtype = float_dtype
+
+        self._use_cuda = str(device).startswith("cuda")
+        self._stream = torch.cuda.Stream(device=device) if self._use_cuda else None
+
+        self._step = 0
+        self._chunk_start = 0
+        self._active = 0
+        self._finalized = False
+        # One entry per chunk: (step at which the chunk starts, number of steps, event) of the copy in flight.
+        self._pending = [None, None]
+
+        self._chunks = None
+        self._staging = None
+        self._storage = None
+
+    @property
+    def num_recorded_steps(self) -> int:
+        return self._step
+
+    def _allocate(self, step_data: dict[str, torch.Tensor]) -> None:
+        """Allocate the device chunks, the host staging buffers and the storage from the first recorded step."""
+
+        fields = self._fields if self._fields is not None else list(step_data.keys())
+        self._fields = fields
+        pin_memory = self._use_cuda
+        self._chunks = [{}, {}]
+        self._staging = [{}, {}]
+        self._storage = {}
+        if self._save_path is not None:
+            os.makedirs(self._save_path, exist_ok=True)
+        metadata = {"num_steps": 0, "num_envs": self._num_envs, "fields": {}}
+        for name in fields:
+            value = step_data[name]
+            dtype = self._float_dtype if (self._float_dtype is not None and value.is_floating_point()) else value.dtype
+            shape = tuple(value.shape)
+            for i in range(2):
+                self._chunks[i][name] = torch.empty((self._chunk_size, *shape), dtype=dtype, device=self._device)
+            if self._save_path is None:
+                # The host copy is written directly into the pinned storage.
+                self._storage[name] = torch.empty((self._num_steps, *shape), dtype=dtype, pin_memory=pin_memory)
+            else:
+                for i in range(2):
+                    self._staging[i][name] = torch.empty((self._chunk_size, *shape), dtype=dtype, pin_memory=pin_memory)
+                np_dtype = self._staging[0][name].numpy().dtype
+                self._storage[name] = np.lib.format.open_memmap(
+                    os.path.join(self._save_path, f"{name}.npy"),
+                    mode="w+",
+                    dtype=np_dtype,
+                    shape=(self._num_steps, *shape),
+                )
+                metadata["fields"][name] = {"dtype": np_dtype.str, "shape": list(shape)}
+        self._metadata = metadata
+
+        if self._save_path is not None:
+            self._write_metadata()
+
+    def _write_metadata(self) -> None:
+        self._metadata["num_steps"] = self._step
+        with open(os.path.join(self._save_path, self.METADATA_FILE), "w") as f:
+            json.dump(self._metadata, f, indent=4)
+
+    def record(self, **step_data: torch.Tensor) -> None:
+        """Record the data of one step. The tensors are expected to have the number of environments as first
+        dimension.
+
+        Args:
+            **step_data (torch.Tensor): The tensors to record, e.g. act=actions, obs=obs, rews=rews."""
+
+        assert not self._finalized, "The recorder was already finalized."
+        assert self._step < self._num_steps, "The recorder is full."
+        if self._chunks is None:
+            self._allocate(step_data)
+
+        row = self._step - self._chunk_start
+        chunk = self._chunks[self._active]
+        for name in self._fields:
+            chunk[name][row].copy_(step_data[name])
+        self._step += 1
+
+        if self._step - self._chunk_start == self._chunk_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Launch the copy of the active chunk to the host, and wait for the copy of the other chunk."""
+
+        num_rows = self._step - self._chunk_start
+        if num_rows == 0:
+            return
+        chunk = self._chunks[self._active]
+        if self._save_path is None:
+            targets = {name: self._storage[name][self._chunk_start : self._step] for name in self._fields}
+        else:
+            targets = {name: self._staging[self._active][name][:num_rows] for name in self._fields}
+
+        event = None
+        if self._use_cuda:
+            # The copies must see the writes made on the compute stream.
+            self._stream.wait_stream(torch.cuda.current_stream(self._device))
+            with torch.cuda.stream(self._stream):
+                for name in self._fields:
+                    targets[name].copy_(chunk[name][:num_rows], non_blocking=True)
+                event = torch.cuda.Event()
+                event.record(self._stream)
+        else:
+            for name in self._fields:
+                targets[name].copy_(chunk[name][:num_rows])
+        self._pending[self._active] = (self._chunk_start, num_rows, event)
+
+        # The other chunk is about to be overwritten: its copy must be done.
+        self._active = 1 - self._active
+        self._drain(self._active)
+        self._chunk_start = self._step
+
+    def _drain(self, index: int) -> None:
+        """Wait for the copy of a chunk to the host and move it to the storage."""
+
+        pending = self._pending[index]
+        if pending is None:
+            return
+        start, num_rows, event = pending
+        if event is not None:
+            event.synchronize()
+        if self._save_path is not None:
+            for name in self._fields:
+                self._storage[name][start : start + num_rows] = self._staging[index][name][:num_rows].numpy()
+        self._pending[index] = None
+
+    def finalize(self) -> dict[str, np.ndarray]:
+        """Flush the remaining steps and wait for all the copies to the host.
+
+        Returns:
+            dict[str, np.ndarray]: The recorded data, see :meth:`data`."""
+
+        if not self._finalized and self._chunks is not None:
+            self._flush()
+            self._drain(0)
+            self._drain(1)
+            if self._save_path is not None:
+                for name in self._fields:
+                    self._storage[name].flush()
+                self._write_metadata()
+        self._finalized = True
+        return self.data()
+
+    def data(self) -> dict[str, np.ndarray]:
+        """Get the recorded data. The arrays are views on the storage, either in memory or memory-mapped.
+
+        Returns:
+            dict[str, np.ndarray]: The recorded data as [T, N, ...] arrays, with T the number of recorded steps."""
+
+        assert self._finalized, "The recorder must be finalized before accessing the data."
+        if self._storage is None:
+            return {}
+        if self._save_path is None:
+            return {name: self._storage[name][: self._step].numpy() for name in self._fields}
+        return {name: self._storage[name][: self._step] for name in self._fields}
+
+    @classmethod
+    def load(cls, path: str, fields: list[str] | None = None) -> dict[str, np.ndarray]:
+        """Open a recording lazily. Nothing is read from the disk until the arrays are accessed.
+
+        Args:
+            path (str): The directory of the recording.
+            fields (list[str] | None): The fields to open. If None, all the fields are opened.
+
+        Returns:
+            dict[str, np.ndarray]: The memory-mapped [T, N, ...] arrays."""
+
+        with open(os.path.join(path, cls.METADATA_FILE)) as f:
+            metadata = json.load(f)
+        fields = fields if fields is not None else list(metadata["fields"].keys())
+        return {
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r")[: metadata["num_steps"]] for name in fields
+        }
@@ -0,0 +1,210 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import json
+import numpy as np
+import os
+import torch
+
+
+class ScenarioBank:
+    FIELDS = ["task_seeds", "robot_seeds", "task_gen_actions", "robot_gen_actions"]
+
+    def __init__(
+        self,
+        task_seeds: np.ndarray,
+        robot_seeds: np.ndarray,
+        task_gen_actions: np.ndarray,
+        robot_gen_actions: np.ndarray,
+        num_envs: int,
+        device: str = "cuda",
+        metadata: dict | None = None,
+    ) -> None:
+        """Bank of evaluation scenarios replayed at every reset.
+
+        A scenario is the input of the reset of an episode: the seed of the task, the seed of the robot, and the
+        generation actions of the task and of the robot. The k-th episode of environment i replays the scenario
+        `(k * num_envs + i) % num_scenarios`, such that the sequence of scenarios of each environment does not depend
+        on when the environments are reset. Two runs with the same bank and the same number of environments therefore
+        see the same episodes (common random numbers), and the difference of their metrics has a much lower variance
+        than with independently drawn episodes.
+
+        Banks are generated with :meth:`generate` and stored with :meth:`save`, see the
+        ``scripts/tools/generate_scenario_bank.py`` tool.
+
+        Args:
+            task_seeds: The seeds of the task [num_scenarios].
+            robot_seeds: The seeds of the robot [num_scenarios].
+            task_gen_actions: The generation actions of the task [num_scenarios, task_gen_space].
+            robot_gen_actions: The generation actions of the robot [num_scenarios, robot_gen_space].
+            num_envs: The number of environments replaying the bank.
+            device: The device to use.
+            metadata: The parameters the bank was generated with."""
+
+        assert len(task_seeds) > 0, "The scenario bank must hold at least one scenario."
+        assert (
+            len(task_seeds) == len(robot_seeds) == len(task_gen_actions) == len(robot_gen_actions)
+        ), "All the fields of the scenario bank must have the same number of scenarios."
+
+        self._num_scenarios = len(task_seeds)
+        self._num_envs = num_envs
+        self._device = device
+        self.metadata = metadata if metadata is not None else {}
+
+        self._task_seeds = torch.as_tensor(np.asarray(task_seeds, dtype=np.int32), device=device)
+        self._robot_seeds = torch.as_tensor(np.asarray(robot_seeds, dtype=np.int32), device=device)
+        self._task_gen_actions = torch.as_tensor(np.asarray(task_gen_actions, dtype=np.float32), device=device)
+        self._robot_gen_actions = torch.as_tensor(np.asarray(robot_gen_actions, dtype=np.float32), device=device)
+
+        self._env_ids = torch.arange(num_envs, dtype=torch.long, device=device)
+        self._episode_counts = torch.zeros(num_envs, dtype=torch.long, device=device)
+
+    @property
+    def num_scenarios(self) -> int:
+        return self._num_scenarios
+
+    @property
+    def task_gen_space(self) -> int:
+        return self._task_gen_actions.shape[1]
+
+    @property
+    def robot_gen_space(self) -> int:
+        return self._robot_gen_actions.shape[1]
+
+    @property
+    def episode_counts(self) -> torch.Tensor:
+        """The number of episodes started by each environment."""
+        return self._episode_counts
+
+    def sample(self, env_ids: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
+        """Gathers the next scenario of each environment. Everything stays on the device.
+
+        Args:
+            env_ids: The ids of the environments being reset.
+
+        Returns:
+            tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]: The task seeds, the robot seeds, the task
+                generation actions and the robot generation actions of the environments."""
+
+        env_ids = self._env_ids[env_ids]
+        ids = (self._episode_counts[env_ids] * self._num_envs + env_ids) % self._num_scenarios
+        self._episode_counts[env_ids] += 1
+        return (
+            self._task_seeds[ids],
+            self._robot_seeds[ids],
+            self._task_gen_actions[ids],
+            self._robot_gen_actions[ids],
+        )
+
+    def rewind(self) -> None:
+        """Restarts the replay from the first scenario of each environment."""
+        self._episode_counts.zero_()
+
+    @staticmethod
+    def generate(
+        num_scenarios: int,
+        task_gen_space: int,
+        robot_gen_space: int = 0,
+        seed: int = 0,
+        method: str = "lhs",
+        block_size: int | None = None,
+        low: float = 0.0,
+        high: float = 1.0,
+    ) -> dict[str, np.ndarray]:
+        """Generates the scenarios of a bank.
+
+        The generation actions are sampled jointly over the task and robot dimensions, with one of the methods:
+
+        - 'lhs': Latin hypercube sampling. Each dimension is split into as many strata as there are scenarios in a
+          block, and each stratum holds exactly one scenario.
+        - 'grid': Jittered grid. The space is split into the same number of cells along each dimension, and each
+          block holds one scenario per cell (the block size is rounded up to a full grid).
+        - 'uniform': Independent uniform samples, as drawn by the default resets.
+
+        The scenarios are stratified by block of `block_size` consecutive scenarios. With the block size set to the
+        number of environments, every full round of episodes covers the difficulty space evenly.
+
+        Args:
+            num_scenarios: The number of scenarios.
+            task_gen_space: The number of generation actions of the task.
+            robot_gen_space: The number of generation actions of the robot.
+            seed: The seed of the generation.
+            method: The sampling method, one of 'lhs', 'grid' or 'uniform'.
+            block_size: The number of scenarios per stratified block. If None, the whole bank is one block.
+            low: The lower bound of the generation actions.
+            high: The upper bound of the generation actions.
+
+        Returns:
+            dict[str, np.ndarray]: The fields of the bank, see :attr:`FIELDS`."""
+
+        assert num_scenarios > 0, "The scenario bank must hold at least one scenario."
+        assert method in ["lhs", "grid", "uniform"], f"Invalid sampling method: {method}"
+        assert 0.0 <= low < high <= 1.0, "The generation actions must be within [0, 1]."
+
+        rng = np.random.default_rng(seed)
+        num_dims = task_gen_space + robot_gen_space
+        block_size = num_scenarios if block_size is None else block_size
+        if method == "grid" and num_dims > 0:
+            # the smallest grid with at least block_size cells
+            levels = max(int(np.ceil(block_size ** (1.0 / num_dims) - 1e-9)), 1)
+            block_size = levels**num_dims
+
+        blocks = []
+        num_generated = 0
+        while num_generated < num_scenarios:
+            if method == "lhs" and num_dims > 0:
+                strata = np.stack([rng.permutation(block_size) for _ in range(num_dims)], axis=-1)
+                samples = (strata + rng.random((block_size, num_dims))) / block_size
+            elif method == "grid" and num_dims > 0:
+                cells = np.stack(np.unravel_index(rng.permutation(block_size), (levels,) * num_dims), axis=-1)
+                samples = (cells + rng.random((block_size, num_dims))) / levels
+            else:
+                samples = rng.random((block_size, num_dims))
+            blocks.append(samples.reshape(block_size, num_dims))
+            num_generated += block_size
+        gen_actions = low + (high - low) * np.concatenate(blocks)[:num_scenarios]
+
+        return {
+            "task_seeds": rng.integers(0, 2**31, num_scenarios, dtype=np.int64).astype(np.int32),
+            "robot_seeds": rng.integers(0, 2**31, num_scenarios, dtype=np.int64).astype(np.int32),
+            "task_gen_actions": gen_actions[:, :task_gen_space].astype(np.float32),
+            "robot_gen_actions": gen_actions[:, task_gen_space:].astype(np.float32),
+        }
+
+    @classmethod
+    def save(cls, path: str, scenarios: dict[str, np.ndarray], metadata: dict | None = None) -> None:
+        """Saves the scenarios of a bank to a .npz file.
+
+        Args:
+            path: The path of the file.
+            scenarios: The fields of the bank, see :meth:`generate`.
+            metadata: The parameters the bank was generated with, e.g. the robot and the task."""
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        np.savez(
+            path,
+            metadata=np.array(json.dumps(metadata if metadata is not None else {})),
+            **{name: scenarios[name] for name in cls.FIELDS},
+        )
+
+    @classmethod
+    def load(cls, path: str, num_envs: int, device: str = "cuda") -> "ScenarioBank":
+        """Loads a bank saved with :meth:`save`.
+
+        Args:
+            path: The path of the file.
+            num_envs: The number of environments replaying the bank.
+            device: The device to use.
+
+        Returns:
+            ScenarioBank: The bank."""
+
+        with np.load(path) as data:
+            return cls(
+                *(data[name] for name in cls.FIELDS),
+                num_envs=num_envs,
+                device=device,
+                metadata=json.loads(str(data["metadata"])),
+            )
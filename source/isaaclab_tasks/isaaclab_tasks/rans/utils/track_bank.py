@@ -0,0 +1,266 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import json
+import numpy as np
+import os
+import threading
+import torch
+from typing import TYPE_CHECKING
+
+from . import RNG_FACTORY
+from .track_generator import TrackGenerator
+
+if TYPE_CHECKING:
+    from .rng_philox import PhiloxPerEnvSeededRNG
+    from .rng_utils import PerEnvSeededRNG
+
+
+class TrackBank:
+    def __init__(
+        self,
+        num_tracks: int,
+        path: str | None = None,
+        seed: int = 0,
+        dtype: str = "float16",
+        refresh_fraction: float = 0.0,
+        refresh_interval: int = 100,
+        device: str = "cuda",
+        rng_backend: str = "warp",
+        **generator_kwargs,
+    ) -> None:
+        """Precomputed bank of race tracks.
+
+        The tracks are generated once, track i being generated from the seed `seed + i`, and stored in a compact
+        record array: the seed, the number of points, the points normalized by the scale of the track, and the
+        tangents. When a path is given, the records are memory-mapped from that file, such that the bank is only
+        generated the first time and shared between runs. At reset, the tracks are gathered from a packed copy of the
+        bank on the device in one indexed copy.
+
+        To keep the diversity high, a fraction of the bank can be refreshed every `refresh_interval` samples: the least
+        recently used tracks are regenerated from new seeds in a background thread, and swapped in at the next sample.
+        Note that with refresh enabled, the track assigned to an environment seed depends on the state of the bank.
+
+        Args:
+            num_tracks: The number of tracks in the bank.
+            path: The memory-mapped file holding the bank. It is created if it does not exist, or if it was generated
+                with different parameters. If None, the bank is generated in memory.
+            seed: The seed of the first track.
+            dtype: The precision of the points and tangents, either 'float16' or 'float32'. With float16, the points
+                are stored with a resolution of about 1e-3 of the scale of the track.
+            refresh_fraction: The fraction of the bank regenerated at each refresh. 0 disables the refresh.
+            refresh_interval: The number of calls to :meth:`sample` between two refreshes.
+            device: The device to use.
+            rng_backend: The backend of the random number generator of the tracks, 'warp' or 'philox'. The tracks
+                generated by the two backends differ, a bank is regenerated when the backend changes.
+            generator_kwargs: The arguments of the :class:`TrackGenerator`."""
+
+        assert num_tracks > 0, "The track bank must hold at least one track."
+        assert dtype in ["float16", "float32"], f"Invalid dtype: {dtype}"
+        assert 0.0 <= refresh_fraction <= 1.0, "The refresh fraction must be between 0 and 1."
+
+        self._num_tracks = num_tracks
+        self._path = path
+        self._dtype = dtype
+        self._refresh_fraction = refresh_fraction
+        self._refresh_interval = refresh_interval
+        self._device = device
+
+        self._seeds = torch.arange(seed, seed + num_tracks, dtype=torch.int32, device=self._device)
+        self._rng = RNG_FACTORY(rng_backend, seeds=self._seeds, num_envs=num_tracks, device=self._device)
+        self._generator = TrackGenerator(rng=self._rng, device=self._device, **generator_kwargs)
+        self._max_num_points = self._generator._max_num_points
+        self._scale = self._generator._scale
+
+        self._record_dtype = np.dtype([
+            ("seed", "<i4"),
+            ("num_points", "<i2"),
+            ("points", dtype, (self._max_num_points, 2)),
+            ("tangents", dtype, (self._max_num_points,)),
+        ])
+        self._metadata = {
+            "num_tracks": num_tracks,
+            "dtype": dtype,
+            "min_num_points": self._generator._min_num_points,
+            "max_num_points": self._max_num_points,
+            "min_point_distance": self._generator._min_point_distance,
+            "min_angle": self._generator._min_angle,
+            "edgy": self._generator._edgy,
+            "rng_backend": rng_backend,
+        }
+        self._records = self._load_or_generate()
+        self._seeds[:] = torch.from_numpy(self._records["seed"].copy()).to(self._device)
+        self._next_seed = int(self._records["seed"].max()) + 1
+
+        # Packed copy of the bank: [points (2 x max_num_points), tangents (max_num_points), num_points]
+        torch_dtype = getattr(torch, dtype)
+        self._bank = torch.zeros((num_tracks, 3 * self._max_num_points + 1), dtype=torch_dtype, device=self._device)
+        self._bank[:, : 2 * self._max_num_points] = torch.from_numpy(
+            self._records["points"].reshape(num_tracks, -1).copy()
+        ).to(self._device)
+        self._bank[:, 2 * self._max_num_points : -1] = torch.from_numpy(self._records["tangents"].copy()).to(
+            self._device
+        )
+        self._bank[:, -1] = torch.from_numpy(self._records["num_points"].copy()).to(self._device)
+
+        # Least recently used bookkeeping
+        self._num_samples = 0
+        self._last_used = torch.zeros(num_tracks, dtype=torch.long, device=self._device)
+        self._refresh_thread: threading.Thread | None = None
+        self._pending: tuple | None = None
+
+    @property
+    def num_tracks(self) -> int:
+        return self._num_tracks
+
+    @property
+    def seeds(self) -> torch.Tensor:
+        """The seed of each track in the bank."""
+        return self._seeds
+
+    def _load_or_generate(self) -> np.ndarray:
+        """Loads the records from the memory-mapped file if it matches the parameters of the bank, otherwise
+        generates them.
+
+        Returns:
+            np.ndarray: The records of the bank."""
+
+        if self._path is None:
+            records = np.zeros(self._num_tracks, dtype=self._record_dtype)
+            self._generate_records(records, np.arange(self._num_tracks))
+            return records
+
+        metadata_path = self._path + ".json"
+        if os.path.exists(self._path) and os.path.exists(metadata_path):
+            with open(metadata_path) as f:
+                metadata = json.load(f)
+            if metadata == self._metadata:
+                return np.memmap(self._path, dtype=self._record_dtype, mode="r+", shape=(self._num_tracks,))
+
+        os.makedirs(os.path.dirname(os.path.abspath(self._path)), exist_ok=True)
+        records = np.memmap(self._path, dtype=self._record_dtype, mode="w+", shape=(self._num_tracks,))
+        self._generate_records(records, np.arange(self._num_tracks))
+        records.flush()
+        with open(metadata_path, "w") as f:
+            json.dump(self._metadata, f, indent=2)
+        return records
+
+    def _generate(self, ids: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """Generates the tracks of the given bank entries from their seeds.
+
+        Args:
+            ids: The ids of the tracks in the bank.
+
+        Returns:
+            tuple[torch.Tensor, torch.Tensor, torch.Tensor]: The normalized points, the tangents and the number of
+                points of each track."""
+
+        self._rng.set_seeds(self._seeds[ids], ids)
+        points, tangents, num_points = self._generator.generate_tracks_points_non_fixed_points(ids)
+        return points / self._scale, tangents, num_points
+
+    def _generate_records(self, records: np.ndarray, ids: np.ndarray) -> None:
+        ids_torch = torch.from_numpy(ids).to(self._device)
+        points, tangents, num_points = self._generate(ids_torch)
+        records["seed"][ids] = self._seeds[ids_torch].cpu().numpy()
+        records["num_points"][ids] = num_points.cpu().numpy()
+        records["points"][ids] = points.cpu().numpy()
+        records["tangents"][ids] = tangents.cpu().numpy()
+
+    def sample(
+        self, rng: PerEnvSeededRNG | PhiloxPerEnvSeededRNG, env_ids: torch.Tensor
+    ) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """Gathers a track from the bank for each environment. The track is picked using the per-environment RNG.
+        The outputs match the ones of :meth:`TrackGenerator.generate_tracks_points_non_fixed_points`.
+
+        Args:
+            rng: The random number generator of the environments.
+            env_ids: The ids of the environments.
+
+        Returns:
+            tuple[torch.Tensor, torch.Tensor, torch.Tensor]: The points [num_envs, max_num_points, 2], the tangents
+                [num_envs, max_num_points] and the number of points [num_envs] of the tracks."""
+
+        self._apply_refresh()
+
+        track_ids = rng.sample_integer_torch(0, self._num_tracks, 1, ids=env_ids).long()
+        tracks = self._bank[track_ids].float()
+        self._num_samples += 1
+        self._last_used[track_ids] = self._num_samples
+
+        if self._refresh_fraction > 0 and self._num_samples % self._refresh_interval == 0:
+            self.refresh()
+
+        points = tracks[:, : 2 * self._max_num_points].view(-1, self._max_num_points, 2) * self._scale
+        tangents = tracks[:, 2 * self._max_num_points : -1]
+        num_points = tracks[:, -1].long()
+        return points, tangents, num_points
+
+    def refresh(self, block: bool = False) -> None:
+        """Regenerates the least recently used fraction of the bank from new seeds. The generation runs in a background
+        thread, the new tracks are swapped in at the next call to :meth:`sample`. Does nothing if a refresh is already
+        running.
+
+        Args:
+            block: Whether to wait for the new tracks and swap them in immediately."""
+
+        if self._refresh_thread is not None:
+            return
+
+        num_refreshed = max(1, int(self._num_tracks * self._refresh_fraction))
+        ids = torch.argsort(self._last_used)[:num_refreshed]
+        self._seeds[ids] = torch.arange(
+            self._next_seed, self._next_seed + num_refreshed, dtype=torch.int32, device=self._device
+        )
+        self._next_seed += num_refreshed
+
+        def target():
+            self._pending = (ids, *self._generate(ids))
+
+        self._refresh_thread = threading.Thread(target=target, daemon=True)
+        self._refresh_thread.start()
+        if block:
+            self._apply_refresh(wait=True)
+
+    def _apply_refresh(self, wait: bool = False) -> None:
+        """Swaps in the tracks of a finished refresh, in the packed bank and in the records.
+
+        Args:
+            wait: Whether to wait for a running refresh to finish."""
+
+        if self._refresh_thread is None:
+            return
+        if wait:
+            self._refresh_thread.join()
+        elif self._refresh_thread.is_alive():
+            return
+        self._refresh_thread = None
+        if self._pending is None:
+            # The generation failed, the exception was reported by the thread.
+            return
+
+        ids, points, tangents, num_points = self._pending
+        self._pending = None
+        self._bank[ids, : 2 * self._max_num_points] = points.reshape(len(ids), -1).to(self._bank.dtype)
+        self._bank[ids, 2 * self._max_num_points : -1] = tangents.to(self._bank.dtype)
+        self._bank[ids, -1] = num_points.to(self._bank.dtype)
+        self._last_used[ids] = self._num_samples
+
+        ids_numpy = ids.cpu().numpy()
+        self._records["seed"][ids_numpy] = self._seeds[ids].cpu().numpy()
+        self._records["num_points"][ids_numpy] = num_points.cpu().numpy()
+        self._records["points"][ids_numpy] = points.cpu().numpy()
+        self._records["tangents"][ids_numpy] = tangents.cpu().numpy()
+        if isinstance(self._records, np.memmap):
+            self._records.flush()
+
+    def close(self) -> None:
+        """Waits for a running refresh and flushes the bank to its file."""
+
+        self._apply_refresh(wait=True)
+        if isinstance(self._records, np.memmap):
+            self._records.flush()
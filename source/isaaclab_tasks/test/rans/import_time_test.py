@@ -0,0 +1,94 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import os
+import subprocess
+import sys
+import textwrap
+import unittest
+
+from isaaclab.app import run_tests
+
+# Budget of the import of isaaclab_tasks.rans during the startup, in microseconds. Eagerly importing the robots, the
+# tasks and the randomizers takes several seconds, the lazy registry only imports the factories.
+RANS_IMPORT_BUDGET_US = int(os.environ.get("RANS_IMPORT_BUDGET_US", 100_000))
+
+# The startup of an environment: the registration of the environments, then the resolution of the robot and task
+# configurations by SingleEnvCfg.
+STARTUP_SCRIPT = textwrap.dedent("""
+    from isaaclab.app import AppLauncher
+
+    simulation_app = AppLauncher({"headless": True}).app
+
+    import isaaclab_tasks  # noqa: F401
+    from isaaclab_tasks.rans import ROBOT_CFG_FACTORY, TASK_CFG_FACTORY
+
+    ROBOT_CFG_FACTORY("Kingfisher")
+    TASK_CFG_FACTORY("GoToPosition")
+    simulation_app.close()
+""")
+
+
+def parse_importtime(report: str) -> dict[str, tuple[int, int]]:
+    """Parses the report of ``python -X importtime``.
+
+    Args:
+        report: The standard error of the process.
+    Returns:
+        The self and cumulative import times of the modules, in microseconds."""
+
+    modules = {}
+    for line in report.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        # Skip the header
+        if not self_us.strip().isdigit():
+            continue
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+class TestImportTime(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", STARTUP_SCRIPT], capture_output=True, text=True, timeout=600
+        )
+        cls.modules = parse_importtime(result.stderr)
+        if "isaaclab_tasks" not in cls.modules:
+            raise RuntimeError(f"The startup script failed:\n{result.stderr[-5000:]}")
+        cls.rans_modules = {name for name in cls.modules if name.startswith("isaaclab_tasks.rans")}
+
+    def slowest(self, count: int = 10) -> str:
+        modules = sorted(self.rans_modules, key=lambda name: self.modules[name][1], reverse=True)[:count]
+        return "\n".join(f"{self.modules[name][1]:>10} us | {name}" for name in modules)
+
+    def test_only_resolved_entries_are_imported(self):
+        prefixes = ["isaaclab_tasks.rans.robots.", "isaaclab_tasks.rans.tasks."]
+        self.assertEqual([name for name in self.rans_modules if name.startswith(tuple(prefixes))], [])
+        robot_cfgs = {name for name in self.rans_modules if name.startswith("isaaclab_tasks.rans.robots_cfg.")}
+        self.assertEqual(
+            robot_cfgs,
+            {"isaaclab_tasks.rans.robots_cfg.kingfisher_cfg", "isaaclab_tasks.rans.robots_cfg.robot_core_cfg"},
+        )
+        task_cfgs = {name for name in self.rans_modules if name.startswith("isaaclab_tasks.rans.tasks_cfg.")}
+        self.assertEqual(
+            task_cfgs,
+            {"isaaclab_tasks.rans.tasks_cfg.go_to_position_cfg", "isaaclab_tasks.rans.tasks_cfg.task_core_cfg"},
+        )
+
+    def test_rans_import_time(self):
+        _, cumulative_us = self.modules["isaaclab_tasks.rans"]
+        print(f"[INFO] isaaclab_tasks: {self.modules['isaaclab_tasks'][1]} us, isaaclab_tasks.rans: {cumulative_us} us")
+        self.assertLessEqual(
+            cumulative_us,
+            RANS_IMPORT_BUDGET_US,
+            f"The import of isaaclab_tasks.rans regressed. Slowest RANS modules:\n{self.slowest()}",
+        )
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,139 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+config = {"headless": True}
+simulation_app = AppLauncher(config).app
+import math
+import torch
+import unittest
+
+from isaaclab_tasks.rans import ROBOT_CFG_FACTORY
+from isaaclab_tasks.rans.environments.single.kinematic_env_single import KinematicSingleEnv, KinematicSingleEnvCfg
+from isaaclab_tasks.rans.robots.kinematic_backend import KINEMATIC_MODEL_FACTORY, KinematicRobotBackend
+
+TASKS_2D = ["GoToPosition", "GoToPose", "GoThroughPositions", "GoThroughPoses", "TrackVelocities", "RaceWaypoints"]
+TASKS_3D = ["GoToPosition3D", "GoToPose3D", "GoThroughPositions3D", "TrackVelocities3D"]
+
+
+class TestKinematicRobotBackend(unittest.TestCase):
+    def setUp(self):
+        self.num_envs = 8
+        self.dt = 1.0 / 60.0
+
+    def make_backend(self, robot_name: str) -> KinematicRobotBackend:
+        robot_cfg = ROBOT_CFG_FACTORY(robot_name)
+        return KinematicRobotBackend(
+            KINEMATIC_MODEL_FACTORY(robot_name, robot_cfg=robot_cfg),
+            init_state=robot_cfg.robot_cfg.init_state,
+            num_envs=self.num_envs,
+        )
+
+    def test_differential_drive(self):
+        robot = self.make_backend("Jetbot")
+        wheel_ids, _ = robot.find_joints(ROBOT_CFG_FACTORY("Jetbot").wheels_dof_names)
+        radius, separation = robot.cfg.wheel_radius, robot.cfg.wheel_separation
+        # Straight line at 1m/s
+        robot.set_joint_velocity_target(torch.full((self.num_envs, 2), 1.0 / radius), joint_ids=wheel_ids)
+        for _ in range(60):
+            robot.step(self.dt)
+        self.assertTrue(torch.allclose(robot.data.root_link_pos_w[:, 0], torch.full((self.num_envs,), 1.0), atol=1e-4))
+        self.assertTrue(torch.allclose(robot.data.root_com_lin_vel_b[:, 0], torch.ones(self.num_envs), atol=1e-5))
+        # Turn in place
+        target = torch.tensor([[-0.1, 0.1]]).repeat(self.num_envs, 1) / radius
+        robot.set_joint_velocity_target(target, joint_ids=wheel_ids)
+        for _ in range(30):
+            robot.step(self.dt)
+        yaw_rate = 2 * 0.1 / separation
+        self.assertTrue(torch.allclose(robot.data.heading_w, torch.full((self.num_envs,), yaw_rate * 0.5), atol=1e-4))
+        self.assertTrue(torch.allclose(robot.data.root_ang_vel_w[:, 2], torch.full((self.num_envs,), yaw_rate)))
+
+    def test_anchored_planar_thrusters(self):
+        robot = self.make_backend("ModularFreeflyer")
+        root_idx, _ = robot.find_bodies("body")
+        thruster_ids, _ = robot.find_bodies("thruster_.*")
+        self.assertEqual(len(thruster_ids), 8)
+
+        pose = torch.tensor([[1.0, 2.0, 0.5, 1.0, 0.0, 0.0, 0.0]]).repeat(self.num_envs, 1)
+        robot.write_root_pose_to_sim(pose)
+        zeros = torch.zeros((self.num_envs, 3))
+        robot.write_joint_state_to_sim(zeros, zeros, joint_ids=[0, 1, 2], env_ids=torch.arange(self.num_envs))
+        self.assertTrue(torch.allclose(robot.data.body_link_pos_w[:, root_idx[0]], pose[:, :3]))
+
+        # Pure torque: two opposite forces on both sides of the body
+        forces = torch.zeros((self.num_envs, 8, 3))
+        positions = torch.zeros((self.num_envs, 8, 3))
+        forces[:, 0, 0], positions[:, 0, 1] = 1.0, 0.5
+        forces[:, 1, 0], positions[:, 1, 1] = -1.0, -0.5
+        robot.set_external_force_and_torque(
+            forces, torch.zeros_like(forces), positions=positions, body_ids=thruster_ids
+        )
+        for _ in range(30):
+            robot.step(self.dt)
+        ang_vel = -1.0 / robot.cfg.inertia[2] * 0.5
+        self.assertTrue(torch.allclose(robot.data.joint_vel[:, 2], torch.full((self.num_envs,), ang_vel), atol=1e-4))
+        # The anchor is the root of the articulation, the body stays above it
+        self.assertTrue(torch.allclose(robot.data.root_link_pos_w, pose[:, :3]))
+        self.assertTrue(torch.allclose(robot.data.body_link_pos_w[:, root_idx[0]], pose[:, :3], atol=1e-5))
+
+    def test_rigid_body(self):
+        robot = self.make_backend("IntBall2")
+        robot.write_root_pose_to_sim(torch.tensor([[0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0]]).repeat(self.num_envs, 1))
+        forces = torch.zeros((self.num_envs, 1, 3))
+        forces[:, 0, 2] = robot.cfg.mass
+        robot.set_external_force_and_torque(forces, torch.zeros_like(forces), body_ids=[0])
+        for _ in range(60):
+            robot.step(self.dt)
+        self.assertTrue(torch.allclose(robot.data.root_lin_vel_w[:, 2], torch.ones(self.num_envs), atol=1e-5))
+        self.assertTrue(torch.allclose(robot.data.root_quat_w.norm(dim=-1), torch.ones(self.num_envs)))
+
+    def test_mass_randomization_view(self):
+        robot = self.make_backend("Kingfisher")
+        masses = robot.root_physx_view.get_masses()
+        masses[:, 0] *= 2.0
+        robot.root_physx_view.set_masses(masses, torch.arange(0, self.num_envs, 2))
+        robot.step(self.dt)
+        self.assertTrue(torch.all(robot._mass[0::2, 0] == 2 * robot.cfg.mass))
+        self.assertTrue(torch.all(robot._mass[1::2, 0] == robot.cfg.mass))
+
+
+class TestKinematicSingleEnv(unittest.TestCase):
+    def run_env(self, robot_name: str, task_name: str, num_steps: int = 20) -> None:
+        cfg = KinematicSingleEnvCfg(robot_name=robot_name, task_name=task_name, num_envs=64, seed=0)
+        env = KinematicSingleEnv(cfg)
+        obs, _ = env.reset()
+        for _ in range(num_steps):
+            actions = torch.rand((env.num_envs, env.robot_cfg.action_space)) * 2 - 1
+            obs, rewards, terminated, truncated, _ = env.step(actions)
+            self.assertTrue(torch.all(torch.isfinite(obs["policy"])), f"{robot_name} x {task_name}")
+            self.assertTrue(torch.all(torch.isfinite(rewards)), f"{robot_name} x {task_name}")
+            self.assertEqual(rewards.shape, (env.num_envs,))
+        self.assertEqual(obs["policy"].shape[0], env.num_envs)
+
+    def test_2d_tasks(self):
+        for robot_name in ["Jetbot", "Leatherback", "Turtlebot2", "FloatingPlatform", "ModularFreeflyer", "Kingfisher"]:
+            for task_name in TASKS_2D:
+                self.run_env(robot_name, task_name)
+
+    def test_3d_tasks(self):
+        for task_name in TASKS_3D:
+            self.run_env("IntBall2", task_name)
+
+    def test_timeout(self):
+        cfg = KinematicSingleEnvCfg(robot_name="Jetbot", task_name="GoToPosition", num_envs=16, episode_length_s=1.0)
+        env = KinematicSingleEnv(cfg)
+        env.reset()
+        truncated_any = False
+        for _ in range(math.ceil(cfg.episode_length_s / env.step_dt)):
+            _, _, _, truncated, _ = env.step(torch.zeros((env.num_envs, 2)))
+            truncated_any |= bool(truncated.any())
+        self.assertTrue(truncated_any)
+        self.assertTrue(torch.all(env.episode_length_buf < env.max_episode_length))
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,151 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+config = {"headless": True}
+simulation_app = AppLauncher(config).app
+import torch
+import unittest
+
+from isaaclab.actuator_force.actuator_force import PropellerActuator
+from isaaclab.physics.hydrodynamics import Hydrodynamics
+from isaaclab.physics.hydrostatics import Hydrostatics
+from isaaclab.utils import math as math_utils
+
+from isaaclab_tasks.rans import KingfisherRobotCfg
+from isaaclab_tasks.rans.robots.kingfisher_physics import KingfisherPhysics
+from isaaclab_tasks.rans.utils import PerEnvSeededRNG
+
+
+class TestKingfisherPhysics(unittest.TestCase):
+    def setUp(self):
+        self.device = "cuda"
+        self.num_envs = 256
+        self.dt = 1.0 / 60.0
+        self.robot_cfg = KingfisherRobotCfg()
+        self.rng = PerEnvSeededRNG(
+            torch.arange(self.num_envs, dtype=torch.int32, device=self.device), self.num_envs, self.device
+        )
+        torch.manual_seed(0)
+        self.root_pos = torch.rand((self.num_envs, 3), device=self.device) * 2 - 1
+        self.root_pos[:, 2] *= 0.3
+        self.root_quat = math_utils.random_orientation(self.num_envs, device=self.device)
+        self.root_vel = torch.rand((self.num_envs, 6), device=self.device) * 4 - 2
+        self.cmds = torch.rand((self.num_envs, 2), device=self.device) * 2.4 - 1.2
+
+    def make_physics(self, backend="torch", compile=False, use_drag_randomization=False):
+        hydrodynamics_cfg = self.robot_cfg.hydrodynamics_cfg.replace(use_drag_randomization=use_drag_randomization)
+        return KingfisherPhysics(
+            self.robot_cfg.hydrostatics_cfg,
+            hydrodynamics_cfg,
+            self.robot_cfg.propeller_cfg,
+            self.rng,
+            num_envs=self.num_envs,
+            dt=self.dt,
+            device=self.device,
+            backend=backend,
+            compile=compile,
+        )
+
+    def make_reference(self, physics: KingfisherPhysics):
+        hydrostatics = Hydrostatics(self.num_envs, self.device, self.robot_cfg.hydrostatics_cfg)
+        hydrodynamics = Hydrodynamics(self.num_envs, self.device, physics._hydrodynamics_cfg)
+        propellers = [
+            PropellerActuator(self.num_envs, self.device, self.dt, self.robot_cfg.propeller_cfg) for _ in range(2)
+        ]
+        # Share the randomizations of the fused implementation
+        for k, propeller in enumerate(propellers):
+            propeller.randomization_factor[:] = physics.propeller_factors[:, k]
+        return hydrostatics, hydrodynamics, propellers
+
+    def check_against_reference(self, physics: KingfisherPhysics, hydrostatics, hydrodynamics, propellers):
+        for k, propeller in enumerate(propellers):
+            propeller.set_target_cmd(self.cmds[:, k])
+        physics.set_target_cmds(self.cmds)
+        # Several steps so that the commands of the propellers are rate limited
+        for _ in range(3):
+            buoyancy = hydrostatics.compute_archimedes_metacentric_local(self.root_pos, self.root_quat)
+            drag = hydrodynamics.ComputeHydrodynamicsEffects(self.root_quat, self.root_vel)
+            thruster_forces = torch.stack([propeller.update_forces() for propeller in propellers], dim=1)
+            physics.update(self.root_pos, self.root_quat, self.root_vel)
+
+            torch.testing.assert_close(physics.buoyancy, buoyancy, atol=1e-3, rtol=1e-4)
+            torch.testing.assert_close(physics.drag, drag, atol=1e-4, rtol=1e-4)
+            torch.testing.assert_close(physics.root_wrench[:, 0], buoyancy + drag, atol=1e-3, rtol=1e-4)
+            torch.testing.assert_close(physics.thruster_forces, thruster_forces)
+            torch.testing.assert_close(physics.current_cmds, torch.stack([p._current_cmds for p in propellers], dim=1))
+
+    def test_torch_matches_reference(self):
+        physics = self.make_physics()
+        physics.reset(torch.arange(self.num_envs, device=self.device))
+        self.check_against_reference(physics, *self.make_reference(physics))
+
+    def test_compiled_matches_reference(self):
+        physics = self.make_physics(compile=True)
+        physics.reset(torch.arange(self.num_envs, device=self.device))
+        self.check_against_reference(physics, *self.make_reference(physics))
+
+    def test_warp_matches_reference(self):
+        physics = self.make_physics(backend="warp")
+        physics.reset(torch.arange(self.num_envs, device=self.device))
+        self.check_against_reference(physics, *self.make_reference(physics))
+
+    def test_drag_randomization_matches_reference(self):
+        for backend in ["torch", "warp"]:
+            physics = self.make_physics(backend=backend, use_drag_randomization=True)
+            env_ids = torch.arange(self.num_envs, device=self.device)
+            physics.reset(env_ids)
+            hydrostatics, hydrodynamics, propellers = self.make_reference(physics)
+            # Draw the same noise as the fused implementation, after the randomization of the propellers
+            self.rng.set_seeds(torch.arange(self.num_envs, dtype=torch.int32, device=self.device), env_ids)
+            self.rng.sample_uniform_torch(-1.0, 1.0, (2,), ids=env_ids)
+            noise = self.rng.sample_uniform_torch(-1.0, 1.0, (2, 6), ids=env_ids)
+            hydrodynamics.linear_damping = hydrodynamics.base_linear_damping * (
+                1 + noise[:, 0] * hydrodynamics.linear_rand
+            )
+            hydrodynamics.quadratic_damping = hydrodynamics.base_quadratic_damping * (
+                1 + noise[:, 1] * hydrodynamics.quadratic_rand
+            )
+            self.rng.set_seeds(torch.arange(self.num_envs, dtype=torch.int32, device=self.device), env_ids)
+            physics.reset(env_ids)
+            self.check_against_reference(physics, hydrostatics, hydrodynamics, propellers)
+
+    def test_reset_is_seeded(self):
+        physics = self.make_physics(use_drag_randomization=True)
+        env_ids = torch.tensor([3, 7, 11], device=self.device)
+        seeds = torch.tensor([42, 43, 44], dtype=torch.int32, device=self.device)
+        self.rng.set_seeds(seeds, env_ids)
+        physics.reset(env_ids)
+        factors = physics.propeller_factors[env_ids].clone()
+        linear_damping = physics._linear_damping[env_ids].clone()
+        quadratic_damping = physics._quadratic_damping[env_ids].clone()
+
+        # The other environments keep their coefficients
+        torch.testing.assert_close(physics._linear_damping[0], physics._linear_damping[1])
+        self.assertFalse(torch.equal(linear_damping[0], linear_damping[1]))
+
+        self.rng.set_seeds(seeds, env_ids)
+        physics.reset(env_ids)
+        torch.testing.assert_close(physics.propeller_factors[env_ids], factors)
+        torch.testing.assert_close(physics._linear_damping[env_ids], linear_damping)
+        torch.testing.assert_close(physics._quadratic_damping[env_ids], quadratic_damping)
+
+    def test_reset_clears_commands(self):
+        physics = self.make_physics()
+        physics.set_target_cmds(self.cmds)
+        physics.update(self.root_pos, self.root_quat, self.root_vel)
+        env_ids = torch.tensor([0, 5], device=self.device)
+        physics.reset(env_ids)
+        self.assertTrue(torch.all(physics.current_cmds[env_ids] == 0))
+        physics.update(self.root_pos, self.root_quat, self.root_vel)
+        # The reset environments are back to a zero target, the others keep their state
+        self.assertTrue(torch.all(physics.current_cmds[env_ids] == 0))
+        self.assertTrue(torch.any(physics.current_cmds[1] != 0))
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,78 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+config = {"headless": True}
+simulation_app = AppLauncher(config).app
+import torch
+import unittest
+
+from isaaclab_tasks.rans.utils import ScalarLogger
+
+
+class TestScalarLogger(unittest.TestCase):
+    def setUp(self):
+        self.num_envs = 64
+        self.device = "cuda"
+        self.logger = ScalarLogger(self.num_envs, self.device, "task")
+        for op in ["sum", "mean", "max", "min", "ema"]:
+            self.logger.add_log("task_state", op, op)
+        self.logger.add_log("task_reward", "never_logged_max", "max")
+        self.values = torch.rand(10, self.num_envs, device=self.device) - 0.5
+
+    def run_episode(self) -> None:
+        for value in self.values:
+            for op in ["sum", "mean", "max", "min", "ema"]:
+                self.logger.log("task_state", op, value)
+
+    def test_episode_logs(self):
+        self.run_episode()
+        episode_length = torch.full((self.num_envs,), len(self.values), device=self.device)
+        self.logger.reset(torch.arange(self.num_envs, device=self.device), episode_length)
+
+        ema = torch.zeros(self.num_envs, device=self.device)
+        for value in self.values:
+            ema = value * (1 - self.logger.ema_coeff) + ema * self.logger.ema_coeff
+        expected = {
+            "sum": self.values.sum(dim=0),
+            "mean": self.values.mean(dim=0),
+            "max": self.values.max(dim=0).values,
+            "min": self.values.min(dim=0).values,
+            "ema": ema,
+        }
+        logs = self.logger.get_episode_logs
+        for op, value in expected.items():
+            self.assertTrue(torch.allclose(logs["task_state"][op], value, atol=1e-6), op)
+        self.assertTrue(torch.all(logs["task_reward"]["never_logged_max"] == 0))
+
+    def test_reset_subset(self):
+        self.run_episode()
+        env_ids = torch.arange(0, self.num_envs, 2, device=self.device)
+        self.logger.reset(env_ids, torch.full((self.num_envs,), len(self.values), device=self.device))
+        step_logs = self.logger.get_step_logs["task_state"]
+        self.assertTrue(torch.all(step_logs["sum"][env_ids] == 0))
+        self.assertTrue(torch.all(step_logs["max"][env_ids] == -float("inf")))
+        self.assertTrue(torch.all(step_logs["min"][1::2] == self.values.min(dim=0).values[1::2]))
+        self.assertTrue(torch.all(self.logger.get_episode_logs["task_state"]["sum"][1::2] == 0))
+
+    def test_compute_extras(self):
+        self.run_episode()
+        self.logger.reset(
+            torch.arange(self.num_envs, device=self.device),
+            torch.full((self.num_envs,), len(self.values), device=self.device),
+        )
+        stacked = self.logger.compute_extras_tensor()
+        extras = self.logger.compute_extras()
+        self.assertEqual(stacked.shape, (6,))
+        self.assertEqual(list(extras.keys()), self.logger.logs_names)
+        self.assertIn("task_state/max", extras)
+        for i, key in enumerate(self.logger.logs_names):
+            self.assertEqual(extras[key], stacked[i])
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,264 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+config = {"headless": True}
+simulation_app = AppLauncher(config).app
+import math
+import torch
+import unittest
+
+from isaaclab.utils import math as math_utils
+
+from isaaclab_tasks.rans.tasks.look_ahead import EPS, GoalLookAhead, rotation_6d, wrap_angle
+
+NUM_ENVS = 512
+MAX_NUM_GOALS = 8
+DEVICE = "cuda"
+
+
+def reference_robot_frame_2d(positions, target_index, num_goals, robot_pos, heading, num_subsequent_goals, loop):
+    """The per-goal loop of the GoThroughPositions and RaceWaypoints observations."""
+    all_indices = torch.arange(positions.shape[0], device=positions.device)
+    obs = torch.zeros((positions.shape[0], 3 * num_subsequent_goals), device=positions.device)
+    error = positions[all_indices, target_index] - robot_pos
+    bearing = wrap_angle(torch.atan2(error[:, 1], error[:, 0]) - heading)
+    obs[:, 0] = torch.linalg.norm(error, dim=-1)
+    obs[:, 1] = torch.cos(bearing)
+    obs[:, 2] = torch.sin(bearing)
+    for i in range(num_subsequent_goals - 1):
+        overflowing = (target_index + i + 1) >= num_goals
+        indices = (target_index + i + 1) * torch.logical_not(overflowing)
+        goal_distance = torch.linalg.norm(robot_pos - positions[all_indices, indices], dim=-1)
+        error = positions[all_indices, indices] - robot_pos
+        bearing = wrap_angle(torch.atan2(error[:, 1], error[:, 0]) - heading)
+        if not loop:
+            goal_distance = goal_distance * torch.logical_not(overflowing)
+            bearing = bearing * torch.logical_not(overflowing)
+        obs[:, 3 + 3 * i] = goal_distance
+        obs[:, 4 + 3 * i] = torch.cos(bearing)
+        obs[:, 5 + 3 * i] = torch.sin(bearing)
+    return obs
+
+
+def reference_goal_frame_2d(
+    positions, headings, target_index, num_goals, robot_pos, heading, num_subsequent_goals, loop, wrap
+):
+    """The per-goal loop of the GoThroughPoses, RaceWayposes and RaceGates observations."""
+    all_indices = torch.arange(positions.shape[0], device=positions.device)
+    obs = torch.zeros((positions.shape[0], 5 * num_subsequent_goals), device=positions.device)
+    error = positions[all_indices, target_index] - robot_pos
+    bearing = wrap_angle(torch.atan2(error[:, 1], error[:, 0]) - heading)
+    heading_error = wrap_angle(headings[all_indices, target_index] - heading)
+    obs[:, 0] = torch.linalg.norm(error, dim=-1)
+    obs[:, 1] = torch.cos(bearing)
+    obs[:, 2] = torch.sin(bearing)
+    obs[:, 3] = torch.cos(heading_error)
+    obs[:, 4] = torch.sin(heading_error)
+    for i in range(num_subsequent_goals - 1):
+        overflowing = (target_index + i + 1) >= num_goals
+        if wrap:
+            indices = torch.remainder(target_index + i + 1, num_goals)
+        else:
+            indices = (target_index + i + 1) * torch.logical_not(overflowing)
+        goal_distance = torch.linalg.norm(positions[all_indices, indices - 1] - positions[all_indices, indices], dim=-1)
+        error = positions[all_indices, indices] - positions[all_indices, indices - 1]
+        bearing = wrap_angle(torch.atan2(error[:, 1], error[:, 0]) - headings[all_indices, indices - 1])
+        heading_error = wrap_angle(headings[all_indices, indices] - headings[all_indices, indices - 1])
+        if not loop:
+            goal_distance = goal_distance * torch.logical_not(overflowing)
+            bearing = bearing * torch.logical_not(overflowing)
+        obs[:, 5 + 5 * i] = goal_distance
+        obs[:, 6 + 5 * i] = torch.cos(bearing)
+        obs[:, 7 + 5 * i] = torch.sin(bearing)
+        obs[:, 8 + 5 * i] = torch.cos(heading_error)
+        obs[:, 9 + 5 * i] = torch.sin(heading_error)
+    return obs
+
+
+def reference_next_indices(target_index, num_goals, i, loop):
+    next_indices = torch.where(
+        (target_index + i + 1) >= num_goals, torch.zeros_like(target_index), target_index + i + 1
+    )
+    if loop:
+        next_indices = (target_index + i + 1) % num_goals
+    return next_indices
+
+
+def reference_robot_frame_3d(positions, target_index, num_goals, robot_pos, robot_quat, num_subsequent_goals, loop):
+    """The per-goal loop of the GoThroughPositions3D observations."""
+    all_indices = torch.arange(positions.shape[0], device=positions.device)
+    obs = torch.zeros((positions.shape[0], 3 * num_subsequent_goals), device=positions.device)
+    error = positions[all_indices, target_index] - robot_pos
+    obs[:, 0:3] = math_utils.quat_rotate_inverse(robot_quat, error)
+    for i in range(num_subsequent_goals - 1):
+        next_indices = reference_next_indices(target_index, num_goals, i, loop)
+        local_error = math_utils.quat_rotate_inverse(robot_quat, positions[all_indices, next_indices] - robot_pos)
+        if not loop:
+            local_error = local_error * ((target_index + i + 1) < num_goals).unsqueeze(-1)
+        obs[:, 3 + 3 * i : 6 + 3 * i] = local_error
+    return obs
+
+
+def reference_goal_frame_3d(positions, orientations, target_index, num_goals, robot_quat, num_subsequent_goals, loop):
+    """The per-goal loop of the GoThroughPoses3D observations."""
+    all_indices = torch.arange(positions.shape[0], device=positions.device)
+    obs = torch.zeros((positions.shape[0], 9 * (num_subsequent_goals - 1)), device=positions.device)
+    target_quat = torch.nn.functional.normalize(orientations[all_indices, target_index], dim=-1, eps=EPS)
+    for i in range(num_subsequent_goals - 1):
+        next_indices = reference_next_indices(target_index, num_goals, i, loop)
+        error = positions[all_indices, next_indices] - positions[all_indices, target_index]
+        local_error = math_utils.quat_rotate_inverse(robot_quat, error)
+        rel_quat = math_utils.quat_mul(math_utils.quat_conjugate(target_quat), orientations[all_indices, next_indices])
+        rel_mat = math_utils.matrix_from_quat(rel_quat)
+        col0 = torch.nn.functional.normalize(rel_mat[:, :, 0], dim=-1, eps=EPS)
+        col1 = rel_mat[:, :, 1]
+        col1 = torch.nn.functional.normalize(col1 - (col1 * col0).sum(dim=-1, keepdim=True) * col0, dim=-1, eps=EPS)
+        rel_mat_6 = torch.cat([col0, col1], dim=-1)
+        if not loop:
+            valid = ((target_index + i + 1) < num_goals).unsqueeze(-1)
+            local_error = local_error * valid
+            rel_mat_6 = rel_mat_6 * valid
+        obs[:, 9 * i : 9 * i + 3] = local_error
+        obs[:, 9 * i + 3 : 9 * i + 9] = rel_mat_6
+    return obs
+
+
+class TestGoalLookAhead(unittest.TestCase):
+    def setUp(self):
+        torch.manual_seed(0)
+        self.num_goals = torch.randint(1, MAX_NUM_GOALS + 1, (NUM_ENVS,), device=DEVICE)
+        self.target_index = (torch.rand(NUM_ENVS, device=DEVICE) * self.num_goals).long()
+        self.positions_2d = torch.rand((NUM_ENVS, MAX_NUM_GOALS, 2), device=DEVICE) * 20 - 10
+        self.headings = torch.rand((NUM_ENVS, MAX_NUM_GOALS), device=DEVICE) * 2 * math.pi - math.pi
+        self.positions_3d = torch.rand((NUM_ENVS, MAX_NUM_GOALS, 3), device=DEVICE) * 20 - 10
+        self.orientations = math_utils.random_orientation(NUM_ENVS * MAX_NUM_GOALS, DEVICE).view(NUM_ENVS, -1, 4)
+        self.robot_pos = torch.rand((NUM_ENVS, 3), device=DEVICE) * 20 - 10
+        self.robot_heading = torch.rand(NUM_ENVS, device=DEVICE) * 2 * math.pi - math.pi
+        self.robot_quat = math_utils.random_orientation(NUM_ENVS, DEVICE)
+
+    def cases(self):
+        for num_subsequent_goals in [1, 2, 4, MAX_NUM_GOALS + 2]:
+            for loop in [False, True]:
+                with self.subTest(num_subsequent_goals=num_subsequent_goals, loop=loop):
+                    yield num_subsequent_goals, loop
+
+    def test_indices(self):
+        look_ahead = GoalLookAhead(4, DEVICE, wrap=True)
+        indices, valid = look_ahead.indices(self.target_index, self.num_goals)
+        self.assertEqual(indices.shape, (NUM_ENVS, 4))
+        self.assertTrue(torch.equal(indices[:, 0], self.target_index))
+        self.assertTrue(torch.all(valid[:, 0]))
+        self.assertTrue(torch.all(indices[:, 1:] < self.num_goals.unsqueeze(-1)))
+
+    def test_robot_frame_2d(self):
+        for num_subsequent_goals, loop in self.cases():
+            look_ahead = GoalLookAhead(num_subsequent_goals, DEVICE)
+            obs = torch.zeros((NUM_ENVS, 3 * num_subsequent_goals), device=DEVICE)
+            position_error, position_dist = look_ahead.robot_frame_2d(
+                obs.unflatten(1, (-1, 3)),
+                self.positions_2d,
+                self.target_index,
+                self.num_goals,
+                self.robot_pos[:, :2],
+                self.robot_heading,
+                mask_overflow=not loop,
+            )
+            expected = reference_robot_frame_2d(
+                self.positions_2d,
+                self.target_index,
+                self.num_goals,
+                self.robot_pos[:, :2],
+                self.robot_heading,
+                num_subsequent_goals,
+                loop,
+            )
+            torch.testing.assert_close(obs, expected)
+            torch.testing.assert_close(position_dist, expected[:, 0])
+            torch.testing.assert_close(
+                position_error,
+                self.positions_2d[torch.arange(NUM_ENVS, device=DEVICE), self.target_index] - self.robot_pos[:, :2],
+            )
+
+    def test_goal_frame_2d(self):
+        for num_subsequent_goals, loop in self.cases():
+            for wrap in [False, True]:
+                look_ahead = GoalLookAhead(num_subsequent_goals, DEVICE, wrap=wrap)
+                obs = torch.zeros((NUM_ENVS, 5 * num_subsequent_goals), device=DEVICE)
+                _, position_dist = look_ahead.goal_frame_2d(
+                    obs.unflatten(1, (-1, 5)),
+                    self.positions_2d,
+                    self.headings,
+                    self.target_index,
+                    self.num_goals,
+                    self.robot_pos[:, :2],
+                    self.robot_heading,
+                    mask_overflow=not loop,
+                )
+                expected = reference_goal_frame_2d(
+                    self.positions_2d,
+                    self.headings,
+                    self.target_index,
+                    self.num_goals,
+                    self.robot_pos[:, :2],
+                    self.robot_heading,
+                    num_subsequent_goals,
+                    loop,
+                    wrap,
+                )
+                torch.testing.assert_close(obs, expected)
+                torch.testing.assert_close(position_dist, expected[:, 0])
+
+    def test_robot_frame_3d(self):
+        for num_subsequent_goals, loop in self.cases():
+            look_ahead = GoalLookAhead(num_subsequent_goals, DEVICE, wrap=loop)
+            _, local_errors = look_ahead.robot_frame_3d(
+                self.positions_3d, self.target_index, self.num_goals, self.robot_pos, self.robot_quat, not loop
+            )
+            expected = reference_robot_frame_3d(
+                self.positions_3d,
+                self.target_index,
+                self.num_goals,
+                self.robot_pos,
+                self.robot_quat,
+                num_subsequent_goals,
+                loop,
+            )
+            torch.testing.assert_close(local_errors.flatten(1), expected)
+
+    def test_goal_frame_3d(self):
+        for num_subsequent_goals, loop in self.cases():
+            look_ahead = GoalLookAhead(num_subsequent_goals, DEVICE, wrap=loop)
+            obs = torch.zeros((NUM_ENVS, 9 * look_ahead.num_look_ahead), device=DEVICE)
+            look_ahead.goal_frame_3d(
+                obs.unflatten(1, (look_ahead.num_look_ahead, 9)),
+                self.positions_3d,
+                self.orientations,
+                self.target_index,
+                self.num_goals,
+                self.robot_quat,
+                mask_overflow=not loop,
+            )
+            expected = reference_goal_frame_3d(
+                self.positions_3d,
+                self.orientations,
+                self.target_index,
+                self.num_goals,
+                self.robot_quat,
+                num_subsequent_goals,
+                loop,
+            )
+            torch.testing.assert_close(obs, expected)
+
+    def test_rotation_6d_is_orthonormal(self):
+        rot6 = rotation_6d(self.robot_quat).view(-1, 2, 3)
+        gram = torch.bmm(rot6, rot6.transpose(1, 2))
+        torch.testing.assert_close(gram, torch.eye(2, device=DEVICE).expand_as(gram))
+
+
+if __name__ == "__main__":
+    run_tests()
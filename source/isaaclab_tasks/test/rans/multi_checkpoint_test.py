@@ -0,0 +1,98 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+config = {"headless": True}
+simulation_app = AppLauncher(config).app
+import numpy as np
+import os
+import tempfile
+import torch
+import unittest
+from pathlib import Path
+
+from isaaclab_tasks.rans.environments.single.kinematic_env_single import KinematicSingleEnv, KinematicSingleEnvCfg
+from isaaclab_tasks.rans.utils.multi_checkpoint import (
+    act_partitioned,
+    partition_envs,
+    reseed_env,
+    resolve_checkpoints,
+    split_episode_data,
+)
+
+
+class TestMultiCheckpoint(unittest.TestCase):
+    def test_partition_envs(self):
+        for num_envs, num_policies in [(16, 1), (16, 4), (10, 3), (5, 5)]:
+            env_slices = partition_envs(num_envs, num_policies)
+            self.assertEqual(len(env_slices), num_policies)
+            sizes = [env_slice.stop - env_slice.start for env_slice in env_slices]
+            self.assertEqual(sum(sizes), num_envs)
+            self.assertLessEqual(max(sizes) - min(sizes), 1)
+            self.assertEqual(env_slices[0].start, 0)
+            for previous, current in zip(env_slices[:-1], env_slices[1:]):
+                self.assertEqual(previous.stop, current.start)
+        with self.assertRaises(AssertionError):
+            partition_envs(2, 3)
+
+    def test_act_partitioned(self):
+        obs = torch.rand(10, 4, device="cuda")
+        weights = [torch.rand(4, 2, device="cuda") for _ in range(3)]
+        policies = [lambda obs, weight=weight: obs @ weight for weight in weights]
+        env_slices = partition_envs(10, 3)
+        actions = act_partitioned(policies, obs, env_slices)
+        self.assertEqual(actions.shape, (10, 2))
+        for weight, env_slice in zip(weights, env_slices):
+            torch.testing.assert_close(actions[env_slice], obs[env_slice] @ weight)
+
+    def test_split_episode_data(self):
+        ep_data = {"obs": np.random.rand(7, 10, 3), "rews": np.random.rand(7, 10)}
+        env_slices = partition_envs(10, 3)
+        splits = split_episode_data(ep_data, env_slices)
+        self.assertEqual(len(splits), 3)
+        for split, env_slice in zip(splits, env_slices):
+            for name, value in ep_data.items():
+                np.testing.assert_array_equal(split[name], value[:, env_slice])
+                # the arrays are views, nothing is copied
+                self.assertTrue(np.shares_memory(split[name], value))
+
+    def test_resolve_checkpoints(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for run in [1, 2, 10]:
+                os.makedirs(os.path.join(tmp_dir, f"run_{run}"))
+                Path(tmp_dir, f"run_{run}", "agent.pt").touch()
+            checkpoints = resolve_checkpoints([os.path.join(tmp_dir, "run_*", "agent.pt")])
+            self.assertEqual(checkpoints, [os.path.join(tmp_dir, f"run_{run}", "agent.pt") for run in [1, 2, 10]])
+            # the duplicates are dropped, the order of the patterns is kept
+            checkpoints = resolve_checkpoints(
+                [os.path.join(tmp_dir, "run_10", "agent.pt"), os.path.join(tmp_dir, "run_*", "agent.pt")]
+            )
+            self.assertEqual(checkpoints, [os.path.join(tmp_dir, f"run_{run}", "agent.pt") for run in [10, 1, 2]])
+            with self.assertRaises(FileNotFoundError):
+                resolve_checkpoints([os.path.join(tmp_dir, "missing_*.pt")])
+
+    def test_sequential_evaluations_start_from_the_same_state(self):
+        cfg = KinematicSingleEnvCfg(robot_name="Jetbot", task_name="GoToPosition", num_envs=16, device="cuda")
+        env = KinematicSingleEnv(cfg)
+        env.reset()
+        initial_states, final_states = [], []
+        # two checkpoints evaluated back to back, each one drives the robots differently
+        for policy in [lambda obs: torch.ones((obs.shape[0], 2), device="cuda"), lambda obs: -obs[:, :2]]:
+            reseed_env(env, 0)
+            obs, _ = env.reset()
+            initial_states.append((obs["policy"].clone(), env.robot.data.root_state_w.clone()))
+            self.assertTrue(torch.all(env.episode_length_buf == 0))
+            for _ in range(10):
+                obs, _, _, _, _ = env.step(policy(obs["policy"]))
+            final_states.append(env.robot.data.root_state_w.clone())
+        self.assertFalse(torch.equal(final_states[0], final_states[1]))
+        torch.testing.assert_close(initial_states[0][0], initial_states[1][0])
+        torch.testing.assert_close(initial_states[0][1], initial_states[1][1])
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,77 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+config = {"headless": True}
+simulation_app = AppLauncher(config).app
+import torch
+import unittest
+
+from isaaclab_tasks.rans.domain_randomization import (
+    NoiseBank,
+    NoisyObservations,
+    NoisyObservationsCfg,
+    RandomizationPipeline,
+)
+from isaaclab_tasks.rans.utils import PerEnvSeededRNG
+
+
+class TestNoiseBank(unittest.TestCase):
+    def setUp(self):
+        self.device = "cuda"
+        self.num_envs = 8
+        self.dim = 3
+        self.env_ids = torch.arange(self.num_envs, device=self.device)
+
+    def make_rng(self):
+        rng = PerEnvSeededRNG(0, self.num_envs, self.device)
+        rng.set_seeds(torch.arange(self.num_envs, dtype=torch.int32, device=self.device), self.env_ids)
+        return rng
+
+    def test_noise_is_independent_of_the_reset_step(self):
+        first = NoiseBank(self.make_rng(), "normal", 5, self.dim, self.num_envs, self.device)
+        second = NoiseBank(self.make_rng(), "normal", 5, self.dim, self.num_envs, self.device)
+        first.fill(self.env_ids)
+        # The second bank is reset in the middle of its ring buffer
+        for _ in range(3):
+            second.next()
+        second.fill(self.env_ids)
+        for _ in range(7):
+            self.assertTrue(torch.equal(first.next(), second.next()))
+
+    def test_partial_reset(self):
+        bank = NoiseBank(self.make_rng(), "uniform", 4, self.dim, self.num_envs, self.device)
+        bank.fill(self.env_ids)
+        bank.next()
+        before = bank._bank.clone()
+        bank.fill(torch.tensor([2], device=self.device))
+        changed = (bank._bank != before).flatten(1).any(dim=1)
+        self.assertEqual(changed.nonzero().squeeze(-1).tolist(), [2])
+        self.assertTrue(torch.all(bank._bank.abs() <= 1.0))
+
+    def test_pipeline_uses_the_bank(self):
+        cfg = NoisyObservationsCfg(
+            enable=True, randomization_modes=["uniform"], slices=[(1, 3)], max_delta=[0.1], noise_bank_size=4
+        )
+        randomizer = NoisyObservations(cfg, self.make_rng(), None, self.num_envs, self.device)
+        randomizer.setup()
+        pipeline = RandomizationPipeline([randomizer], dims={"observations": 5})
+        pipeline.reset(self.env_ids)
+        noises = []
+        for _ in range(8):
+            observations = torch.zeros((self.num_envs, 5), device=self.device)
+            pipeline.observations(observations=observations)
+            noises.append(observations)
+        self.assertEqual((noises[0] != 0).any(0).tolist(), [False, True, True, False, False])
+        self.assertTrue(torch.all(noises[0].abs() <= 0.1 + 1e-6))
+        # The noise repeats itself with the period of the bank
+        self.assertFalse(torch.equal(noises[0], noises[1]))
+        self.assertTrue(torch.equal(noises[0], noises[4]))
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,98 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+config = {"headless": True}
+simulation_app = AppLauncher(config).app
+import numpy as np
+import os
+import tempfile
+import torch
+import unittest
+
+from isaaclab_tasks.rans.utils.performance_evaluator_v2 import (
+    PerformanceEvaluatorV2,
+    load_timeseries_metrics,
+    track_ordered_goals,
+)
+
+
+def reference_go_through_positions(obs: np.ndarray, threshold: float, max_horizon: int) -> dict[str, np.ndarray]:
+    """Step-by-step implementation of the ordered goal tracking, used as a regression fixture."""
+
+    T, N, D = obs.shape
+    num_goals = (D - 6) // 3
+    goal_idx = np.zeros(N, dtype=int)
+    for t in range(T):
+        for n in range(N):
+            g = goal_idx[n]
+            if g < num_goals and obs[t, n, 6 + g * 3] < threshold:
+                goal_idx[n] += 1
+    final_d = np.array([obs[-1, n, 6 + min(goal_idx[n], num_goals - 1) * 3] for n in range(N)])
+    reach_mask = np.zeros((T, N), dtype=bool)
+    for t in range(T):
+        for n in range(N):
+            g = goal_idx[n]
+            if g < num_goals:
+                reach_mask[t, n] = obs[t, n, 6 + g * 3] < threshold
+    times = np.where(reach_mask.any(axis=0), reach_mask.argmax(axis=0), max_horizon)
+    return {"goals_reached": goal_idx, "final_distance": final_d, "time_to_target": times}
+
+
+class TestPerformanceEvaluatorV2(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.T, self.N, self.num_goals = 60, 64, 5
+        self.obs = rng.uniform(0.0, 1.5, size=(self.T, self.N, 6 + 3 * self.num_goals)).astype(np.float32)
+        # Goals are reached at random times: some environments reach all of them, others only a few
+        self.obs[:, :, 6::3] = rng.uniform(0.0, 6.0, size=(self.T, self.N, self.num_goals)) ** 2
+
+    def test_track_ordered_goals_numpy(self):
+        expected = reference_go_through_positions(self.obs, PerformanceEvaluatorV2.THRESH_DIST, self.T)
+        output = track_ordered_goals(self.obs, PerformanceEvaluatorV2.THRESH_DIST, self.T)
+        self.assertGreater(len(np.unique(expected["goals_reached"])), 2)
+        for key, value in expected.items():
+            self.assertTrue(np.array_equal(output[key], value), key)
+
+    def test_track_ordered_goals_torch(self):
+        expected = reference_go_through_positions(self.obs, PerformanceEvaluatorV2.THRESH_DIST, self.T)
+        output = track_ordered_goals(torch.from_numpy(self.obs).to("cuda"), PerformanceEvaluatorV2.THRESH_DIST, self.T)
+        for key, value in expected.items():
+            self.assertTrue(np.array_equal(output[key].cpu().numpy(), value), key)
+
+    def test_evaluate(self):
+        data = {"obs": self.obs, "act": np.zeros((self.T, self.N, 2), dtype=np.float32)}
+        evaluator = PerformanceEvaluatorV2("GoThroughPositions", "Robot", "skrl", data, self.T, "test")
+        metrics = evaluator.evaluate()
+        expected = reference_go_through_positions(self.obs, PerformanceEvaluatorV2.THRESH_DIST, self.T)
+        self.assertAlmostEqual(metrics["num_goals_reached"], np.mean(expected["goals_reached"]))
+        self.assertAlmostEqual(metrics["final_distance_error"], np.mean(expected["final_distance"]), places=5)
+        self.assertAlmostEqual(metrics["avg_time_to_target"], np.mean(expected["time_to_target"]))
+
+    def test_timeseries_round_trip(self):
+        data = {"obs": self.obs, "act": np.zeros((self.T, self.N, 2), dtype=np.float32)}
+        evaluator = PerformanceEvaluatorV2("GoThroughPositions", "Robot", "skrl", data, self.T, "test")
+        metrics = evaluator.timeseries_metrics()
+        self.assertEqual(set(metrics.keys()), {"distance_error", "cumulative_goals"})
+        self.assertTrue(np.array_equal(metrics["cumulative_goals"][-1], np.sum(self.obs[:, :, 3] < 0.2, axis=0)))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = evaluator.export_timeseries_metrics(os.path.join(tmp_dir, "timeseries"), time_stride=2)
+            wide = load_timeseries_metrics(str(path), metrics=["cumulative_goals"])
+            self.assertNotIn("distance_error", wide)
+            self.assertTrue(np.array_equal(wide["cumulative_goals"], metrics["cumulative_goals"][::2]))
+            self.assertEqual(str(wide["task"]), "GoThroughPositions")
+
+            path = evaluator.export_timeseries_metrics(
+                os.path.join(tmp_dir, "timeseries"), file_format="parquet", chunk_size=16
+            )
+            long = load_timeseries_metrics(str(path), metrics=["distance_error"], env_ids=[3])
+            self.assertEqual(len(long), self.T)
+            self.assertTrue(np.array_equal(long["value"].to_numpy(), metrics["distance_error"][:, 3]))
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,94 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+config = {"headless": True}
+simulation_app = AppLauncher(config).app
+import torch
+import unittest
+
+from isaaclab_tasks.rans.domain_randomization import PhysxPropertyWriter
+from isaaclab_tasks.rans.robots.kinematic_backend import KinematicPhysxView
+
+
+class Asset:
+    def __init__(self, num_envs: int):
+        self.root_physx_view = KinematicPhysxView(num_envs, 2, 1.0, (0.1, 0.1, 0.1))
+
+
+class TestPhysxPropertyWriter(unittest.TestCase):
+    def setUp(self):
+        self.device = "cuda"
+        self.num_envs = 32
+        self.asset = Asset(self.num_envs)
+        self.view = self.asset.root_physx_view
+        self.writer = PhysxPropertyWriter.get(self.asset, self.num_envs, self.device)
+        self.masses = self.writer.read("masses")
+        self.coms = self.writer.read("coms")
+        self.writer.register("masses", self.masses)
+        self.writer.register("coms", self.coms, write_interval=3)
+
+    def test_shared_writer(self):
+        self.assertIs(PhysxPropertyWriter.get(self.asset, self.num_envs, self.device), self.writer)
+
+    def test_only_dirty_rows_are_written(self):
+        env_ids = torch.tensor([1, 5], device=self.device)
+        self.masses[:, 0] = 2.0
+        self.writer.mark_dirty("masses", env_ids)
+        # Nothing is written before the flush
+        self.assertEqual(self.view.version, 0)
+        self.writer.flush()
+        self.assertEqual(self.view.version, 1)
+        written = self.view.get_masses()[:, 0]
+        self.assertTrue(torch.all(written[[1, 5]] == 2.0))
+        self.assertEqual((written == 2.0).sum().item(), 2)
+        # Clean writers do not write
+        self.writer.flush()
+        self.assertEqual(self.view.version, 1)
+
+    def test_properties_are_merged(self):
+        self.masses[2, 1] = 3.0
+        self.coms[4, 1, 0] = 0.5
+        self.writer.mark_dirty("masses", torch.tensor([2], device=self.device))
+        self.writer.mark_dirty("coms", torch.tensor([4], device=self.device))
+        self.writer.flush()
+        self.assertEqual(self.view.version, 2)
+        self.assertEqual(self.view.get_masses()[2, 1].item(), 3.0)
+        self.assertEqual(self.view.get_coms()[4, 1, 0].item(), 0.5)
+
+    def test_write_interval(self):
+        versions = []
+        for _ in range(6):
+            self.coms[:, 0, 0] += 0.1
+            self.writer.mark_dirty("coms")
+            self.writer.flush()
+            versions.append(self.view.version)
+        # The continuous changes of the CoM are written every 3 flushes
+        self.assertEqual(versions, [1, 1, 1, 2, 2, 2])
+        # The changes made at reset are not delayed
+        self.writer.mark_dirty("coms", torch.tensor([0], device=self.device))
+        self.writer.flush()
+        self.assertEqual(self.view.version, 3)
+        self.assertTrue(torch.allclose(self.view.get_coms()[0, 0, 0], self.coms[0, 0, 0].cpu()))
+
+    def test_reset_flush(self):
+        self.coms[:, 0, 0] += 0.1
+        self.writer.mark_dirty("coms")
+        self.masses[3, 0] = 2.0
+        self.writer.mark_dirty("masses", torch.tensor([3], device=self.device))
+        # The flush of a reset writes the changes made at reset, the continuous changes wait for the next step
+        self.writer.flush(step=False)
+        self.assertEqual(self.view.version, 1)
+        self.assertEqual(self.view.get_masses()[3, 0].item(), 2.0)
+        self.assertFalse(torch.allclose(self.view.get_coms()[:, 0, 0], self.coms[:, 0, 0].cpu()))
+        self.writer.flush()
+        self.assertEqual(self.view.version, 2)
+        self.assertTrue(torch.allclose(self.view.get_coms()[:, 0, 0], self.coms[:, 0, 0].cpu()))
+
+
+if __name__ == "__main__":
+    run_tests()
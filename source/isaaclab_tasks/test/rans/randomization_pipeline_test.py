@@ -0,0 +1,143 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+config = {"headless": True}
+simulation_app = AppLauncher(config).app
+import torch
+import unittest
+
+from isaaclab_tasks.rans import ROBOT_CFG_FACTORY
+from isaaclab_tasks.rans.domain_randomization import (
+    ActionsRescaler,
+    ActionsRescalerCfg,
+    MassRandomization,
+    MassRandomizationCfg,
+    NoisyActions,
+    NoisyActionsCfg,
+    NoisyObservations,
+    NoisyObservationsCfg,
+    RandomizationPipeline,
+)
+from isaaclab_tasks.rans.environments.single.kinematic_env_single import KinematicScene
+from isaaclab_tasks.rans.robots.kinematic_backend import KINEMATIC_MODEL_FACTORY, KinematicRobotBackend
+from isaaclab_tasks.rans.utils import PerEnvSeededRNG
+
+
+class TestRandomizationPipeline(unittest.TestCase):
+    def setUp(self):
+        self.device = "cuda"
+        self.num_envs = 64
+        self.dim = 4
+        self.env_ids = torch.arange(self.num_envs, device=self.device)
+
+    def make(self, cls, cfg):
+        rng = PerEnvSeededRNG(0, self.num_envs, self.device)
+        rng.set_seeds(torch.arange(self.num_envs, dtype=torch.int32, device=self.device), self.env_ids)
+        randomizer = cls(cfg, rng, None, self.num_envs, self.device)
+        randomizer.setup()
+        return randomizer
+
+    def make_rescaler(self):
+        cfg = ActionsRescalerCfg(
+            enable=True,
+            randomization_modes=["uniform"],
+            slices=[0, (2, 4)],
+            rescaling_ranges=[(0.5, 1.0), (0.2, 0.9)],
+            clip_actions=[(-0.5, 0.5), (-0.3, 0.3)],
+        )
+        return self.make(ActionsRescaler, cfg)
+
+    def make_noisy_actions(self):
+        cfg = NoisyActionsCfg(
+            enable=True,
+            randomization_modes=["uniform"],
+            slices=[0, (2, 4)],
+            max_delta=[0.1, 0.2],
+            clip_actions=[(-1.0, 1.0), (-0.5, 0.5)],
+        )
+        return self.make(NoisyActions, cfg)
+
+    def test_disabled_randomizers_are_removed(self):
+        disabled = self.make(NoisyActions, NoisyActionsCfg(enable=False))
+        pipeline = RandomizationPipeline([disabled, disabled], dims={"actions": self.dim})
+        for phase in RandomizationPipeline.PHASES:
+            self.assertEqual(pipeline.num_hooks(phase), 0)
+
+    def test_elementwise_stages_are_fused(self):
+        pipeline = RandomizationPipeline([self.make_noisy_actions(), self.make_rescaler()], dims={"actions": self.dim})
+        self.assertEqual(pipeline.num_hooks("actions"), 1)
+        self.assertEqual(pipeline.num_hooks("update"), 0)
+        self.assertEqual(pipeline.num_hooks("reset"), 4)
+
+    def test_rescaler_matches_legacy(self):
+        legacy, fused = self.make_rescaler(), self.make_rescaler()
+        legacy.reset(self.env_ids)
+        pipeline = RandomizationPipeline([fused], dims={"actions": self.dim})
+        pipeline.reset(self.env_ids)
+        actions = torch.rand((self.num_envs, self.dim), device=self.device) * 2 - 1
+        legacy_actions, fused_actions = actions.clone(), actions.clone()
+        legacy.actions(actions=legacy_actions)
+        pipeline.actions(actions=fused_actions)
+        self.assertTrue(torch.allclose(legacy_actions, fused_actions))
+
+    def test_noise_is_bounded_and_clipped(self):
+        pipeline = RandomizationPipeline([self.make_noisy_actions()], dims={"actions": self.dim})
+        pipeline.reset(self.env_ids)
+        actions = torch.rand((self.num_envs, self.dim), device=self.device) * 2 - 1
+        noisy_actions = actions.clone()
+        pipeline.actions(actions=noisy_actions)
+        # The column outside of the slices is untouched
+        self.assertTrue(torch.equal(noisy_actions[:, 1], actions[:, 1]))
+        self.assertTrue(torch.all((noisy_actions[:, 0] - actions[:, 0]).abs() <= 0.1 + 1e-6))
+        self.assertTrue(torch.all(noisy_actions[:, 2:].abs() <= 0.5 + 1e-6))
+
+    def test_observation_noise(self):
+        cfg = NoisyObservationsCfg(enable=True, randomization_modes=["normal"], slices=[(1, 3)], std=[0.05])
+        pipeline = RandomizationPipeline([self.make(NoisyObservations, cfg)], dims={"observations": 5})
+        pipeline.reset(self.env_ids)
+        observations = torch.zeros((self.num_envs, 5), device=self.device)
+        pipeline.observations(observations=observations)
+        self.assertEqual((observations != 0).any(0).tolist(), [False, True, True, False, False])
+
+    def test_eager_matches_compiled(self):
+        randomizers = [self.make_rescaler()]
+        compiled = RandomizationPipeline(randomizers, dims={"actions": self.dim})
+        eager = RandomizationPipeline(randomizers, dims={"actions": self.dim}, compile=False)
+        compiled.reset(self.env_ids)
+        actions = torch.rand((self.num_envs, self.dim), device=self.device) * 2 - 1
+        compiled_actions, eager_actions = actions.clone(), actions.clone()
+        compiled.actions(actions=compiled_actions)
+        eager.actions(actions=eager_actions)
+        self.assertTrue(torch.allclose(compiled_actions, eager_actions))
+
+    def test_properties_are_written_at_reset(self):
+        robot_cfg = ROBOT_CFG_FACTORY("FloatingPlatform")
+        scene = KinematicScene(self.num_envs, 5.0, 1.0, self.device)
+        scene.articulations["robot"] = KinematicRobotBackend(
+            KINEMATIC_MODEL_FACTORY("FloatingPlatform", robot_cfg=robot_cfg),
+            init_state=robot_cfg.robot_cfg.init_state,
+            num_envs=self.num_envs,
+            device=self.device,
+        )
+        cfg = MassRandomizationCfg(
+            enable=True, randomization_modes=["uniform"], body_name="Cylinder", max_delta=0.5, min_mass=0.0
+        )
+        rng = PerEnvSeededRNG(0, self.num_envs, self.device)
+        rng.set_seeds(torch.arange(self.num_envs, dtype=torch.int32, device=self.device), self.env_ids)
+        randomizer = MassRandomization(cfg, rng, scene, "robot", self.num_envs, self.device)
+        randomizer.setup()
+        # Like the tasks, the pipeline is only reset and never goes through the 'actions' phase
+        pipeline = RandomizationPipeline([randomizer])
+        pipeline.reset(self.env_ids)
+        view = scene["robot"].root_physx_view
+        self.assertEqual(view.version, 1)
+        self.assertTrue(torch.equal(view.get_masses(), randomizer._current_mass.cpu()))
+
+
+if __name__ == "__main__":
+    run_tests()
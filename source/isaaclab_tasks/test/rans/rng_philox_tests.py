@@ -0,0 +1,250 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+config = {"headless": True}
+simulation_app = AppLauncher(config).app
+import math
+import subprocess
+import sys
+import textwrap
+import torch
+import unittest
+
+from isaaclab_tasks.rans import ROBOT_CFG_FACTORY, ROBOT_FACTORY, TASK_CFG_FACTORY, TASK_FACTORY
+from isaaclab_tasks.rans.environments.single.kinematic_env_single import KinematicScene
+from isaaclab_tasks.rans.utils import RNG_FACTORY, PerEnvSeededRNG, PhiloxPerEnvSeededRNG
+from isaaclab_tasks.rans.utils.rng_philox import philox4x32
+
+DEVICES = ["cpu", "cuda"] if torch.cuda.is_available() else ["cpu"]
+
+# Creates a philox generator through the factory in a fresh interpreter and reports whether the warp generator was
+# imported.
+FACTORY_SCRIPT = textwrap.dedent("""
+    import sys
+
+    from isaaclab_tasks.rans.utils import RNG_FACTORY
+
+    rng = RNG_FACTORY("philox", seeds=42, num_envs=10, device="cpu")
+    rng.sample_uniform_torch(0.0, 1.0, 1)
+    print("isaaclab_tasks.rans.utils.rng_utils" in sys.modules)
+""")
+
+
+def make_rng(device: str, num_envs: int = 4096) -> PhiloxPerEnvSeededRNG:
+    rng = PerEnvSeededRNG(42, num_envs, device, backend="philox")
+    rng.set_seeds(
+        torch.arange(num_envs, dtype=torch.int32, device=device),
+        torch.arange(num_envs, dtype=torch.int32, device=device),
+    )
+    return rng
+
+
+class TestPhiloxRandomNumberGenerator(unittest.TestCase):
+    def __init__(self, methodName="runTest"):
+        super().__init__(methodName)
+
+    ############################################################
+    # Test Generator
+    ############################################################
+
+    def test_backend_selection(self):
+        self.assertIsInstance(PerEnvSeededRNG(42, 10, "cpu", backend="philox"), PhiloxPerEnvSeededRNG)
+        self.assertIsInstance(PerEnvSeededRNG(42, 10, "cpu"), PerEnvSeededRNG)
+        with self.assertRaises(ValueError):
+            PerEnvSeededRNG(42, 10, "cpu", backend="unknown")
+
+    def test_factory(self):
+        self.assertIsInstance(RNG_FACTORY("philox", seeds=42, num_envs=10, device="cpu"), PhiloxPerEnvSeededRNG)
+        self.assertIsInstance(RNG_FACTORY("warp", seeds=42, num_envs=10, device="cpu"), PerEnvSeededRNG)
+
+    def test_factory_does_not_import_warp(self):
+        result = subprocess.run([sys.executable, "-c", FACTORY_SCRIPT], capture_output=True, text=True, timeout=600)
+        self.assertEqual(result.returncode, 0, result.stderr[-5000:])
+        self.assertEqual(result.stdout.strip().splitlines()[-1], "False")
+
+    def test_backend_from_cfg(self):
+        robot_cfg = ROBOT_CFG_FACTORY("Jetbot")
+        task_cfg = TASK_CFG_FACTORY("GoToPosition")
+        robot_cfg.rng_backend = "philox"
+        task_cfg.rng_backend = "philox"
+        scene = KinematicScene(16, 5.0, 1.0 / 60.0, "cuda")
+        robot = ROBOT_FACTORY("Jetbot", scene=scene, robot_cfg=robot_cfg, num_envs=16, device="cuda")
+        task = TASK_FACTORY("GoToPosition", scene=scene, task_cfg=task_cfg, num_envs=16, device="cuda")
+        self.assertIsInstance(robot._rng, PhiloxPerEnvSeededRNG)
+        self.assertIsInstance(task._rng, PhiloxPerEnvSeededRNG)
+
+    def test_known_answers(self):
+        # Known answer tests from the Random123 library
+        for device in DEVICES:
+            zero = torch.zeros(1, dtype=torch.int64, device=device)
+            output = philox4x32(zero, zero, zero, zero, zero, zero)
+            self.assertEqual([int(x) for x in output], [0x6627E8D5, 0xE169C58D, 0xBC57AC4C, 0x9B00DBD8])
+            ones = torch.full((1,), 0xFFFFFFFF, dtype=torch.int64, device=device)
+            output = philox4x32(ones, ones, ones, ones, ones, ones)
+            self.assertEqual([int(x) for x in output], [0x408F276D, 0x41C83B0E, 0xA20BC7C6, 0x6D5451FD])
+
+    ############################################################
+    # Test Determinism
+    ############################################################
+
+    def test_reproducibility(self):
+        for device in DEVICES:
+            rng_1 = make_rng(device)
+            rng_2 = make_rng(device)
+            for _ in range(10):
+                self.assertTrue(
+                    torch.equal(rng_1.sample_uniform_torch(0, 1, (10, 5)), rng_2.sample_uniform_torch(0, 1, (10, 5)))
+                )
+                self.assertTrue(torch.equal(rng_1.sample_normal_torch(0, 1, 10), rng_2.sample_normal_torch(0, 1, 10)))
+                self.assertTrue(torch.equal(rng_1.sample_integer_torch(0, 5, 3), rng_2.sample_integer_torch(0, 5, 3)))
+                self.assertTrue(torch.equal(rng_1.sample_sign_torch("int", 1), rng_2.sample_sign_torch("int", 1)))
+                self.assertTrue(torch.equal(rng_1.sample_quaternion_torch(2), rng_2.sample_quaternion_torch(2)))
+                self.assertTrue(
+                    torch.equal(
+                        rng_1.sample_unique_integers_torch(0, 20, 5), rng_2.sample_unique_integers_torch(0, 20, 5)
+                    )
+                )
+
+    def test_reproducibility_across_devices(self):
+        if len(DEVICES) < 2:
+            self.skipTest("Requires a CUDA device.")
+        output_cpu = make_rng("cpu").sample_uniform_torch(0, 1, 10)
+        output_cuda = make_rng("cuda").sample_uniform_torch(0, 1, 10)
+        self.assertTrue(torch.equal(output_cpu, output_cuda.cpu()))
+
+    def test_index_sampling(self):
+        # Sampling a subset of the environments yields the same values as sampling all of them.
+        for device in DEVICES:
+            rng_1 = make_rng(device)
+            rng_2 = make_rng(device)
+            ids = torch.arange(0, 4096, 7, device=device)
+            for _ in range(10):
+                output_1 = rng_1.sample_uniform_torch(0, 1, 4, ids=ids)
+                output_2 = rng_2.sample_uniform_torch(0, 1, 4)[ids]
+                self.assertTrue(torch.equal(output_1, output_2))
+
+    def test_reseeding_is_independent_of_other_envs(self):
+        for device in DEVICES:
+            rng_1 = make_rng(device)
+            rng_2 = make_rng(device)
+            rng_2.sample_uniform_torch(0, 1, 3, ids=torch.arange(10, device=device))
+            rng_2.set_seeds(torch.arange(10, dtype=torch.int32, device=device), torch.arange(10, device=device))
+            self.assertTrue(torch.equal(rng_1.sample_uniform_torch(0, 1, 3), rng_2.sample_uniform_torch(0, 1, 3)))
+
+    def test_different_for_each_run(self):
+        for device in DEVICES:
+            rng = make_rng(device)
+            self.assertFalse(torch.equal(rng.sample_uniform_torch(0, 1, 1), rng.sample_uniform_torch(0, 1, 1)))
+
+    ############################################################
+    # Test Statistics
+    ############################################################
+
+    def test_uniform_statistics(self):
+        for device in DEVICES:
+            output = make_rng(device).sample_uniform_torch(-1.0, 3.0, 100)
+            self.assertEqual(output.shape, (4096, 100))
+            self.assertTrue(torch.all(output >= -1.0) and torch.all(output < 3.0))
+            self.assertAlmostEqual(output.mean().item(), 1.0, delta=0.01)
+            self.assertAlmostEqual(output.var().item(), 16.0 / 12.0, delta=0.01)
+
+    def test_uniform_tensorized(self):
+        for device in DEVICES:
+            low = torch.arange(4096, dtype=torch.float32, device=device) / 4096
+            output = make_rng(device).sample_uniform_torch(low, low + 1.0, (10, 5))
+            self.assertEqual(output.shape, (4096, 10, 5))
+            self.assertTrue(torch.all(output >= low.view(-1, 1, 1)) and torch.all(output < low.view(-1, 1, 1) + 1.0))
+
+    def test_normal_statistics(self):
+        for device in DEVICES:
+            output = make_rng(device).sample_normal_torch(2.0, 3.0, 100)
+            self.assertAlmostEqual(output.mean().item(), 2.0, delta=0.02)
+            self.assertAlmostEqual(output.std().item(), 3.0, delta=0.02)
+            self.assertTrue(torch.all(torch.isfinite(output)))
+
+    def test_integer_statistics(self):
+        for device in DEVICES:
+            output = make_rng(device).sample_integer_torch(2, 7, 100)
+            self.assertEqual(output.dtype, torch.int32)
+            self.assertTrue(torch.all(output >= 2) and torch.all(output < 7))
+            counts = torch.bincount(output.flatten().long() - 2).float()
+            self.assertTrue(torch.all(torch.abs(counts / output.numel() - 0.2) < 0.005))
+
+    def test_sign_statistics(self):
+        for device in DEVICES:
+            output = make_rng(device).sample_sign_torch("float", 100)
+            self.assertTrue(torch.all(torch.abs(output) == 1.0))
+            self.assertAlmostEqual(output.mean().item(), 0.0, delta=0.01)
+
+    def test_poisson_statistics(self):
+        for device in DEVICES:
+            for lam in [0.5, 4.0, 250.0]:
+                output = make_rng(device).sample_poisson_torch(lam, 100).float()
+                self.assertAlmostEqual(output.mean().item() / lam, 1.0, delta=0.02)
+                self.assertAlmostEqual(output.var().item() / lam, 1.0, delta=0.05)
+
+    def test_quaternion_statistics(self):
+        for device in DEVICES:
+            output = make_rng(device).sample_quaternion_torch(10)
+            self.assertEqual(output.shape, (4096, 10, 4))
+            self.assertTrue(torch.allclose(torch.linalg.norm(output, dim=-1), torch.ones(1, device=device), atol=1e-5))
+            # The rotation axis is uniform on the sphere
+            axis = output[..., :3] / torch.linalg.norm(output[..., :3], dim=-1, keepdim=True)
+            self.assertTrue(torch.all(torch.abs(axis.reshape(-1, 3).mean(dim=0)) < 0.02))
+
+    def test_unique_integers(self):
+        for device in DEVICES:
+            output = make_rng(device).sample_unique_integers_torch(0, 30, 30)
+            expected = torch.arange(30, dtype=torch.int32, device=device).expand(4096, -1)
+            self.assertTrue(torch.equal(torch.sort(output, dim=1)[0], expected))
+            # Every position is uniformly distributed
+            output = make_rng(device).sample_unique_integers_torch(0, 10, 3)
+            for i in range(3):
+                counts = torch.bincount(output[:, i].long(), minlength=10).float()
+                self.assertTrue(torch.all(torch.abs(counts / 4096 - 0.1) < 0.025))
+
+    def test_unique_integers_tensorized(self):
+        for device in DEVICES:
+            min = torch.arange(4096, dtype=torch.int32, device=device)
+            output = make_rng(device).sample_unique_integers_torch(min, min + 50, 10)
+            self.assertTrue(torch.all(output >= min.unsqueeze(1)) and torch.all(output < min.unsqueeze(1) + 50))
+            self.assertTrue(torch.all(torch.diff(torch.sort(output, dim=1)[0], dim=1) > 0))
+
+    def test_draw_plan(self):
+        for device in DEVICES:
+            rng_1 = make_rng(device)
+            rng_2 = make_rng(device)
+            plan = rng_2.create_draw_plan()
+            plan.add_integer("integer", 1, 5, 1)
+            plan.add_uniform("uniform", 0.0, 1.0, 2)
+            plan.add_sign("sign", "float", 1)
+            low = torch.zeros(4096, device=device)
+            outputs = plan.sample(bounds={"uniform": (low, low + math.pi)})
+            self.assertTrue(torch.equal(outputs["integer"], rng_1.sample_integer_torch(1, 5, 1)))
+            self.assertTrue(torch.equal(outputs["uniform"], rng_1.sample_uniform_torch(low, low + math.pi, 2)))
+            self.assertTrue(torch.equal(outputs["sign"], rng_1.sample_sign_torch("float", 1)))
+
+    def test_draw_plan_masked(self):
+        for device in DEVICES:
+            rng_1 = make_rng(device)
+            rng_2 = make_rng(device)
+            plan = rng_2.create_draw_plan()
+            plan.add_sign("sign", "float", 3)
+            plan.add_integer("integer", 10, 50, 1)
+            generator = torch.Generator(device=device).manual_seed(0)
+            for _ in range(5):
+                mask = torch.rand(4096, device=device, generator=generator) < 0.3
+                ids = torch.where(mask)[0]
+                outputs = plan.sample(mask=mask)
+                self.assertTrue(torch.equal(outputs["sign"][mask], rng_1.sample_sign_torch("float", 3, ids=ids)))
+                self.assertTrue(torch.equal(outputs["integer"][mask], rng_1.sample_integer_torch(10, 50, 1, ids=ids)))
+            self.assertTrue(torch.equal(rng_1._counters, rng_2._counters))
+
+
+if __name__ == "__main__":
+    run_tests()
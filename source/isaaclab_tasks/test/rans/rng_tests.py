@@ -11,6 +11,8 @@ simulation_app = AppLauncher(config).app
 import torch
 import unittest
 
+import warp as wp
+
 from isaaclab_tasks.rans.utils import PerEnvSeededRNG
 
 
@@ -893,6 +895,31 @@ class TestRandomNumberGenerator(unittest.TestCase):
         output_2 = pesrng_1.sample_unique_integers_torch(0, 100, 10)
         self.assertFalse(torch.equal(output_1, output_2))
 
+    def test_unique_integers_are_unique(self):
+        pesrng = PerEnvSeededRNG(42, 1000, "cuda")
+        pesrng.set_seeds(
+            torch.arange(1000, dtype=torch.int32, device="cuda"),
+            torch.arange(1000, dtype=torch.int32, device="cuda"),
+        )
+        output = pesrng.sample_unique_integers_torch(0, 20, 20)
+        self.assertEqual(output.device.type, "cuda")
+        expected = torch.arange(20, dtype=torch.int32, device="cuda").expand(1000, -1)
+        self.assertTrue(torch.equal(torch.sort(output, dim=1)[0], expected))
+
+    def test_unique_integers_bounds_tensorized(self):
+        pesrng = PerEnvSeededRNG(42, 1000, "cuda")
+        pesrng.set_seeds(
+            torch.arange(1000, dtype=torch.int32, device="cuda"),
+            torch.arange(1000, dtype=torch.int32, device="cuda"),
+        )
+        min = torch.arange(1000, dtype=torch.int32, device="cuda")
+        max = min + 50
+        output = pesrng.sample_unique_integers_torch(min, max, 10)
+        self.assertTrue(torch.all(output >= min.unsqueeze(1)))
+        self.assertTrue(torch.all(output < max.unsqueeze(1)))
+        sorted_output = torch.sort(output, dim=1)[0]
+        self.assertTrue(torch.all(torch.diff(sorted_output, dim=1) > 0))
+
     def test_unique_integers_catch_max_min(self):
         pesrng = PerEnvSeededRNG(42, 1000, "cuda")
         pesrng.set_seeds(
@@ -913,6 +940,122 @@ class TestRandomNumberGenerator(unittest.TestCase):
         with self.assertRaises(AssertionError):
             pesrng.sample_unique_integers_torch(0, 100, 101)
 
+    def test_unique_integers_catch_bound_types(self):
+        pesrng = PerEnvSeededRNG(42, 1000, "cuda")
+        pesrng.set_seeds(
+            torch.arange(1000, dtype=torch.int32, device="cuda"),
+            torch.arange(1000, dtype=torch.int32, device="cuda"),
+        )
+        max = wp.from_torch(torch.ones((1000), dtype=torch.int32, device="cuda") * 100, dtype=wp.int32)
+
+        with self.assertRaises(TypeError):
+            pesrng.sample_unique_integers_warp(0.0, 100.0, 10)
+        with self.assertRaisesRegex(ValueError, "The high value must be a tensor"):
+            pesrng.sample_unique_integers_warp(max, 200, 10)
+
+    ############################################################
+    # Test Draw plans
+    ############################################################
+
+    def test_draw_plan_matches_per_call(self):
+        pesrng_1 = PerEnvSeededRNG(42, 1000, "cuda")
+        pesrng_1.set_seeds(
+            torch.arange(1000, dtype=torch.int32, device="cuda"),
+            torch.arange(1000, dtype=torch.int32, device="cuda"),
+        )
+        pesrng_2 = PerEnvSeededRNG(42, 1000, "cuda")
+        pesrng_2.set_seeds(
+            torch.arange(1000, dtype=torch.int32, device="cuda"),
+            torch.arange(1000, dtype=torch.int32, device="cuda"),
+        )
+        plan = pesrng_2.create_draw_plan()
+        plan.add_integer("integer", 1, 5, 1)
+        plan.add_uniform("uniform", 0.0, 1.0, (10, 5))
+        plan.add_normal("normal", 0.0, 1.0, 3)
+        plan.add_sign("sign", "float", 1)
+        plan.add_quaternion("quaternion", 2)
+
+        ids = torch.arange(0, 1000, 3, dtype=torch.int32, device="cuda")
+        low = torch.zeros((ids.shape[0]), device="cuda")
+        high = torch.ones((ids.shape[0]), device="cuda") * 2.0
+        for i in range(10):
+            outputs = plan.sample(ids, bounds={"uniform": (low, high)})
+            self.assertTrue(torch.equal(outputs["integer"], pesrng_1.sample_integer_torch(1, 5, 1, ids=ids)))
+            self.assertTrue(torch.equal(outputs["uniform"], pesrng_1.sample_uniform_torch(low, high, (10, 5), ids=ids)))
+            self.assertTrue(torch.equal(outputs["normal"], pesrng_1.sample_normal_torch(0.0, 1.0, 3, ids=ids)))
+            self.assertTrue(torch.equal(outputs["sign"], pesrng_1.sample_sign_torch("float", 1, ids=ids)))
+            self.assertTrue(torch.equal(outputs["quaternion"], pesrng_1.sample_quaternion_torch(2, ids=ids)))
+
+    def test_draw_plan_different_for_each_run(self):
+        pesrng = PerEnvSeededRNG(42, 1000, "cuda")
+        pesrng.set_seeds(
+            torch.arange(1000, dtype=torch.int32, device="cuda"),
+            torch.arange(1000, dtype=torch.int32, device="cuda"),
+        )
+        plan = pesrng.create_draw_plan()
+        plan.add_uniform("uniform", 0.0, 1.0, 1)
+        output_1 = plan.sample()["uniform"].clone()
+        output_2 = plan.sample()["uniform"]
+        self.assertFalse(torch.equal(output_1, output_2))
+
+    def test_draw_plan_masked_matches_indexed(self):
+        pesrng_1 = PerEnvSeededRNG(42, 1000, "cuda")
+        pesrng_1.set_seeds(
+            torch.arange(1000, dtype=torch.int32, device="cuda"),
+            torch.arange(1000, dtype=torch.int32, device="cuda"),
+        )
+        pesrng_2 = PerEnvSeededRNG(42, 1000, "cuda")
+        pesrng_2.set_seeds(
+            torch.arange(1000, dtype=torch.int32, device="cuda"),
+            torch.arange(1000, dtype=torch.int32, device="cuda"),
+        )
+        plan = pesrng_2.create_draw_plan()
+        plan.add_sign("sign", "float", 3)
+        plan.add_uniform("uniform", 0.0, 1.0, 1)
+        plan.add_integer("integer", 10, 50, 1)
+
+        generator = torch.Generator(device="cuda").manual_seed(0)
+        for i in range(10):
+            mask = torch.rand(1000, device="cuda", generator=generator) < 0.3
+            ids = torch.where(mask)[0].to(torch.int32)
+            outputs = plan.sample(mask=mask)
+            # Only the masked environments consume their draws, as if they were the only ones sampled
+            self.assertTrue(torch.equal(outputs["sign"][mask], pesrng_1.sample_sign_torch("float", 3, ids=ids)))
+            self.assertTrue(torch.equal(outputs["uniform"][mask], pesrng_1.sample_uniform_torch(0.0, 1.0, 1, ids=ids)))
+            self.assertTrue(torch.equal(outputs["integer"][mask], pesrng_1.sample_integer_torch(10, 50, 1, ids=ids)))
+        # Without a mask all the environments advance again
+        outputs = plan.sample()
+        self.assertTrue(torch.equal(outputs["sign"], pesrng_1.sample_sign_torch("float", 3)))
+        self.assertTrue(torch.equal(pesrng_1.states_torch, pesrng_2.states_torch))
+
+    def test_draw_plan_interleaved_with_per_call(self):
+        pesrng_1 = PerEnvSeededRNG(42, 1000, "cuda")
+        pesrng_1.set_seeds(
+            torch.arange(1000, dtype=torch.int32, device="cuda"),
+            torch.arange(1000, dtype=torch.int32, device="cuda"),
+        )
+        pesrng_2 = PerEnvSeededRNG(42, 1000, "cuda")
+        pesrng_2.set_seeds(
+            torch.arange(1000, dtype=torch.int32, device="cuda"),
+            torch.arange(1000, dtype=torch.int32, device="cuda"),
+        )
+        plan = pesrng_2.create_draw_plan()
+        plan.add_uniform("uniform", 0.0, 1.0, 2)
+
+        plan_ids = torch.arange(0, 1000, 2, dtype=torch.int32, device="cuda")
+        other_ids = torch.arange(1, 1000, 2, dtype=torch.int32, device="cuda")
+        for i in range(10):
+            # The per-call sampling of the other environments must not rewind the environments advanced by the plan
+            outputs = plan.sample(plan_ids)
+            self.assertTrue(torch.equal(outputs["uniform"], pesrng_1.sample_uniform_torch(0.0, 1.0, 2, ids=plan_ids)))
+            self.assertTrue(
+                torch.equal(
+                    pesrng_2.sample_uniform_torch(0.0, 1.0, 1, ids=other_ids),
+                    pesrng_1.sample_uniform_torch(0.0, 1.0, 1, ids=other_ids),
+                )
+            )
+        self.assertTrue(torch.equal(pesrng_1.states_torch, pesrng_2.states_torch))
+
 
 if __name__ == "__main__":
     run_tests()
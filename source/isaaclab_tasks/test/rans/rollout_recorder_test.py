@@ -0,0 +1,75 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+config = {"headless": True}
+simulation_app = AppLauncher(config).app
+import numpy as np
+import os
+import tempfile
+import torch
+import unittest
+
+from isaaclab_tasks.rans.utils.rollout_recorder import RolloutRecorder
+
+
+class TestRolloutRecorder(unittest.TestCase):
+    def setUp(self):
+        self.num_steps = 50
+        self.num_envs = 16
+        self.device = "cuda"
+        self.steps = [
+            {
+                "act": torch.rand(self.num_envs, 2, device=self.device),
+                "obs": torch.rand(self.num_envs, 6, device=self.device),
+                "rews": torch.rand(self.num_envs, device=self.device),
+                "dones": torch.rand(self.num_envs, device=self.device) > 0.5,
+            }
+            for _ in range(self.num_steps)
+        ]
+
+    def expected(self, name: str, num_steps: int) -> np.ndarray:
+        return np.stack([step[name].cpu().numpy() for step in self.steps[:num_steps]])
+
+    def test_in_memory(self):
+        for chunk_size in [1, 7, 32, 100]:
+            recorder = RolloutRecorder(self.num_steps, self.num_envs, self.device, chunk_size=chunk_size)
+            for step in self.steps:
+                recorder.record(**step)
+            data = recorder.finalize()
+            for name in self.steps[0].keys():
+                self.assertEqual(data[name].shape, (self.num_steps, *self.steps[0][name].shape))
+                self.assertTrue(np.array_equal(data[name], self.expected(name, self.num_steps)))
+
+    def test_memory_mapped(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "rollout")
+            recorder = RolloutRecorder(self.num_steps, self.num_envs, self.device, save_path=path, chunk_size=8)
+            # Stop before the end of the horizon, like when recording videos
+            for step in self.steps[:37]:
+                recorder.record(**step)
+            recorder.finalize()
+            data = RolloutRecorder.load(path)
+            for name in self.steps[0].keys():
+                self.assertIsInstance(data[name], np.memmap)
+                self.assertTrue(np.array_equal(data[name], self.expected(name, 37)))
+
+    def test_fields_and_float_dtype(self):
+        recorder = RolloutRecorder(
+            self.num_steps, self.num_envs, self.device, fields=["obs", "dones"], float_dtype=torch.float16
+        )
+        for step in self.steps:
+            recorder.record(**step)
+        data = recorder.finalize()
+        self.assertEqual(set(data.keys()), {"obs", "dones"})
+        self.assertEqual(data["obs"].dtype, np.float16)
+        self.assertEqual(data["dones"].dtype, np.bool_)
+        self.assertTrue(np.allclose(data["obs"], self.expected("obs", self.num_steps), atol=1e-3))
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,55 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import os
+import shlex
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from isaaclab.app import run_tests
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+RUN_ALL_EVALS = REPO_ROOT / "scripts" / "reinforcement_learning" / "run_all_evals.py"
+
+
+class TestRunAllEvalsDryRun(unittest.TestCase):
+    def test_results_dir_is_forwarded_to_eval(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            results_dir = os.path.join(tmp_dir, "sweep_results")
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    str(RUN_ALL_EVALS),
+                    "--robots",
+                    "Jetbot",
+                    "--tasks",
+                    "GoToPosition",
+                    "--rl_libs",
+                    "skrl",
+                    "--results_dir",
+                    results_dir,
+                    "--dry_run",
+                    "--stub_duration",
+                    "0",
+                ],
+                capture_output=True,
+                text=True,
+                timeout=120,
+                cwd=REPO_ROOT,
+            )
+            self.assertEqual(result.returncode, 0, result.stderr)
+
+            # The stub prints the command of the evaluation in the log of the job
+            with open(os.path.join(results_dir, "logs", "Jetbot_GoToPosition_skrl.log")) as log_file:
+                command = shlex.split(log_file.read().splitlines()[-1])
+            self.assertIn("scripts/reinforcement_learning/skrl/eval.py", command)
+            self.assertEqual(command[command.index("--results_dir") + 1], results_dir)
+
+
+if __name__ == "__main__":
+    run_tests()
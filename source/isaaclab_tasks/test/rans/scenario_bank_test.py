@@ -0,0 +1,92 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+config = {"headless": True}
+simulation_app = AppLauncher(config).app
+import numpy as np
+import os
+import tempfile
+import torch
+import unittest
+
+from isaaclab_tasks.rans.utils import ScenarioBank
+
+
+class TestScenarioBank(unittest.TestCase):
+    def setUp(self):
+        self.device = "cuda"
+        self.num_envs = 8
+
+    def test_lhs_is_stratified(self):
+        scenarios = ScenarioBank.generate(64, 4, 1, seed=0, method="lhs", block_size=16)
+        self.assertEqual(scenarios["task_gen_actions"].shape, (64, 4))
+        self.assertEqual(scenarios["robot_gen_actions"].shape, (64, 1))
+        gen_actions = np.concatenate([scenarios["task_gen_actions"], scenarios["robot_gen_actions"]], axis=-1)
+        # each block holds exactly one scenario per stratum of each dimension
+        for block in gen_actions.reshape(4, 16, 5):
+            strata = np.floor(block * 16).astype(np.int64)
+            for dim in range(5):
+                np.testing.assert_array_equal(np.sort(strata[:, dim]), np.arange(16))
+
+    def test_grid_is_stratified(self):
+        scenarios = ScenarioBank.generate(20, 2, seed=1, method="grid", block_size=9)
+        gen_actions = scenarios["task_gen_actions"]
+        self.assertEqual(gen_actions.shape, (20, 2))
+        self.assertEqual(scenarios["robot_gen_actions"].shape, (20, 0))
+        cells = np.floor(gen_actions[:9] * 3).astype(np.int64)
+        self.assertEqual(len({tuple(cell) for cell in cells}), 9)
+
+    def test_generation_is_deterministic(self):
+        first = ScenarioBank.generate(32, 3, 2, seed=5)
+        second = ScenarioBank.generate(32, 3, 2, seed=5)
+        for name in ScenarioBank.FIELDS:
+            np.testing.assert_array_equal(first[name], second[name])
+
+    def test_replay_order(self):
+        scenarios = ScenarioBank.generate(20, 3, seed=2)
+        bank = ScenarioBank(**scenarios, num_envs=self.num_envs, device=self.device)
+        task_seeds = torch.from_numpy(scenarios["task_seeds"]).to(self.device)
+
+        # the k-th episode of environment i replays the scenario (k * num_envs + i) % num_scenarios
+        all_ids = torch.arange(self.num_envs, device=self.device)
+        seeds, _, gen_actions, _ = bank.sample(all_ids)
+        torch.testing.assert_close(seeds, task_seeds[: self.num_envs])
+        np.testing.assert_array_equal(gen_actions.cpu().numpy(), scenarios["task_gen_actions"][: self.num_envs])
+
+        # the scenarios of an environment do not depend on when the other environments are reset
+        env_ids = torch.tensor([5, 1], device=self.device)
+        seeds, _, _, _ = bank.sample(env_ids)
+        torch.testing.assert_close(seeds, task_seeds[torch.tensor([13, 9], device=self.device)])
+        seeds, _, _, _ = bank.sample(torch.tensor([5], device=self.device))
+        torch.testing.assert_close(seeds, task_seeds[torch.tensor([21 % 20], device=self.device)])
+
+        bank.rewind()
+        seeds, _, _, _ = bank.sample(all_ids)
+        torch.testing.assert_close(seeds, task_seeds[: self.num_envs])
+
+    def test_save_load(self):
+        scenarios = ScenarioBank.generate(16, 4, 1, seed=3)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "bank.npz")
+            ScenarioBank.save(path, scenarios, {"robot_name": "FloatingPlatform", "task_name": "GoToPose"})
+            bank = ScenarioBank.load(path, self.num_envs, self.device)
+        self.assertEqual(bank.num_scenarios, 16)
+        self.assertEqual(bank.task_gen_space, 4)
+        self.assertEqual(bank.robot_gen_space, 1)
+        self.assertEqual(bank.metadata["task_name"], "GoToPose")
+        task_seeds, robot_seeds, task_gen_actions, robot_gen_actions = bank.sample(
+            torch.arange(self.num_envs, device=self.device)
+        )
+        np.testing.assert_array_equal(task_seeds.cpu().numpy(), scenarios["task_seeds"][: self.num_envs])
+        np.testing.assert_array_equal(robot_seeds.cpu().numpy(), scenarios["robot_seeds"][: self.num_envs])
+        np.testing.assert_array_equal(task_gen_actions.cpu().numpy(), scenarios["task_gen_actions"][: self.num_envs])
+        np.testing.assert_array_equal(robot_gen_actions.cpu().numpy(), scenarios["robot_gen_actions"][: self.num_envs])
+
+
+if __name__ == "__main__":
+    run_tests()
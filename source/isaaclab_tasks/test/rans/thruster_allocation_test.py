@@ -0,0 +1,132 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+config = {"headless": True}
+simulation_app = AppLauncher(config).app
+import math
+import torch
+import unittest
+
+from isaaclab.utils import math as math_utils
+
+from isaaclab_tasks.rans.robots.thruster_allocation import ThrusterAllocation
+
+A, B, C = 0.035, 0.045, 0.035
+TRANSFORMS_3D = [
+    [2 * A, 2 * B, 2 * C, 0, 0, 0],
+    [2 * A, -2 * B, 2 * C, 0, 0, math.pi],
+    [2 * A, -2 * B, -2 * C, 0, math.pi, 0],
+    [2 * A, 2 * B, -2 * C, 0, math.pi, math.pi],
+    [-2 * A, 2 * B, -2 * C, math.pi, 0, 0],
+    [-2 * A, 2 * B, 2 * C, math.pi, 0, math.pi],
+    [-2 * A, -2 * B, 2 * C, math.pi, math.pi, 0],
+    [-2 * A, -2 * B, -2 * C, math.pi, math.pi, math.pi],
+]
+TRANSFORMS_2D = [
+    [0.2192031, 0.2192031, -math.pi / 4.0],
+    [0.2192031, 0.2192031, math.pi * 3.0 / 4.0],
+    [-0.2192031, 0.2192031, math.pi / 4.0],
+    [-0.2192031, 0.2192031, math.pi * 5.0 / 4.0],
+    [-0.2192031, -0.2192031, math.pi * 3.0 / 4.0],
+    [-0.2192031, -0.2192031, -math.pi / 4.0],
+    [0.2192031, -0.2192031, math.pi * 5.0 / 4.0],
+    [0.2192031, -0.2192031, math.pi / 4.0],
+]
+
+
+def reference_thrust_3d(actions, transforms, max_thrust):
+    """Per-environment projection of the thrusts, as done by the IntBall2 before the allocation matrix."""
+    num_envs, num_thrusters = actions.shape
+    R = torch.zeros((num_envs, num_thrusters, 3, 3), device=actions.device)
+    T = torch.zeros((num_envs, num_thrusters, 3), device=actions.device)
+    unit_vector = torch.zeros((num_envs, num_thrusters, 3), device=actions.device)
+    for i, (x, y, z, rot_x, rot_y, rot_z) in enumerate(transforms):
+        R_i = math_utils.matrix_from_euler(torch.tensor([[rot_x, rot_y, rot_z]], device=actions.device), "XYZ")
+        R[:, i] = R_i
+        T[:, i] = torch.tensor([x, y, z], device=actions.device)
+        unit_vector[:, i] = R_i[:, 2]
+    forces = -unit_vector * (actions * torch.tensor(max_thrust, device=actions.device)).unsqueeze(-1)
+    forces = torch.matmul(R, forces.unsqueeze(-1)).squeeze(-1)
+    return T, forces, torch.cross(T, forces, dim=-1)
+
+
+def reference_thrust_2d(actions, transforms, max_thrust):
+    """Per-environment projection of the thrusts, as done by the ModularFreeflyer before the allocation matrix."""
+    thrusts = actions * torch.tensor(max_thrust, device=actions.device)
+    theta = torch.tensor([t[2] for t in transforms], device=actions.device)
+    forces = torch.stack([thrusts * torch.cos(theta), thrusts * torch.sin(theta), torch.zeros_like(thrusts)], -1)
+    positions = torch.tensor([[x, y, 0.0] for x, y, _ in transforms], device=actions.device)
+    return positions.expand(actions.shape[0], -1, -1), forces
+
+
+class TestThrusterAllocation(unittest.TestCase):
+    def setUp(self):
+        self.device = "cuda"
+        self.num_envs = 64
+        self.max_thrust = [1.0, 0.5, 1.0, 0.5, 1.0, 0.5, 1.0, 0.5]
+        torch.manual_seed(0)
+        self.actions = torch.rand((self.num_envs, 8), device=self.device)
+
+    def test_thruster_forces_3d(self):
+        allocation = ThrusterAllocation.from_transforms_3d(
+            TRANSFORMS_3D, self.max_thrust, num_envs=self.num_envs, device=self.device
+        )
+        positions, forces, torques = allocation.compute_thruster_forces(self.actions)
+        ref_positions, ref_forces, ref_torques = reference_thrust_3d(self.actions, TRANSFORMS_3D, self.max_thrust)
+        torch.testing.assert_close(positions, ref_positions)
+        torch.testing.assert_close(forces, ref_forces)
+        torch.testing.assert_close(torques, ref_torques)
+
+    def test_thruster_forces_2d(self):
+        allocation = ThrusterAllocation.from_transforms_2d(
+            TRANSFORMS_2D, self.max_thrust, num_envs=self.num_envs, device=self.device
+        )
+        positions, forces, _ = allocation.compute_thruster_forces(self.actions)
+        ref_positions, ref_forces = reference_thrust_2d(self.actions, TRANSFORMS_2D, self.max_thrust)
+        torch.testing.assert_close(positions, ref_positions)
+        torch.testing.assert_close(forces, ref_forces)
+
+    def test_wrench_is_sum_of_thruster_wrenches(self):
+        for allocation in [
+            ThrusterAllocation.from_transforms_3d(TRANSFORMS_3D, self.max_thrust, self.num_envs, self.device),
+            ThrusterAllocation.from_transforms_2d(TRANSFORMS_2D, self.max_thrust, self.num_envs, self.device),
+        ]:
+            self.assertEqual(allocation.allocation_matrix.shape, (6, 8))
+            positions, forces, _ = allocation.compute_thruster_forces(self.actions)
+            wrench = allocation.compute_wrench(self.actions)
+            self.assertEqual(wrench.shape, (self.num_envs, 6))
+            torch.testing.assert_close(wrench[:, :3], forces.sum(dim=1))
+            torch.testing.assert_close(wrench[:, 3:], torch.cross(positions, forces, dim=-1).sum(dim=1))
+            torch.testing.assert_close(
+                allocation.compute_torque_norms(self.actions),
+                torch.cross(positions, forces, dim=-1).abs().sum(dim=(1, 2)),
+            )
+
+    def test_thrust_scales(self):
+        allocation = ThrusterAllocation.from_transforms_3d(TRANSFORMS_3D, self.max_thrust, self.num_envs, self.device)
+        self.assertIsNone(allocation.thrust_scales)
+        unscaled_wrench = allocation.compute_wrench(self.actions)
+
+        env_ids = torch.tensor([1, 5], device=self.device)
+        scales = torch.rand((2, 8), device=self.device)
+        allocation.set_thrust_scales(scales, env_ids)
+        self.assertEqual(allocation.thrust_scales.shape, (self.num_envs, 8))
+
+        wrench = allocation.compute_wrench(self.actions)
+        scaled_actions = self.actions.clone()
+        scaled_actions[env_ids] *= scales
+        _, ref_forces, ref_torques = reference_thrust_3d(scaled_actions, TRANSFORMS_3D, self.max_thrust)
+        torch.testing.assert_close(wrench[:, :3], ref_forces.sum(dim=1))
+        torch.testing.assert_close(wrench[:, 3:], ref_torques.sum(dim=1))
+        # the other environments are not affected
+        other_ids = torch.tensor([0, 2, 3, 4], device=self.device)
+        torch.testing.assert_close(wrench[other_ids], unscaled_wrench[other_ids])
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,84 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+config = {"headless": True}
+simulation_app = AppLauncher(config).app
+import os
+import tempfile
+import torch
+import unittest
+
+from isaaclab_tasks.rans.utils import PerEnvSeededRNG, TrackBank, TrackGenerator
+
+
+class TestTrackBank(unittest.TestCase):
+    def setUp(self):
+        self.device = "cuda"
+        self.num_tracks = 256
+        self.num_envs = 64
+        self.env_rng = PerEnvSeededRNG(0, self.num_envs, self.device)
+        self.env_rng.set_seeds(
+            torch.arange(self.num_envs, dtype=torch.int32, device=self.device),
+            torch.arange(self.num_envs, device=self.device),
+        )
+
+    def test_tracks_match_generator(self):
+        bank = TrackBank(self.num_tracks, seed=10, dtype="float32", device=self.device, scale=20.0)
+        rng = PerEnvSeededRNG(0, 1, self.device)
+        rng.set_seeds(torch.tensor([15], dtype=torch.int32, device=self.device), torch.tensor([0], device=self.device))
+        generator = TrackGenerator(rng=rng, device=self.device, scale=20.0)
+        points, tangents, num_points = generator.generate_tracks_points_non_fixed_points(
+            torch.tensor([0], device=self.device)
+        )
+        self.assertEqual(bank.seeds[5].item(), 15)
+        self.assertTrue(torch.allclose(bank._bank[5, :26].view(13, 2) * 20.0, points[0], atol=1e-5))
+        self.assertTrue(torch.allclose(bank._bank[5, 26:39], tangents[0]))
+        self.assertEqual(bank._bank[5, -1].item(), num_points[0].item())
+
+    def test_sample(self):
+        bank = TrackBank(self.num_tracks, device=self.device, scale=20.0)
+        env_ids = torch.arange(0, self.num_envs, 2, device=self.device)
+        points, tangents, num_points = bank.sample(self.env_rng, env_ids)
+        self.assertEqual(points.shape, (len(env_ids), 13, 2))
+        self.assertEqual(tangents.shape, (len(env_ids), 13))
+        self.assertEqual(num_points.dtype, torch.long)
+        self.assertTrue(torch.all((num_points >= 9) & (num_points <= 13)))
+
+    def test_memory_mapped_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "tracks.bin")
+            bank = TrackBank(self.num_tracks, path=path, device=self.device, scale=20.0)
+            self.assertTrue(os.path.exists(path))
+            reloaded = TrackBank(self.num_tracks, path=path, device=self.device, scale=20.0)
+            self.assertTrue(torch.equal(bank._bank, reloaded._bank))
+            # Different generation parameters invalidate the file
+            regenerated = TrackBank(self.num_tracks, path=path, device=self.device, scale=20.0, edgy=0.5)
+            self.assertFalse(torch.equal(bank._bank, regenerated._bank))
+
+    def test_refresh(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "tracks.bin")
+            bank = TrackBank(
+                self.num_tracks, path=path, refresh_fraction=0.25, refresh_interval=4, device=self.device, scale=20.0
+            )
+            seeds = bank.seeds.clone()
+            env_ids = torch.arange(self.num_envs, device=self.device)
+            for _ in range(4):
+                bank.sample(self.env_rng, env_ids)
+            bank.close()
+            refreshed = bank.seeds != seeds
+            self.assertEqual(refreshed.sum().item(), self.num_tracks // 4)
+            self.assertTrue(torch.all(bank.seeds[refreshed] >= self.num_tracks))
+            # The refreshed tracks are written back to the file
+            reloaded = TrackBank(self.num_tracks, path=path, device=self.device, scale=20.0)
+            self.assertTrue(torch.equal(reloaded.seeds, bank.seeds))
+            self.assertTrue(torch.equal(reloaded._bank, bank._bank))
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,125 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+config = {"headless": True}
+simulation_app = AppLauncher(config).app
+import torch
+import unittest
+
+from isaaclab_tasks.rans.environments.single.kinematic_env_single import KinematicSingleEnv, KinematicSingleEnvCfg
+from isaaclab_tasks.rans.utils import PerEnvSeededRNG
+
+# Name of the velocities of each task, in the order of the packed tensors and of the generation actions
+VELOCITIES = {
+    "TrackVelocities": [("linear", "lin"), ("lateral", "lat"), ("angular", "ang")],
+    "TrackVelocities3D": [
+        ("linear", "lin"),
+        ("lateral", "lat"),
+        ("vertical", "ver"),
+        ("yaw", "yaw"),
+        ("pitch", "pitch"),
+        ("roll", "roll"),
+    ],
+}
+
+
+class ReferenceGoals:
+    """The per-component, indexed goal updates used before the packed implementation of the tasks."""
+
+    def __init__(self, task, task_name: str):
+        cfg = task._task_cfg
+        self.cfg = cfg
+        self.gen_actions = task._gen_actions
+        self.components = [
+            (k, getattr(cfg, f"goal_min_{short}_vel"), getattr(cfg, f"goal_max_{short}_vel"))
+            for k, (name, short) in enumerate(VELOCITIES[task_name])
+            if getattr(cfg, f"enable_{name}_velocity")
+        ]
+        # Same random streams as the task
+        self.rng = PerEnvSeededRNG(0, task._num_envs, task._device)
+        self.rng.states_torch.copy_(task._rng.states_torch)
+        self.target = task._velocity_target.clone()
+        self.desired = task._velocity_desired.clone()
+        self.smoothing_factor = task._smoothing_factor.clone()
+        self.update_after_n_steps = task._update_after_n_steps.clone()
+        self.num_steps = task._num_steps.clone()
+
+    def sample(self, ids: torch.Tensor) -> None:
+        for k, low, high in self.components:
+            self.desired[ids, k] = (self.gen_actions[ids, k] * (high - low) + low) * self.rng.sample_sign_torch(
+                "float", 1, ids=ids
+            )
+        self.smoothing_factor[ids] = (
+            self.rng.sample_uniform_torch(0.0, 1.0, 1, ids=ids)
+            * (self.cfg.smoothing_factor[1] - self.cfg.smoothing_factor[0])
+            + self.cfg.smoothing_factor[0]
+        )
+        self.update_after_n_steps[ids] = self.rng.sample_integer_torch(
+            self.cfg.interval[0], self.cfg.interval[1], 1, ids=ids
+        )
+
+    def set_goals(self, env_ids: torch.Tensor) -> None:
+        self.sample(env_ids)
+        self.target[env_ids] = self.desired[env_ids]
+
+    def update_goals(self) -> None:
+        self.num_steps += 1
+        s = self.smoothing_factor.unsqueeze(-1)
+        self.target = self.desired * (1 - s) + self.target * s
+        idx_to_update = torch.where(self.update_after_n_steps < self.num_steps)[0]
+        if len(idx_to_update) > 0:
+            self.sample(idx_to_update)
+            self.num_steps[idx_to_update] = 0
+
+
+class TestTrackVelocitiesGoals(unittest.TestCase):
+    def make_task(self, robot_name: str, task_name: str):
+        cfg = KinematicSingleEnvCfg(robot_name=robot_name, task_name=task_name, num_envs=256, seed=0)
+        env = KinematicSingleEnv(cfg)
+        env.reset()
+        return env.task_api
+
+    def check_against_reference(self, task, reference: ReferenceGoals) -> None:
+        torch.testing.assert_close(task._velocity_target, reference.target)
+        torch.testing.assert_close(task._velocity_desired, reference.desired)
+        torch.testing.assert_close(task._smoothing_factor, reference.smoothing_factor)
+        self.assertTrue(torch.equal(task._update_after_n_steps, reference.update_after_n_steps))
+        self.assertTrue(torch.equal(task._num_steps, reference.num_steps))
+        self.assertTrue(torch.equal(task._rng.states_torch, reference.rng.states_torch))
+
+    def run_task(self, robot_name: str, task_name: str) -> None:
+        task = self.make_task(robot_name, task_name)
+        reference = ReferenceGoals(task, task_name)
+        # Long enough for every environment to refresh its goals several times
+        for i in range(250):
+            task.update_goals()
+            reference.update_goals()
+            self.check_against_reference(task, reference)
+            if i == 100:
+                env_ids = torch.arange(0, task._num_envs, 3, device=task._device)
+                task.set_goals(env_ids)
+                reference.set_goals(env_ids)
+                self.check_against_reference(task, reference)
+
+    def test_track_velocities_matches_reference(self):
+        self.run_task("Jetbot", "TrackVelocities")
+
+    def test_track_velocities_3d_matches_reference(self):
+        self.run_task("IntBall2", "TrackVelocities3D")
+
+    def test_views_follow_packed_velocities(self):
+        task = self.make_task("IntBall2", "TrackVelocities3D")
+        for _ in range(100):
+            task.update_goals()
+        for k, (name, _) in enumerate(VELOCITIES["TrackVelocities3D"]):
+            self.assertTrue(torch.equal(getattr(task, f"_{name}_velocity_target"), task._velocity_target[:, k]))
+            self.assertTrue(torch.equal(getattr(task, f"_{name}_velocity_desired"), task._velocity_desired[:, k]))
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,110 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+config = {"headless": True}
+simulation_app = AppLauncher(config).app
+import torch
+import unittest
+
+from isaaclab_tasks.rans import ROBOT_CFG_FACTORY
+from isaaclab_tasks.rans.domain_randomization import WrenchRandomization, WrenchRandomizationCfg
+from isaaclab_tasks.rans.environments.single.kinematic_env_single import KinematicScene
+from isaaclab_tasks.rans.robots.kinematic_backend import KINEMATIC_MODEL_FACTORY, KinematicRobotBackend
+from isaaclab_tasks.rans.utils import PerEnvSeededRNG
+
+
+class TestWrenchKicks(unittest.TestCase):
+    def setUp(self):
+        self.device = "cuda"
+        self.num_envs = 16
+        self.env_ids = torch.arange(self.num_envs, device=self.device)
+        robot_cfg = ROBOT_CFG_FACTORY("FloatingPlatform")
+        # With a physics_dt of 1, the push interval is expressed in steps.
+        self.scene = KinematicScene(self.num_envs, 5.0, 1.0, self.device)
+        self.scene.articulations["robot"] = KinematicRobotBackend(
+            KINEMATIC_MODEL_FACTORY("FloatingPlatform", robot_cfg=robot_cfg),
+            init_state=robot_cfg.robot_cfg.init_state,
+            num_envs=self.num_envs,
+            device=self.device,
+        )
+
+    def make(self, **kwargs) -> WrenchRandomization:
+        cfg = WrenchRandomizationCfg(
+            enable=True,
+            randomization_modes=["kick_uniform"],
+            body_name="Cylinder",
+            uniform_force=(1.0, 2.0),
+            uniform_torque=(0.5, 1.0),
+            push_interval=4,
+            max_push_interval_variation=1,
+            **kwargs,
+        )
+        rng = PerEnvSeededRNG(0, self.num_envs, self.device)
+        rng.set_seeds(torch.arange(self.num_envs, dtype=torch.int32, device=self.device), self.env_ids)
+        randomizer = WrenchRandomization(cfg, rng, self.scene, "robot", self.num_envs, self.device)
+        randomizer.setup()
+        randomizer.reset(self.env_ids)
+        return randomizer
+
+    def test_masked_kicks(self):
+        randomizer = self.make()
+        for _ in range(20):
+            kick_time = randomizer._kick_time.clone()
+            force = randomizer._kick_force.clone()
+            randomizer.update()
+            kicked = kick_time <= 1
+            # The kick flags are cleared once the wrench is applied
+            self.assertFalse(torch.any(randomizer._bool_to_kick))
+            # The environments that were not kicked keep their wrench
+            self.assertTrue(torch.equal(randomizer._kick_force[~kicked], force[~kicked]))
+            self.assertTrue(torch.all(randomizer._kick_force[kicked].norm(dim=-1) > 0))
+            # The kicked environments are rescheduled
+            self.assertTrue(torch.all(randomizer._kick_time[kicked] >= 3))
+            self.assertTrue(torch.all(randomizer._kick_time[~kicked] == kick_time[~kicked] - 1))
+
+    def test_presampled_schedule(self):
+        randomizer = self.make(presample_kicks=True, max_kicks=4)
+        schedule_time = randomizer._kick_schedule_time.clone()
+        self.assertTrue(torch.all(schedule_time.diff(dim=1) >= 3))
+        for step in range(1, 20):
+            randomizer.update()
+            num_kicks = (schedule_time <= step).sum(dim=1)
+            self.assertTrue(torch.equal(randomizer._num_kicks, num_kicks))
+            kicked = num_kicks > 0
+            last_kick = randomizer._kick_schedule[self.env_ids, (num_kicks - 1).clamp(min=0)]
+            self.assertTrue(torch.equal(randomizer._kick_force[kicked], last_kick[kicked, :3]))
+            self.assertTrue(torch.equal(randomizer._kick_torque[kicked], last_kick[kicked, 3:]))
+            self.assertTrue(torch.all(randomizer._kick_force[~kicked] == 0))
+
+    def test_presampled_single_kick(self):
+        randomizer = self.make(presample_kicks=True, max_kicks=1)
+        self.assertEqual(randomizer._kick_schedule_time.shape, (self.num_envs, 1))
+        self.assertEqual(randomizer._kick_schedule.shape, (self.num_envs, 1, 6))
+        schedule_time = randomizer._kick_schedule_time[:, 0].clone()
+        for step in range(1, 10):
+            randomizer.update()
+            kicked = schedule_time <= step
+            self.assertTrue(torch.equal(randomizer._kick_force[kicked], randomizer._kick_schedule[kicked, 0, :3]))
+            self.assertTrue(torch.all(randomizer._kick_force[~kicked] == 0))
+        # A partial reset only redraws the schedule of the reset environments
+        schedule = randomizer._kick_schedule.clone()
+        randomizer.reset(self.env_ids[:4])
+        self.assertTrue(torch.equal(randomizer._kick_schedule[4:], schedule[4:]))
+        self.assertFalse(torch.equal(randomizer._kick_schedule[:4], schedule[:4]))
+
+    def test_reproducible(self):
+        first, second = self.make(), self.make()
+        for _ in range(10):
+            first.update()
+            second.update()
+        self.assertTrue(torch.equal(first._kick_force, second._kick_force))
+        self.assertTrue(torch.equal(first._kick_time, second._kick_time))
+
+
+if __name__ == "__main__":
+    run_tests()